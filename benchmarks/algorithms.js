@@ -0,0 +1,249 @@
+/**
+ * @license
+ * Copyright (C) 2006-2020  Music Technology Group - Universitat Pompeu Fabra
+ *
+ * This file is part of Essentia
+ *
+ * Essentia is free software: you can redistribute it and/or modify it under
+ * the terms of the GNU Affero General Public License as published by the Free
+ * Software Foundation (FSF), either version 3 of the License, or (at your
+ * option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful, but WITHOUT
+ * ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+ * FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+ * details.
+ *
+ * You should have received a copy of the Affero GNU General Public License
+ * version 3 along with this program.  If not, see http://www.gnu.org/licenses/
+ */
+
+// NOTE: This source code is machine-generated.
+
+// Benchmark cases of the essentia.js algorithms (see run.js), ie. the names and types of the inputs of each algorithm
+// along with the sizes of the vector inputs which depend on the default parameters of the algorithm (null for the 
+// signal length given to the benchmark runner) and the names of its outputs.
+module.exports = [
+  {name: 'AfterMaxToBeforeMaxEnergyRatio', inputs: [{name: 'pitch', type: 'vector_real', size: null}], outputs: ['afterMaxToBeforeMaxEnergyRatio']},
+  {name: 'AllPass', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['signal']},
+  {name: 'AudioOnsetsMarker', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['signal']},
+  {name: 'AutoCorrelation', inputs: [{name: 'array', type: 'vector_real', size: null}], outputs: ['autoCorrelation']},
+  {name: 'BFCC', inputs: [{name: 'spectrum', type: 'vector_real', size: 1025}], outputs: ['bands', 'bfcc']},
+  {name: 'BPF', inputs: [{name: 'x', type: 'real', size: null}], outputs: ['y']},
+  {name: 'BandPass', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['signal']},
+  {name: 'BandReject', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['signal']},
+  {name: 'BarkBands', inputs: [{name: 'spectrum', type: 'vector_real', size: null}], outputs: ['bands']},
+  {name: 'BeatTrackerDegara', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['ticks']},
+  {name: 'BeatTrackerMultiFeature', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['ticks', 'confidence']},
+  {name: 'Beatogram', inputs: [{name: 'loudness', type: 'vector_real', size: null}, {name: 'loudnessBandRatio', type: 'vector_vector_real', size: null}], outputs: ['beatogram']},
+  {name: 'BeatsLoudness', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['loudness', 'loudnessBandRatio']},
+  {name: 'BinaryOperator', inputs: [{name: 'array1', type: 'vector_real', size: null}, {name: 'array2', type: 'vector_real', size: null}], outputs: ['array']},
+  {name: 'BinaryOperatorStream', inputs: [{name: 'array1', type: 'vector_real', size: null}, {name: 'array2', type: 'vector_real', size: null}], outputs: ['array']},
+  {name: 'BpmHistogram', inputs: [{name: 'novelty', type: 'vector_real', size: null}], outputs: ['bpm', 'bpmCandidates', 'bpmMagnitudes', 'tempogram', 'frameBpms', 'ticks', 'ticksMagnitude', 'sinusoid']},
+  {name: 'BpmHistogramDescriptors', inputs: [{name: 'bpmIntervals', type: 'vector_real', size: null}], outputs: ['firstPeakBPM', 'firstPeakWeight', 'firstPeakSpread', 'secondPeakBPM', 'secondPeakWeight', 'secondPeakSpread', 'histogram']},
+  {name: 'BpmRubato', inputs: [{name: 'beats', type: 'vector_real', size: null}], outputs: ['rubatoStart', 'rubatoStop', 'rubatoNumber']},
+  {name: 'CartesianToPolar', inputs: [{name: 'complex', type: 'vector_complex', size: null}], outputs: ['magnitude', 'phase']},
+  {name: 'CentralMoments', inputs: [{name: 'array', type: 'vector_real', size: null}], outputs: ['centralMoments']},
+  {name: 'Centroid', inputs: [{name: 'array', type: 'vector_real', size: null}], outputs: ['centroid']},
+  {name: 'ChordsDescriptors', inputs: [{name: 'chords', type: 'vector_string', size: null}, {name: 'key', type: 'string', size: null}, {name: 'scale', type: 'string', size: null}], outputs: ['chordsHistogram', 'chordsNumberRate', 'chordsChangesRate', 'chordsKey', 'chordsScale']},
+  {name: 'ChordsDetection', inputs: [{name: 'pcp', type: 'vector_vector_real', size: null}], outputs: ['chords', 'strength']},
+  {name: 'ChordsDetectionBeats', inputs: [{name: 'pcp', type: 'vector_vector_real', size: null}, {name: 'ticks', type: 'vector_real', size: null}], outputs: ['chords', 'strength']},
+  {name: 'ChromaCrossSimilarity', inputs: [{name: 'queryFeature', type: 'vector_vector_real', size: null}, {name: 'referenceFeature', type: 'vector_vector_real', size: null}], outputs: ['csm']},
+  {name: 'Chromagram', inputs: [{name: 'frame', type: 'vector_real', size: null}], outputs: ['chromagram']},
+  {name: 'ClickDetector', inputs: [{name: 'frame', type: 'vector_real', size: 512}], outputs: ['starts', 'ends']},
+  {name: 'Clipper', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['signal']},
+  {name: 'ConstantQ', inputs: [{name: 'frame', type: 'vector_real', size: null}], outputs: ['constantq']},
+  {name: 'CoverSongSimilarity', inputs: [{name: 'inputArray', type: 'vector_vector_real', size: null}], outputs: ['scoreMatrix', 'distance']},
+  {name: 'Crest', inputs: [{name: 'array', type: 'vector_real', size: null}], outputs: ['crest']},
+  {name: 'CrossCorrelation', inputs: [{name: 'arrayX', type: 'vector_real', size: null}, {name: 'arrayY', type: 'vector_real', size: null}], outputs: ['crossCorrelation']},
+  {name: 'CrossSimilarityMatrix', inputs: [{name: 'queryFeature', type: 'vector_vector_real', size: null}, {name: 'referenceFeature', type: 'vector_vector_real', size: null}], outputs: ['csm']},
+  {name: 'CubicSpline', inputs: [{name: 'x', type: 'real', size: null}], outputs: ['y', 'dy', 'ddy']},
+  {name: 'DCRemoval', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['signal']},
+  {name: 'DCT', inputs: [{name: 'array', type: 'vector_real', size: null}], outputs: ['dct']},
+  {name: 'Danceability', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['danceability', 'dfa']},
+  {name: 'Decrease', inputs: [{name: 'array', type: 'vector_real', size: null}], outputs: ['decrease']},
+  {name: 'Derivative', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['signal']},
+  {name: 'DerivativeSFX', inputs: [{name: 'envelope', type: 'vector_real', size: null}], outputs: ['derAvAfterMax', 'maxDerBeforeMax']},
+  {name: 'DiscontinuityDetector', inputs: [{name: 'frame', type: 'vector_real', size: 512}], outputs: ['discontinuityLocations', 'discontinuityAmplitudes']},
+  {name: 'Dissonance', inputs: [{name: 'frequencies', type: 'vector_real', size: null}, {name: 'magnitudes', type: 'vector_real', size: null}], outputs: ['dissonance']},
+  {name: 'DistributionShape', inputs: [{name: 'centralMoments', type: 'vector_real', size: null}], outputs: ['spread', 'skewness', 'kurtosis']},
+  {name: 'Duration', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['duration']},
+  {name: 'DynamicComplexity', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['dynamicComplexity', 'loudness']},
+  {name: 'ERBBands', inputs: [{name: 'spectrum', type: 'vector_real', size: 1025}], outputs: ['bands']},
+  {name: 'EffectiveDuration', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['effectiveDuration']},
+  {name: 'Energy', inputs: [{name: 'array', type: 'vector_real', size: null}], outputs: ['energy']},
+  {name: 'EnergyBand', inputs: [{name: 'spectrum', type: 'vector_real', size: null}], outputs: ['energyBand']},
+  {name: 'EnergyBandRatio', inputs: [{name: 'spectrum', type: 'vector_real', size: null}], outputs: ['energyBandRatio']},
+  {name: 'Entropy', inputs: [{name: 'array', type: 'vector_real', size: null}], outputs: ['entropy']},
+  {name: 'Envelope', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['signal']},
+  {name: 'EqualLoudness', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['signal']},
+  {name: 'FFT', inputs: [{name: 'frame', type: 'vector_real', size: 1024}], outputs: ['fft']},
+  {name: 'FFTC', inputs: [{name: 'frame', type: 'vector_complex', size: 1024}], outputs: ['fft']},
+  {name: 'FadeDetection', inputs: [{name: 'rms', type: 'vector_real', size: null}], outputs: ['fadeIn', 'fadeOut']},
+  {name: 'FalseStereoDetector', inputs: [{name: 'frame', type: 'vector_stereosample', size: null}], outputs: ['isFalseStereo', 'correlation']},
+  {name: 'Flatness', inputs: [{name: 'array', type: 'vector_real', size: null}], outputs: ['flatness']},
+  {name: 'FlatnessDB', inputs: [{name: 'array', type: 'vector_real', size: null}], outputs: ['flatnessDB']},
+  {name: 'FlatnessSFX', inputs: [{name: 'envelope', type: 'vector_real', size: null}], outputs: ['flatness']},
+  {name: 'Flux', inputs: [{name: 'spectrum', type: 'vector_real', size: null}], outputs: ['flux']},
+  {name: 'FrameCutter', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['frame']},
+  {name: 'FrameToReal', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['signal']},
+  {name: 'FrequencyBands', inputs: [{name: 'spectrum', type: 'vector_real', size: null}], outputs: ['bands']},
+  {name: 'GFCC', inputs: [{name: 'spectrum', type: 'vector_real', size: 1025}], outputs: ['bands', 'gfcc']},
+  {name: 'GapsDetector', inputs: [{name: 'frame', type: 'vector_real', size: 2048}], outputs: ['starts', 'ends']},
+  {name: 'GeometricMean', inputs: [{name: 'array', type: 'vector_real', size: null}], outputs: ['geometricMean']},
+  {name: 'HFC', inputs: [{name: 'spectrum', type: 'vector_real', size: null}], outputs: ['hfc']},
+  {name: 'HPCP', inputs: [{name: 'frequencies', type: 'vector_real', size: null}, {name: 'magnitudes', type: 'vector_real', size: null}], outputs: ['hpcp']},
+  {name: 'HarmonicBpm', inputs: [{name: 'bpms', type: 'vector_real', size: null}], outputs: ['harmonicBpms']},
+  {name: 'HarmonicMask', inputs: [{name: 'fft', type: 'vector_complex', size: null}, {name: 'pitch', type: 'real', size: null}], outputs: ['fft']},
+  {name: 'HarmonicModelAnal', inputs: [{name: 'fft', type: 'vector_complex', size: null}, {name: 'pitch', type: 'real', size: null}], outputs: ['frequencies', 'magnitudes', 'phases']},
+  {name: 'HarmonicPeaks', inputs: [{name: 'frequencies', type: 'vector_real', size: null}, {name: 'magnitudes', type: 'vector_real', size: null}, {name: 'pitch', type: 'real', size: null}], outputs: ['harmonicFrequencies', 'harmonicMagnitudes']},
+  {name: 'HighPass', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['signal']},
+  {name: 'HighResolutionFeatures', inputs: [{name: 'hpcp', type: 'vector_real', size: null}], outputs: ['equalTemperedDeviation', 'nonTemperedEnergyRatio', 'nonTemperedPeaksEnergyRatio']},
+  {name: 'Histogram', inputs: [{name: 'array', type: 'vector_real', size: null}], outputs: ['histogram', 'binEdges']},
+  {name: 'HprModelAnal', inputs: [{name: 'frame', type: 'vector_real', size: null}, {name: 'pitch', type: 'real', size: null}], outputs: ['frequencies', 'magnitudes', 'phases', 'res']},
+  {name: 'HpsModelAnal', inputs: [{name: 'frame', type: 'vector_real', size: null}, {name: 'pitch', type: 'real', size: null}], outputs: ['frequencies', 'magnitudes', 'phases', 'stocenv']},
+  {name: 'HumDetector', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['r', 'frequencies', 'saliences', 'starts', 'ends']},
+  {name: 'IDCT', inputs: [{name: 'dct', type: 'vector_real', size: null}], outputs: ['idct']},
+  {name: 'IFFT', inputs: [{name: 'fft', type: 'vector_complex', size: null}], outputs: ['frame']},
+  {name: 'IFFTC', inputs: [{name: 'fft', type: 'vector_complex', size: null}], outputs: ['frame']},
+  {name: 'IIR', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['signal']},
+  {name: 'Inharmonicity', inputs: [{name: 'frequencies', type: 'vector_real', size: null}, {name: 'magnitudes', type: 'vector_real', size: null}], outputs: ['inharmonicity']},
+  {name: 'InstantPower', inputs: [{name: 'array', type: 'vector_real', size: null}], outputs: ['power']},
+  {name: 'Intensity', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['intensity']},
+  {name: 'Key', inputs: [{name: 'pcp', type: 'vector_real', size: 36}], outputs: ['key', 'scale', 'strength', 'firstToSecondRelativeStrength']},
+  {name: 'KeyExtractor', inputs: [{name: 'audio', type: 'vector_real', size: null}], outputs: ['key', 'scale', 'strength']},
+  {name: 'LPC', inputs: [{name: 'frame', type: 'vector_real', size: null}], outputs: ['lpc', 'reflection']},
+  {name: 'Larm', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['larm']},
+  {name: 'Leq', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['leq']},
+  {name: 'LevelExtractor', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['loudness']},
+  {name: 'LogAttackTime', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['logAttackTime', 'attackStart', 'attackStop']},
+  {name: 'LogSpectrum', inputs: [{name: 'spectrum', type: 'vector_real', size: 513}], outputs: ['logFreqSpectrum', 'meanTuning', 'localTuning']},
+  {name: 'LoopBpmConfidence', inputs: [{name: 'signal', type: 'vector_real', size: null}, {name: 'bpmEstimate', type: 'real', size: null}], outputs: ['confidence']},
+  {name: 'LoopBpmEstimator', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['bpm']},
+  {name: 'Loudness', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['loudness']},
+  {name: 'LoudnessVickers', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['loudness']},
+  {name: 'LowLevelSpectralEqloudExtractor', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['dissonance', 'sccoeffs', 'scvalleys', 'spectral_centroid', 'spectral_kurtosis', 'spectral_skewness', 'spectral_spread']},
+  {name: 'LowLevelSpectralExtractor', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['barkbands', 'barkbands_kurtosis', 'barkbands_skewness', 'barkbands_spread', 'hfc', 'mfcc', 'pitch', 'pitch_instantaneous_confidence', 'pitch_salience', 'silence_rate_20dB', 'silence_rate_30dB', 'silence_rate_60dB', 'spectral_complexity', 'spectral_crest', 'spectral_decrease', 'spectral_energy', 'spectral_energyband_low', 'spectral_energyband_middle_low', 'spectral_energyband_middle_high', 'spectral_energyband_high', 'spectral_flatness_db', 'spectral_flux', 'spectral_rms', 'spectral_rolloff', 'spectral_strongpeak', 'zerocrossingrate', 'inharmonicity', 'tristimulus', 'oddtoevenharmonicenergyratio']},
+  {name: 'LowPass', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['signal']},
+  {name: 'MFCC', inputs: [{name: 'spectrum', type: 'vector_real', size: 1025}], outputs: ['bands', 'mfcc']},
+  {name: 'Magnitude', inputs: [{name: 'complex', type: 'vector_complex', size: null}], outputs: ['magnitude']},
+  {name: 'MaxFilter', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['signal']},
+  {name: 'MaxMagFreq', inputs: [{name: 'spectrum', type: 'vector_real', size: null}], outputs: ['maxMagFreq']},
+  {name: 'MaxToTotal', inputs: [{name: 'envelope', type: 'vector_real', size: null}], outputs: ['maxToTotal']},
+  {name: 'Mean', inputs: [{name: 'array', type: 'vector_real', size: null}], outputs: ['mean']},
+  {name: 'Median', inputs: [{name: 'array', type: 'vector_real', size: null}], outputs: ['median']},
+  {name: 'MedianFilter', inputs: [{name: 'array', type: 'vector_real', size: null}], outputs: ['filteredArray']},
+  {name: 'MelBands', inputs: [{name: 'spectrum', type: 'vector_real', size: 1025}], outputs: ['bands']},
+  {name: 'Meter', inputs: [{name: 'beatogram', type: 'vector_vector_real', size: null}], outputs: ['meter']},
+  {name: 'MinMax', inputs: [{name: 'array', type: 'vector_real', size: null}], outputs: ['real', 'int']},
+  {name: 'MinToTotal', inputs: [{name: 'envelope', type: 'vector_real', size: null}], outputs: ['minToTotal']},
+  {name: 'MovingAverage', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['signal']},
+  {name: 'MultiPitchKlapuri', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['pitch']},
+  {name: 'MultiPitchMelodia', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['pitch']},
+  {name: 'Multiplexer', inputs: [], outputs: ['data']},
+  {name: 'NNLSChroma', inputs: [{name: 'logSpectrogram', type: 'vector_vector_real', size: null}, {name: 'meanTuning', type: 'vector_real', size: null}, {name: 'localTuning', type: 'vector_real', size: null}], outputs: ['tunedLogfreqSpectrum', 'semitoneSpectrum', 'bassChromagram', 'chromagram']},
+  {name: 'NoiseAdder', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['signal']},
+  {name: 'NoiseBurstDetector', inputs: [{name: 'frame', type: 'vector_real', size: null}], outputs: ['indexes']},
+  {name: 'NoveltyCurve', inputs: [{name: 'frequencyBands', type: 'vector_vector_real', size: null}], outputs: ['novelty']},
+  {name: 'NoveltyCurveFixedBpmEstimator', inputs: [{name: 'novelty', type: 'vector_real', size: null}], outputs: ['bpms', 'amplitudes']},
+  {name: 'OddToEvenHarmonicEnergyRatio', inputs: [{name: 'frequencies', type: 'vector_real', size: null}, {name: 'magnitudes', type: 'vector_real', size: null}], outputs: ['oddToEvenHarmonicEnergyRatio']},
+  {name: 'OnsetDetection', inputs: [{name: 'spectrum', type: 'vector_real', size: null}, {name: 'phase', type: 'vector_real', size: null}], outputs: ['onsetDetection']},
+  {name: 'OnsetDetectionGlobal', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['onsetDetections']},
+  {name: 'OnsetRate', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['onsets', 'onsetRate']},
+  {name: 'Onsets', inputs: [{name: 'detections', type: 'matrix_real', size: null}, {name: 'weights', type: 'vector_real', size: null}], outputs: ['onsets']},
+  {name: 'OverlapAdd', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['signal']},
+  {name: 'Panning', inputs: [{name: 'spectrumLeft', type: 'vector_real', size: null}, {name: 'spectrumRight', type: 'vector_real', size: null}], outputs: ['panningCoeffs']},
+  {name: 'PeakDetection', inputs: [{name: 'array', type: 'vector_real', size: null}], outputs: ['positions', 'amplitudes']},
+  {name: 'PercivalBpmEstimator', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['bpm']},
+  {name: 'PercivalEnhanceHarmonics', inputs: [{name: 'array', type: 'vector_real', size: null}], outputs: ['array']},
+  {name: 'PercivalEvaluatePulseTrains', inputs: [{name: 'oss', type: 'vector_real', size: null}, {name: 'positions', type: 'vector_real', size: null}], outputs: ['lag']},
+  {name: 'PitchContourSegmentation', inputs: [{name: 'pitch', type: 'vector_real', size: null}, {name: 'signal', type: 'vector_real', size: null}], outputs: ['onset', 'duration', 'MIDIpitch']},
+  {name: 'PitchContours', inputs: [{name: 'peakBins', type: 'vector_vector_real', size: null}, {name: 'peakSaliences', type: 'vector_vector_real', size: null}], outputs: ['contoursBins', 'contoursSaliences', 'contoursStartTimes', 'duration']},
+  {name: 'PitchContoursMelody', inputs: [{name: 'contoursBins', type: 'vector_vector_real', size: null}, {name: 'contoursSaliences', type: 'vector_vector_real', size: null}, {name: 'contoursStartTimes', type: 'vector_real', size: null}, {name: 'duration', type: 'real', size: null}], outputs: ['pitch', 'pitchConfidence']},
+  {name: 'PitchContoursMonoMelody', inputs: [{name: 'contoursBins', type: 'vector_vector_real', size: null}, {name: 'contoursSaliences', type: 'vector_vector_real', size: null}, {name: 'contoursStartTimes', type: 'vector_real', size: null}, {name: 'duration', type: 'real', size: null}], outputs: ['pitch', 'pitchConfidence']},
+  {name: 'PitchContoursMultiMelody', inputs: [{name: 'contoursBins', type: 'vector_vector_real', size: null}, {name: 'contoursSaliences', type: 'vector_vector_real', size: null}, {name: 'contoursStartTimes', type: 'vector_real', size: null}, {name: 'duration', type: 'real', size: null}], outputs: ['pitch']},
+  {name: 'PitchFilter', inputs: [{name: 'pitch', type: 'vector_real', size: null}, {name: 'pitchConfidence', type: 'vector_real', size: null}], outputs: ['pitchFiltered']},
+  {name: 'PitchMelodia', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['pitch', 'pitchConfidence']},
+  {name: 'PitchSalience', inputs: [{name: 'spectrum', type: 'vector_real', size: null}], outputs: ['pitchSalience']},
+  {name: 'PitchSalienceFunction', inputs: [{name: 'frequencies', type: 'vector_real', size: null}, {name: 'magnitudes', type: 'vector_real', size: null}], outputs: ['salienceFunction']},
+  {name: 'PitchSalienceFunctionPeaks', inputs: [{name: 'salienceFunction', type: 'vector_real', size: null}], outputs: ['salienceBins', 'salienceValues']},
+  {name: 'PitchYin', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['pitch', 'pitchConfidence']},
+  {name: 'PitchYinFFT', inputs: [{name: 'spectrum', type: 'vector_real', size: 1025}], outputs: ['pitch', 'pitchConfidence']},
+  {name: 'PitchYinProbabilistic', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['pitch', 'voicedProbabilities']},
+  {name: 'PitchYinProbabilities', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['pitch', 'probabilities', 'RMS']},
+  {name: 'PitchYinProbabilitiesHMM', inputs: [{name: 'pitchCandidates', type: 'vector_vector_real', size: null}, {name: 'probabilities', type: 'vector_vector_real', size: null}], outputs: ['pitch']},
+  {name: 'PolarToCartesian', inputs: [{name: 'magnitude', type: 'vector_real', size: null}, {name: 'phase', type: 'vector_real', size: null}], outputs: ['complex']},
+  {name: 'PowerMean', inputs: [{name: 'array', type: 'vector_real', size: null}], outputs: ['powerMean']},
+  {name: 'PowerSpectrum', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['powerSpectrum']},
+  {name: 'PredominantPitchMelodia', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['pitch', 'pitchConfidence']},
+  {name: 'RMS', inputs: [{name: 'array', type: 'vector_real', size: null}], outputs: ['rms']},
+  {name: 'RawMoments', inputs: [{name: 'array', type: 'vector_real', size: null}], outputs: ['rawMoments']},
+  {name: 'ReplayGain', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['replayGain']},
+  {name: 'Resample', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['signal']},
+  {name: 'ResampleFFT', inputs: [{name: 'input', type: 'vector_real', size: null}], outputs: ['output']},
+  {name: 'RhythmDescriptors', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['beats_position', 'confidence', 'bpm', 'bpm_estimates', 'bpm_intervals', 'first_peak_bpm', 'first_peak_spread', 'first_peak_weight', 'second_peak_bpm', 'second_peak_spread', 'second_peak_weight', 'histogram']},
+  {name: 'RhythmExtractor', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['bpm', 'ticks', 'estimates', 'bpmIntervals']},
+  {name: 'RhythmExtractor2013', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['bpm', 'ticks', 'confidence', 'estimates', 'bpmIntervals']},
+  {name: 'RhythmTransform', inputs: [{name: 'melBands', type: 'vector_vector_real', size: null}], outputs: ['rhythm']},
+  {name: 'RollOff', inputs: [{name: 'spectrum', type: 'vector_real', size: null}], outputs: ['rollOff']},
+  {name: 'SBic', inputs: [{name: 'features', type: 'matrix_real', size: null}], outputs: ['segmentation']},
+  {name: 'SNR', inputs: [{name: 'frame', type: 'vector_real', size: 512}], outputs: ['instantSNR', 'averagedSNR', 'spectralSNR']},
+  {name: 'SaturationDetector', inputs: [{name: 'frame', type: 'vector_real', size: 512}], outputs: ['starts', 'ends']},
+  {name: 'Scale', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['signal']},
+  {name: 'SineModelAnal', inputs: [{name: 'fft', type: 'vector_complex', size: null}], outputs: ['frequencies', 'magnitudes', 'phases']},
+  {name: 'SineModelSynth', inputs: [{name: 'magnitudes', type: 'vector_real', size: null}, {name: 'frequencies', type: 'vector_real', size: null}, {name: 'phases', type: 'vector_real', size: null}], outputs: ['fft']},
+  {name: 'SineSubtraction', inputs: [{name: 'frame', type: 'vector_real', size: null}, {name: 'magnitudes', type: 'vector_real', size: null}, {name: 'frequencies', type: 'vector_real', size: null}, {name: 'phases', type: 'vector_real', size: null}], outputs: ['frame']},
+  {name: 'SingleBeatLoudness', inputs: [{name: 'beat', type: 'vector_real', size: null}], outputs: ['loudness', 'loudnessBandRatio']},
+  {name: 'SingleGaussian', inputs: [{name: 'matrix', type: 'matrix_real', size: null}], outputs: ['mean', 'covariance', 'inverseCovariance']},
+  {name: 'Slicer', inputs: [{name: 'audio', type: 'vector_real', size: null}], outputs: ['frame']},
+  {name: 'SpectralCentroidTime', inputs: [{name: 'array', type: 'vector_real', size: null}], outputs: ['centroid']},
+  {name: 'SpectralComplexity', inputs: [{name: 'spectrum', type: 'vector_real', size: null}], outputs: ['spectralComplexity']},
+  {name: 'SpectralContrast', inputs: [{name: 'spectrum', type: 'vector_real', size: 1025}], outputs: ['spectralContrast', 'spectralValley']},
+  {name: 'SpectralPeaks', inputs: [{name: 'spectrum', type: 'vector_real', size: null}], outputs: ['frequencies', 'magnitudes']},
+  {name: 'SpectralWhitening', inputs: [{name: 'spectrum', type: 'vector_real', size: null}, {name: 'frequencies', type: 'vector_real', size: null}, {name: 'magnitudes', type: 'vector_real', size: null}], outputs: ['magnitudes']},
+  {name: 'Spectrum', inputs: [{name: 'frame', type: 'vector_real', size: 2048}], outputs: ['spectrum']},
+  {name: 'SpectrumCQ', inputs: [{name: 'frame', type: 'vector_real', size: null}], outputs: ['spectrumCQ']},
+  {name: 'SpectrumToCent', inputs: [{name: 'spectrum', type: 'vector_real', size: 32768}], outputs: ['bands', 'frequencies']},
+  {name: 'Spline', inputs: [{name: 'x', type: 'real', size: null}], outputs: ['y']},
+  {name: 'SprModelAnal', inputs: [{name: 'frame', type: 'vector_real', size: null}], outputs: ['frequencies', 'magnitudes', 'phases', 'res']},
+  {name: 'SprModelSynth', inputs: [{name: 'magnitudes', type: 'vector_real', size: null}, {name: 'frequencies', type: 'vector_real', size: null}, {name: 'phases', type: 'vector_real', size: null}, {name: 'res', type: 'vector_real', size: null}], outputs: ['frame', 'sineframe', 'resframe']},
+  {name: 'SpsModelAnal', inputs: [{name: 'frame', type: 'vector_real', size: null}], outputs: ['frequencies', 'magnitudes', 'phases', 'stocenv']},
+  {name: 'SpsModelSynth', inputs: [{name: 'magnitudes', type: 'vector_real', size: null}, {name: 'frequencies', type: 'vector_real', size: null}, {name: 'phases', type: 'vector_real', size: null}, {name: 'stocenv', type: 'vector_real', size: null}], outputs: ['frame', 'sineframe', 'stocframe']},
+  {name: 'StartStopCut', inputs: [{name: 'audio', type: 'vector_real', size: null}], outputs: ['startCut', 'stopCut']},
+  {name: 'StartStopSilence', inputs: [{name: 'frame', type: 'vector_real', size: null}], outputs: ['startFrame', 'stopFrame']},
+  {name: 'StereoDemuxer', inputs: [{name: 'audio', type: 'vector_stereosample', size: null}], outputs: ['left', 'right']},
+  {name: 'StereoMuxer', inputs: [{name: 'left', type: 'vector_real', size: null}, {name: 'right', type: 'vector_real', size: null}], outputs: ['audio']},
+  {name: 'StereoTrimmer', inputs: [{name: 'signal', type: 'vector_stereosample', size: null}], outputs: ['signal']},
+  {name: 'StochasticModelAnal', inputs: [{name: 'frame', type: 'vector_real', size: null}], outputs: ['stocenv']},
+  {name: 'StochasticModelSynth', inputs: [{name: 'stocenv', type: 'vector_real', size: null}], outputs: ['frame']},
+  {name: 'StrongDecay', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['strongDecay']},
+  {name: 'StrongPeak', inputs: [{name: 'spectrum', type: 'vector_real', size: null}], outputs: ['strongPeak']},
+  {name: 'SuperFluxExtractor', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['onsets']},
+  {name: 'SuperFluxNovelty', inputs: [{name: 'bands', type: 'vector_vector_real', size: null}], outputs: ['differences']},
+  {name: 'SuperFluxPeaks', inputs: [{name: 'novelty', type: 'vector_real', size: null}], outputs: ['peaks']},
+  {name: 'TCToTotal', inputs: [{name: 'envelope', type: 'vector_real', size: null}], outputs: ['TCToTotal']},
+  {name: 'TempoScaleBands', inputs: [{name: 'bands', type: 'vector_real', size: null}], outputs: ['scaledBands', 'cumulativeBands']},
+  {name: 'TempoTap', inputs: [{name: 'featuresFrame', type: 'vector_real', size: null}], outputs: ['periods', 'phases']},
+  {name: 'TempoTapDegara', inputs: [{name: 'onsetDetections', type: 'vector_real', size: null}], outputs: ['ticks']},
+  {name: 'TempoTapMaxAgreement', inputs: [{name: 'tickCandidates', type: 'vector_vector_real', size: null}], outputs: ['ticks', 'confidence']},
+  {name: 'TempoTapTicks', inputs: [{name: 'periods', type: 'vector_real', size: null}, {name: 'phases', type: 'vector_real', size: null}], outputs: ['ticks', 'matchingPeriods']},
+  {name: 'TensorflowInputMusiCNN', inputs: [{name: 'frame', type: 'vector_real', size: null}], outputs: ['bands']},
+  {name: 'TensorflowInputVGGish', inputs: [{name: 'frame', type: 'vector_real', size: null}], outputs: ['bands']},
+  {name: 'TonalExtractor', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['chords_changes_rate', 'chords_histogram', 'chords_key', 'chords_number_rate', 'chords_progression', 'chords_scale', 'chords_strength', 'hpcp', 'hpcp_highres', 'key_key', 'key_scale', 'key_strength']},
+  {name: 'TonicIndianArtMusic', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['tonic']},
+  {name: 'TriangularBands', inputs: [{name: 'spectrum', type: 'vector_real', size: 1025}], outputs: ['bands']},
+  {name: 'TriangularBarkBands', inputs: [{name: 'spectrum', type: 'vector_real', size: 1025}], outputs: ['bands']},
+  {name: 'Trimmer', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['signal']},
+  {name: 'Tristimulus', inputs: [{name: 'frequencies', type: 'vector_real', size: null}, {name: 'magnitudes', type: 'vector_real', size: null}], outputs: ['tristimulus']},
+  {name: 'TruePeakDetector', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['peakLocations', 'output']},
+  {name: 'TuningFrequency', inputs: [{name: 'frequencies', type: 'vector_real', size: null}, {name: 'magnitudes', type: 'vector_real', size: null}], outputs: ['tuningFrequency', 'tuningCents']},
+  {name: 'TuningFrequencyExtractor', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['tuningFrequency']},
+  {name: 'UnaryOperator', inputs: [{name: 'array', type: 'vector_real', size: null}], outputs: ['array']},
+  {name: 'UnaryOperatorStream', inputs: [{name: 'array', type: 'vector_real', size: null}], outputs: ['array']},
+  {name: 'Variance', inputs: [{name: 'array', type: 'vector_real', size: null}], outputs: ['variance']},
+  {name: 'Vibrato', inputs: [{name: 'pitch', type: 'vector_real', size: null}], outputs: ['vibratoFrequency', 'vibratoExtend']},
+  {name: 'WarpedAutoCorrelation', inputs: [{name: 'array', type: 'vector_real', size: null}], outputs: ['warpedAutoCorrelation']},
+  {name: 'Welch', inputs: [{name: 'frame', type: 'vector_real', size: 512}], outputs: ['psd']},
+  {name: 'Windowing', inputs: [{name: 'frame', type: 'vector_real', size: 1024}], outputs: ['frame']},
+  {name: 'ZeroCrossingRate', inputs: [{name: 'signal', type: 'vector_real', size: null}], outputs: ['zeroCrossingRate']},
+];
@@ -0,0 +1,222 @@
+// WASM-vs-native parity report of the essentia.js algorithms.
+// The fixtures written by `python configure_bindings.py --parity-fixtures fixtures.json` (see
+// src/python/parity_fixtures.py) hold the synthetic inputs of each included algorithm along with the outputs and
+// the mean compute time of the native essentia python bindings. Each algorithm is computed again with the same
+// inputs and default parameters by the WASM backend, and we report the slowdown of its compute time (and of the
+// compute and marshalling time) over the native one along with the maximum deviation of its outputs, ie. the
+// maximum absolute difference and the same difference relative to the peak magnitude of the native output.
+// The compute time of the WASM backend is the one recorded by a profiled build (`configure_bindings.py --profiling`),
+// otherwise the time of the whole call of the algorithm method, including its conversions inside WASM (see run.js).
+//
+// usage: node benchmarks/parity.js --fixtures fixtures.json [options]
+//   --algorithms MFCC,HPCP   only compare the given algorithms (default: all the algorithms of the fixtures)
+//   --time 200               minimum measuring time of each algorithm in ms (default: 200)
+//   --cache 16               algorithm cache size of the essentia instance, ie. 16 to measure the compute time of a
+//                            configured algorithm like the native one (default: 16)
+//   --tolerance 0.001        relative deviation of the outputs which is flagged as a mismatch (default: 0.001)
+//   --output report.json     write the report to a JSON file
+// The process exits with 1 if the outputs of an algorithm mismatch the native ones.
+
+var fs = require('fs');
+var esLib = require('../index');
+var {benchmark, marshalInput, unmarshalOutput, isVector} = require('./run');
+
+// version of the layout of the fixtures file (see PARITY_FIXTURES_FORMAT_VERSION in parity_fixtures.py)
+const FIXTURES_FORMAT_VERSION = 1;
+
+const DEFAULT_OPTIONS = {
+  fixtures: null,
+  algorithms: null,
+  time: 200,
+  cache: 16,
+  tolerance: 0.001,
+  output: null
+};
+
+function parseOptions(argv) {
+  const options = Object.assign({}, DEFAULT_OPTIONS);
+  for (let i=0; i<argv.length; i+=2) {
+    const key = argv[i].replace(/^--/, '');
+    if (!(key in DEFAULT_OPTIONS) || i + 1 >= argv.length) {
+      throw new Error(`Invalid option '${argv[i]}', see the usage in benchmarks/parity.js`);
+    }
+    const value = argv[i + 1];
+    if (key === 'algorithms') options.algorithms = value.split(',');
+    else if (typeof DEFAULT_OPTIONS[key] === 'number') options[key] = Number(value);
+    else options[key] = value;
+  }
+  if (!options.fixtures) {
+    throw new Error('Missing the --fixtures file, see the usage in benchmarks/parity.js');
+  }
+  return options;
+}
+
+// convert an input of the fixtures to the JS data of the benchmark runner (see `syntheticInput` in run.js)
+function fixtureInput(input) {
+  switch (input.type) {
+    case 'vector_real':
+    case 'vector_complex':
+    case 'vector_stereosample':
+      return Float32Array.from(input.value);
+    case 'vector_vector_real':
+    case 'matrix_real':
+      return {data: Float32Array.from(input.value.data), shape: input.value.shape};
+    default:
+      return input.value;
+  }
+}
+
+// returns the numeric values of an output of the WASM backend (once converted to JS by `unmarshalOutput`)
+function flattenOutput(value) {
+  if (typeof value === 'number' || typeof value === 'boolean') return [Number(value)];
+  if (ArrayBuffer.isView(value)) return Array.from(value);
+  if (Array.isArray(value)) return [].concat(...value.map(flattenOutput));
+  // row-major matrices
+  return Array.from(value.data);
+}
+
+function difference(wasm, native) {
+  if (wasm === native || (Number.isNaN(wasm) && Number.isNaN(native))) return 0;
+  if (!Number.isFinite(wasm) || !Number.isFinite(native)) return Infinity;
+  return Math.abs(wasm - native);
+}
+
+// compare an output of the WASM backend with the native one of the fixtures
+function deviation(wasm, native) {
+  if (!('data' in native)) {
+    const equal = JSON.stringify(wasm) === JSON.stringify(native.value);
+    return equal ? {maxAbsDeviation: 0, maxRelDeviation: 0} : {mismatch: 'different values'};
+  }
+  const values = flattenOutput(wasm);
+  // the non-finite values are stored as strings
+  const expected = native.data.map(Number);
+  if (values.length !== expected.length) {
+    return {mismatch: `${values.length} values instead of ${expected.length}`};
+  }
+  let maxAbsDeviation = 0;
+  let peak = 0;
+  for (let i=0; i<values.length; i++) {
+    maxAbsDeviation = Math.max(maxAbsDeviation, difference(values[i], expected[i]));
+    if (Number.isFinite(expected[i])) peak = Math.max(peak, Math.abs(expected[i]));
+  }
+  return {
+    maxAbsDeviation: maxAbsDeviation,
+    maxRelDeviation: maxAbsDeviation === 0 ? 0 : maxAbsDeviation / Math.max(peak, Number.MIN_VALUE)
+  };
+}
+
+function compareOutputs(essentia, name, fixture, inputs) {
+  const args = fixture.inputs.map((input, i) => marshalInput(essentia, input, inputs[i]));
+  const outputs = essentia[name].apply(essentia, args);
+  args.forEach((arg) => { if (isVector(arg)) arg.delete(); });
+  const deviations = {};
+  for (const output in fixture.outputs) {
+    deviations[output] = deviation(unmarshalOutput(essentia, outputs[output]), fixture.outputs[output]);
+  }
+  return deviations;
+}
+
+function parity(essentia, name, fixture, options) {
+  const inputs = fixture.inputs.map(fixtureInput);
+  // the outputs of the first call of a newly configured algorithm, like the native ones
+  const outputs = compareOutputs(essentia, name, fixture, inputs);
+  const benchmarkCase = {name: name, inputs: fixture.inputs, outputs: Object.keys(fixture.outputs)};
+  const result = benchmark(essentia, benchmarkCase, {time: options.time}, inputs);
+  const mismatches = Object.keys(outputs).filter((output) => {
+    return 'mismatch' in outputs[output] || !(outputs[output].maxRelDeviation <= options.tolerance);
+  });
+  // the compute time of a profiled build or the call time
+  const computeMs = 'computeMs' in result ? result.computeMs : result.callMs;
+  return {
+    nativeMs: fixture.nativeMs,
+    computeMs: computeMs,
+    callMs: result.callMs,
+    marshalMs: result.marshalMs,
+    slowdown: computeMs / fixture.nativeMs,
+    totalSlowdown: (result.callMs + result.marshalMs) / fixture.nativeMs,
+    maxAbsDeviation: Math.max(0, ...Object.values(outputs).map((d) => 'mismatch' in d ? Infinity : d.maxAbsDeviation)),
+    maxRelDeviation: Math.max(0, ...Object.values(outputs).map((d) => 'mismatch' in d ? Infinity : d.maxRelDeviation)),
+    outputs: outputs,
+    mismatches: mismatches
+  };
+}
+
+function formatResult(name, result) {
+  if (result.error) return `${name}: failed (${result.error})`;
+  return `${name}: ${result.slowdown.toFixed(2)}x slowdown (native ${result.nativeMs.toFixed(4)} ms, ` +
+         `wasm ${result.computeMs.toFixed(4)} ms, call ${result.callMs.toFixed(4)} ms + marshal ${result.marshalMs.toFixed(4)} ms), ` +
+         `max deviation ${result.maxAbsDeviation.toExponential(2)} (relative ${result.maxRelDeviation.toExponential(2)})` +
+         (result.mismatches.length ? ` MISMATCH (${result.mismatches.join(', ')})` : '');
+}
+
+function run(fixtures, options) {
+  if (fixtures.formatVersion !== FIXTURES_FORMAT_VERSION) {
+    throw new Error(`Unsupported format version '${fixtures.formatVersion}' of the fixtures, expected ${FIXTURES_FORMAT_VERSION}`);
+  }
+  const essentia = new esLib.Essentia(esLib.EssentiaWASM, false, options.cache);
+  if (essentia.version !== fixtures.environment.essentiaVersion) {
+    console.log(`WARNING: the fixtures were computed with essentia ${fixtures.environment.essentiaVersion} ` +
+                `and the WASM backend is built with essentia ${essentia.version}\n`);
+  }
+  const results = {};
+  for (const name in fixtures.algorithms) {
+    if (options.algorithms && options.algorithms.indexOf(name) === -1) continue;
+    const fixture = fixtures.algorithms[name];
+    if (fixture.error) {
+      results[name] = {error: `native: ${fixture.error}`};
+    } else if (typeof essentia[name] !== 'function') {
+      results[name] = {error: 'not included in the WASM build'};
+    } else {
+      try {
+        results[name] = parity(essentia, name, fixture, options);
+      } catch (error) {
+        // essentia exceptions of the WASM backend are thrown as pointers
+        results[name] = {error: typeof error === 'number' ? 'essentia exception' : String(error.message || error)};
+      }
+    }
+    console.log(formatResult(name, results[name]));
+  }
+  essentia.delete();
+  return {
+    environment: {
+      essentiaVersion: essentia.version,
+      native: fixtures.environment,
+      node: process.version,
+      platform: `${process.platform}-${process.arch}`,
+      date: new Date().toISOString(),
+      profiled: essentia.isProfiled(),
+      time: options.time,
+      cache: options.cache,
+      tolerance: options.tolerance
+    },
+    results: results
+  };
+}
+
+// print the compared algorithms by decreasing slowdown along with the ones whose outputs mismatch
+function summarize(report) {
+  const compared = Object.keys(report.results).filter((name) => !report.results[name].error);
+  compared.sort((a, b) => report.results[b].slowdown - report.results[a].slowdown);
+  console.log(`\nSlowdown of the WASM backend over native essentia (${compared.length} algorithms):`);
+  for (const name of compared) {
+    const result = report.results[name];
+    console.log(`${name}: ${result.slowdown.toFixed(2)}x (with marshalling ${result.totalSlowdown.toFixed(2)}x)`);
+  }
+  const mismatches = compared.filter((name) => report.results[name].mismatches.length);
+  if (mismatches.length) {
+    console.log(`\n${mismatches.length} algorithms whose outputs deviate by more than ` +
+                `${report.environment.tolerance} from native essentia: ${mismatches.join(', ')}`);
+  }
+  return mismatches;
+}
+
+if (require.main === module) {
+  const options = parseOptions(process.argv.slice(2));
+  const report = run(JSON.parse(fs.readFileSync(options.fixtures)), options);
+  if (options.output) {
+    fs.writeFileSync(options.output, JSON.stringify(report, null, 2) + '\n');
+  }
+  if (summarize(report).length) process.exitCode = 1;
+}
+
+module.exports = {run, summarize, deviation, parseOptions};
@@ -0,0 +1,116 @@
+// Throughput benchmark of the EssentiaPool over an increasing number of workers.
+// Each call computes the batched variant of an algorithm (the spectra of `--frames` frames of a synthetic signal by
+// default) on one of the workers of the pool, which run their own essentia instance (see pool-worker.js). For each
+// number of workers we report the number of calls per second once the workers are instantiated, along with the
+// speedup over the first number of workers (a single worker by default) and the efficiency, ie. the speedup relative
+// to the increase of the number of workers (100% for a linear scaling).
+//
+// usage: node benchmarks/pool.js [options]
+//   --workers 1,2,4,8        numbers of workers of the measured pools (default: powers of 2 up to the number of cpus)
+//   --method SpectrumBatch   batched method of the Essentia class computed by each call (default: SpectrumBatch)
+//   --frames 256             number of frames of each call (default: 256)
+//   --frameSize 2048         number of samples of each frame (default: 2048)
+//   --calls 128              number of calls which are measured for each pool (default: 128)
+//   --output results.json    write the results to a JSON file
+
+var fs = require('fs');
+var os = require('os');
+var { Worker } = require('worker_threads');
+var esLib = require('../index');
+
+const DEFAULT_OPTIONS = {
+  workers: null,
+  method: 'SpectrumBatch',
+  frames: 256,
+  frameSize: 2048,
+  calls: 128,
+  output: null
+};
+
+function parseOptions(argv) {
+  const options = Object.assign({}, DEFAULT_OPTIONS);
+  for (let i=0; i<argv.length; i+=2) {
+    const key = argv[i].replace(/^--/, '');
+    if (!(key in DEFAULT_OPTIONS) || i + 1 >= argv.length) {
+      throw new Error(`Invalid option '${argv[i]}', see the usage in benchmarks/pool.js`);
+    }
+    const value = argv[i + 1];
+    if (key === 'workers') options.workers = value.split(',').map(Number);
+    else if (typeof DEFAULT_OPTIONS[key] === 'number') options[key] = Number(value);
+    else options[key] = value;
+  }
+  if (!options.workers) {
+    options.workers = [];
+    for (let numWorkers=1; numWorkers<os.cpus().length; numWorkers*=2) options.workers.push(numWorkers);
+    options.workers.push(os.cpus().length);
+  }
+  return options;
+}
+
+// deterministic audio-like signal cut into contiguous frames, so that the runs are comparable
+function syntheticFrames(numFrames, frameSize) {
+  const frames = new Float32Array(numFrames * frameSize);
+  let seed = 1;
+  for (let i=0; i<frames.length; i++) {
+    seed = (seed * 16807) % 2147483647;
+    frames[i] = 0.5 * Math.sin(2 * Math.PI * 440 * i / 44100) + 0.05 * (seed / 2147483647 - 0.5);
+  }
+  return frames;
+}
+
+async function benchmark(numWorkers, frames, options) {
+  const pool = new esLib.EssentiaPool(() => new Worker(require.resolve('../pool-worker.js')), numWorkers,
+                                      Math.max(1024, options.calls));
+  const call = () => pool.run(options.method, [frames, options.frames, options.frameSize]);
+  try {
+    // one call per worker, so that the instantiation of the WASM backends isn't measured
+    await Promise.all(Array.from({length: numWorkers}, call));
+    const start = process.hrtime.bigint();
+    await Promise.all(Array.from({length: options.calls}, call));
+    const elapsedMs = Number(process.hrtime.bigint() - start) / 1e6;
+    return {callsPerSec: options.calls * 1000 / elapsedMs, elapsedMs: elapsedMs};
+  } finally {
+    pool.terminate();
+  }
+}
+
+async function run(options) {
+  const frames = syntheticFrames(options.frames, options.frameSize);
+  const results = {};
+  for (const numWorkers of options.workers) {
+    const result = await benchmark(numWorkers, frames, options);
+    const baseline = results[options.workers[0]] || result;
+    result.speedup = result.callsPerSec / baseline.callsPerSec;
+    result.efficiency = result.speedup * options.workers[0] / numWorkers;
+    results[numWorkers] = result;
+    console.log(`${numWorkers} workers: ${result.callsPerSec.toFixed(1)} calls/sec, speedup ${result.speedup.toFixed(2)}x ` +
+                `(efficiency ${(result.efficiency * 100).toFixed(0)}%)`);
+  }
+  return {
+    environment: {
+      node: process.version,
+      platform: `${process.platform}-${process.arch}`,
+      cpus: os.cpus().length,
+      date: new Date().toISOString(),
+      method: options.method,
+      frames: options.frames,
+      frameSize: options.frameSize,
+      calls: options.calls
+    },
+    results: results
+  };
+}
+
+if (require.main === module) {
+  const options = parseOptions(process.argv.slice(2));
+  run(options).then((report) => {
+    if (options.output) {
+      fs.writeFileSync(options.output, JSON.stringify(report, null, 2) + '\n');
+    }
+  }).catch((error) => {
+    console.error(error);
+    process.exitCode = 1;
+  });
+}
+
+module.exports = {run, parseOptions};
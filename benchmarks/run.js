@@ -0,0 +1,281 @@
+// Benchmark suite of the essentia.js algorithms.
+// Every algorithm of the generated benchmark cases (see algorithms.js, generated by src/python/benchmarks.cog)
+// is computed on synthetic input signals with its default parameters. For each algorithm we report the number of
+// operations per second, the mean time spent marshalling the inputs and outputs between the JS arrays and the
+// embind vectors and calling the algorithm method, the peak JS heap and the growth of the WASM heap.
+// The call time includes the conversions of the inputs and outputs inside WASM and, without algorithm cache, the
+// instantiation of the algorithm. With a profiled build (`configure_bindings.py --profiling`), it is split into the
+// create, input, compute and output times recorded by the instrumentation of the methods (see `Essentia.profile`).
+//
+// usage: node benchmarks/run.js [options]
+//   --algorithms MFCC,HPCP   only benchmark the given algorithms (default: all)
+//   --length 2048            length of the synthetic vector inputs which don't depend on the parameters (default: 2048)
+//   --frames 32              number of rows of the synthetic matrix inputs (default: 32)
+//   --time 200               minimum measuring time of each algorithm in ms (default: 200)
+//   --cache 0                algorithm cache size of the essentia instance, ie. 0 to measure the algorithm
+//                            instantiation along with the compute time (default: 0)
+//   --output results.json    write the results to a JSON file
+//   --compare baseline.json  compare the results with the ones of a previous run and exit with 1 on regressions
+//   --threshold 0.1          relative drop of the operations per second which is flagged as a regression (default: 0.1)
+
+var fs = require('fs');
+var esLib = require('../index');
+var benchmarkCases = require('./algorithms');
+
+const DEFAULT_OPTIONS = {
+  algorithms: null,
+  length: 2048,
+  frames: 32,
+  time: 200,
+  cache: 0,
+  output: null,
+  compare: null,
+  threshold: 0.1
+};
+
+// inputs which are filled with an audio-like signal, the other ones are filled with positive values
+// (eg. spectra, magnitudes or envelopes) or increasing values (frequencies)
+const SIGNAL_INPUTS = ['signal', 'frame', 'audio', 'array', 'array1', 'array2', 'arrayX', 'arrayY', 'x'];
+const INCREASING_INPUTS = ['frequencies', 'bpmIntervals', 'beats', 'ticks', 'contoursStartTimes'];
+const SAMPLE_RATE = 44100;
+
+function parseOptions(argv) {
+  const options = Object.assign({}, DEFAULT_OPTIONS);
+  for (let i=0; i<argv.length; i+=2) {
+    const key = argv[i].replace(/^--/, '');
+    if (!(key in DEFAULT_OPTIONS) || i + 1 >= argv.length) {
+      throw new Error(`Invalid option '${argv[i]}', see the usage in benchmarks/run.js`);
+    }
+    const value = argv[i + 1];
+    if (key === 'algorithms') options.algorithms = value.split(',');
+    else if (typeof DEFAULT_OPTIONS[key] === 'number') options[key] = Number(value);
+    else options[key] = value;
+  }
+  return options;
+}
+
+// deterministic synthetic values so that the runs are comparable
+function syntheticArray(name, size) {
+  const array = new Float32Array(size);
+  let seed = 1;
+  for (let i=0; i<size; i++) {
+    seed = (seed * 16807) % 2147483647;
+    const noise = seed / 2147483647 - 0.5;
+    if (SIGNAL_INPUTS.indexOf(name) !== -1) {
+      array[i] = 0.5 * Math.sin(2 * Math.PI * 440 * i / SAMPLE_RATE) + 0.05 * noise;
+    } else if (INCREASING_INPUTS.indexOf(name) !== -1) {
+      array[i] = 20 + i * (SAMPLE_RATE / 2 - 40) / size;
+    } else {
+      array[i] = 0.5 + 0.5 * Math.abs(Math.sin(i / 8)) + 0.05 * noise;
+    }
+  }
+  return array;
+}
+
+// create the JS data of an input, which is marshalled to the WASM types on every operation by `marshalInput`
+function syntheticInput(input, options) {
+  const size = input.size || options.length;
+  switch (input.type) {
+    case 'vector_real':
+      return syntheticArray(input.name, size);
+    case 'vector_vector_real':
+    case 'matrix_real': {
+      const cols = input.size || 12;
+      return {data: syntheticArray(input.name, options.frames * cols), shape: [options.frames, cols]};
+    }
+    case 'vector_complex':
+      return syntheticArray(input.name, 2 * (input.size || Math.floor(options.length / 2) + 1));
+    case 'vector_stereosample':
+      // interleaved left and right samples
+      return syntheticArray('signal', 2 * size);
+    case 'real':
+      return input.name === 'pitch' ? 440 : 0.5;
+    case 'string':
+      return input.name === 'scale' ? 'major' : 'C';
+    case 'vector_string':
+      return ['C', 'Am', 'F', 'G'];
+    default:
+      throw new Error(`Unsupported input type '${input.type}' of the input '${input.name}'`);
+  }
+}
+
+function marshalInput(essentia, input, data) {
+  switch (input.type) {
+    case 'vector_real':
+      return essentia.arrayToVector(data);
+    case 'vector_vector_real': {
+      const matrix = new essentia.module.VectorVectorFloat();
+      for (let i=0; i<data.shape[0]; i++) {
+        const row = essentia.arrayToVector(data.data.subarray(i * data.shape[1], (i + 1) * data.shape[1]));
+        matrix.push_back(row);
+        row.delete();
+      }
+      return matrix;
+    }
+    case 'vector_string': {
+      const vector = new essentia.module.VectorString();
+      data.forEach((value) => vector.push_back(value));
+      return vector;
+    }
+    // numbers, strings and the flat buffer types are passed as they are
+    default:
+      return data;
+  }
+}
+
+function isVector(value) {
+  return value !== null && typeof value === 'object' && typeof value.size === 'function' && typeof value.get === 'function';
+}
+
+// convert an output to JS and free its WASM memory
+function unmarshalOutput(essentia, value) {
+  if (!isVector(value)) return value;
+  let output;
+  if (value.size() > 0 && isVector(value.get(0))) {
+    output = [];
+    for (let i=0; i<value.size(); i++) {
+      const row = value.get(i);
+      output.push(unmarshalOutput(essentia, row));
+    }
+  } else if (value instanceof essentia.module.VectorFloat) {
+    output = essentia.vectorToArray(value);
+  } else {
+    output = [];
+    for (let i=0; i<value.size(); i++) output.push(value.get(i));
+  }
+  value.delete();
+  return output;
+}
+
+function wasmHeapSize() {
+  return esLib.EssentiaWASM.HEAPU8.length;
+}
+
+// the inputs default to the synthetic inputs of the benchmark case
+function benchmark(essentia, benchmarkCase, options, inputs) {
+  inputs = inputs || benchmarkCase.inputs.map((input) => syntheticInput(input, options));
+  const nanoToMs = (nano) => Number(nano) / 1e6;
+  const wasmHeapStart = wasmHeapSize();
+  let iterations = 0;
+  let marshalTime = BigInt(0);
+  let callTime = BigInt(0);
+  let peakHeap = process.memoryUsage().heapUsed;
+  essentia.resetProfile();
+  const start = process.hrtime.bigint();
+  const deadline = start + BigInt(options.time * 1e6);
+  do {
+    const t0 = process.hrtime.bigint();
+    const args = benchmarkCase.inputs.map((input, i) => marshalInput(essentia, input, inputs[i]));
+    const t1 = process.hrtime.bigint();
+    const outputs = essentia[benchmarkCase.name].apply(essentia, args);
+    const t2 = process.hrtime.bigint();
+    for (const name of benchmarkCase.outputs) unmarshalOutput(essentia, outputs[name]);
+    args.forEach((arg) => { if (isVector(arg)) arg.delete(); });
+    const t3 = process.hrtime.bigint();
+    marshalTime += (t1 - t0) + (t3 - t2);
+    callTime += t2 - t1;
+    iterations++;
+    if (iterations % 16 === 1) peakHeap = Math.max(peakHeap, process.memoryUsage().heapUsed);
+  } while (process.hrtime.bigint() < deadline);
+  const elapsed = process.hrtime.bigint() - start;
+  const result = {
+    iterations: iterations,
+    opsPerSec: iterations / (nanoToMs(elapsed) / 1000),
+    marshalMs: nanoToMs(marshalTime) / iterations,
+    callMs: nanoToMs(callTime) / iterations,
+    peakHeapBytes: peakHeap,
+    wasmHeapGrowthBytes: wasmHeapSize() - wasmHeapStart
+  };
+  // split of the call time recorded by the instrumentation of a profiled build
+  const profile = essentia.profile()[benchmarkCase.name];
+  if (profile && profile.calls) {
+    for (const phase of ['createMs', 'inputMs', 'computeMs', 'outputMs']) result[phase] = profile[phase] / profile.calls;
+  }
+  return result;
+}
+
+function formatResult(name, result) {
+  if (result.error) return `${name}: failed (${result.error})`;
+  const split = 'computeMs' in result ? ` = create ${result.createMs.toFixed(4)} + input ${result.inputMs.toFixed(4)} + ` +
+    `compute ${result.computeMs.toFixed(4)} + output ${result.outputMs.toFixed(4)} ms` : '';
+  return `${name}: ${result.opsPerSec.toFixed(1)} ops/sec (marshal ${result.marshalMs.toFixed(4)} ms, ` +
+         `call ${result.callMs.toFixed(4)} ms${split}, peak heap ${(result.peakHeapBytes / 1048576).toFixed(1)} MB, ` +
+         `wasm heap growth ${result.wasmHeapGrowthBytes} bytes)`;
+}
+
+function run(options) {
+  const essentia = new esLib.Essentia(esLib.EssentiaWASM, false, options.cache);
+  if (!essentia.isProfiled()) {
+    console.log('The call time includes the conversions inside WASM and the algorithm instantiation (unless cached), ' +
+                'build with `configure_bindings.py --profiling` to split it into the create, input, compute and output times\n');
+  }
+  const cases = benchmarkCases.filter((benchmarkCase) => {
+    return !options.algorithms || options.algorithms.indexOf(benchmarkCase.name) !== -1;
+  });
+  const results = {};
+  for (const benchmarkCase of cases) {
+    try {
+      results[benchmarkCase.name] = benchmark(essentia, benchmarkCase, options);
+    } catch (error) {
+      // essentia exceptions of the WASM backend are thrown as pointers
+      results[benchmarkCase.name] = {error: typeof error === 'number' ? 'essentia exception' : String(error.message || error)};
+    }
+    console.log(formatResult(benchmarkCase.name, results[benchmarkCase.name]));
+  }
+  essentia.delete();
+  return {
+    environment: {
+      essentiaVersion: essentia.version,
+      node: process.version,
+      platform: `${process.platform}-${process.arch}`,
+      date: new Date().toISOString(),
+      profiled: essentia.isProfiled(),
+      length: options.length,
+      frames: options.frames,
+      time: options.time,
+      cache: options.cache
+    },
+    results: results
+  };
+}
+
+// returns the names of the algorithms whose operations per second dropped by more than the threshold
+// or which fail since the baseline
+function compare(report, baseline, threshold) {
+  const regressions = [];
+  console.log(`\nComparison with the baseline of ${baseline.environment.date} (threshold ${threshold * 100}%):`);
+  for (const name in report.results) {
+    const current = report.results[name];
+    const previous = baseline.results[name];
+    if (!previous || previous.error) continue;
+    if (current.error) {
+      regressions.push(name);
+      console.log(`${name}: REGRESSION, fails since the baseline (${current.error})`);
+      continue;
+    }
+    const change = current.opsPerSec / previous.opsPerSec - 1;
+    const regression = change < -threshold;
+    if (regression) regressions.push(name);
+    console.log(`${name}: ${previous.opsPerSec.toFixed(1)} -> ${current.opsPerSec.toFixed(1)} ops/sec ` +
+                `(${change >= 0 ? '+' : ''}${(change * 100).toFixed(1)}%)${regression ? ' REGRESSION' : ''}`);
+  }
+  return regressions;
+}
+
+if (require.main === module) {
+  const options = parseOptions(process.argv.slice(2));
+  const report = run(options);
+  if (options.output) {
+    fs.writeFileSync(options.output, JSON.stringify(report, null, 2) + '\n');
+  }
+  if (options.compare) {
+    const baseline = JSON.parse(fs.readFileSync(options.compare));
+    const regressions = compare(report, baseline, options.threshold);
+    if (regressions.length) {
+      console.log(`\n${regressions.length} regressions: ${regressions.join(', ')}`);
+      process.exitCode = 1;
+    }
+  }
+}
+
+module.exports = {run, compare, parseOptions, benchmark, marshalInput, unmarshalOutput, isVector};
@@ -26,4 +26,5 @@ $NPM_PATH run build-js-api rollup.config.min.js
 
 # Run tests
 echo "Running tests ..."
-$NPM_PATH test
\ No newline at end of file
+$NPM_PATH test
+$NPM_PATH run test-codegen
\ No newline at end of file
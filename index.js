@@ -5,6 +5,7 @@ const Essentia = require("./dist/essentia.js-core.umd");
 const EssentiaModel = require("./dist/essentia.js-model.umd");
 const EssentiaExtractor = require("./dist/essentia.js-extractor.umd");
 const EssentiaPlot = require("./dist/essentia.js-plot.umd");
+const EssentiaPool = require("./dist/essentia.js-pool.umd");
 
 
 module.exports = {
@@ -15,5 +16,6 @@ module.exports = {
     // Add-on modules
     EssentiaModel,
     EssentiaExtractor,
-    EssentiaPlot
+    EssentiaPlot,
+    EssentiaPool
 };
\ No newline at end of file
@@ -0,0 +1,10 @@
+"use strict"
+
+// worker_threads script of an EssentiaPool in node.js, which serves the calls of the pool with its own essentia instance
+// eg. new EssentiaPool(() => new Worker(require.resolve('essentia.js/pool-worker.js')), os.cpus().length)
+const { parentPort } = require("worker_threads");
+const EssentiaWASM = require("./dist/essentia-wasm.umd");
+const Essentia = require("./dist/essentia.js-core.umd");
+const EssentiaPool = require("./dist/essentia.js-pool.umd");
+
+EssentiaPool.serve(new Essentia(EssentiaWASM), parentPort);
@@ -104,6 +104,29 @@ let defaultBuildOpts = [{
     typescript: require('typescript'),
    }),
   ]
+ }, {
+  input: 'src/typescript/pool/pool.ts', // our source file
+  output: [
+   {
+    file: DIST_DIR + '/essentia.js-pool.es.js',
+    format: 'es' // the preferred format
+   },
+   {
+    file: DIST_DIR + '/essentia.js-pool.umd.js',
+    format: 'umd',
+    name: 'EssentiaPool' // the global which can be used during imports
+   },
+   {
+    file: DIST_DIR + '/essentia.js-pool.js',
+    format: 'iife',
+    name: 'EssentiaPool' // the global which can be used in a browser
+   }
+  ],
+  plugins: [
+   typescript({
+    typescript: require('typescript'),
+   }),
+  ]
  }
 ]
 
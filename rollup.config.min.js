@@ -105,6 +105,29 @@ let defaultBuildOpts = [{
     typescript: require('typescript'),
    }),
   ]
+ }, {
+  input: 'src/typescript/pool/pool.ts', // our source file
+  output: [
+   {
+    file: DIST_DIR + '/essentia.js-pool.es.min.js',
+    format: 'es' // the preferred format
+   },
+   {
+    file: DIST_DIR + '/essentia.js-pool.umd.min.js',
+    format: 'umd',
+    name: 'EssentiaPool' // the global which can be used during imports
+   },
+   {
+    file: DIST_DIR + '/essentia.js-pool.min.js',
+    format: 'iife',
+    name: 'EssentiaPool' // the global which can be used in a browser
+   }
+  ],
+  plugins: [
+   typescript({
+    typescript: require('typescript'),
+   }),
+  ]
  }
 ]
 
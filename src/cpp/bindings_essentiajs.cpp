@@ -26,8 +26,15 @@ EMSCRIPTEN_BINDINGS(CLASS_EssentiaJS) {
   // NOTE: The following code snippets are machine generated. Do not edit.
   class_<EssentiaJS>("EssentiaJS")
     .constructor<bool>()
+    .constructor<bool, int>()
     .property("version", &EssentiaJS::essentiaVersion)
     .property("algorithmNames", &EssentiaJS::algorithmNames)
+    .property("algorithmCacheSize", &EssentiaJS::getAlgorithmCacheSize, &EssentiaJS::setAlgorithmCacheSize)
+    .function("getAlgorithmCacheStats", &EssentiaJS::getAlgorithmCacheStats)
+    .function("clearAlgorithmCache", &EssentiaJS::clearAlgorithmCache)
+    .property("profiling", &EssentiaJS::isProfiled)
+    .function("getProfile", &EssentiaJS::getProfile)
+    .function("resetProfile", &EssentiaJS::resetProfile)
     .function("shutdown", &EssentiaJS::shutdown)
     .function("FrameGenerator", &EssentiaJS::FrameGenerator)
     .function("MonoMixer", &EssentiaJS::MonoMixer)
@@ -47,8 +54,10 @@ EMSCRIPTEN_BINDINGS(CLASS_EssentiaJS) {
     .function("BeatsLoudness", &EssentiaJS::BeatsLoudness)
     .function("BinaryOperator", &EssentiaJS::BinaryOperator)
     .function("BinaryOperatorStream", &EssentiaJS::BinaryOperatorStream)
+    .function("BpmHistogram", &EssentiaJS::BpmHistogram)
     .function("BpmHistogramDescriptors", &EssentiaJS::BpmHistogramDescriptors)
     .function("BpmRubato", &EssentiaJS::BpmRubato)
+    .function("CartesianToPolar", &EssentiaJS::CartesianToPolar)
     .function("CentralMoments", &EssentiaJS::CentralMoments)
     .function("Centroid", &EssentiaJS::Centroid)
     .function("ChordsDescriptors", &EssentiaJS::ChordsDescriptors)
@@ -58,6 +67,7 @@ EMSCRIPTEN_BINDINGS(CLASS_EssentiaJS) {
     .function("Chromagram", &EssentiaJS::Chromagram)
     .function("ClickDetector", &EssentiaJS::ClickDetector)
     .function("Clipper", &EssentiaJS::Clipper)
+    .function("ConstantQ", &EssentiaJS::ConstantQ)
     .function("CoverSongSimilarity", &EssentiaJS::CoverSongSimilarity)
     .function("Crest", &EssentiaJS::Crest)
     .function("CrossCorrelation", &EssentiaJS::CrossCorrelation)
@@ -82,6 +92,10 @@ EMSCRIPTEN_BINDINGS(CLASS_EssentiaJS) {
     .function("Entropy", &EssentiaJS::Entropy)
     .function("Envelope", &EssentiaJS::Envelope)
     .function("EqualLoudness", &EssentiaJS::EqualLoudness)
+    .function("FFT", &EssentiaJS::FFT)
+    .function("FFTC", &EssentiaJS::FFTC)
+    .function("FadeDetection", &EssentiaJS::FadeDetection)
+    .function("FalseStereoDetector", &EssentiaJS::FalseStereoDetector)
     .function("Flatness", &EssentiaJS::Flatness)
     .function("FlatnessDB", &EssentiaJS::FlatnessDB)
     .function("FlatnessSFX", &EssentiaJS::FlatnessSFX)
@@ -95,13 +109,18 @@ EMSCRIPTEN_BINDINGS(CLASS_EssentiaJS) {
     .function("HFC", &EssentiaJS::HFC)
     .function("HPCP", &EssentiaJS::HPCP)
     .function("HarmonicBpm", &EssentiaJS::HarmonicBpm)
+    .function("HarmonicMask", &EssentiaJS::HarmonicMask)
+    .function("HarmonicModelAnal", &EssentiaJS::HarmonicModelAnal)
     .function("HarmonicPeaks", &EssentiaJS::HarmonicPeaks)
     .function("HighPass", &EssentiaJS::HighPass)
     .function("HighResolutionFeatures", &EssentiaJS::HighResolutionFeatures)
     .function("Histogram", &EssentiaJS::Histogram)
     .function("HprModelAnal", &EssentiaJS::HprModelAnal)
     .function("HpsModelAnal", &EssentiaJS::HpsModelAnal)
+    .function("HumDetector", &EssentiaJS::HumDetector)
     .function("IDCT", &EssentiaJS::IDCT)
+    .function("IFFT", &EssentiaJS::IFFT)
+    .function("IFFTC", &EssentiaJS::IFFTC)
     .function("IIR", &EssentiaJS::IIR)
     .function("Inharmonicity", &EssentiaJS::Inharmonicity)
     .function("InstantPower", &EssentiaJS::InstantPower)
@@ -122,6 +141,7 @@ EMSCRIPTEN_BINDINGS(CLASS_EssentiaJS) {
     .function("LowLevelSpectralExtractor", &EssentiaJS::LowLevelSpectralExtractor)
     .function("LowPass", &EssentiaJS::LowPass)
     .function("MFCC", &EssentiaJS::MFCC)
+    .function("Magnitude", &EssentiaJS::Magnitude)
     .function("MaxFilter", &EssentiaJS::MaxFilter)
     .function("MaxMagFreq", &EssentiaJS::MaxMagFreq)
     .function("MaxToTotal", &EssentiaJS::MaxToTotal)
@@ -145,7 +165,9 @@ EMSCRIPTEN_BINDINGS(CLASS_EssentiaJS) {
     .function("OnsetDetection", &EssentiaJS::OnsetDetection)
     .function("OnsetDetectionGlobal", &EssentiaJS::OnsetDetectionGlobal)
     .function("OnsetRate", &EssentiaJS::OnsetRate)
+    .function("Onsets", &EssentiaJS::Onsets)
     .function("OverlapAdd", &EssentiaJS::OverlapAdd)
+    .function("Panning", &EssentiaJS::Panning)
     .function("PeakDetection", &EssentiaJS::PeakDetection)
     .function("PercivalBpmEstimator", &EssentiaJS::PercivalBpmEstimator)
     .function("PercivalEnhanceHarmonics", &EssentiaJS::PercivalEnhanceHarmonics)
@@ -165,6 +187,7 @@ EMSCRIPTEN_BINDINGS(CLASS_EssentiaJS) {
     .function("PitchYinProbabilistic", &EssentiaJS::PitchYinProbabilistic)
     .function("PitchYinProbabilities", &EssentiaJS::PitchYinProbabilities)
     .function("PitchYinProbabilitiesHMM", &EssentiaJS::PitchYinProbabilitiesHMM)
+    .function("PolarToCartesian", &EssentiaJS::PolarToCartesian)
     .function("PowerMean", &EssentiaJS::PowerMean)
     .function("PowerSpectrum", &EssentiaJS::PowerSpectrum)
     .function("PredominantPitchMelodia", &EssentiaJS::PredominantPitchMelodia)
@@ -178,11 +201,15 @@ EMSCRIPTEN_BINDINGS(CLASS_EssentiaJS) {
     .function("RhythmExtractor2013", &EssentiaJS::RhythmExtractor2013)
     .function("RhythmTransform", &EssentiaJS::RhythmTransform)
     .function("RollOff", &EssentiaJS::RollOff)
+    .function("SBic", &EssentiaJS::SBic)
     .function("SNR", &EssentiaJS::SNR)
     .function("SaturationDetector", &EssentiaJS::SaturationDetector)
     .function("Scale", &EssentiaJS::Scale)
+    .function("SineModelAnal", &EssentiaJS::SineModelAnal)
+    .function("SineModelSynth", &EssentiaJS::SineModelSynth)
     .function("SineSubtraction", &EssentiaJS::SineSubtraction)
     .function("SingleBeatLoudness", &EssentiaJS::SingleBeatLoudness)
+    .function("SingleGaussian", &EssentiaJS::SingleGaussian)
     .function("Slicer", &EssentiaJS::Slicer)
     .function("SpectralCentroidTime", &EssentiaJS::SpectralCentroidTime)
     .function("SpectralComplexity", &EssentiaJS::SpectralComplexity)
@@ -199,6 +226,9 @@ EMSCRIPTEN_BINDINGS(CLASS_EssentiaJS) {
     .function("SpsModelSynth", &EssentiaJS::SpsModelSynth)
     .function("StartStopCut", &EssentiaJS::StartStopCut)
     .function("StartStopSilence", &EssentiaJS::StartStopSilence)
+    .function("StereoDemuxer", &EssentiaJS::StereoDemuxer)
+    .function("StereoMuxer", &EssentiaJS::StereoMuxer)
+    .function("StereoTrimmer", &EssentiaJS::StereoTrimmer)
     .function("StochasticModelAnal", &EssentiaJS::StochasticModelAnal)
     .function("StochasticModelSynth", &EssentiaJS::StochasticModelSynth)
     .function("StrongDecay", &EssentiaJS::StrongDecay)
@@ -231,9 +261,184 @@ EMSCRIPTEN_BINDINGS(CLASS_EssentiaJS) {
     .function("Welch", &EssentiaJS::Welch)
     .function("Windowing", &EssentiaJS::Windowing)
     .function("ZeroCrossingRate", &EssentiaJS::ZeroCrossingRate)
+    .function("AfterMaxToBeforeMaxEnergyRatioBatch", &EssentiaJS::AfterMaxToBeforeMaxEnergyRatioBatch)
+    .function("AllPassBatch", &EssentiaJS::AllPassBatch)
+    .function("AudioOnsetsMarkerBatch", &EssentiaJS::AudioOnsetsMarkerBatch)
+    .function("AutoCorrelationBatch", &EssentiaJS::AutoCorrelationBatch)
+    .function("BFCCBatch", &EssentiaJS::BFCCBatch)
+    .function("BPFBatch", &EssentiaJS::BPFBatch)
+    .function("BandPassBatch", &EssentiaJS::BandPassBatch)
+    .function("BandRejectBatch", &EssentiaJS::BandRejectBatch)
+    .function("BarkBandsBatch", &EssentiaJS::BarkBandsBatch)
+    .function("BeatTrackerDegaraBatch", &EssentiaJS::BeatTrackerDegaraBatch)
+    .function("BeatTrackerMultiFeatureBatch", &EssentiaJS::BeatTrackerMultiFeatureBatch)
+    .function("BpmHistogramDescriptorsBatch", &EssentiaJS::BpmHistogramDescriptorsBatch)
+    .function("BpmRubatoBatch", &EssentiaJS::BpmRubatoBatch)
+    .function("CentralMomentsBatch", &EssentiaJS::CentralMomentsBatch)
+    .function("CentroidBatch", &EssentiaJS::CentroidBatch)
+    .function("ChromagramBatch", &EssentiaJS::ChromagramBatch)
+    .function("ClickDetectorBatch", &EssentiaJS::ClickDetectorBatch)
+    .function("ClipperBatch", &EssentiaJS::ClipperBatch)
+    .function("CrestBatch", &EssentiaJS::CrestBatch)
+    .function("CubicSplineBatch", &EssentiaJS::CubicSplineBatch)
+    .function("DCRemovalBatch", &EssentiaJS::DCRemovalBatch)
+    .function("DCTBatch", &EssentiaJS::DCTBatch)
+    .function("DanceabilityBatch", &EssentiaJS::DanceabilityBatch)
+    .function("DecreaseBatch", &EssentiaJS::DecreaseBatch)
+    .function("DerivativeBatch", &EssentiaJS::DerivativeBatch)
+    .function("DerivativeSFXBatch", &EssentiaJS::DerivativeSFXBatch)
+    .function("DiscontinuityDetectorBatch", &EssentiaJS::DiscontinuityDetectorBatch)
+    .function("DistributionShapeBatch", &EssentiaJS::DistributionShapeBatch)
+    .function("DurationBatch", &EssentiaJS::DurationBatch)
+    .function("DynamicComplexityBatch", &EssentiaJS::DynamicComplexityBatch)
+    .function("ERBBandsBatch", &EssentiaJS::ERBBandsBatch)
+    .function("EffectiveDurationBatch", &EssentiaJS::EffectiveDurationBatch)
+    .function("EnergyBatch", &EssentiaJS::EnergyBatch)
+    .function("EnergyBandBatch", &EssentiaJS::EnergyBandBatch)
+    .function("EnergyBandRatioBatch", &EssentiaJS::EnergyBandRatioBatch)
+    .function("EntropyBatch", &EssentiaJS::EntropyBatch)
+    .function("EnvelopeBatch", &EssentiaJS::EnvelopeBatch)
+    .function("EqualLoudnessBatch", &EssentiaJS::EqualLoudnessBatch)
+    .function("FlatnessBatch", &EssentiaJS::FlatnessBatch)
+    .function("FlatnessDBBatch", &EssentiaJS::FlatnessDBBatch)
+    .function("FlatnessSFXBatch", &EssentiaJS::FlatnessSFXBatch)
+    .function("FluxBatch", &EssentiaJS::FluxBatch)
+    .function("FrameCutterBatch", &EssentiaJS::FrameCutterBatch)
+    .function("FrameToRealBatch", &EssentiaJS::FrameToRealBatch)
+    .function("FrequencyBandsBatch", &EssentiaJS::FrequencyBandsBatch)
+    .function("GFCCBatch", &EssentiaJS::GFCCBatch)
+    .function("GapsDetectorBatch", &EssentiaJS::GapsDetectorBatch)
+    .function("GeometricMeanBatch", &EssentiaJS::GeometricMeanBatch)
+    .function("HFCBatch", &EssentiaJS::HFCBatch)
+    .function("HarmonicBpmBatch", &EssentiaJS::HarmonicBpmBatch)
+    .function("HighPassBatch", &EssentiaJS::HighPassBatch)
+    .function("HighResolutionFeaturesBatch", &EssentiaJS::HighResolutionFeaturesBatch)
+    .function("HistogramBatch", &EssentiaJS::HistogramBatch)
+    .function("IDCTBatch", &EssentiaJS::IDCTBatch)
+    .function("IIRBatch", &EssentiaJS::IIRBatch)
+    .function("InstantPowerBatch", &EssentiaJS::InstantPowerBatch)
+    .function("IntensityBatch", &EssentiaJS::IntensityBatch)
+    .function("LPCBatch", &EssentiaJS::LPCBatch)
+    .function("LarmBatch", &EssentiaJS::LarmBatch)
+    .function("LeqBatch", &EssentiaJS::LeqBatch)
+    .function("LevelExtractorBatch", &EssentiaJS::LevelExtractorBatch)
+    .function("LogAttackTimeBatch", &EssentiaJS::LogAttackTimeBatch)
+    .function("LogSpectrumBatch", &EssentiaJS::LogSpectrumBatch)
+    .function("LoopBpmEstimatorBatch", &EssentiaJS::LoopBpmEstimatorBatch)
+    .function("LoudnessBatch", &EssentiaJS::LoudnessBatch)
+    .function("LoudnessVickersBatch", &EssentiaJS::LoudnessVickersBatch)
+    .function("LowPassBatch", &EssentiaJS::LowPassBatch)
+    .function("MFCCBatch", &EssentiaJS::MFCCBatch)
+    .function("MaxFilterBatch", &EssentiaJS::MaxFilterBatch)
+    .function("MaxMagFreqBatch", &EssentiaJS::MaxMagFreqBatch)
+    .function("MaxToTotalBatch", &EssentiaJS::MaxToTotalBatch)
+    .function("MeanBatch", &EssentiaJS::MeanBatch)
+    .function("MedianBatch", &EssentiaJS::MedianBatch)
+    .function("MedianFilterBatch", &EssentiaJS::MedianFilterBatch)
+    .function("MelBandsBatch", &EssentiaJS::MelBandsBatch)
+    .function("MinMaxBatch", &EssentiaJS::MinMaxBatch)
+    .function("MinToTotalBatch", &EssentiaJS::MinToTotalBatch)
+    .function("MovingAverageBatch", &EssentiaJS::MovingAverageBatch)
+    .function("NoiseAdderBatch", &EssentiaJS::NoiseAdderBatch)
+    .function("NoiseBurstDetectorBatch", &EssentiaJS::NoiseBurstDetectorBatch)
+    .function("NoveltyCurveFixedBpmEstimatorBatch", &EssentiaJS::NoveltyCurveFixedBpmEstimatorBatch)
+    .function("OnsetDetectionGlobalBatch", &EssentiaJS::OnsetDetectionGlobalBatch)
+    .function("OnsetRateBatch", &EssentiaJS::OnsetRateBatch)
+    .function("OverlapAddBatch", &EssentiaJS::OverlapAddBatch)
+    .function("PeakDetectionBatch", &EssentiaJS::PeakDetectionBatch)
+    .function("PercivalBpmEstimatorBatch", &EssentiaJS::PercivalBpmEstimatorBatch)
+    .function("PercivalEnhanceHarmonicsBatch", &EssentiaJS::PercivalEnhanceHarmonicsBatch)
+    .function("PitchMelodiaBatch", &EssentiaJS::PitchMelodiaBatch)
+    .function("PitchSalienceBatch", &EssentiaJS::PitchSalienceBatch)
+    .function("PitchSalienceFunctionPeaksBatch", &EssentiaJS::PitchSalienceFunctionPeaksBatch)
+    .function("PitchYinBatch", &EssentiaJS::PitchYinBatch)
+    .function("PitchYinFFTBatch", &EssentiaJS::PitchYinFFTBatch)
+    .function("PitchYinProbabilisticBatch", &EssentiaJS::PitchYinProbabilisticBatch)
+    .function("PitchYinProbabilitiesBatch", &EssentiaJS::PitchYinProbabilitiesBatch)
+    .function("PowerMeanBatch", &EssentiaJS::PowerMeanBatch)
+    .function("PowerSpectrumBatch", &EssentiaJS::PowerSpectrumBatch)
+    .function("PredominantPitchMelodiaBatch", &EssentiaJS::PredominantPitchMelodiaBatch)
+    .function("RMSBatch", &EssentiaJS::RMSBatch)
+    .function("RawMomentsBatch", &EssentiaJS::RawMomentsBatch)
+    .function("ReplayGainBatch", &EssentiaJS::ReplayGainBatch)
+    .function("ResampleBatch", &EssentiaJS::ResampleBatch)
+    .function("ResampleFFTBatch", &EssentiaJS::ResampleFFTBatch)
+    .function("RhythmDescriptorsBatch", &EssentiaJS::RhythmDescriptorsBatch)
+    .function("RhythmExtractorBatch", &EssentiaJS::RhythmExtractorBatch)
+    .function("RhythmExtractor2013Batch", &EssentiaJS::RhythmExtractor2013Batch)
+    .function("RollOffBatch", &EssentiaJS::RollOffBatch)
+    .function("SNRBatch", &EssentiaJS::SNRBatch)
+    .function("SaturationDetectorBatch", &EssentiaJS::SaturationDetectorBatch)
+    .function("ScaleBatch", &EssentiaJS::ScaleBatch)
+    .function("SingleBeatLoudnessBatch", &EssentiaJS::SingleBeatLoudnessBatch)
+    .function("SpectralCentroidTimeBatch", &EssentiaJS::SpectralCentroidTimeBatch)
+    .function("SpectralComplexityBatch", &EssentiaJS::SpectralComplexityBatch)
+    .function("SpectralContrastBatch", &EssentiaJS::SpectralContrastBatch)
+    .function("SpectralPeaksBatch", &EssentiaJS::SpectralPeaksBatch)
+    .function("SpectrumBatch", &EssentiaJS::SpectrumBatch)
+    .function("SpectrumCQBatch", &EssentiaJS::SpectrumCQBatch)
+    .function("SpectrumToCentBatch", &EssentiaJS::SpectrumToCentBatch)
+    .function("SplineBatch", &EssentiaJS::SplineBatch)
+    .function("SprModelAnalBatch", &EssentiaJS::SprModelAnalBatch)
+    .function("SpsModelAnalBatch", &EssentiaJS::SpsModelAnalBatch)
+    .function("StartStopCutBatch", &EssentiaJS::StartStopCutBatch)
+    .function("StartStopSilenceBatch", &EssentiaJS::StartStopSilenceBatch)
+    .function("StochasticModelAnalBatch", &EssentiaJS::StochasticModelAnalBatch)
+    .function("StochasticModelSynthBatch", &EssentiaJS::StochasticModelSynthBatch)
+    .function("StrongDecayBatch", &EssentiaJS::StrongDecayBatch)
+    .function("StrongPeakBatch", &EssentiaJS::StrongPeakBatch)
+    .function("SuperFluxExtractorBatch", &EssentiaJS::SuperFluxExtractorBatch)
+    .function("SuperFluxPeaksBatch", &EssentiaJS::SuperFluxPeaksBatch)
+    .function("TCToTotalBatch", &EssentiaJS::TCToTotalBatch)
+    .function("TempoScaleBandsBatch", &EssentiaJS::TempoScaleBandsBatch)
+    .function("TempoTapBatch", &EssentiaJS::TempoTapBatch)
+    .function("TempoTapDegaraBatch", &EssentiaJS::TempoTapDegaraBatch)
+    .function("TensorflowInputMusiCNNBatch", &EssentiaJS::TensorflowInputMusiCNNBatch)
+    .function("TensorflowInputVGGishBatch", &EssentiaJS::TensorflowInputVGGishBatch)
+    .function("TonicIndianArtMusicBatch", &EssentiaJS::TonicIndianArtMusicBatch)
+    .function("TriangularBandsBatch", &EssentiaJS::TriangularBandsBatch)
+    .function("TriangularBarkBandsBatch", &EssentiaJS::TriangularBarkBandsBatch)
+    .function("TrimmerBatch", &EssentiaJS::TrimmerBatch)
+    .function("TruePeakDetectorBatch", &EssentiaJS::TruePeakDetectorBatch)
+    .function("TuningFrequencyExtractorBatch", &EssentiaJS::TuningFrequencyExtractorBatch)
+    .function("UnaryOperatorBatch", &EssentiaJS::UnaryOperatorBatch)
+    .function("UnaryOperatorStreamBatch", &EssentiaJS::UnaryOperatorStreamBatch)
+    .function("VarianceBatch", &EssentiaJS::VarianceBatch)
+    .function("VibratoBatch", &EssentiaJS::VibratoBatch)
+    .function("WarpedAutoCorrelationBatch", &EssentiaJS::WarpedAutoCorrelationBatch)
+    .function("WelchBatch", &EssentiaJS::WelchBatch)
+    .function("WindowingBatch", &EssentiaJS::WindowingBatch)
+    .function("ZeroCrossingRateBatch", &EssentiaJS::ZeroCrossingRateBatch)
+    ;
+  // incremental frame source
+  class_<FrameStream>("FrameStream")
+    .constructor<int, int, bool, bool, bool>()
+    .function("push", &FrameStream::push)
+    .function("flush", &FrameStream::flush)
+    .function("reset", &FrameStream::reset)
+    .function("next", &FrameStream::next)
+    .function("nextBlock", &FrameStream::nextBlock)
+    .function("available", &FrameStream::available)
+    .property("frameIndex", &FrameStream::frameIndex)
+    ;
+  // network of essentia streaming mode algorithms
+  class_<StreamingNetwork>("StreamingNetwork")
+    .constructor<>()
+    .function("add", &StreamingNetwork::add)
+    .function("connect", &StreamingNetwork::connect)
+    .function("connectToPool", &StreamingNetwork::connectToPool)
+    .function("push", &StreamingNetwork::push)
+    .function("end", &StreamingNetwork::end)
+    .function("reset", &StreamingNetwork::reset)
+    .function("getPool", &StreamingNetwork::getPool)
+    .function("aggregate", &StreamingNetwork::aggregate)
     ;
   // utility function to convert a Float32 JS typed array into std::vector<float>
   function("arrayToVector", &float32ArrayToVector);
+  // utility function which returns a Float32Array view on the memory of a VectorFloat, eg. to copy it in bulk
+  function("vectorView", &vectorToTypedArray);
+  // utility function to pack the outputs of an algorithm or extractor into a single transferable ArrayBuffer
+  function("packOutputs", &packOutputs);
   // expose stl datatypes to js
   register_vector<int>("VectorInt");
   register_vector<float>("VectorFloat");
@@ -241,4 +446,1861 @@ EMSCRIPTEN_BINDINGS(CLASS_EssentiaJS) {
   register_vector<std::string>("VectorString");
   register_vector<std::vector<float>>("VectorVectorFloat");
   register_vector<std::vector<double>>("VectorVectorDouble");
+  // expose the persistent algorithm classes to js
+#ifdef ESSENTIAJS_DISPATCHER
+  class_<DispatchedAlgorithm>("DispatchedAlgorithm")
+    .constructor<std::string, val>()
+    .function("configure", &DispatchedAlgorithm::configure)
+    .function("compute", &DispatchedAlgorithm::compute)
+    .function("computeTyped", &DispatchedAlgorithm::computeTyped)
+    .function("inputBuffer", &DispatchedAlgorithm::inputBuffer)
+    .function("outputBuffer", &DispatchedAlgorithm::outputBuffer)
+    .function("computeInto", &DispatchedAlgorithm::computeInto)
+    ;
+#endif
+  class_<AfterMaxToBeforeMaxEnergyRatioAlgo>("AfterMaxToBeforeMaxEnergyRatioAlgo")
+    .constructor<>()
+    .function("configure", &AfterMaxToBeforeMaxEnergyRatioAlgo::configure)
+    .function("compute", &AfterMaxToBeforeMaxEnergyRatioAlgo::compute)
+    .function("computeTyped", &AfterMaxToBeforeMaxEnergyRatioAlgo::computeTyped)
+    .function("inputBuffer", &AfterMaxToBeforeMaxEnergyRatioAlgo::inputBuffer)
+    .function("outputBuffer", &AfterMaxToBeforeMaxEnergyRatioAlgo::outputBuffer)
+    .function("computeInto", &AfterMaxToBeforeMaxEnergyRatioAlgo::computeInto)
+    ;
+  class_<AllPassAlgo>("AllPassAlgo")
+    .constructor<float, float, int, float>()
+    .function("configure", &AllPassAlgo::configure)
+    .function("compute", &AllPassAlgo::compute)
+    .function("computeTyped", &AllPassAlgo::computeTyped)
+    .function("inputBuffer", &AllPassAlgo::inputBuffer)
+    .function("outputBuffer", &AllPassAlgo::outputBuffer)
+    .function("computeInto", &AllPassAlgo::computeInto)
+    ;
+  class_<AudioOnsetsMarkerAlgo>("AudioOnsetsMarkerAlgo")
+    .constructor<std::vector<float>, float, std::string>()
+    .function("configure", &AudioOnsetsMarkerAlgo::configure)
+    .function("compute", &AudioOnsetsMarkerAlgo::compute)
+    .function("computeTyped", &AudioOnsetsMarkerAlgo::computeTyped)
+    .function("inputBuffer", &AudioOnsetsMarkerAlgo::inputBuffer)
+    .function("outputBuffer", &AudioOnsetsMarkerAlgo::outputBuffer)
+    .function("computeInto", &AudioOnsetsMarkerAlgo::computeInto)
+    ;
+  class_<AutoCorrelationAlgo>("AutoCorrelationAlgo")
+    .constructor<float, bool, std::string>()
+    .function("configure", &AutoCorrelationAlgo::configure)
+    .function("compute", &AutoCorrelationAlgo::compute)
+    .function("computeTyped", &AutoCorrelationAlgo::computeTyped)
+    .function("inputBuffer", &AutoCorrelationAlgo::inputBuffer)
+    .function("outputBuffer", &AutoCorrelationAlgo::outputBuffer)
+    .function("computeInto", &AutoCorrelationAlgo::computeInto)
+    ;
+  class_<BFCCAlgo>("BFCCAlgo")
+    .constructor<int, float, int, int, std::string, float, std::string, int, int, float, std::string, std::string>()
+    .function("configure", &BFCCAlgo::configure)
+    .function("compute", &BFCCAlgo::compute)
+    .function("computeTyped", &BFCCAlgo::computeTyped)
+    .function("inputBuffer", &BFCCAlgo::inputBuffer)
+    .function("outputBuffer", &BFCCAlgo::outputBuffer)
+    .function("computeInto", &BFCCAlgo::computeInto)
+    ;
+  class_<BPFAlgo>("BPFAlgo")
+    .constructor<std::vector<float>, std::vector<float>>()
+    .function("configure", &BPFAlgo::configure)
+    .function("compute", &BPFAlgo::compute)
+    .function("computeTyped", &BPFAlgo::computeTyped)
+    .function("inputBuffer", &BPFAlgo::inputBuffer)
+    .function("outputBuffer", &BPFAlgo::outputBuffer)
+    .function("computeInto", &BPFAlgo::computeInto)
+    ;
+  class_<BandPassAlgo>("BandPassAlgo")
+    .constructor<float, float, float>()
+    .function("configure", &BandPassAlgo::configure)
+    .function("compute", &BandPassAlgo::compute)
+    .function("computeTyped", &BandPassAlgo::computeTyped)
+    .function("inputBuffer", &BandPassAlgo::inputBuffer)
+    .function("outputBuffer", &BandPassAlgo::outputBuffer)
+    .function("computeInto", &BandPassAlgo::computeInto)
+    ;
+  class_<BandRejectAlgo>("BandRejectAlgo")
+    .constructor<float, float, float>()
+    .function("configure", &BandRejectAlgo::configure)
+    .function("compute", &BandRejectAlgo::compute)
+    .function("computeTyped", &BandRejectAlgo::computeTyped)
+    .function("inputBuffer", &BandRejectAlgo::inputBuffer)
+    .function("outputBuffer", &BandRejectAlgo::outputBuffer)
+    .function("computeInto", &BandRejectAlgo::computeInto)
+    ;
+  class_<BarkBandsAlgo>("BarkBandsAlgo")
+    .constructor<int, float>()
+    .function("configure", &BarkBandsAlgo::configure)
+    .function("compute", &BarkBandsAlgo::compute)
+    .function("computeTyped", &BarkBandsAlgo::computeTyped)
+    .function("inputBuffer", &BarkBandsAlgo::inputBuffer)
+    .function("outputBuffer", &BarkBandsAlgo::outputBuffer)
+    .function("computeInto", &BarkBandsAlgo::computeInto)
+    ;
+  class_<BeatTrackerDegaraAlgo>("BeatTrackerDegaraAlgo")
+    .constructor<int, int>()
+    .function("configure", &BeatTrackerDegaraAlgo::configure)
+    .function("compute", &BeatTrackerDegaraAlgo::compute)
+    .function("computeTyped", &BeatTrackerDegaraAlgo::computeTyped)
+    .function("inputBuffer", &BeatTrackerDegaraAlgo::inputBuffer)
+    .function("outputBuffer", &BeatTrackerDegaraAlgo::outputBuffer)
+    .function("computeInto", &BeatTrackerDegaraAlgo::computeInto)
+    ;
+  class_<BeatTrackerMultiFeatureAlgo>("BeatTrackerMultiFeatureAlgo")
+    .constructor<int, int>()
+    .function("configure", &BeatTrackerMultiFeatureAlgo::configure)
+    .function("compute", &BeatTrackerMultiFeatureAlgo::compute)
+    .function("computeTyped", &BeatTrackerMultiFeatureAlgo::computeTyped)
+    .function("inputBuffer", &BeatTrackerMultiFeatureAlgo::inputBuffer)
+    .function("outputBuffer", &BeatTrackerMultiFeatureAlgo::outputBuffer)
+    .function("computeInto", &BeatTrackerMultiFeatureAlgo::computeInto)
+    ;
+  class_<BeatogramAlgo>("BeatogramAlgo")
+    .constructor<int>()
+    .function("configure", &BeatogramAlgo::configure)
+    .function("compute", &BeatogramAlgo::compute)
+    .function("computeTyped", &BeatogramAlgo::computeTyped)
+    ;
+  class_<BeatsLoudnessAlgo>("BeatsLoudnessAlgo")
+    .constructor<float, float, std::vector<float>, std::vector<float>, float>()
+    .function("configure", &BeatsLoudnessAlgo::configure)
+    .function("compute", &BeatsLoudnessAlgo::compute)
+    .function("computeTyped", &BeatsLoudnessAlgo::computeTyped)
+    ;
+  class_<BinaryOperatorAlgo>("BinaryOperatorAlgo")
+    .constructor<std::string>()
+    .function("configure", &BinaryOperatorAlgo::configure)
+    .function("compute", &BinaryOperatorAlgo::compute)
+    .function("computeTyped", &BinaryOperatorAlgo::computeTyped)
+    .function("inputBuffer", &BinaryOperatorAlgo::inputBuffer)
+    .function("outputBuffer", &BinaryOperatorAlgo::outputBuffer)
+    .function("computeInto", &BinaryOperatorAlgo::computeInto)
+    ;
+  class_<BinaryOperatorStreamAlgo>("BinaryOperatorStreamAlgo")
+    .constructor<std::string>()
+    .function("configure", &BinaryOperatorStreamAlgo::configure)
+    .function("compute", &BinaryOperatorStreamAlgo::compute)
+    .function("computeTyped", &BinaryOperatorStreamAlgo::computeTyped)
+    .function("inputBuffer", &BinaryOperatorStreamAlgo::inputBuffer)
+    .function("outputBuffer", &BinaryOperatorStreamAlgo::outputBuffer)
+    .function("computeInto", &BinaryOperatorStreamAlgo::computeInto)
+    ;
+  class_<BpmHistogramAlgo>("BpmHistogramAlgo")
+    .constructor<float, bool, float, float, float, int, float, int, float, bool, std::string, int>()
+    .function("configure", &BpmHistogramAlgo::configure)
+    .function("compute", &BpmHistogramAlgo::compute)
+    .function("computeTyped", &BpmHistogramAlgo::computeTyped)
+    ;
+  class_<BpmHistogramDescriptorsAlgo>("BpmHistogramDescriptorsAlgo")
+    .constructor<>()
+    .function("configure", &BpmHistogramDescriptorsAlgo::configure)
+    .function("compute", &BpmHistogramDescriptorsAlgo::compute)
+    .function("computeTyped", &BpmHistogramDescriptorsAlgo::computeTyped)
+    .function("inputBuffer", &BpmHistogramDescriptorsAlgo::inputBuffer)
+    .function("outputBuffer", &BpmHistogramDescriptorsAlgo::outputBuffer)
+    .function("computeInto", &BpmHistogramDescriptorsAlgo::computeInto)
+    ;
+  class_<BpmRubatoAlgo>("BpmRubatoAlgo")
+    .constructor<float, float, float>()
+    .function("configure", &BpmRubatoAlgo::configure)
+    .function("compute", &BpmRubatoAlgo::compute)
+    .function("computeTyped", &BpmRubatoAlgo::computeTyped)
+    .function("inputBuffer", &BpmRubatoAlgo::inputBuffer)
+    .function("outputBuffer", &BpmRubatoAlgo::outputBuffer)
+    .function("computeInto", &BpmRubatoAlgo::computeInto)
+    ;
+  class_<CartesianToPolarAlgo>("CartesianToPolarAlgo")
+    .constructor<>()
+    .function("configure", &CartesianToPolarAlgo::configure)
+    .function("compute", &CartesianToPolarAlgo::compute)
+    .function("computeTyped", &CartesianToPolarAlgo::computeTyped)
+    ;
+  class_<CentralMomentsAlgo>("CentralMomentsAlgo")
+    .constructor<std::string, float>()
+    .function("configure", &CentralMomentsAlgo::configure)
+    .function("compute", &CentralMomentsAlgo::compute)
+    .function("computeTyped", &CentralMomentsAlgo::computeTyped)
+    .function("inputBuffer", &CentralMomentsAlgo::inputBuffer)
+    .function("outputBuffer", &CentralMomentsAlgo::outputBuffer)
+    .function("computeInto", &CentralMomentsAlgo::computeInto)
+    ;
+  class_<CentroidAlgo>("CentroidAlgo")
+    .constructor<float>()
+    .function("configure", &CentroidAlgo::configure)
+    .function("compute", &CentroidAlgo::compute)
+    .function("computeTyped", &CentroidAlgo::computeTyped)
+    .function("inputBuffer", &CentroidAlgo::inputBuffer)
+    .function("outputBuffer", &CentroidAlgo::outputBuffer)
+    .function("computeInto", &CentroidAlgo::computeInto)
+    ;
+  class_<ChordsDescriptorsAlgo>("ChordsDescriptorsAlgo")
+    .constructor<>()
+    .function("configure", &ChordsDescriptorsAlgo::configure)
+    .function("compute", &ChordsDescriptorsAlgo::compute)
+    .function("computeTyped", &ChordsDescriptorsAlgo::computeTyped)
+    ;
+  class_<ChordsDetectionAlgo>("ChordsDetectionAlgo")
+    .constructor<int, float, float>()
+    .function("configure", &ChordsDetectionAlgo::configure)
+    .function("compute", &ChordsDetectionAlgo::compute)
+    .function("computeTyped", &ChordsDetectionAlgo::computeTyped)
+    ;
+  class_<ChordsDetectionBeatsAlgo>("ChordsDetectionBeatsAlgo")
+    .constructor<std::string, int, float>()
+    .function("configure", &ChordsDetectionBeatsAlgo::configure)
+    .function("compute", &ChordsDetectionBeatsAlgo::compute)
+    .function("computeTyped", &ChordsDetectionBeatsAlgo::computeTyped)
+    ;
+  class_<ChromaCrossSimilarityAlgo>("ChromaCrossSimilarityAlgo")
+    .constructor<float, int, int, int, bool, bool, bool>()
+    .function("configure", &ChromaCrossSimilarityAlgo::configure)
+    .function("compute", &ChromaCrossSimilarityAlgo::compute)
+    .function("computeTyped", &ChromaCrossSimilarityAlgo::computeTyped)
+    ;
+  class_<ChromagramAlgo>("ChromagramAlgo")
+    .constructor<int, float, int, std::string, int, float, float, float, std::string, bool>()
+    .function("configure", &ChromagramAlgo::configure)
+    .function("compute", &ChromagramAlgo::compute)
+    .function("computeTyped", &ChromagramAlgo::computeTyped)
+    .function("inputBuffer", &ChromagramAlgo::inputBuffer)
+    .function("outputBuffer", &ChromagramAlgo::outputBuffer)
+    .function("computeInto", &ChromagramAlgo::computeInto)
+    ;
+  class_<ClickDetectorAlgo>("ClickDetectorAlgo")
+    .constructor<float, int, int, int, int, float, int>()
+    .function("configure", &ClickDetectorAlgo::configure)
+    .function("compute", &ClickDetectorAlgo::compute)
+    .function("computeTyped", &ClickDetectorAlgo::computeTyped)
+    .function("inputBuffer", &ClickDetectorAlgo::inputBuffer)
+    .function("outputBuffer", &ClickDetectorAlgo::outputBuffer)
+    .function("computeInto", &ClickDetectorAlgo::computeInto)
+    ;
+  class_<ClipperAlgo>("ClipperAlgo")
+    .constructor<float, float>()
+    .function("configure", &ClipperAlgo::configure)
+    .function("compute", &ClipperAlgo::compute)
+    .function("computeTyped", &ClipperAlgo::computeTyped)
+    .function("inputBuffer", &ClipperAlgo::inputBuffer)
+    .function("outputBuffer", &ClipperAlgo::outputBuffer)
+    .function("computeInto", &ClipperAlgo::computeInto)
+    ;
+  class_<ConstantQAlgo>("ConstantQAlgo")
+    .constructor<int, float, int, int, float, float, float, std::string, bool>()
+    .function("configure", &ConstantQAlgo::configure)
+    .function("compute", &ConstantQAlgo::compute)
+    .function("computeTyped", &ConstantQAlgo::computeTyped)
+    ;
+  class_<CoverSongSimilarityAlgo>("CoverSongSimilarityAlgo")
+    .constructor<std::string, float, float, std::string>()
+    .function("configure", &CoverSongSimilarityAlgo::configure)
+    .function("compute", &CoverSongSimilarityAlgo::compute)
+    .function("computeTyped", &CoverSongSimilarityAlgo::computeTyped)
+    ;
+  class_<CrestAlgo>("CrestAlgo")
+    .constructor<>()
+    .function("configure", &CrestAlgo::configure)
+    .function("compute", &CrestAlgo::compute)
+    .function("computeTyped", &CrestAlgo::computeTyped)
+    .function("inputBuffer", &CrestAlgo::inputBuffer)
+    .function("outputBuffer", &CrestAlgo::outputBuffer)
+    .function("computeInto", &CrestAlgo::computeInto)
+    ;
+  class_<CrossCorrelationAlgo>("CrossCorrelationAlgo")
+    .constructor<int, int>()
+    .function("configure", &CrossCorrelationAlgo::configure)
+    .function("compute", &CrossCorrelationAlgo::compute)
+    .function("computeTyped", &CrossCorrelationAlgo::computeTyped)
+    .function("inputBuffer", &CrossCorrelationAlgo::inputBuffer)
+    .function("outputBuffer", &CrossCorrelationAlgo::outputBuffer)
+    .function("computeInto", &CrossCorrelationAlgo::computeInto)
+    ;
+  class_<CrossSimilarityMatrixAlgo>("CrossSimilarityMatrixAlgo")
+    .constructor<bool, float, int, int>()
+    .function("configure", &CrossSimilarityMatrixAlgo::configure)
+    .function("compute", &CrossSimilarityMatrixAlgo::compute)
+    .function("computeTyped", &CrossSimilarityMatrixAlgo::computeTyped)
+    ;
+  class_<CubicSplineAlgo>("CubicSplineAlgo")
+    .constructor<int, float, int, float, std::vector<float>, std::vector<float>>()
+    .function("configure", &CubicSplineAlgo::configure)
+    .function("compute", &CubicSplineAlgo::compute)
+    .function("computeTyped", &CubicSplineAlgo::computeTyped)
+    .function("inputBuffer", &CubicSplineAlgo::inputBuffer)
+    .function("outputBuffer", &CubicSplineAlgo::outputBuffer)
+    .function("computeInto", &CubicSplineAlgo::computeInto)
+    ;
+  class_<DCRemovalAlgo>("DCRemovalAlgo")
+    .constructor<float, float>()
+    .function("configure", &DCRemovalAlgo::configure)
+    .function("compute", &DCRemovalAlgo::compute)
+    .function("computeTyped", &DCRemovalAlgo::computeTyped)
+    .function("inputBuffer", &DCRemovalAlgo::inputBuffer)
+    .function("outputBuffer", &DCRemovalAlgo::outputBuffer)
+    .function("computeInto", &DCRemovalAlgo::computeInto)
+    ;
+  class_<DCTAlgo>("DCTAlgo")
+    .constructor<int, int, int, int>()
+    .function("configure", &DCTAlgo::configure)
+    .function("compute", &DCTAlgo::compute)
+    .function("computeTyped", &DCTAlgo::computeTyped)
+    .function("inputBuffer", &DCTAlgo::inputBuffer)
+    .function("outputBuffer", &DCTAlgo::outputBuffer)
+    .function("computeInto", &DCTAlgo::computeInto)
+    ;
+  class_<DanceabilityAlgo>("DanceabilityAlgo")
+    .constructor<float, float, float, float>()
+    .function("configure", &DanceabilityAlgo::configure)
+    .function("compute", &DanceabilityAlgo::compute)
+    .function("computeTyped", &DanceabilityAlgo::computeTyped)
+    .function("inputBuffer", &DanceabilityAlgo::inputBuffer)
+    .function("outputBuffer", &DanceabilityAlgo::outputBuffer)
+    .function("computeInto", &DanceabilityAlgo::computeInto)
+    ;
+  class_<DecreaseAlgo>("DecreaseAlgo")
+    .constructor<float>()
+    .function("configure", &DecreaseAlgo::configure)
+    .function("compute", &DecreaseAlgo::compute)
+    .function("computeTyped", &DecreaseAlgo::computeTyped)
+    .function("inputBuffer", &DecreaseAlgo::inputBuffer)
+    .function("outputBuffer", &DecreaseAlgo::outputBuffer)
+    .function("computeInto", &DecreaseAlgo::computeInto)
+    ;
+  class_<DerivativeAlgo>("DerivativeAlgo")
+    .constructor<>()
+    .function("configure", &DerivativeAlgo::configure)
+    .function("compute", &DerivativeAlgo::compute)
+    .function("computeTyped", &DerivativeAlgo::computeTyped)
+    .function("inputBuffer", &DerivativeAlgo::inputBuffer)
+    .function("outputBuffer", &DerivativeAlgo::outputBuffer)
+    .function("computeInto", &DerivativeAlgo::computeInto)
+    ;
+  class_<DerivativeSFXAlgo>("DerivativeSFXAlgo")
+    .constructor<>()
+    .function("configure", &DerivativeSFXAlgo::configure)
+    .function("compute", &DerivativeSFXAlgo::compute)
+    .function("computeTyped", &DerivativeSFXAlgo::computeTyped)
+    .function("inputBuffer", &DerivativeSFXAlgo::inputBuffer)
+    .function("outputBuffer", &DerivativeSFXAlgo::outputBuffer)
+    .function("computeInto", &DerivativeSFXAlgo::computeInto)
+    ;
+  class_<DiscontinuityDetectorAlgo>("DiscontinuityDetectorAlgo")
+    .constructor<float, float, int, int, int, int, int, int>()
+    .function("configure", &DiscontinuityDetectorAlgo::configure)
+    .function("compute", &DiscontinuityDetectorAlgo::compute)
+    .function("computeTyped", &DiscontinuityDetectorAlgo::computeTyped)
+    .function("inputBuffer", &DiscontinuityDetectorAlgo::inputBuffer)
+    .function("outputBuffer", &DiscontinuityDetectorAlgo::outputBuffer)
+    .function("computeInto", &DiscontinuityDetectorAlgo::computeInto)
+    ;
+  class_<DissonanceAlgo>("DissonanceAlgo")
+    .constructor<>()
+    .function("configure", &DissonanceAlgo::configure)
+    .function("compute", &DissonanceAlgo::compute)
+    .function("computeTyped", &DissonanceAlgo::computeTyped)
+    .function("inputBuffer", &DissonanceAlgo::inputBuffer)
+    .function("outputBuffer", &DissonanceAlgo::outputBuffer)
+    .function("computeInto", &DissonanceAlgo::computeInto)
+    ;
+  class_<DistributionShapeAlgo>("DistributionShapeAlgo")
+    .constructor<>()
+    .function("configure", &DistributionShapeAlgo::configure)
+    .function("compute", &DistributionShapeAlgo::compute)
+    .function("computeTyped", &DistributionShapeAlgo::computeTyped)
+    .function("inputBuffer", &DistributionShapeAlgo::inputBuffer)
+    .function("outputBuffer", &DistributionShapeAlgo::outputBuffer)
+    .function("computeInto", &DistributionShapeAlgo::computeInto)
+    ;
+  class_<DurationAlgo>("DurationAlgo")
+    .constructor<float>()
+    .function("configure", &DurationAlgo::configure)
+    .function("compute", &DurationAlgo::compute)
+    .function("computeTyped", &DurationAlgo::computeTyped)
+    .function("inputBuffer", &DurationAlgo::inputBuffer)
+    .function("outputBuffer", &DurationAlgo::outputBuffer)
+    .function("computeInto", &DurationAlgo::computeInto)
+    ;
+  class_<DynamicComplexityAlgo>("DynamicComplexityAlgo")
+    .constructor<float, float>()
+    .function("configure", &DynamicComplexityAlgo::configure)
+    .function("compute", &DynamicComplexityAlgo::compute)
+    .function("computeTyped", &DynamicComplexityAlgo::computeTyped)
+    .function("inputBuffer", &DynamicComplexityAlgo::inputBuffer)
+    .function("outputBuffer", &DynamicComplexityAlgo::outputBuffer)
+    .function("computeInto", &DynamicComplexityAlgo::computeInto)
+    ;
+  class_<ERBBandsAlgo>("ERBBandsAlgo")
+    .constructor<float, int, float, int, float, std::string, float>()
+    .function("configure", &ERBBandsAlgo::configure)
+    .function("compute", &ERBBandsAlgo::compute)
+    .function("computeTyped", &ERBBandsAlgo::computeTyped)
+    .function("inputBuffer", &ERBBandsAlgo::inputBuffer)
+    .function("outputBuffer", &ERBBandsAlgo::outputBuffer)
+    .function("computeInto", &ERBBandsAlgo::computeInto)
+    ;
+  class_<EffectiveDurationAlgo>("EffectiveDurationAlgo")
+    .constructor<float, float>()
+    .function("configure", &EffectiveDurationAlgo::configure)
+    .function("compute", &EffectiveDurationAlgo::compute)
+    .function("computeTyped", &EffectiveDurationAlgo::computeTyped)
+    .function("inputBuffer", &EffectiveDurationAlgo::inputBuffer)
+    .function("outputBuffer", &EffectiveDurationAlgo::outputBuffer)
+    .function("computeInto", &EffectiveDurationAlgo::computeInto)
+    ;
+  class_<EnergyAlgo>("EnergyAlgo")
+    .constructor<>()
+    .function("configure", &EnergyAlgo::configure)
+    .function("compute", &EnergyAlgo::compute)
+    .function("computeTyped", &EnergyAlgo::computeTyped)
+    .function("inputBuffer", &EnergyAlgo::inputBuffer)
+    .function("outputBuffer", &EnergyAlgo::outputBuffer)
+    .function("computeInto", &EnergyAlgo::computeInto)
+    ;
+  class_<EnergyBandAlgo>("EnergyBandAlgo")
+    .constructor<float, float, float>()
+    .function("configure", &EnergyBandAlgo::configure)
+    .function("compute", &EnergyBandAlgo::compute)
+    .function("computeTyped", &EnergyBandAlgo::computeTyped)
+    .function("inputBuffer", &EnergyBandAlgo::inputBuffer)
+    .function("outputBuffer", &EnergyBandAlgo::outputBuffer)
+    .function("computeInto", &EnergyBandAlgo::computeInto)
+    ;
+  class_<EnergyBandRatioAlgo>("EnergyBandRatioAlgo")
+    .constructor<float, float, float>()
+    .function("configure", &EnergyBandRatioAlgo::configure)
+    .function("compute", &EnergyBandRatioAlgo::compute)
+    .function("computeTyped", &EnergyBandRatioAlgo::computeTyped)
+    .function("inputBuffer", &EnergyBandRatioAlgo::inputBuffer)
+    .function("outputBuffer", &EnergyBandRatioAlgo::outputBuffer)
+    .function("computeInto", &EnergyBandRatioAlgo::computeInto)
+    ;
+  class_<EntropyAlgo>("EntropyAlgo")
+    .constructor<>()
+    .function("configure", &EntropyAlgo::configure)
+    .function("compute", &EntropyAlgo::compute)
+    .function("computeTyped", &EntropyAlgo::computeTyped)
+    .function("inputBuffer", &EntropyAlgo::inputBuffer)
+    .function("outputBuffer", &EntropyAlgo::outputBuffer)
+    .function("computeInto", &EntropyAlgo::computeInto)
+    ;
+  class_<EnvelopeAlgo>("EnvelopeAlgo")
+    .constructor<bool, float, float, float>()
+    .function("configure", &EnvelopeAlgo::configure)
+    .function("compute", &EnvelopeAlgo::compute)
+    .function("computeTyped", &EnvelopeAlgo::computeTyped)
+    .function("inputBuffer", &EnvelopeAlgo::inputBuffer)
+    .function("outputBuffer", &EnvelopeAlgo::outputBuffer)
+    .function("computeInto", &EnvelopeAlgo::computeInto)
+    ;
+  class_<EqualLoudnessAlgo>("EqualLoudnessAlgo")
+    .constructor<float>()
+    .function("configure", &EqualLoudnessAlgo::configure)
+    .function("compute", &EqualLoudnessAlgo::compute)
+    .function("computeTyped", &EqualLoudnessAlgo::computeTyped)
+    .function("inputBuffer", &EqualLoudnessAlgo::inputBuffer)
+    .function("outputBuffer", &EqualLoudnessAlgo::outputBuffer)
+    .function("computeInto", &EqualLoudnessAlgo::computeInto)
+    ;
+  class_<FFTAlgo>("FFTAlgo")
+    .constructor<int>()
+    .function("configure", &FFTAlgo::configure)
+    .function("compute", &FFTAlgo::compute)
+    .function("computeTyped", &FFTAlgo::computeTyped)
+    ;
+  class_<FFTCAlgo>("FFTCAlgo")
+    .constructor<bool, int>()
+    .function("configure", &FFTCAlgo::configure)
+    .function("compute", &FFTCAlgo::compute)
+    .function("computeTyped", &FFTCAlgo::computeTyped)
+    ;
+  class_<FadeDetectionAlgo>("FadeDetectionAlgo")
+    .constructor<float, float, float, float>()
+    .function("configure", &FadeDetectionAlgo::configure)
+    .function("compute", &FadeDetectionAlgo::compute)
+    .function("computeTyped", &FadeDetectionAlgo::computeTyped)
+    ;
+  class_<FalseStereoDetectorAlgo>("FalseStereoDetectorAlgo")
+    .constructor<float, int>()
+    .function("configure", &FalseStereoDetectorAlgo::configure)
+    .function("compute", &FalseStereoDetectorAlgo::compute)
+    .function("computeTyped", &FalseStereoDetectorAlgo::computeTyped)
+    ;
+  class_<FlatnessAlgo>("FlatnessAlgo")
+    .constructor<>()
+    .function("configure", &FlatnessAlgo::configure)
+    .function("compute", &FlatnessAlgo::compute)
+    .function("computeTyped", &FlatnessAlgo::computeTyped)
+    .function("inputBuffer", &FlatnessAlgo::inputBuffer)
+    .function("outputBuffer", &FlatnessAlgo::outputBuffer)
+    .function("computeInto", &FlatnessAlgo::computeInto)
+    ;
+  class_<FlatnessDBAlgo>("FlatnessDBAlgo")
+    .constructor<>()
+    .function("configure", &FlatnessDBAlgo::configure)
+    .function("compute", &FlatnessDBAlgo::compute)
+    .function("computeTyped", &FlatnessDBAlgo::computeTyped)
+    .function("inputBuffer", &FlatnessDBAlgo::inputBuffer)
+    .function("outputBuffer", &FlatnessDBAlgo::outputBuffer)
+    .function("computeInto", &FlatnessDBAlgo::computeInto)
+    ;
+  class_<FlatnessSFXAlgo>("FlatnessSFXAlgo")
+    .constructor<>()
+    .function("configure", &FlatnessSFXAlgo::configure)
+    .function("compute", &FlatnessSFXAlgo::compute)
+    .function("computeTyped", &FlatnessSFXAlgo::computeTyped)
+    .function("inputBuffer", &FlatnessSFXAlgo::inputBuffer)
+    .function("outputBuffer", &FlatnessSFXAlgo::outputBuffer)
+    .function("computeInto", &FlatnessSFXAlgo::computeInto)
+    ;
+  class_<FluxAlgo>("FluxAlgo")
+    .constructor<bool, std::string>()
+    .function("configure", &FluxAlgo::configure)
+    .function("compute", &FluxAlgo::compute)
+    .function("computeTyped", &FluxAlgo::computeTyped)
+    .function("inputBuffer", &FluxAlgo::inputBuffer)
+    .function("outputBuffer", &FluxAlgo::outputBuffer)
+    .function("computeInto", &FluxAlgo::computeInto)
+    ;
+  class_<FrameCutterAlgo>("FrameCutterAlgo")
+    .constructor<int, int, bool, bool, float>()
+    .function("configure", &FrameCutterAlgo::configure)
+    .function("compute", &FrameCutterAlgo::compute)
+    .function("computeTyped", &FrameCutterAlgo::computeTyped)
+    .function("inputBuffer", &FrameCutterAlgo::inputBuffer)
+    .function("outputBuffer", &FrameCutterAlgo::outputBuffer)
+    .function("computeInto", &FrameCutterAlgo::computeInto)
+    ;
+  class_<FrameToRealAlgo>("FrameToRealAlgo")
+    .constructor<int, int>()
+    .function("configure", &FrameToRealAlgo::configure)
+    .function("compute", &FrameToRealAlgo::compute)
+    .function("computeTyped", &FrameToRealAlgo::computeTyped)
+    .function("inputBuffer", &FrameToRealAlgo::inputBuffer)
+    .function("outputBuffer", &FrameToRealAlgo::outputBuffer)
+    .function("computeInto", &FrameToRealAlgo::computeInto)
+    ;
+  class_<FrequencyBandsAlgo>("FrequencyBandsAlgo")
+    .constructor<std::vector<float>, float>()
+    .function("configure", &FrequencyBandsAlgo::configure)
+    .function("compute", &FrequencyBandsAlgo::compute)
+    .function("computeTyped", &FrequencyBandsAlgo::computeTyped)
+    .function("inputBuffer", &FrequencyBandsAlgo::inputBuffer)
+    .function("outputBuffer", &FrequencyBandsAlgo::outputBuffer)
+    .function("computeInto", &FrequencyBandsAlgo::computeInto)
+    ;
+  class_<GFCCAlgo>("GFCCAlgo")
+    .constructor<int, float, int, std::string, float, int, int, float, float, std::string>()
+    .function("configure", &GFCCAlgo::configure)
+    .function("compute", &GFCCAlgo::compute)
+    .function("computeTyped", &GFCCAlgo::computeTyped)
+    .function("inputBuffer", &GFCCAlgo::inputBuffer)
+    .function("outputBuffer", &GFCCAlgo::outputBuffer)
+    .function("computeInto", &GFCCAlgo::computeInto)
+    ;
+  class_<GapsDetectorAlgo>("GapsDetectorAlgo")
+    .constructor<float, int, int, int, float, float, float, float, float, float, float, float>()
+    .function("configure", &GapsDetectorAlgo::configure)
+    .function("compute", &GapsDetectorAlgo::compute)
+    .function("computeTyped", &GapsDetectorAlgo::computeTyped)
+    .function("inputBuffer", &GapsDetectorAlgo::inputBuffer)
+    .function("outputBuffer", &GapsDetectorAlgo::outputBuffer)
+    .function("computeInto", &GapsDetectorAlgo::computeInto)
+    ;
+  class_<GeometricMeanAlgo>("GeometricMeanAlgo")
+    .constructor<>()
+    .function("configure", &GeometricMeanAlgo::configure)
+    .function("compute", &GeometricMeanAlgo::compute)
+    .function("computeTyped", &GeometricMeanAlgo::computeTyped)
+    .function("inputBuffer", &GeometricMeanAlgo::inputBuffer)
+    .function("outputBuffer", &GeometricMeanAlgo::outputBuffer)
+    .function("computeInto", &GeometricMeanAlgo::computeInto)
+    ;
+  class_<HFCAlgo>("HFCAlgo")
+    .constructor<float, std::string>()
+    .function("configure", &HFCAlgo::configure)
+    .function("compute", &HFCAlgo::compute)
+    .function("computeTyped", &HFCAlgo::computeTyped)
+    .function("inputBuffer", &HFCAlgo::inputBuffer)
+    .function("outputBuffer", &HFCAlgo::outputBuffer)
+    .function("computeInto", &HFCAlgo::computeInto)
+    ;
+  class_<HPCPAlgo>("HPCPAlgo")
+    .constructor<bool, float, int, float, bool, float, bool, std::string, float, float, int, std::string, float>()
+    .function("configure", &HPCPAlgo::configure)
+    .function("compute", &HPCPAlgo::compute)
+    .function("computeTyped", &HPCPAlgo::computeTyped)
+    .function("inputBuffer", &HPCPAlgo::inputBuffer)
+    .function("outputBuffer", &HPCPAlgo::outputBuffer)
+    .function("computeInto", &HPCPAlgo::computeInto)
+    ;
+  class_<HarmonicBpmAlgo>("HarmonicBpmAlgo")
+    .constructor<float, float, float>()
+    .function("configure", &HarmonicBpmAlgo::configure)
+    .function("compute", &HarmonicBpmAlgo::compute)
+    .function("computeTyped", &HarmonicBpmAlgo::computeTyped)
+    .function("inputBuffer", &HarmonicBpmAlgo::inputBuffer)
+    .function("outputBuffer", &HarmonicBpmAlgo::outputBuffer)
+    .function("computeInto", &HarmonicBpmAlgo::computeInto)
+    ;
+  class_<HarmonicMaskAlgo>("HarmonicMaskAlgo")
+    .constructor<float, int, float>()
+    .function("configure", &HarmonicMaskAlgo::configure)
+    .function("compute", &HarmonicMaskAlgo::compute)
+    .function("computeTyped", &HarmonicMaskAlgo::computeTyped)
+    ;
+  class_<HarmonicModelAnalAlgo>("HarmonicModelAnalAlgo")
+    .constructor<float, float, float, int, float, float, int, int, float, int, std::string, float>()
+    .function("configure", &HarmonicModelAnalAlgo::configure)
+    .function("compute", &HarmonicModelAnalAlgo::compute)
+    .function("computeTyped", &HarmonicModelAnalAlgo::computeTyped)
+    ;
+  class_<HarmonicPeaksAlgo>("HarmonicPeaksAlgo")
+    .constructor<int, float>()
+    .function("configure", &HarmonicPeaksAlgo::configure)
+    .function("compute", &HarmonicPeaksAlgo::compute)
+    .function("computeTyped", &HarmonicPeaksAlgo::computeTyped)
+    .function("inputBuffer", &HarmonicPeaksAlgo::inputBuffer)
+    .function("outputBuffer", &HarmonicPeaksAlgo::outputBuffer)
+    .function("computeInto", &HarmonicPeaksAlgo::computeInto)
+    ;
+  class_<HighPassAlgo>("HighPassAlgo")
+    .constructor<float, float>()
+    .function("configure", &HighPassAlgo::configure)
+    .function("compute", &HighPassAlgo::compute)
+    .function("computeTyped", &HighPassAlgo::computeTyped)
+    .function("inputBuffer", &HighPassAlgo::inputBuffer)
+    .function("outputBuffer", &HighPassAlgo::outputBuffer)
+    .function("computeInto", &HighPassAlgo::computeInto)
+    ;
+  class_<HighResolutionFeaturesAlgo>("HighResolutionFeaturesAlgo")
+    .constructor<int>()
+    .function("configure", &HighResolutionFeaturesAlgo::configure)
+    .function("compute", &HighResolutionFeaturesAlgo::compute)
+    .function("computeTyped", &HighResolutionFeaturesAlgo::computeTyped)
+    .function("inputBuffer", &HighResolutionFeaturesAlgo::inputBuffer)
+    .function("outputBuffer", &HighResolutionFeaturesAlgo::outputBuffer)
+    .function("computeInto", &HighResolutionFeaturesAlgo::computeInto)
+    ;
+  class_<HistogramAlgo>("HistogramAlgo")
+    .constructor<float, float, std::string, int>()
+    .function("configure", &HistogramAlgo::configure)
+    .function("compute", &HistogramAlgo::compute)
+    .function("computeTyped", &HistogramAlgo::computeTyped)
+    .function("inputBuffer", &HistogramAlgo::inputBuffer)
+    .function("outputBuffer", &HistogramAlgo::outputBuffer)
+    .function("computeInto", &HistogramAlgo::computeInto)
+    ;
+  class_<HprModelAnalAlgo>("HprModelAnalAlgo")
+    .constructor<int, int, float, float, int, float, float, int, int, float, int, std::string, float, float>()
+    .function("configure", &HprModelAnalAlgo::configure)
+    .function("compute", &HprModelAnalAlgo::compute)
+    .function("computeTyped", &HprModelAnalAlgo::computeTyped)
+    .function("inputBuffer", &HprModelAnalAlgo::inputBuffer)
+    .function("outputBuffer", &HprModelAnalAlgo::outputBuffer)
+    .function("computeInto", &HprModelAnalAlgo::computeInto)
+    ;
+  class_<HpsModelAnalAlgo>("HpsModelAnalAlgo")
+    .constructor<int, int, float, float, int, float, float, int, int, float, int, std::string, float, float>()
+    .function("configure", &HpsModelAnalAlgo::configure)
+    .function("compute", &HpsModelAnalAlgo::compute)
+    .function("computeTyped", &HpsModelAnalAlgo::computeTyped)
+    .function("inputBuffer", &HpsModelAnalAlgo::inputBuffer)
+    .function("outputBuffer", &HpsModelAnalAlgo::outputBuffer)
+    .function("computeInto", &HpsModelAnalAlgo::computeInto)
+    ;
+  class_<HumDetectorAlgo>("HumDetectorAlgo")
+    .constructor<float, float, float, float, float, float, float, float, int, float, float, float>()
+    .function("configure", &HumDetectorAlgo::configure)
+    .function("compute", &HumDetectorAlgo::compute)
+    .function("computeTyped", &HumDetectorAlgo::computeTyped)
+    ;
+  class_<IDCTAlgo>("IDCTAlgo")
+    .constructor<int, int, int, int>()
+    .function("configure", &IDCTAlgo::configure)
+    .function("compute", &IDCTAlgo::compute)
+    .function("computeTyped", &IDCTAlgo::computeTyped)
+    .function("inputBuffer", &IDCTAlgo::inputBuffer)
+    .function("outputBuffer", &IDCTAlgo::outputBuffer)
+    .function("computeInto", &IDCTAlgo::computeInto)
+    ;
+  class_<IFFTAlgo>("IFFTAlgo")
+    .constructor<bool, int>()
+    .function("configure", &IFFTAlgo::configure)
+    .function("compute", &IFFTAlgo::compute)
+    .function("computeTyped", &IFFTAlgo::computeTyped)
+    ;
+  class_<IFFTCAlgo>("IFFTCAlgo")
+    .constructor<bool, int>()
+    .function("configure", &IFFTCAlgo::configure)
+    .function("compute", &IFFTCAlgo::compute)
+    .function("computeTyped", &IFFTCAlgo::computeTyped)
+    ;
+  class_<IIRAlgo>("IIRAlgo")
+    .constructor<std::vector<float>, std::vector<float>>()
+    .function("configure", &IIRAlgo::configure)
+    .function("compute", &IIRAlgo::compute)
+    .function("computeTyped", &IIRAlgo::computeTyped)
+    .function("inputBuffer", &IIRAlgo::inputBuffer)
+    .function("outputBuffer", &IIRAlgo::outputBuffer)
+    .function("computeInto", &IIRAlgo::computeInto)
+    ;
+  class_<InharmonicityAlgo>("InharmonicityAlgo")
+    .constructor<>()
+    .function("configure", &InharmonicityAlgo::configure)
+    .function("compute", &InharmonicityAlgo::compute)
+    .function("computeTyped", &InharmonicityAlgo::computeTyped)
+    .function("inputBuffer", &InharmonicityAlgo::inputBuffer)
+    .function("outputBuffer", &InharmonicityAlgo::outputBuffer)
+    .function("computeInto", &InharmonicityAlgo::computeInto)
+    ;
+  class_<InstantPowerAlgo>("InstantPowerAlgo")
+    .constructor<>()
+    .function("configure", &InstantPowerAlgo::configure)
+    .function("compute", &InstantPowerAlgo::compute)
+    .function("computeTyped", &InstantPowerAlgo::computeTyped)
+    .function("inputBuffer", &InstantPowerAlgo::inputBuffer)
+    .function("outputBuffer", &InstantPowerAlgo::outputBuffer)
+    .function("computeInto", &InstantPowerAlgo::computeInto)
+    ;
+  class_<IntensityAlgo>("IntensityAlgo")
+    .constructor<float>()
+    .function("configure", &IntensityAlgo::configure)
+    .function("compute", &IntensityAlgo::compute)
+    .function("computeTyped", &IntensityAlgo::computeTyped)
+    .function("inputBuffer", &IntensityAlgo::inputBuffer)
+    .function("outputBuffer", &IntensityAlgo::outputBuffer)
+    .function("computeInto", &IntensityAlgo::computeInto)
+    ;
+  class_<KeyAlgo>("KeyAlgo")
+    .constructor<int, int, std::string, float, bool, bool, bool>()
+    .function("configure", &KeyAlgo::configure)
+    .function("compute", &KeyAlgo::compute)
+    .function("computeTyped", &KeyAlgo::computeTyped)
+    ;
+  class_<KeyExtractorAlgo>("KeyExtractorAlgo")
+    .constructor<bool, int, int, int, float, int, float, float, std::string, float, float, float, std::string, std::string>()
+    .function("configure", &KeyExtractorAlgo::configure)
+    .function("compute", &KeyExtractorAlgo::compute)
+    .function("computeTyped", &KeyExtractorAlgo::computeTyped)
+    ;
+  class_<LPCAlgo>("LPCAlgo")
+    .constructor<int, float, std::string>()
+    .function("configure", &LPCAlgo::configure)
+    .function("compute", &LPCAlgo::compute)
+    .function("computeTyped", &LPCAlgo::computeTyped)
+    .function("inputBuffer", &LPCAlgo::inputBuffer)
+    .function("outputBuffer", &LPCAlgo::outputBuffer)
+    .function("computeInto", &LPCAlgo::computeInto)
+    ;
+  class_<LarmAlgo>("LarmAlgo")
+    .constructor<float, float, float, float>()
+    .function("configure", &LarmAlgo::configure)
+    .function("compute", &LarmAlgo::compute)
+    .function("computeTyped", &LarmAlgo::computeTyped)
+    .function("inputBuffer", &LarmAlgo::inputBuffer)
+    .function("outputBuffer", &LarmAlgo::outputBuffer)
+    .function("computeInto", &LarmAlgo::computeInto)
+    ;
+  class_<LeqAlgo>("LeqAlgo")
+    .constructor<>()
+    .function("configure", &LeqAlgo::configure)
+    .function("compute", &LeqAlgo::compute)
+    .function("computeTyped", &LeqAlgo::computeTyped)
+    .function("inputBuffer", &LeqAlgo::inputBuffer)
+    .function("outputBuffer", &LeqAlgo::outputBuffer)
+    .function("computeInto", &LeqAlgo::computeInto)
+    ;
+  class_<LevelExtractorAlgo>("LevelExtractorAlgo")
+    .constructor<int, int>()
+    .function("configure", &LevelExtractorAlgo::configure)
+    .function("compute", &LevelExtractorAlgo::compute)
+    .function("computeTyped", &LevelExtractorAlgo::computeTyped)
+    .function("inputBuffer", &LevelExtractorAlgo::inputBuffer)
+    .function("outputBuffer", &LevelExtractorAlgo::outputBuffer)
+    .function("computeInto", &LevelExtractorAlgo::computeInto)
+    ;
+  class_<LogAttackTimeAlgo>("LogAttackTimeAlgo")
+    .constructor<float, float, float>()
+    .function("configure", &LogAttackTimeAlgo::configure)
+    .function("compute", &LogAttackTimeAlgo::compute)
+    .function("computeTyped", &LogAttackTimeAlgo::computeTyped)
+    .function("inputBuffer", &LogAttackTimeAlgo::inputBuffer)
+    .function("outputBuffer", &LogAttackTimeAlgo::outputBuffer)
+    .function("computeInto", &LogAttackTimeAlgo::computeInto)
+    ;
+  class_<LogSpectrumAlgo>("LogSpectrumAlgo")
+    .constructor<float, int, int, float, float>()
+    .function("configure", &LogSpectrumAlgo::configure)
+    .function("compute", &LogSpectrumAlgo::compute)
+    .function("computeTyped", &LogSpectrumAlgo::computeTyped)
+    .function("inputBuffer", &LogSpectrumAlgo::inputBuffer)
+    .function("outputBuffer", &LogSpectrumAlgo::outputBuffer)
+    .function("computeInto", &LogSpectrumAlgo::computeInto)
+    ;
+  class_<LoopBpmConfidenceAlgo>("LoopBpmConfidenceAlgo")
+    .constructor<float>()
+    .function("configure", &LoopBpmConfidenceAlgo::configure)
+    .function("compute", &LoopBpmConfidenceAlgo::compute)
+    .function("computeTyped", &LoopBpmConfidenceAlgo::computeTyped)
+    .function("inputBuffer", &LoopBpmConfidenceAlgo::inputBuffer)
+    .function("outputBuffer", &LoopBpmConfidenceAlgo::outputBuffer)
+    .function("computeInto", &LoopBpmConfidenceAlgo::computeInto)
+    ;
+  class_<LoopBpmEstimatorAlgo>("LoopBpmEstimatorAlgo")
+    .constructor<float>()
+    .function("configure", &LoopBpmEstimatorAlgo::configure)
+    .function("compute", &LoopBpmEstimatorAlgo::compute)
+    .function("computeTyped", &LoopBpmEstimatorAlgo::computeTyped)
+    .function("inputBuffer", &LoopBpmEstimatorAlgo::inputBuffer)
+    .function("outputBuffer", &LoopBpmEstimatorAlgo::outputBuffer)
+    .function("computeInto", &LoopBpmEstimatorAlgo::computeInto)
+    ;
+  class_<LoudnessAlgo>("LoudnessAlgo")
+    .constructor<>()
+    .function("configure", &LoudnessAlgo::configure)
+    .function("compute", &LoudnessAlgo::compute)
+    .function("computeTyped", &LoudnessAlgo::computeTyped)
+    .function("inputBuffer", &LoudnessAlgo::inputBuffer)
+    .function("outputBuffer", &LoudnessAlgo::outputBuffer)
+    .function("computeInto", &LoudnessAlgo::computeInto)
+    ;
+  class_<LoudnessVickersAlgo>("LoudnessVickersAlgo")
+    .constructor<float>()
+    .function("configure", &LoudnessVickersAlgo::configure)
+    .function("compute", &LoudnessVickersAlgo::compute)
+    .function("computeTyped", &LoudnessVickersAlgo::computeTyped)
+    .function("inputBuffer", &LoudnessVickersAlgo::inputBuffer)
+    .function("outputBuffer", &LoudnessVickersAlgo::outputBuffer)
+    .function("computeInto", &LoudnessVickersAlgo::computeInto)
+    ;
+  class_<LowLevelSpectralEqloudExtractorAlgo>("LowLevelSpectralEqloudExtractorAlgo")
+    .constructor<int, int, float>()
+    .function("configure", &LowLevelSpectralEqloudExtractorAlgo::configure)
+    .function("compute", &LowLevelSpectralEqloudExtractorAlgo::compute)
+    .function("computeTyped", &LowLevelSpectralEqloudExtractorAlgo::computeTyped)
+    ;
+  class_<LowLevelSpectralExtractorAlgo>("LowLevelSpectralExtractorAlgo")
+    .constructor<int, int, float>()
+    .function("configure", &LowLevelSpectralExtractorAlgo::configure)
+    .function("compute", &LowLevelSpectralExtractorAlgo::compute)
+    .function("computeTyped", &LowLevelSpectralExtractorAlgo::computeTyped)
+    ;
+  class_<LowPassAlgo>("LowPassAlgo")
+    .constructor<float, float>()
+    .function("configure", &LowPassAlgo::configure)
+    .function("compute", &LowPassAlgo::compute)
+    .function("computeTyped", &LowPassAlgo::computeTyped)
+    .function("inputBuffer", &LowPassAlgo::inputBuffer)
+    .function("outputBuffer", &LowPassAlgo::outputBuffer)
+    .function("computeInto", &LowPassAlgo::computeInto)
+    ;
+  class_<MFCCAlgo>("MFCCAlgo")
+    .constructor<int, float, int, int, std::string, float, std::string, int, int, float, float, std::string, std::string, std::string>()
+    .function("configure", &MFCCAlgo::configure)
+    .function("compute", &MFCCAlgo::compute)
+    .function("computeTyped", &MFCCAlgo::computeTyped)
+    .function("inputBuffer", &MFCCAlgo::inputBuffer)
+    .function("outputBuffer", &MFCCAlgo::outputBuffer)
+    .function("computeInto", &MFCCAlgo::computeInto)
+    ;
+  class_<MagnitudeAlgo>("MagnitudeAlgo")
+    .constructor<>()
+    .function("configure", &MagnitudeAlgo::configure)
+    .function("compute", &MagnitudeAlgo::compute)
+    .function("computeTyped", &MagnitudeAlgo::computeTyped)
+    ;
+  class_<MaxFilterAlgo>("MaxFilterAlgo")
+    .constructor<bool, int>()
+    .function("configure", &MaxFilterAlgo::configure)
+    .function("compute", &MaxFilterAlgo::compute)
+    .function("computeTyped", &MaxFilterAlgo::computeTyped)
+    .function("inputBuffer", &MaxFilterAlgo::inputBuffer)
+    .function("outputBuffer", &MaxFilterAlgo::outputBuffer)
+    .function("computeInto", &MaxFilterAlgo::computeInto)
+    ;
+  class_<MaxMagFreqAlgo>("MaxMagFreqAlgo")
+    .constructor<float>()
+    .function("configure", &MaxMagFreqAlgo::configure)
+    .function("compute", &MaxMagFreqAlgo::compute)
+    .function("computeTyped", &MaxMagFreqAlgo::computeTyped)
+    .function("inputBuffer", &MaxMagFreqAlgo::inputBuffer)
+    .function("outputBuffer", &MaxMagFreqAlgo::outputBuffer)
+    .function("computeInto", &MaxMagFreqAlgo::computeInto)
+    ;
+  class_<MaxToTotalAlgo>("MaxToTotalAlgo")
+    .constructor<>()
+    .function("configure", &MaxToTotalAlgo::configure)
+    .function("compute", &MaxToTotalAlgo::compute)
+    .function("computeTyped", &MaxToTotalAlgo::computeTyped)
+    .function("inputBuffer", &MaxToTotalAlgo::inputBuffer)
+    .function("outputBuffer", &MaxToTotalAlgo::outputBuffer)
+    .function("computeInto", &MaxToTotalAlgo::computeInto)
+    ;
+  class_<MeanAlgo>("MeanAlgo")
+    .constructor<>()
+    .function("configure", &MeanAlgo::configure)
+    .function("compute", &MeanAlgo::compute)
+    .function("computeTyped", &MeanAlgo::computeTyped)
+    .function("inputBuffer", &MeanAlgo::inputBuffer)
+    .function("outputBuffer", &MeanAlgo::outputBuffer)
+    .function("computeInto", &MeanAlgo::computeInto)
+    ;
+  class_<MedianAlgo>("MedianAlgo")
+    .constructor<>()
+    .function("configure", &MedianAlgo::configure)
+    .function("compute", &MedianAlgo::compute)
+    .function("computeTyped", &MedianAlgo::computeTyped)
+    .function("inputBuffer", &MedianAlgo::inputBuffer)
+    .function("outputBuffer", &MedianAlgo::outputBuffer)
+    .function("computeInto", &MedianAlgo::computeInto)
+    ;
+  class_<MedianFilterAlgo>("MedianFilterAlgo")
+    .constructor<int>()
+    .function("configure", &MedianFilterAlgo::configure)
+    .function("compute", &MedianFilterAlgo::compute)
+    .function("computeTyped", &MedianFilterAlgo::computeTyped)
+    .function("inputBuffer", &MedianFilterAlgo::inputBuffer)
+    .function("outputBuffer", &MedianFilterAlgo::outputBuffer)
+    .function("computeInto", &MedianFilterAlgo::computeInto)
+    ;
+  class_<MelBandsAlgo>("MelBandsAlgo")
+    .constructor<float, int, bool, float, std::string, int, float, std::string, std::string, std::string>()
+    .function("configure", &MelBandsAlgo::configure)
+    .function("compute", &MelBandsAlgo::compute)
+    .function("computeTyped", &MelBandsAlgo::computeTyped)
+    .function("inputBuffer", &MelBandsAlgo::inputBuffer)
+    .function("outputBuffer", &MelBandsAlgo::outputBuffer)
+    .function("computeInto", &MelBandsAlgo::computeInto)
+    ;
+  class_<MeterAlgo>("MeterAlgo")
+    .constructor<>()
+    .function("configure", &MeterAlgo::configure)
+    .function("compute", &MeterAlgo::compute)
+    .function("computeTyped", &MeterAlgo::computeTyped)
+    ;
+  class_<MinMaxAlgo>("MinMaxAlgo")
+    .constructor<std::string>()
+    .function("configure", &MinMaxAlgo::configure)
+    .function("compute", &MinMaxAlgo::compute)
+    .function("computeTyped", &MinMaxAlgo::computeTyped)
+    .function("inputBuffer", &MinMaxAlgo::inputBuffer)
+    .function("outputBuffer", &MinMaxAlgo::outputBuffer)
+    .function("computeInto", &MinMaxAlgo::computeInto)
+    ;
+  class_<MinToTotalAlgo>("MinToTotalAlgo")
+    .constructor<>()
+    .function("configure", &MinToTotalAlgo::configure)
+    .function("compute", &MinToTotalAlgo::compute)
+    .function("computeTyped", &MinToTotalAlgo::computeTyped)
+    .function("inputBuffer", &MinToTotalAlgo::inputBuffer)
+    .function("outputBuffer", &MinToTotalAlgo::outputBuffer)
+    .function("computeInto", &MinToTotalAlgo::computeInto)
+    ;
+  class_<MovingAverageAlgo>("MovingAverageAlgo")
+    .constructor<int>()
+    .function("configure", &MovingAverageAlgo::configure)
+    .function("compute", &MovingAverageAlgo::compute)
+    .function("computeTyped", &MovingAverageAlgo::computeTyped)
+    .function("inputBuffer", &MovingAverageAlgo::inputBuffer)
+    .function("outputBuffer", &MovingAverageAlgo::outputBuffer)
+    .function("computeInto", &MovingAverageAlgo::computeInto)
+    ;
+  class_<MultiPitchKlapuriAlgo>("MultiPitchKlapuriAlgo")
+    .constructor<float, int, float, int, float, int, float, float, int, float, float>()
+    .function("configure", &MultiPitchKlapuriAlgo::configure)
+    .function("compute", &MultiPitchKlapuriAlgo::compute)
+    .function("computeTyped", &MultiPitchKlapuriAlgo::computeTyped)
+    ;
+  class_<MultiPitchMelodiaAlgo>("MultiPitchMelodiaAlgo")
+    .constructor<float, int, int, bool, float, int, float, int, float, int, float, int, float, float, float, float, float, int>()
+    .function("configure", &MultiPitchMelodiaAlgo::configure)
+    .function("compute", &MultiPitchMelodiaAlgo::compute)
+    .function("computeTyped", &MultiPitchMelodiaAlgo::computeTyped)
+    ;
+  class_<MultiplexerAlgo>("MultiplexerAlgo")
+    .constructor<int, int>()
+    .function("configure", &MultiplexerAlgo::configure)
+    .function("compute", &MultiplexerAlgo::compute)
+    .function("computeTyped", &MultiplexerAlgo::computeTyped)
+    ;
+  class_<NNLSChromaAlgo>("NNLSChromaAlgo")
+    .constructor<std::string, int, float, float, float, std::string, bool>()
+    .function("configure", &NNLSChromaAlgo::configure)
+    .function("compute", &NNLSChromaAlgo::compute)
+    .function("computeTyped", &NNLSChromaAlgo::computeTyped)
+    ;
+  class_<NoiseAdderAlgo>("NoiseAdderAlgo")
+    .constructor<bool, int>()
+    .function("configure", &NoiseAdderAlgo::configure)
+    .function("compute", &NoiseAdderAlgo::compute)
+    .function("computeTyped", &NoiseAdderAlgo::computeTyped)
+    .function("inputBuffer", &NoiseAdderAlgo::inputBuffer)
+    .function("outputBuffer", &NoiseAdderAlgo::outputBuffer)
+    .function("computeInto", &NoiseAdderAlgo::computeInto)
+    ;
+  class_<NoiseBurstDetectorAlgo>("NoiseBurstDetectorAlgo")
+    .constructor<float, int, int>()
+    .function("configure", &NoiseBurstDetectorAlgo::configure)
+    .function("compute", &NoiseBurstDetectorAlgo::compute)
+    .function("computeTyped", &NoiseBurstDetectorAlgo::computeTyped)
+    .function("inputBuffer", &NoiseBurstDetectorAlgo::inputBuffer)
+    .function("outputBuffer", &NoiseBurstDetectorAlgo::outputBuffer)
+    .function("computeInto", &NoiseBurstDetectorAlgo::computeInto)
+    ;
+  class_<NoveltyCurveAlgo>("NoveltyCurveAlgo")
+    .constructor<float, bool, std::vector<float>, std::string>()
+    .function("configure", &NoveltyCurveAlgo::configure)
+    .function("compute", &NoveltyCurveAlgo::compute)
+    .function("computeTyped", &NoveltyCurveAlgo::computeTyped)
+    ;
+  class_<NoveltyCurveFixedBpmEstimatorAlgo>("NoveltyCurveFixedBpmEstimatorAlgo")
+    .constructor<int, float, float, float, float>()
+    .function("configure", &NoveltyCurveFixedBpmEstimatorAlgo::configure)
+    .function("compute", &NoveltyCurveFixedBpmEstimatorAlgo::compute)
+    .function("computeTyped", &NoveltyCurveFixedBpmEstimatorAlgo::computeTyped)
+    .function("inputBuffer", &NoveltyCurveFixedBpmEstimatorAlgo::inputBuffer)
+    .function("outputBuffer", &NoveltyCurveFixedBpmEstimatorAlgo::outputBuffer)
+    .function("computeInto", &NoveltyCurveFixedBpmEstimatorAlgo::computeInto)
+    ;
+  class_<OddToEvenHarmonicEnergyRatioAlgo>("OddToEvenHarmonicEnergyRatioAlgo")
+    .constructor<>()
+    .function("configure", &OddToEvenHarmonicEnergyRatioAlgo::configure)
+    .function("compute", &OddToEvenHarmonicEnergyRatioAlgo::compute)
+    .function("computeTyped", &OddToEvenHarmonicEnergyRatioAlgo::computeTyped)
+    .function("inputBuffer", &OddToEvenHarmonicEnergyRatioAlgo::inputBuffer)
+    .function("outputBuffer", &OddToEvenHarmonicEnergyRatioAlgo::outputBuffer)
+    .function("computeInto", &OddToEvenHarmonicEnergyRatioAlgo::computeInto)
+    ;
+  class_<OnsetDetectionAlgo>("OnsetDetectionAlgo")
+    .constructor<std::string, float>()
+    .function("configure", &OnsetDetectionAlgo::configure)
+    .function("compute", &OnsetDetectionAlgo::compute)
+    .function("computeTyped", &OnsetDetectionAlgo::computeTyped)
+    .function("inputBuffer", &OnsetDetectionAlgo::inputBuffer)
+    .function("outputBuffer", &OnsetDetectionAlgo::outputBuffer)
+    .function("computeInto", &OnsetDetectionAlgo::computeInto)
+    ;
+  class_<OnsetDetectionGlobalAlgo>("OnsetDetectionGlobalAlgo")
+    .constructor<int, int, std::string, float>()
+    .function("configure", &OnsetDetectionGlobalAlgo::configure)
+    .function("compute", &OnsetDetectionGlobalAlgo::compute)
+    .function("computeTyped", &OnsetDetectionGlobalAlgo::computeTyped)
+    .function("inputBuffer", &OnsetDetectionGlobalAlgo::inputBuffer)
+    .function("outputBuffer", &OnsetDetectionGlobalAlgo::outputBuffer)
+    .function("computeInto", &OnsetDetectionGlobalAlgo::computeInto)
+    ;
+  class_<OnsetRateAlgo>("OnsetRateAlgo")
+    .constructor<>()
+    .function("configure", &OnsetRateAlgo::configure)
+    .function("compute", &OnsetRateAlgo::compute)
+    .function("computeTyped", &OnsetRateAlgo::computeTyped)
+    .function("inputBuffer", &OnsetRateAlgo::inputBuffer)
+    .function("outputBuffer", &OnsetRateAlgo::outputBuffer)
+    .function("computeInto", &OnsetRateAlgo::computeInto)
+    ;
+  class_<OnsetsAlgo>("OnsetsAlgo")
+    .constructor<float, int, float, float>()
+    .function("configure", &OnsetsAlgo::configure)
+    .function("compute", &OnsetsAlgo::compute)
+    .function("computeTyped", &OnsetsAlgo::computeTyped)
+    ;
+  class_<OverlapAddAlgo>("OverlapAddAlgo")
+    .constructor<int, float, int>()
+    .function("configure", &OverlapAddAlgo::configure)
+    .function("compute", &OverlapAddAlgo::compute)
+    .function("computeTyped", &OverlapAddAlgo::computeTyped)
+    .function("inputBuffer", &OverlapAddAlgo::inputBuffer)
+    .function("outputBuffer", &OverlapAddAlgo::outputBuffer)
+    .function("computeInto", &OverlapAddAlgo::computeInto)
+    ;
+  class_<PanningAlgo>("PanningAlgo")
+    .constructor<int, int, int, int, float, bool>()
+    .function("configure", &PanningAlgo::configure)
+    .function("compute", &PanningAlgo::compute)
+    .function("computeTyped", &PanningAlgo::computeTyped)
+    ;
+  class_<PeakDetectionAlgo>("PeakDetectionAlgo")
+    .constructor<bool, int, float, float, float, std::string, float, float>()
+    .function("configure", &PeakDetectionAlgo::configure)
+    .function("compute", &PeakDetectionAlgo::compute)
+    .function("computeTyped", &PeakDetectionAlgo::computeTyped)
+    .function("inputBuffer", &PeakDetectionAlgo::inputBuffer)
+    .function("outputBuffer", &PeakDetectionAlgo::outputBuffer)
+    .function("computeInto", &PeakDetectionAlgo::computeInto)
+    ;
+  class_<PercivalBpmEstimatorAlgo>("PercivalBpmEstimatorAlgo")
+    .constructor<int, int, int, int, int, int, int>()
+    .function("configure", &PercivalBpmEstimatorAlgo::configure)
+    .function("compute", &PercivalBpmEstimatorAlgo::compute)
+    .function("computeTyped", &PercivalBpmEstimatorAlgo::computeTyped)
+    .function("inputBuffer", &PercivalBpmEstimatorAlgo::inputBuffer)
+    .function("outputBuffer", &PercivalBpmEstimatorAlgo::outputBuffer)
+    .function("computeInto", &PercivalBpmEstimatorAlgo::computeInto)
+    ;
+  class_<PercivalEnhanceHarmonicsAlgo>("PercivalEnhanceHarmonicsAlgo")
+    .constructor<>()
+    .function("configure", &PercivalEnhanceHarmonicsAlgo::configure)
+    .function("compute", &PercivalEnhanceHarmonicsAlgo::compute)
+    .function("computeTyped", &PercivalEnhanceHarmonicsAlgo::computeTyped)
+    .function("inputBuffer", &PercivalEnhanceHarmonicsAlgo::inputBuffer)
+    .function("outputBuffer", &PercivalEnhanceHarmonicsAlgo::outputBuffer)
+    .function("computeInto", &PercivalEnhanceHarmonicsAlgo::computeInto)
+    ;
+  class_<PercivalEvaluatePulseTrainsAlgo>("PercivalEvaluatePulseTrainsAlgo")
+    .constructor<>()
+    .function("configure", &PercivalEvaluatePulseTrainsAlgo::configure)
+    .function("compute", &PercivalEvaluatePulseTrainsAlgo::compute)
+    .function("computeTyped", &PercivalEvaluatePulseTrainsAlgo::computeTyped)
+    .function("inputBuffer", &PercivalEvaluatePulseTrainsAlgo::inputBuffer)
+    .function("outputBuffer", &PercivalEvaluatePulseTrainsAlgo::outputBuffer)
+    .function("computeInto", &PercivalEvaluatePulseTrainsAlgo::computeInto)
+    ;
+  class_<PitchContourSegmentationAlgo>("PitchContourSegmentationAlgo")
+    .constructor<int, float, int, int, int, int>()
+    .function("configure", &PitchContourSegmentationAlgo::configure)
+    .function("compute", &PitchContourSegmentationAlgo::compute)
+    .function("computeTyped", &PitchContourSegmentationAlgo::computeTyped)
+    .function("inputBuffer", &PitchContourSegmentationAlgo::inputBuffer)
+    .function("outputBuffer", &PitchContourSegmentationAlgo::outputBuffer)
+    .function("computeInto", &PitchContourSegmentationAlgo::computeInto)
+    ;
+  class_<PitchContoursAlgo>("PitchContoursAlgo")
+    .constructor<float, int, float, float, float, float, float, float>()
+    .function("configure", &PitchContoursAlgo::configure)
+    .function("compute", &PitchContoursAlgo::compute)
+    .function("computeTyped", &PitchContoursAlgo::computeTyped)
+    ;
+  class_<PitchContoursMelodyAlgo>("PitchContoursMelodyAlgo")
+    .constructor<float, int, bool, int, float, float, float, float, bool, float>()
+    .function("configure", &PitchContoursMelodyAlgo::configure)
+    .function("compute", &PitchContoursMelodyAlgo::compute)
+    .function("computeTyped", &PitchContoursMelodyAlgo::computeTyped)
+    ;
+  class_<PitchContoursMonoMelodyAlgo>("PitchContoursMonoMelodyAlgo")
+    .constructor<float, int, bool, int, float, float, float, float>()
+    .function("configure", &PitchContoursMonoMelodyAlgo::configure)
+    .function("compute", &PitchContoursMonoMelodyAlgo::compute)
+    .function("computeTyped", &PitchContoursMonoMelodyAlgo::computeTyped)
+    ;
+  class_<PitchContoursMultiMelodyAlgo>("PitchContoursMultiMelodyAlgo")
+    .constructor<float, int, bool, int, float, float, float, float>()
+    .function("configure", &PitchContoursMultiMelodyAlgo::configure)
+    .function("compute", &PitchContoursMultiMelodyAlgo::compute)
+    .function("computeTyped", &PitchContoursMultiMelodyAlgo::computeTyped)
+    ;
+  class_<PitchFilterAlgo>("PitchFilterAlgo")
+    .constructor<int, int, bool>()
+    .function("configure", &PitchFilterAlgo::configure)
+    .function("compute", &PitchFilterAlgo::compute)
+    .function("computeTyped", &PitchFilterAlgo::computeTyped)
+    .function("inputBuffer", &PitchFilterAlgo::inputBuffer)
+    .function("outputBuffer", &PitchFilterAlgo::outputBuffer)
+    .function("computeInto", &PitchFilterAlgo::computeInto)
+    ;
+  class_<PitchMelodiaAlgo>("PitchMelodiaAlgo")
+    .constructor<float, int, int, bool, float, int, float, int, float, int, float, int, float, float, float, float, float, int>()
+    .function("configure", &PitchMelodiaAlgo::configure)
+    .function("compute", &PitchMelodiaAlgo::compute)
+    .function("computeTyped", &PitchMelodiaAlgo::computeTyped)
+    .function("inputBuffer", &PitchMelodiaAlgo::inputBuffer)
+    .function("outputBuffer", &PitchMelodiaAlgo::outputBuffer)
+    .function("computeInto", &PitchMelodiaAlgo::computeInto)
+    ;
+  class_<PitchSalienceAlgo>("PitchSalienceAlgo")
+    .constructor<float, float, float>()
+    .function("configure", &PitchSalienceAlgo::configure)
+    .function("compute", &PitchSalienceAlgo::compute)
+    .function("computeTyped", &PitchSalienceAlgo::computeTyped)
+    .function("inputBuffer", &PitchSalienceAlgo::inputBuffer)
+    .function("outputBuffer", &PitchSalienceAlgo::outputBuffer)
+    .function("computeInto", &PitchSalienceAlgo::computeInto)
+    ;
+  class_<PitchSalienceFunctionAlgo>("PitchSalienceFunctionAlgo")
+    .constructor<float, float, float, float, int, float>()
+    .function("configure", &PitchSalienceFunctionAlgo::configure)
+    .function("compute", &PitchSalienceFunctionAlgo::compute)
+    .function("computeTyped", &PitchSalienceFunctionAlgo::computeTyped)
+    .function("inputBuffer", &PitchSalienceFunctionAlgo::inputBuffer)
+    .function("outputBuffer", &PitchSalienceFunctionAlgo::outputBuffer)
+    .function("computeInto", &PitchSalienceFunctionAlgo::computeInto)
+    ;
+  class_<PitchSalienceFunctionPeaksAlgo>("PitchSalienceFunctionPeaksAlgo")
+    .constructor<float, float, float, float>()
+    .function("configure", &PitchSalienceFunctionPeaksAlgo::configure)
+    .function("compute", &PitchSalienceFunctionPeaksAlgo::compute)
+    .function("computeTyped", &PitchSalienceFunctionPeaksAlgo::computeTyped)
+    .function("inputBuffer", &PitchSalienceFunctionPeaksAlgo::inputBuffer)
+    .function("outputBuffer", &PitchSalienceFunctionPeaksAlgo::outputBuffer)
+    .function("computeInto", &PitchSalienceFunctionPeaksAlgo::computeInto)
+    ;
+  class_<PitchYinAlgo>("PitchYinAlgo")
+    .constructor<int, bool, float, float, float, float>()
+    .function("configure", &PitchYinAlgo::configure)
+    .function("compute", &PitchYinAlgo::compute)
+    .function("computeTyped", &PitchYinAlgo::computeTyped)
+    .function("inputBuffer", &PitchYinAlgo::inputBuffer)
+    .function("outputBuffer", &PitchYinAlgo::outputBuffer)
+    .function("computeInto", &PitchYinAlgo::computeInto)
+    ;
+  class_<PitchYinFFTAlgo>("PitchYinFFTAlgo")
+    .constructor<int, bool, float, float, float, float, std::string>()
+    .function("configure", &PitchYinFFTAlgo::configure)
+    .function("compute", &PitchYinFFTAlgo::compute)
+    .function("computeTyped", &PitchYinFFTAlgo::computeTyped)
+    .function("inputBuffer", &PitchYinFFTAlgo::inputBuffer)
+    .function("outputBuffer", &PitchYinFFTAlgo::outputBuffer)
+    .function("computeInto", &PitchYinFFTAlgo::computeInto)
+    ;
+  class_<PitchYinProbabilisticAlgo>("PitchYinProbabilisticAlgo")
+    .constructor<int, int, float, std::string, bool, float>()
+    .function("configure", &PitchYinProbabilisticAlgo::configure)
+    .function("compute", &PitchYinProbabilisticAlgo::compute)
+    .function("computeTyped", &PitchYinProbabilisticAlgo::computeTyped)
+    .function("inputBuffer", &PitchYinProbabilisticAlgo::inputBuffer)
+    .function("outputBuffer", &PitchYinProbabilisticAlgo::outputBuffer)
+    .function("computeInto", &PitchYinProbabilisticAlgo::computeInto)
+    ;
+  class_<PitchYinProbabilitiesAlgo>("PitchYinProbabilitiesAlgo")
+    .constructor<int, float, bool, float>()
+    .function("configure", &PitchYinProbabilitiesAlgo::configure)
+    .function("compute", &PitchYinProbabilitiesAlgo::compute)
+    .function("computeTyped", &PitchYinProbabilitiesAlgo::computeTyped)
+    .function("inputBuffer", &PitchYinProbabilitiesAlgo::inputBuffer)
+    .function("outputBuffer", &PitchYinProbabilitiesAlgo::outputBuffer)
+    .function("computeInto", &PitchYinProbabilitiesAlgo::computeInto)
+    ;
+  class_<PitchYinProbabilitiesHMMAlgo>("PitchYinProbabilitiesHMMAlgo")
+    .constructor<float, int, float, float>()
+    .function("configure", &PitchYinProbabilitiesHMMAlgo::configure)
+    .function("compute", &PitchYinProbabilitiesHMMAlgo::compute)
+    .function("computeTyped", &PitchYinProbabilitiesHMMAlgo::computeTyped)
+    ;
+  class_<PolarToCartesianAlgo>("PolarToCartesianAlgo")
+    .constructor<>()
+    .function("configure", &PolarToCartesianAlgo::configure)
+    .function("compute", &PolarToCartesianAlgo::compute)
+    .function("computeTyped", &PolarToCartesianAlgo::computeTyped)
+    ;
+  class_<PowerMeanAlgo>("PowerMeanAlgo")
+    .constructor<float>()
+    .function("configure", &PowerMeanAlgo::configure)
+    .function("compute", &PowerMeanAlgo::compute)
+    .function("computeTyped", &PowerMeanAlgo::computeTyped)
+    .function("inputBuffer", &PowerMeanAlgo::inputBuffer)
+    .function("outputBuffer", &PowerMeanAlgo::outputBuffer)
+    .function("computeInto", &PowerMeanAlgo::computeInto)
+    ;
+  class_<PowerSpectrumAlgo>("PowerSpectrumAlgo")
+    .constructor<int>()
+    .function("configure", &PowerSpectrumAlgo::configure)
+    .function("compute", &PowerSpectrumAlgo::compute)
+    .function("computeTyped", &PowerSpectrumAlgo::computeTyped)
+    .function("inputBuffer", &PowerSpectrumAlgo::inputBuffer)
+    .function("outputBuffer", &PowerSpectrumAlgo::outputBuffer)
+    .function("computeInto", &PowerSpectrumAlgo::computeInto)
+    ;
+  class_<PredominantPitchMelodiaAlgo>("PredominantPitchMelodiaAlgo")
+    .constructor<float, int, int, bool, float, int, float, int, float, int, float, int, float, float, float, float, float, int, bool, float>()
+    .function("configure", &PredominantPitchMelodiaAlgo::configure)
+    .function("compute", &PredominantPitchMelodiaAlgo::compute)
+    .function("computeTyped", &PredominantPitchMelodiaAlgo::computeTyped)
+    .function("inputBuffer", &PredominantPitchMelodiaAlgo::inputBuffer)
+    .function("outputBuffer", &PredominantPitchMelodiaAlgo::outputBuffer)
+    .function("computeInto", &PredominantPitchMelodiaAlgo::computeInto)
+    ;
+  class_<RMSAlgo>("RMSAlgo")
+    .constructor<>()
+    .function("configure", &RMSAlgo::configure)
+    .function("compute", &RMSAlgo::compute)
+    .function("computeTyped", &RMSAlgo::computeTyped)
+    .function("inputBuffer", &RMSAlgo::inputBuffer)
+    .function("outputBuffer", &RMSAlgo::outputBuffer)
+    .function("computeInto", &RMSAlgo::computeInto)
+    ;
+  class_<RawMomentsAlgo>("RawMomentsAlgo")
+    .constructor<float>()
+    .function("configure", &RawMomentsAlgo::configure)
+    .function("compute", &RawMomentsAlgo::compute)
+    .function("computeTyped", &RawMomentsAlgo::computeTyped)
+    .function("inputBuffer", &RawMomentsAlgo::inputBuffer)
+    .function("outputBuffer", &RawMomentsAlgo::outputBuffer)
+    .function("computeInto", &RawMomentsAlgo::computeInto)
+    ;
+  class_<ReplayGainAlgo>("ReplayGainAlgo")
+    .constructor<float>()
+    .function("configure", &ReplayGainAlgo::configure)
+    .function("compute", &ReplayGainAlgo::compute)
+    .function("computeTyped", &ReplayGainAlgo::computeTyped)
+    .function("inputBuffer", &ReplayGainAlgo::inputBuffer)
+    .function("outputBuffer", &ReplayGainAlgo::outputBuffer)
+    .function("computeInto", &ReplayGainAlgo::computeInto)
+    ;
+  class_<ResampleAlgo>("ResampleAlgo")
+    .constructor<float, float, int>()
+    .function("configure", &ResampleAlgo::configure)
+    .function("compute", &ResampleAlgo::compute)
+    .function("computeTyped", &ResampleAlgo::computeTyped)
+    .function("inputBuffer", &ResampleAlgo::inputBuffer)
+    .function("outputBuffer", &ResampleAlgo::outputBuffer)
+    .function("computeInto", &ResampleAlgo::computeInto)
+    ;
+  class_<ResampleFFTAlgo>("ResampleFFTAlgo")
+    .constructor<int, int>()
+    .function("configure", &ResampleFFTAlgo::configure)
+    .function("compute", &ResampleFFTAlgo::compute)
+    .function("computeTyped", &ResampleFFTAlgo::computeTyped)
+    .function("inputBuffer", &ResampleFFTAlgo::inputBuffer)
+    .function("outputBuffer", &ResampleFFTAlgo::outputBuffer)
+    .function("computeInto", &ResampleFFTAlgo::computeInto)
+    ;
+  class_<RhythmDescriptorsAlgo>("RhythmDescriptorsAlgo")
+    .constructor<>()
+    .function("configure", &RhythmDescriptorsAlgo::configure)
+    .function("compute", &RhythmDescriptorsAlgo::compute)
+    .function("computeTyped", &RhythmDescriptorsAlgo::computeTyped)
+    .function("inputBuffer", &RhythmDescriptorsAlgo::inputBuffer)
+    .function("outputBuffer", &RhythmDescriptorsAlgo::outputBuffer)
+    .function("computeInto", &RhythmDescriptorsAlgo::computeInto)
+    ;
+  class_<RhythmExtractorAlgo>("RhythmExtractorAlgo")
+    .constructor<int, int, int, float, int, int, int, float, std::vector<float>, float, bool, bool>()
+    .function("configure", &RhythmExtractorAlgo::configure)
+    .function("compute", &RhythmExtractorAlgo::compute)
+    .function("computeTyped", &RhythmExtractorAlgo::computeTyped)
+    .function("inputBuffer", &RhythmExtractorAlgo::inputBuffer)
+    .function("outputBuffer", &RhythmExtractorAlgo::outputBuffer)
+    .function("computeInto", &RhythmExtractorAlgo::computeInto)
+    ;
+  class_<RhythmExtractor2013Algo>("RhythmExtractor2013Algo")
+    .constructor<int, std::string, int>()
+    .function("configure", &RhythmExtractor2013Algo::configure)
+    .function("compute", &RhythmExtractor2013Algo::compute)
+    .function("computeTyped", &RhythmExtractor2013Algo::computeTyped)
+    .function("inputBuffer", &RhythmExtractor2013Algo::inputBuffer)
+    .function("outputBuffer", &RhythmExtractor2013Algo::outputBuffer)
+    .function("computeInto", &RhythmExtractor2013Algo::computeInto)
+    ;
+  class_<RhythmTransformAlgo>("RhythmTransformAlgo")
+    .constructor<int, int>()
+    .function("configure", &RhythmTransformAlgo::configure)
+    .function("compute", &RhythmTransformAlgo::compute)
+    .function("computeTyped", &RhythmTransformAlgo::computeTyped)
+    ;
+  class_<RollOffAlgo>("RollOffAlgo")
+    .constructor<float, float>()
+    .function("configure", &RollOffAlgo::configure)
+    .function("compute", &RollOffAlgo::compute)
+    .function("computeTyped", &RollOffAlgo::computeTyped)
+    .function("inputBuffer", &RollOffAlgo::inputBuffer)
+    .function("outputBuffer", &RollOffAlgo::outputBuffer)
+    .function("computeInto", &RollOffAlgo::computeInto)
+    ;
+  class_<SBicAlgo>("SBicAlgo")
+    .constructor<float, int, int, int, int, int>()
+    .function("configure", &SBicAlgo::configure)
+    .function("compute", &SBicAlgo::compute)
+    .function("computeTyped", &SBicAlgo::computeTyped)
+    ;
+  class_<SNRAlgo>("SNRAlgo")
+    .constructor<float, float, float, int, float, float, bool>()
+    .function("configure", &SNRAlgo::configure)
+    .function("compute", &SNRAlgo::compute)
+    .function("computeTyped", &SNRAlgo::computeTyped)
+    .function("inputBuffer", &SNRAlgo::inputBuffer)
+    .function("outputBuffer", &SNRAlgo::outputBuffer)
+    .function("computeInto", &SNRAlgo::computeInto)
+    ;
+  class_<SaturationDetectorAlgo>("SaturationDetectorAlgo")
+    .constructor<float, float, int, int, float, float>()
+    .function("configure", &SaturationDetectorAlgo::configure)
+    .function("compute", &SaturationDetectorAlgo::compute)
+    .function("computeTyped", &SaturationDetectorAlgo::computeTyped)
+    .function("inputBuffer", &SaturationDetectorAlgo::inputBuffer)
+    .function("outputBuffer", &SaturationDetectorAlgo::outputBuffer)
+    .function("computeInto", &SaturationDetectorAlgo::computeInto)
+    ;
+  class_<ScaleAlgo>("ScaleAlgo")
+    .constructor<bool, float, float>()
+    .function("configure", &ScaleAlgo::configure)
+    .function("compute", &ScaleAlgo::compute)
+    .function("computeTyped", &ScaleAlgo::computeTyped)
+    .function("inputBuffer", &ScaleAlgo::inputBuffer)
+    .function("outputBuffer", &ScaleAlgo::outputBuffer)
+    .function("computeInto", &ScaleAlgo::computeInto)
+    ;
+  class_<SineModelAnalAlgo>("SineModelAnalAlgo")
+    .constructor<float, float, float, float, int, int, float, std::string, float>()
+    .function("configure", &SineModelAnalAlgo::configure)
+    .function("compute", &SineModelAnalAlgo::compute)
+    .function("computeTyped", &SineModelAnalAlgo::computeTyped)
+    ;
+  class_<SineModelSynthAlgo>("SineModelSynthAlgo")
+    .constructor<int, int, float>()
+    .function("configure", &SineModelSynthAlgo::configure)
+    .function("compute", &SineModelSynthAlgo::compute)
+    .function("computeTyped", &SineModelSynthAlgo::computeTyped)
+    ;
+  class_<SineSubtractionAlgo>("SineSubtractionAlgo")
+    .constructor<int, int, float>()
+    .function("configure", &SineSubtractionAlgo::configure)
+    .function("compute", &SineSubtractionAlgo::compute)
+    .function("computeTyped", &SineSubtractionAlgo::computeTyped)
+    .function("inputBuffer", &SineSubtractionAlgo::inputBuffer)
+    .function("outputBuffer", &SineSubtractionAlgo::outputBuffer)
+    .function("computeInto", &SineSubtractionAlgo::computeInto)
+    ;
+  class_<SingleBeatLoudnessAlgo>("SingleBeatLoudnessAlgo")
+    .constructor<float, float, std::vector<float>, std::string, float>()
+    .function("configure", &SingleBeatLoudnessAlgo::configure)
+    .function("compute", &SingleBeatLoudnessAlgo::compute)
+    .function("computeTyped", &SingleBeatLoudnessAlgo::computeTyped)
+    .function("inputBuffer", &SingleBeatLoudnessAlgo::inputBuffer)
+    .function("outputBuffer", &SingleBeatLoudnessAlgo::outputBuffer)
+    .function("computeInto", &SingleBeatLoudnessAlgo::computeInto)
+    ;
+  class_<SingleGaussianAlgo>("SingleGaussianAlgo")
+    .constructor<>()
+    .function("configure", &SingleGaussianAlgo::configure)
+    .function("compute", &SingleGaussianAlgo::compute)
+    .function("computeTyped", &SingleGaussianAlgo::computeTyped)
+    ;
+  class_<SlicerAlgo>("SlicerAlgo")
+    .constructor<std::vector<float>, float, std::vector<float>, std::string>()
+    .function("configure", &SlicerAlgo::configure)
+    .function("compute", &SlicerAlgo::compute)
+    .function("computeTyped", &SlicerAlgo::computeTyped)
+    ;
+  class_<SpectralCentroidTimeAlgo>("SpectralCentroidTimeAlgo")
+    .constructor<float>()
+    .function("configure", &SpectralCentroidTimeAlgo::configure)
+    .function("compute", &SpectralCentroidTimeAlgo::compute)
+    .function("computeTyped", &SpectralCentroidTimeAlgo::computeTyped)
+    .function("inputBuffer", &SpectralCentroidTimeAlgo::inputBuffer)
+    .function("outputBuffer", &SpectralCentroidTimeAlgo::outputBuffer)
+    .function("computeInto", &SpectralCentroidTimeAlgo::computeInto)
+    ;
+  class_<SpectralComplexityAlgo>("SpectralComplexityAlgo")
+    .constructor<float, float>()
+    .function("configure", &SpectralComplexityAlgo::configure)
+    .function("compute", &SpectralComplexityAlgo::compute)
+    .function("computeTyped", &SpectralComplexityAlgo::computeTyped)
+    .function("inputBuffer", &SpectralComplexityAlgo::inputBuffer)
+    .function("outputBuffer", &SpectralComplexityAlgo::outputBuffer)
+    .function("computeInto", &SpectralComplexityAlgo::computeInto)
+    ;
+  class_<SpectralContrastAlgo>("SpectralContrastAlgo")
+    .constructor<int, float, float, float, int, float, float>()
+    .function("configure", &SpectralContrastAlgo::configure)
+    .function("compute", &SpectralContrastAlgo::compute)
+    .function("computeTyped", &SpectralContrastAlgo::computeTyped)
+    .function("inputBuffer", &SpectralContrastAlgo::inputBuffer)
+    .function("outputBuffer", &SpectralContrastAlgo::outputBuffer)
+    .function("computeInto", &SpectralContrastAlgo::computeInto)
+    ;
+  class_<SpectralPeaksAlgo>("SpectralPeaksAlgo")
+    .constructor<float, float, int, float, std::string, float>()
+    .function("configure", &SpectralPeaksAlgo::configure)
+    .function("compute", &SpectralPeaksAlgo::compute)
+    .function("computeTyped", &SpectralPeaksAlgo::computeTyped)
+    .function("inputBuffer", &SpectralPeaksAlgo::inputBuffer)
+    .function("outputBuffer", &SpectralPeaksAlgo::outputBuffer)
+    .function("computeInto", &SpectralPeaksAlgo::computeInto)
+    ;
+  class_<SpectralWhiteningAlgo>("SpectralWhiteningAlgo")
+    .constructor<float, float>()
+    .function("configure", &SpectralWhiteningAlgo::configure)
+    .function("compute", &SpectralWhiteningAlgo::compute)
+    .function("computeTyped", &SpectralWhiteningAlgo::computeTyped)
+    .function("inputBuffer", &SpectralWhiteningAlgo::inputBuffer)
+    .function("outputBuffer", &SpectralWhiteningAlgo::outputBuffer)
+    .function("computeInto", &SpectralWhiteningAlgo::computeInto)
+    ;
+  class_<SpectrumAlgo>("SpectrumAlgo")
+    .constructor<int>()
+    .function("configure", &SpectrumAlgo::configure)
+    .function("compute", &SpectrumAlgo::compute)
+    .function("computeTyped", &SpectrumAlgo::computeTyped)
+    .function("inputBuffer", &SpectrumAlgo::inputBuffer)
+    .function("outputBuffer", &SpectrumAlgo::outputBuffer)
+    .function("computeInto", &SpectrumAlgo::computeInto)
+    ;
+  class_<SpectrumCQAlgo>("SpectrumCQAlgo")
+    .constructor<int, float, int, int, float, float, float, std::string, bool>()
+    .function("configure", &SpectrumCQAlgo::configure)
+    .function("compute", &SpectrumCQAlgo::compute)
+    .function("computeTyped", &SpectrumCQAlgo::computeTyped)
+    .function("inputBuffer", &SpectrumCQAlgo::inputBuffer)
+    .function("outputBuffer", &SpectrumCQAlgo::outputBuffer)
+    .function("computeInto", &SpectrumCQAlgo::computeInto)
+    ;
+  class_<SpectrumToCentAlgo>("SpectrumToCentAlgo")
+    .constructor<int, float, int, bool, float, std::string, float, std::string>()
+    .function("configure", &SpectrumToCentAlgo::configure)
+    .function("compute", &SpectrumToCentAlgo::compute)
+    .function("computeTyped", &SpectrumToCentAlgo::computeTyped)
+    .function("inputBuffer", &SpectrumToCentAlgo::inputBuffer)
+    .function("outputBuffer", &SpectrumToCentAlgo::outputBuffer)
+    .function("computeInto", &SpectrumToCentAlgo::computeInto)
+    ;
+  class_<SplineAlgo>("SplineAlgo")
+    .constructor<float, float, std::string, std::vector<float>, std::vector<float>>()
+    .function("configure", &SplineAlgo::configure)
+    .function("compute", &SplineAlgo::compute)
+    .function("computeTyped", &SplineAlgo::computeTyped)
+    .function("inputBuffer", &SplineAlgo::inputBuffer)
+    .function("outputBuffer", &SplineAlgo::outputBuffer)
+    .function("computeInto", &SplineAlgo::computeInto)
+    ;
+  class_<SprModelAnalAlgo>("SprModelAnalAlgo")
+    .constructor<int, int, float, int, float, float, int, int, float, std::string, float>()
+    .function("configure", &SprModelAnalAlgo::configure)
+    .function("compute", &SprModelAnalAlgo::compute)
+    .function("computeTyped", &SprModelAnalAlgo::computeTyped)
+    .function("inputBuffer", &SprModelAnalAlgo::inputBuffer)
+    .function("outputBuffer", &SprModelAnalAlgo::outputBuffer)
+    .function("computeInto", &SprModelAnalAlgo::computeInto)
+    ;
+  class_<SprModelSynthAlgo>("SprModelSynthAlgo")
+    .constructor<int, int, float>()
+    .function("configure", &SprModelSynthAlgo::configure)
+    .function("compute", &SprModelSynthAlgo::compute)
+    .function("computeTyped", &SprModelSynthAlgo::computeTyped)
+    .function("inputBuffer", &SprModelSynthAlgo::inputBuffer)
+    .function("outputBuffer", &SprModelSynthAlgo::outputBuffer)
+    .function("computeInto", &SprModelSynthAlgo::computeInto)
+    ;
+  class_<SpsModelAnalAlgo>("SpsModelAnalAlgo")
+    .constructor<int, int, float, int, float, float, int, int, float, std::string, float, float>()
+    .function("configure", &SpsModelAnalAlgo::configure)
+    .function("compute", &SpsModelAnalAlgo::compute)
+    .function("computeTyped", &SpsModelAnalAlgo::computeTyped)
+    .function("inputBuffer", &SpsModelAnalAlgo::inputBuffer)
+    .function("outputBuffer", &SpsModelAnalAlgo::outputBuffer)
+    .function("computeInto", &SpsModelAnalAlgo::computeInto)
+    ;
+  class_<SpsModelSynthAlgo>("SpsModelSynthAlgo")
+    .constructor<int, int, float, float>()
+    .function("configure", &SpsModelSynthAlgo::configure)
+    .function("compute", &SpsModelSynthAlgo::compute)
+    .function("computeTyped", &SpsModelSynthAlgo::computeTyped)
+    .function("inputBuffer", &SpsModelSynthAlgo::inputBuffer)
+    .function("outputBuffer", &SpsModelSynthAlgo::outputBuffer)
+    .function("computeInto", &SpsModelSynthAlgo::computeInto)
+    ;
+  class_<StartStopCutAlgo>("StartStopCutAlgo")
+    .constructor<int, int, float, float, float, int>()
+    .function("configure", &StartStopCutAlgo::configure)
+    .function("compute", &StartStopCutAlgo::compute)
+    .function("computeTyped", &StartStopCutAlgo::computeTyped)
+    .function("inputBuffer", &StartStopCutAlgo::inputBuffer)
+    .function("outputBuffer", &StartStopCutAlgo::outputBuffer)
+    .function("computeInto", &StartStopCutAlgo::computeInto)
+    ;
+  class_<StartStopSilenceAlgo>("StartStopSilenceAlgo")
+    .constructor<int>()
+    .function("configure", &StartStopSilenceAlgo::configure)
+    .function("compute", &StartStopSilenceAlgo::compute)
+    .function("computeTyped", &StartStopSilenceAlgo::computeTyped)
+    .function("inputBuffer", &StartStopSilenceAlgo::inputBuffer)
+    .function("outputBuffer", &StartStopSilenceAlgo::outputBuffer)
+    .function("computeInto", &StartStopSilenceAlgo::computeInto)
+    ;
+  class_<StereoDemuxerAlgo>("StereoDemuxerAlgo")
+    .constructor<>()
+    .function("configure", &StereoDemuxerAlgo::configure)
+    .function("compute", &StereoDemuxerAlgo::compute)
+    .function("computeTyped", &StereoDemuxerAlgo::computeTyped)
+    ;
+  class_<StereoMuxerAlgo>("StereoMuxerAlgo")
+    .constructor<>()
+    .function("configure", &StereoMuxerAlgo::configure)
+    .function("compute", &StereoMuxerAlgo::compute)
+    .function("computeTyped", &StereoMuxerAlgo::computeTyped)
+    ;
+  class_<StereoTrimmerAlgo>("StereoTrimmerAlgo")
+    .constructor<bool, float, float, float>()
+    .function("configure", &StereoTrimmerAlgo::configure)
+    .function("compute", &StereoTrimmerAlgo::compute)
+    .function("computeTyped", &StereoTrimmerAlgo::computeTyped)
+    ;
+  class_<StochasticModelAnalAlgo>("StochasticModelAnalAlgo")
+    .constructor<int, int, float, float>()
+    .function("configure", &StochasticModelAnalAlgo::configure)
+    .function("compute", &StochasticModelAnalAlgo::compute)
+    .function("computeTyped", &StochasticModelAnalAlgo::computeTyped)
+    .function("inputBuffer", &StochasticModelAnalAlgo::inputBuffer)
+    .function("outputBuffer", &StochasticModelAnalAlgo::outputBuffer)
+    .function("computeInto", &StochasticModelAnalAlgo::computeInto)
+    ;
+  class_<StochasticModelSynthAlgo>("StochasticModelSynthAlgo")
+    .constructor<int, int, float, float>()
+    .function("configure", &StochasticModelSynthAlgo::configure)
+    .function("compute", &StochasticModelSynthAlgo::compute)
+    .function("computeTyped", &StochasticModelSynthAlgo::computeTyped)
+    .function("inputBuffer", &StochasticModelSynthAlgo::inputBuffer)
+    .function("outputBuffer", &StochasticModelSynthAlgo::outputBuffer)
+    .function("computeInto", &StochasticModelSynthAlgo::computeInto)
+    ;
+  class_<StrongDecayAlgo>("StrongDecayAlgo")
+    .constructor<float>()
+    .function("configure", &StrongDecayAlgo::configure)
+    .function("compute", &StrongDecayAlgo::compute)
+    .function("computeTyped", &StrongDecayAlgo::computeTyped)
+    .function("inputBuffer", &StrongDecayAlgo::inputBuffer)
+    .function("outputBuffer", &StrongDecayAlgo::outputBuffer)
+    .function("computeInto", &StrongDecayAlgo::computeInto)
+    ;
+  class_<StrongPeakAlgo>("StrongPeakAlgo")
+    .constructor<>()
+    .function("configure", &StrongPeakAlgo::configure)
+    .function("compute", &StrongPeakAlgo::compute)
+    .function("computeTyped", &StrongPeakAlgo::computeTyped)
+    .function("inputBuffer", &StrongPeakAlgo::inputBuffer)
+    .function("outputBuffer", &StrongPeakAlgo::outputBuffer)
+    .function("computeInto", &StrongPeakAlgo::computeInto)
+    ;
+  class_<SuperFluxExtractorAlgo>("SuperFluxExtractorAlgo")
+    .constructor<float, int, int, float, float, float>()
+    .function("configure", &SuperFluxExtractorAlgo::configure)
+    .function("compute", &SuperFluxExtractorAlgo::compute)
+    .function("computeTyped", &SuperFluxExtractorAlgo::computeTyped)
+    .function("inputBuffer", &SuperFluxExtractorAlgo::inputBuffer)
+    .function("outputBuffer", &SuperFluxExtractorAlgo::outputBuffer)
+    .function("computeInto", &SuperFluxExtractorAlgo::computeInto)
+    ;
+  class_<SuperFluxNoveltyAlgo>("SuperFluxNoveltyAlgo")
+    .constructor<int, int>()
+    .function("configure", &SuperFluxNoveltyAlgo::configure)
+    .function("compute", &SuperFluxNoveltyAlgo::compute)
+    .function("computeTyped", &SuperFluxNoveltyAlgo::computeTyped)
+    ;
+  class_<SuperFluxPeaksAlgo>("SuperFluxPeaksAlgo")
+    .constructor<float, float, float, float, float, float>()
+    .function("configure", &SuperFluxPeaksAlgo::configure)
+    .function("compute", &SuperFluxPeaksAlgo::compute)
+    .function("computeTyped", &SuperFluxPeaksAlgo::computeTyped)
+    .function("inputBuffer", &SuperFluxPeaksAlgo::inputBuffer)
+    .function("outputBuffer", &SuperFluxPeaksAlgo::outputBuffer)
+    .function("computeInto", &SuperFluxPeaksAlgo::computeInto)
+    ;
+  class_<TCToTotalAlgo>("TCToTotalAlgo")
+    .constructor<>()
+    .function("configure", &TCToTotalAlgo::configure)
+    .function("compute", &TCToTotalAlgo::compute)
+    .function("computeTyped", &TCToTotalAlgo::computeTyped)
+    .function("inputBuffer", &TCToTotalAlgo::inputBuffer)
+    .function("outputBuffer", &TCToTotalAlgo::outputBuffer)
+    .function("computeInto", &TCToTotalAlgo::computeInto)
+    ;
+  class_<TempoScaleBandsAlgo>("TempoScaleBandsAlgo")
+    .constructor<std::vector<float>, float>()
+    .function("configure", &TempoScaleBandsAlgo::configure)
+    .function("compute", &TempoScaleBandsAlgo::compute)
+    .function("computeTyped", &TempoScaleBandsAlgo::computeTyped)
+    .function("inputBuffer", &TempoScaleBandsAlgo::inputBuffer)
+    .function("outputBuffer", &TempoScaleBandsAlgo::outputBuffer)
+    .function("computeInto", &TempoScaleBandsAlgo::computeInto)
+    ;
+  class_<TempoTapAlgo>("TempoTapAlgo")
+    .constructor<int, int, int, int, int, float, std::vector<float>>()
+    .function("configure", &TempoTapAlgo::configure)
+    .function("compute", &TempoTapAlgo::compute)
+    .function("computeTyped", &TempoTapAlgo::computeTyped)
+    .function("inputBuffer", &TempoTapAlgo::inputBuffer)
+    .function("outputBuffer", &TempoTapAlgo::outputBuffer)
+    .function("computeInto", &TempoTapAlgo::computeInto)
+    ;
+  class_<TempoTapDegaraAlgo>("TempoTapDegaraAlgo")
+    .constructor<int, int, std::string, float>()
+    .function("configure", &TempoTapDegaraAlgo::configure)
+    .function("compute", &TempoTapDegaraAlgo::compute)
+    .function("computeTyped", &TempoTapDegaraAlgo::computeTyped)
+    .function("inputBuffer", &TempoTapDegaraAlgo::inputBuffer)
+    .function("outputBuffer", &TempoTapDegaraAlgo::outputBuffer)
+    .function("computeInto", &TempoTapDegaraAlgo::computeInto)
+    ;
+  class_<TempoTapMaxAgreementAlgo>("TempoTapMaxAgreementAlgo")
+    .constructor<>()
+    .function("configure", &TempoTapMaxAgreementAlgo::configure)
+    .function("compute", &TempoTapMaxAgreementAlgo::compute)
+    .function("computeTyped", &TempoTapMaxAgreementAlgo::computeTyped)
+    ;
+  class_<TempoTapTicksAlgo>("TempoTapTicksAlgo")
+    .constructor<int, int, float>()
+    .function("configure", &TempoTapTicksAlgo::configure)
+    .function("compute", &TempoTapTicksAlgo::compute)
+    .function("computeTyped", &TempoTapTicksAlgo::computeTyped)
+    .function("inputBuffer", &TempoTapTicksAlgo::inputBuffer)
+    .function("outputBuffer", &TempoTapTicksAlgo::outputBuffer)
+    .function("computeInto", &TempoTapTicksAlgo::computeInto)
+    ;
+  class_<TensorflowInputMusiCNNAlgo>("TensorflowInputMusiCNNAlgo")
+    .constructor<>()
+    .function("configure", &TensorflowInputMusiCNNAlgo::configure)
+    .function("compute", &TensorflowInputMusiCNNAlgo::compute)
+    .function("computeTyped", &TensorflowInputMusiCNNAlgo::computeTyped)
+    .function("inputBuffer", &TensorflowInputMusiCNNAlgo::inputBuffer)
+    .function("outputBuffer", &TensorflowInputMusiCNNAlgo::outputBuffer)
+    .function("computeInto", &TensorflowInputMusiCNNAlgo::computeInto)
+    ;
+  class_<TensorflowInputVGGishAlgo>("TensorflowInputVGGishAlgo")
+    .constructor<>()
+    .function("configure", &TensorflowInputVGGishAlgo::configure)
+    .function("compute", &TensorflowInputVGGishAlgo::compute)
+    .function("computeTyped", &TensorflowInputVGGishAlgo::computeTyped)
+    .function("inputBuffer", &TensorflowInputVGGishAlgo::inputBuffer)
+    .function("outputBuffer", &TensorflowInputVGGishAlgo::outputBuffer)
+    .function("computeInto", &TensorflowInputVGGishAlgo::computeInto)
+    ;
+  class_<TonalExtractorAlgo>("TonalExtractorAlgo")
+    .constructor<int, int, float>()
+    .function("configure", &TonalExtractorAlgo::configure)
+    .function("compute", &TonalExtractorAlgo::compute)
+    .function("computeTyped", &TonalExtractorAlgo::computeTyped)
+    ;
+  class_<TonicIndianArtMusicAlgo>("TonicIndianArtMusicAlgo")
+    .constructor<float, int, float, int, float, float, float, float, int, int, float, float>()
+    .function("configure", &TonicIndianArtMusicAlgo::configure)
+    .function("compute", &TonicIndianArtMusicAlgo::compute)
+    .function("computeTyped", &TonicIndianArtMusicAlgo::computeTyped)
+    .function("inputBuffer", &TonicIndianArtMusicAlgo::inputBuffer)
+    .function("outputBuffer", &TonicIndianArtMusicAlgo::outputBuffer)
+    .function("computeInto", &TonicIndianArtMusicAlgo::computeInto)
+    ;
+  class_<TriangularBandsAlgo>("TriangularBandsAlgo")
+    .constructor<std::vector<float>, int, bool, std::string, float, std::string, std::string>()
+    .function("configure", &TriangularBandsAlgo::configure)
+    .function("compute", &TriangularBandsAlgo::compute)
+    .function("computeTyped", &TriangularBandsAlgo::computeTyped)
+    .function("inputBuffer", &TriangularBandsAlgo::inputBuffer)
+    .function("outputBuffer", &TriangularBandsAlgo::outputBuffer)
+    .function("computeInto", &TriangularBandsAlgo::computeInto)
+    ;
+  class_<TriangularBarkBandsAlgo>("TriangularBarkBandsAlgo")
+    .constructor<float, int, bool, float, std::string, int, float, std::string, std::string>()
+    .function("configure", &TriangularBarkBandsAlgo::configure)
+    .function("compute", &TriangularBarkBandsAlgo::compute)
+    .function("computeTyped", &TriangularBarkBandsAlgo::computeTyped)
+    .function("inputBuffer", &TriangularBarkBandsAlgo::inputBuffer)
+    .function("outputBuffer", &TriangularBarkBandsAlgo::outputBuffer)
+    .function("computeInto", &TriangularBarkBandsAlgo::computeInto)
+    ;
+  class_<TrimmerAlgo>("TrimmerAlgo")
+    .constructor<bool, float, float, float>()
+    .function("configure", &TrimmerAlgo::configure)
+    .function("compute", &TrimmerAlgo::compute)
+    .function("computeTyped", &TrimmerAlgo::computeTyped)
+    .function("inputBuffer", &TrimmerAlgo::inputBuffer)
+    .function("outputBuffer", &TrimmerAlgo::outputBuffer)
+    .function("computeInto", &TrimmerAlgo::computeInto)
+    ;
+  class_<TristimulusAlgo>("TristimulusAlgo")
+    .constructor<>()
+    .function("configure", &TristimulusAlgo::configure)
+    .function("compute", &TristimulusAlgo::compute)
+    .function("computeTyped", &TristimulusAlgo::computeTyped)
+    .function("inputBuffer", &TristimulusAlgo::inputBuffer)
+    .function("outputBuffer", &TristimulusAlgo::outputBuffer)
+    .function("computeInto", &TristimulusAlgo::computeInto)
+    ;
+  class_<TruePeakDetectorAlgo>("TruePeakDetectorAlgo")
+    .constructor<bool, bool, int, int, float, float, int>()
+    .function("configure", &TruePeakDetectorAlgo::configure)
+    .function("compute", &TruePeakDetectorAlgo::compute)
+    .function("computeTyped", &TruePeakDetectorAlgo::computeTyped)
+    .function("inputBuffer", &TruePeakDetectorAlgo::inputBuffer)
+    .function("outputBuffer", &TruePeakDetectorAlgo::outputBuffer)
+    .function("computeInto", &TruePeakDetectorAlgo::computeInto)
+    ;
+  class_<TuningFrequencyAlgo>("TuningFrequencyAlgo")
+    .constructor<float>()
+    .function("configure", &TuningFrequencyAlgo::configure)
+    .function("compute", &TuningFrequencyAlgo::compute)
+    .function("computeTyped", &TuningFrequencyAlgo::computeTyped)
+    .function("inputBuffer", &TuningFrequencyAlgo::inputBuffer)
+    .function("outputBuffer", &TuningFrequencyAlgo::outputBuffer)
+    .function("computeInto", &TuningFrequencyAlgo::computeInto)
+    ;
+  class_<TuningFrequencyExtractorAlgo>("TuningFrequencyExtractorAlgo")
+    .constructor<int, int>()
+    .function("configure", &TuningFrequencyExtractorAlgo::configure)
+    .function("compute", &TuningFrequencyExtractorAlgo::compute)
+    .function("computeTyped", &TuningFrequencyExtractorAlgo::computeTyped)
+    .function("inputBuffer", &TuningFrequencyExtractorAlgo::inputBuffer)
+    .function("outputBuffer", &TuningFrequencyExtractorAlgo::outputBuffer)
+    .function("computeInto", &TuningFrequencyExtractorAlgo::computeInto)
+    ;
+  class_<UnaryOperatorAlgo>("UnaryOperatorAlgo")
+    .constructor<float, float, std::string>()
+    .function("configure", &UnaryOperatorAlgo::configure)
+    .function("compute", &UnaryOperatorAlgo::compute)
+    .function("computeTyped", &UnaryOperatorAlgo::computeTyped)
+    .function("inputBuffer", &UnaryOperatorAlgo::inputBuffer)
+    .function("outputBuffer", &UnaryOperatorAlgo::outputBuffer)
+    .function("computeInto", &UnaryOperatorAlgo::computeInto)
+    ;
+  class_<UnaryOperatorStreamAlgo>("UnaryOperatorStreamAlgo")
+    .constructor<float, float, std::string>()
+    .function("configure", &UnaryOperatorStreamAlgo::configure)
+    .function("compute", &UnaryOperatorStreamAlgo::compute)
+    .function("computeTyped", &UnaryOperatorStreamAlgo::computeTyped)
+    .function("inputBuffer", &UnaryOperatorStreamAlgo::inputBuffer)
+    .function("outputBuffer", &UnaryOperatorStreamAlgo::outputBuffer)
+    .function("computeInto", &UnaryOperatorStreamAlgo::computeInto)
+    ;
+  class_<VarianceAlgo>("VarianceAlgo")
+    .constructor<>()
+    .function("configure", &VarianceAlgo::configure)
+    .function("compute", &VarianceAlgo::compute)
+    .function("computeTyped", &VarianceAlgo::computeTyped)
+    .function("inputBuffer", &VarianceAlgo::inputBuffer)
+    .function("outputBuffer", &VarianceAlgo::outputBuffer)
+    .function("computeInto", &VarianceAlgo::computeInto)
+    ;
+  class_<VibratoAlgo>("VibratoAlgo")
+    .constructor<float, float, float, float, float>()
+    .function("configure", &VibratoAlgo::configure)
+    .function("compute", &VibratoAlgo::compute)
+    .function("computeTyped", &VibratoAlgo::computeTyped)
+    .function("inputBuffer", &VibratoAlgo::inputBuffer)
+    .function("outputBuffer", &VibratoAlgo::outputBuffer)
+    .function("computeInto", &VibratoAlgo::computeInto)
+    ;
+  class_<WarpedAutoCorrelationAlgo>("WarpedAutoCorrelationAlgo")
+    .constructor<int, float>()
+    .function("configure", &WarpedAutoCorrelationAlgo::configure)
+    .function("compute", &WarpedAutoCorrelationAlgo::compute)
+    .function("computeTyped", &WarpedAutoCorrelationAlgo::computeTyped)
+    .function("inputBuffer", &WarpedAutoCorrelationAlgo::inputBuffer)
+    .function("outputBuffer", &WarpedAutoCorrelationAlgo::outputBuffer)
+    .function("computeInto", &WarpedAutoCorrelationAlgo::computeInto)
+    ;
+  class_<WelchAlgo>("WelchAlgo")
+    .constructor<int, int, int, float, std::string, std::string>()
+    .function("configure", &WelchAlgo::configure)
+    .function("compute", &WelchAlgo::compute)
+    .function("computeTyped", &WelchAlgo::computeTyped)
+    .function("inputBuffer", &WelchAlgo::inputBuffer)
+    .function("outputBuffer", &WelchAlgo::outputBuffer)
+    .function("computeInto", &WelchAlgo::computeInto)
+    ;
+  class_<WindowingAlgo>("WindowingAlgo")
+    .constructor<int, bool, int, bool, bool, std::string, int, bool>()
+    .function("configure", &WindowingAlgo::configure)
+    .function("compute", &WindowingAlgo::compute)
+    .function("computeTyped", &WindowingAlgo::computeTyped)
+    .function("inputBuffer", &WindowingAlgo::inputBuffer)
+    .function("outputBuffer", &WindowingAlgo::outputBuffer)
+    .function("computeInto", &WindowingAlgo::computeInto)
+    ;
+  class_<ZeroCrossingRateAlgo>("ZeroCrossingRateAlgo")
+    .constructor<float>()
+    .function("configure", &ZeroCrossingRateAlgo::configure)
+    .function("compute", &ZeroCrossingRateAlgo::compute)
+    .function("computeTyped", &ZeroCrossingRateAlgo::computeTyped)
+    .function("inputBuffer", &ZeroCrossingRateAlgo::inputBuffer)
+    .function("outputBuffer", &ZeroCrossingRateAlgo::outputBuffer)
+    .function("computeInto", &ZeroCrossingRateAlgo::computeInto)
+    ;
 }
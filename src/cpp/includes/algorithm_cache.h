@@ -0,0 +1,212 @@
+/*
+ * Copyright (C) 2006-2020  Music Technology Group - Universitat Pompeu Fabra
+ *
+ * This file is part of Essentia
+ *
+ * Essentia is free software: you can redistribute it and/or modify it under
+ * the terms of the GNU Affero General Public License as published by the Free
+ * Software Foundation (FSF), either version 3 of the License, or (at your
+ * option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful, but WITHOUT
+ * ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+ * FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+ * details.
+ *
+ * You should have received a copy of the Affero GNU General Public License
+ * version 3 along with this program.  If not, see http://www.gnu.org/licenses/
+ */
+
+// Internal header of the essentia.js cpp sources which is shared by essentiajs.cpp and the generated 
+// per-algorithm sources (see the split sources mode of configure_bindings.py). It is not exposed to the bindings.
+
+#ifndef ESSENTIAJS_ALGORITHM_CACHE_H
+#define ESSENTIAJS_ALGORITHM_CACHE_H
+
+#include <emscripten.h>
+#include <essentia/algorithmfactory.h>
+#include <list>
+#include <map>
+#include <sstream>
+#include "essentiajs.h"
+
+using namespace essentia;
+using namespace essentia::standard;
+
+// A bounded least-recently-used cache of configured essentia algorithm instances 
+// keyed by the algorithm name and its parameter values
+class AlgorithmCache {
+  public:
+    unsigned int hits;
+    unsigned int misses;
+
+    AlgorithmCache(unsigned int capacity) : hits(0), misses(0), _capacity(capacity) {};
+    ~AlgorithmCache() { clear(); };
+
+    // returns the cached algorithm for a given key or NULL if there is none
+    Algorithm* get(const std::string& key) {
+      std::map<std::string, std::list<Entry>::iterator>::iterator it = _index.find(key);
+      if (it == _index.end()) {
+        misses++;
+        return NULL;
+      }
+      hits++;
+      // move the entry to the front as the most recently used one
+      _entries.splice(_entries.begin(), _entries, it->second);
+      return it->second->second;
+    };
+
+    // add an algorithm to the cache, the cache takes the ownership of the algorithm
+    void put(const std::string& key, Algorithm* algorithm) {
+      _entries.push_front(Entry(key, algorithm));
+      _index[key] = _entries.begin();
+      evict();
+    };
+
+    void resize(unsigned int capacity) {
+      _capacity = capacity;
+      evict();
+    };
+
+    // delete all the cached algorithms
+    void clear() {
+      for (std::list<Entry>::iterator it = _entries.begin(); it != _entries.end(); ++it) {
+        delete it->second;
+      }
+      _entries.clear();
+      _index.clear();
+    };
+
+    unsigned int size() const { return _entries.size(); };
+    unsigned int capacity() const { return _capacity; };
+
+  private:
+    typedef std::pair<std::string, Algorithm*> Entry;
+    unsigned int _capacity;
+    std::list<Entry> _entries;
+    std::map<std::string, std::list<Entry>::iterator> _index;
+
+    // delete the least recently used algorithms until the cache fits its capacity
+    void evict() {
+      while (_entries.size() > _capacity) {
+        delete _entries.back().second;
+        _index.erase(_entries.back().first);
+        _entries.pop_back();
+      }
+    };
+};
+
+// append a value to an algorithm cache key, the strings are prefixed with their length so that a string value which
+// contains the separators of the key cannot collide with another tuple of parameters
+template <typename T>
+void appendValueToCacheKey(std::ostringstream& key, const T& value) {
+  key << value;
+}
+
+inline void appendValueToCacheKey(std::ostringstream& key, const std::string& value) {
+  key << value.size() << ":" << value;
+}
+
+inline void appendValueToCacheKey(std::ostringstream& key, const char* value) {
+  appendValueToCacheKey(key, std::string(value));
+}
+
+// append a parameter name or value to an algorithm cache key
+template <typename T>
+void appendToCacheKey(std::ostringstream& key, const T& value) {
+  key << "|";
+  appendValueToCacheKey(key, value);
+}
+
+template <typename T>
+void appendToCacheKey(std::ostringstream& key, const std::vector<T>& values) {
+  key << "|[" << values.size() << ":";
+  for (size_t i=0; i<values.size(); i++) {
+    appendValueToCacheKey(key, values[i]);
+    key << ",";
+  }
+  key << "]";
+}
+
+// create a unique cache key from the algorithm name and its parameter names and values
+template <typename... Args>
+std::string algorithmCacheKey(const std::string& name, const Args&... args) {
+  std::ostringstream key;
+  // use enough digits to distinguish any two single precision floats
+  key.precision(9);
+  key << name;
+  int expand[] = {0, (appendToCacheKey(key, args), 0)...};
+  (void)expand;
+  return key.str();
+}
+
+#ifdef ESSENTIAJS_DISPATCHER
+// create a unique cache key from the algorithm name and a parameter map, whose parameters are sorted by name
+inline std::string algorithmCacheKey(const std::string& name, const ParameterMap& params) {
+  std::ostringstream key;
+  key.precision(9);
+  key << name;
+  for (ParameterMap::const_iterator it = params.begin(); it != params.end(); ++it) {
+    std::ostringstream value;
+    value.precision(9);
+    value << it->second;
+    key << "|" << it->first << "|";
+    appendValueToCacheKey(key, value.str());
+  }
+  return key.str();
+}
+#endif
+
+// number of bytes of the data of the algorithm inputs and outputs counted by the profiling instrumentation
+template <typename T>
+double profileBytes(const T& value) {
+  return sizeof(T);
+}
+
+inline double profileBytes(const std::string& value) {
+  return value.size();
+}
+
+inline double profileBytes(const std::vector<float>& values) {
+  return values.size() * sizeof(float);
+}
+
+inline double profileBytes(const std::vector<std::complex<float> >& values) {
+  return values.size() * sizeof(std::complex<float>);
+}
+
+inline double profileBytes(const std::vector<StereoSample>& values) {
+  return values.size() * sizeof(StereoSample);
+}
+
+template <typename T>
+double profileBytes(const std::vector<T>& values) {
+  double bytes = 0;
+  for (size_t i=0; i<values.size(); i++) bytes += profileBytes(values[i]);
+  return bytes;
+}
+
+template <typename T>
+double profileBytes(const TNT::Array2D<T>& values) {
+  return values.dim1() * values.dim2() * sizeof(T);
+}
+
+// create a configured algorithm with the given parameters or reuse a cached one if caching is enabled
+template <typename... Args>
+Algorithm* EssentiaJS::createAlgorithm(const std::string& name, const Args&... args) {
+  AlgorithmFactory& factory = standard::AlgorithmFactory::instance();
+  if (!_algorithmCache) return factory.create(name, args...);
+
+  std::string key = algorithmCacheKey(name, args...);
+  Algorithm* algorithm = _algorithmCache->get(key);
+  if (algorithm) {
+    // reset the internal state so that the cached algorithm computes like a newly created one
+    algorithm->reset();
+  } else {
+    algorithm = factory.create(name, args...);
+    _algorithmCache->put(key, algorithm);
+  }
+  return algorithm;
+}
+
+#endif  // ESSENTIAJS_ALGORITHM_CACHE_H
@@ -22,27 +22,81 @@
 #ifndef ESSENTIAJS_H
 #define ESSENTIAJS_H
 
+#include <complex>
+#include <map>
+#include <set>
 #include <emscripten/bind.h>
+#include <essentia/types.h>
+#include <essentia/utils/tnt/tnt.h>
 
 using namespace emscripten;
 
+// forward declaration of the essentia standard mode algorithm base class
+namespace essentia { namespace standard { class Algorithm; } }
+
+// forward declarations of the essentia streaming mode classes used by StreamingNetwork
+namespace essentia { class Pool; }
+namespace essentia { namespace streaming { class Algorithm; } }
+namespace essentia { namespace scheduler { class Network; } }
+class StreamingChunkInput;
+
+#ifdef ESSENTIAJS_DISPATCHER
+namespace essentia { class ParameterMap; }
+#endif
+
+// bounded LRU cache of configured essentia algorithm instances (see algorithm_cache.h)
+class AlgorithmCache;
+
+// accumulated timings (in milliseconds) and data sizes (in bytes) of the calls of an algorithm method 
+// recorded by the profiling instrumentation of the generated code
+struct AlgorithmProfile {
+  unsigned int calls;
+  double createMs;
+  double inputMs;
+  double computeMs;
+  double outputMs;
+  double inputBytes;
+  double outputBytes;
+  AlgorithmProfile() : calls(0), createMs(0), inputMs(0), computeMs(0), outputMs(0), inputBytes(0), outputBytes(0) {};
+};
+
 class EssentiaJS {
   public:
     // property to store the current essentia library version
     std::string essentiaVersion;
     // constructor for instantiating the essentia algo registry with an optional argument to enable debug mode 
-    EssentiaJS(bool debugger=false);
-    ~EssentiaJS(){};
+    // and an optional maximum number of configured algorithms to be cached across calls (0 disables caching)
+    EssentiaJS(bool debugger=false, int cacheSize=0);
+    ~EssentiaJS();
     // method for shutdown essentia instance
     void shutdown();
+    // methods for configuring and inspecting the cache of configured algorithm instances
+    int getAlgorithmCacheSize() const;
+    void setAlgorithmCacheSize(int cacheSize);
+    val getAlgorithmCacheStats() const;
+    void clearAlgorithmCache();
+    // methods for inspecting the per-algorithm profile of the calls of the algorithm methods, which is only recorded 
+    // if the code was generated with profiling instrumentation (see 'configure_bindings.py --profiling')
+    bool isProfiled() const;
+    val getProfile() const;
+    void resetProfile();
     // method for generating frames from a given audio signal
     std::vector<std::vector<float> > FrameGenerator(const val& signalArray, int frameSize, int hopSize);
-    val MonoMixer(std::vector<float>& left_channel, std::vector<float>& right_channel);
-    val LoudnessEBUR128(std::vector<float>& left_channel, std::vector<float>& right_channel, const float hopSize=0.1, const float sampleRate=44100, const bool startAtZero=false);
+    val MonoMixer(const val& left_channel, const val& right_channel);
+    val LoudnessEBUR128(const val& left_channel, const val& right_channel, const float hopSize=0.1, const float sampleRate=44100, const bool startAtZero=false);
+#ifdef ESSENTIAJS_DISPATCHER
+    // generic entry point which computes an algorithm of the metadata table (see 'configure_bindings.py --dispatcher') 
+    // with the given parameters ({name: value}) and inputs ([value, ...]) and returns its outputs
+    val compute(const std::string& name, const val& params, const val& inputs);
+    // generic entry point of the batched variants, which computes an algorithm of the metadata table with a single 
+    // 'vector_real' or 'real' input over all the frames of a flat buffer (or all the values of a buffer)
+    val computeBatch(const std::string& name, const val& params, const val& input, const int numFrames, 
+                     const int frameSize, const int frameStride);
+#endif
     // NOTE: The following code snippets are machine generated. Do not edit.    
      
     // class property which stores all the list of essentia algorithm names available in essentia.js
-    std::string algorithmNames = "['AfterMaxToBeforeMaxEnergyRatio', 'AllPass', 'AudioOnsetsMarker', 'AutoCorrelation', 'BFCC', 'BPF', 'BandPass', 'BandReject', 'BarkBands', 'BeatTrackerDegara', 'BeatTrackerMultiFeature', 'Beatogram', 'BeatsLoudness', 'BinaryOperator', 'BinaryOperatorStream', 'BpmHistogramDescriptors', 'BpmRubato', 'CentralMoments', 'Centroid', 'ChordsDescriptors', 'ChordsDetection', 'ChordsDetectionBeats', 'ChromaCrossSimilarity', 'Chromagram', 'ClickDetector', 'Clipper', 'CoverSongSimilarity', 'Crest', 'CrossCorrelation', 'CrossSimilarityMatrix', 'CubicSpline', 'DCRemoval', 'DCT', 'Danceability', 'Decrease', 'Derivative', 'DerivativeSFX', 'DiscontinuityDetector', 'Dissonance', 'DistributionShape', 'Duration', 'DynamicComplexity', 'ERBBands', 'EffectiveDuration', 'Energy', 'EnergyBand', 'EnergyBandRatio', 'Entropy', 'Envelope', 'EqualLoudness', 'Flatness', 'FlatnessDB', 'FlatnessSFX', 'Flux', 'FrameCutter', 'FrameToReal', 'FrequencyBands', 'GFCC', 'GapsDetector', 'GeometricMean', 'HFC', 'HPCP', 'HarmonicBpm', 'HarmonicPeaks', 'HighPass', 'HighResolutionFeatures', 'Histogram', 'HprModelAnal', 'HpsModelAnal', 'IDCT', 'IIR', 'Inharmonicity', 'InstantPower', 'Intensity', 'Key', 'KeyExtractor', 'LPC', 'Larm', 'Leq', 'LevelExtractor', 'LogAttackTime', 'LogSpectrum', 'LoopBpmConfidence', 'LoopBpmEstimator', 'Loudness', 'LoudnessVickers', 'LowLevelSpectralEqloudExtractor', 'LowLevelSpectralExtractor', 'LowPass', 'MFCC', 'MaxFilter', 'MaxMagFreq', 'MaxToTotal', 'Mean', 'Median', 'MedianFilter', 'MelBands', 'Meter', 'MinMax', 'MinToTotal', 'MovingAverage', 'MultiPitchKlapuri', 'MultiPitchMelodia', 'Multiplexer', 'NNLSChroma', 'NoiseAdder', 'NoiseBurstDetector', 'NoveltyCurve', 'NoveltyCurveFixedBpmEstimator', 'OddToEvenHarmonicEnergyRatio', 'OnsetDetection', 'OnsetDetectionGlobal', 'OnsetRate', 'OverlapAdd', 'PeakDetection', 'PercivalBpmEstimator', 'PercivalEnhanceHarmonics', 'PercivalEvaluatePulseTrains', 'PitchContourSegmentation', 'PitchContours', 'PitchContoursMelody', 'PitchContoursMonoMelody', 'PitchContoursMultiMelody', 'PitchFilter', 'PitchMelodia', 'PitchSalience', 'PitchSalienceFunction', 'PitchSalienceFunctionPeaks', 'PitchYin', 'PitchYinFFT', 'PitchYinProbabilistic', 'PitchYinProbabilities', 'PitchYinProbabilitiesHMM', 'PowerMean', 'PowerSpectrum', 'PredominantPitchMelodia', 'RMS', 'RawMoments', 'ReplayGain', 'Resample', 'ResampleFFT', 'RhythmDescriptors', 'RhythmExtractor', 'RhythmExtractor2013', 'RhythmTransform', 'RollOff', 'SNR', 'SaturationDetector', 'Scale', 'SineSubtraction', 'SingleBeatLoudness', 'Slicer', 'SpectralCentroidTime', 'SpectralComplexity', 'SpectralContrast', 'SpectralPeaks', 'SpectralWhitening', 'Spectrum', 'SpectrumCQ', 'SpectrumToCent', 'Spline', 'SprModelAnal', 'SprModelSynth', 'SpsModelAnal', 'SpsModelSynth', 'StartStopCut', 'StartStopSilence', 'StochasticModelAnal', 'StochasticModelSynth', 'StrongDecay', 'StrongPeak', 'SuperFluxExtractor', 'SuperFluxNovelty', 'SuperFluxPeaks', 'TCToTotal', 'TempoScaleBands', 'TempoTap', 'TempoTapDegara', 'TempoTapMaxAgreement', 'TempoTapTicks', 'TensorflowInputMusiCNN', 'TensorflowInputVGGish', 'TonalExtractor', 'TonicIndianArtMusic', 'TriangularBands', 'TriangularBarkBands', 'Trimmer', 'Tristimulus', 'TruePeakDetector', 'TuningFrequency', 'TuningFrequencyExtractor', 'UnaryOperator', 'UnaryOperatorStream', 'Variance', 'Vibrato', 'WarpedAutoCorrelation', 'Welch', 'Windowing', 'ZeroCrossingRate']";
+    std::string algorithmNames = "['AfterMaxToBeforeMaxEnergyRatio', 'AllPass', 'AudioOnsetsMarker', 'AutoCorrelation', 'BFCC', 'BPF', 'BandPass', 'BandReject', 'BarkBands', 'BeatTrackerDegara', 'BeatTrackerMultiFeature', 'Beatogram', 'BeatsLoudness', 'BinaryOperator', 'BinaryOperatorStream', 'BpmHistogram', 'BpmHistogramDescriptors', 'BpmRubato', 'CartesianToPolar', 'CentralMoments', 'Centroid', 'ChordsDescriptors', 'ChordsDetection', 'ChordsDetectionBeats', 'ChromaCrossSimilarity', 'Chromagram', 'ClickDetector', 'Clipper', 'ConstantQ', 'CoverSongSimilarity', 'Crest', 'CrossCorrelation', 'CrossSimilarityMatrix', 'CubicSpline', 'DCRemoval', 'DCT', 'Danceability', 'Decrease', 'Derivative', 'DerivativeSFX', 'DiscontinuityDetector', 'Dissonance', 'DistributionShape', 'Duration', 'DynamicComplexity', 'ERBBands', 'EffectiveDuration', 'Energy', 'EnergyBand', 'EnergyBandRatio', 'Entropy', 'Envelope', 'EqualLoudness', 'FFT', 'FFTC', 'FadeDetection', 'FalseStereoDetector', 'Flatness', 'FlatnessDB', 'FlatnessSFX', 'Flux', 'FrameCutter', 'FrameToReal', 'FrequencyBands', 'GFCC', 'GapsDetector', 'GeometricMean', 'HFC', 'HPCP', 'HarmonicBpm', 'HarmonicMask', 'HarmonicModelAnal', 'HarmonicPeaks', 'HighPass', 'HighResolutionFeatures', 'Histogram', 'HprModelAnal', 'HpsModelAnal', 'HumDetector', 'IDCT', 'IFFT', 'IFFTC', 'IIR', 'Inharmonicity', 'InstantPower', 'Intensity', 'Key', 'KeyExtractor', 'LPC', 'Larm', 'Leq', 'LevelExtractor', 'LogAttackTime', 'LogSpectrum', 'LoopBpmConfidence', 'LoopBpmEstimator', 'Loudness', 'LoudnessVickers', 'LowLevelSpectralEqloudExtractor', 'LowLevelSpectralExtractor', 'LowPass', 'MFCC', 'Magnitude', 'MaxFilter', 'MaxMagFreq', 'MaxToTotal', 'Mean', 'Median', 'MedianFilter', 'MelBands', 'Meter', 'MinMax', 'MinToTotal', 'MovingAverage', 'MultiPitchKlapuri', 'MultiPitchMelodia', 'Multiplexer', 'NNLSChroma', 'NoiseAdder', 'NoiseBurstDetector', 'NoveltyCurve', 'NoveltyCurveFixedBpmEstimator', 'OddToEvenHarmonicEnergyRatio', 'OnsetDetection', 'OnsetDetectionGlobal', 'OnsetRate', 'Onsets', 'OverlapAdd', 'Panning', 'PeakDetection', 'PercivalBpmEstimator', 'PercivalEnhanceHarmonics', 'PercivalEvaluatePulseTrains', 'PitchContourSegmentation', 'PitchContours', 'PitchContoursMelody', 'PitchContoursMonoMelody', 'PitchContoursMultiMelody', 'PitchFilter', 'PitchMelodia', 'PitchSalience', 'PitchSalienceFunction', 'PitchSalienceFunctionPeaks', 'PitchYin', 'PitchYinFFT', 'PitchYinProbabilistic', 'PitchYinProbabilities', 'PitchYinProbabilitiesHMM', 'PolarToCartesian', 'PowerMean', 'PowerSpectrum', 'PredominantPitchMelodia', 'RMS', 'RawMoments', 'ReplayGain', 'Resample', 'ResampleFFT', 'RhythmDescriptors', 'RhythmExtractor', 'RhythmExtractor2013', 'RhythmTransform', 'RollOff', 'SBic', 'SNR', 'SaturationDetector', 'Scale', 'SineModelAnal', 'SineModelSynth', 'SineSubtraction', 'SingleBeatLoudness', 'SingleGaussian', 'Slicer', 'SpectralCentroidTime', 'SpectralComplexity', 'SpectralContrast', 'SpectralPeaks', 'SpectralWhitening', 'Spectrum', 'SpectrumCQ', 'SpectrumToCent', 'Spline', 'SprModelAnal', 'SprModelSynth', 'SpsModelAnal', 'SpsModelSynth', 'StartStopCut', 'StartStopSilence', 'StereoDemuxer', 'StereoMuxer', 'StereoTrimmer', 'StochasticModelAnal', 'StochasticModelSynth', 'StrongDecay', 'StrongPeak', 'SuperFluxExtractor', 'SuperFluxNovelty', 'SuperFluxPeaks', 'TCToTotal', 'TempoScaleBands', 'TempoTap', 'TempoTapDegara', 'TempoTapMaxAgreement', 'TempoTapTicks', 'TensorflowInputMusiCNN', 'TensorflowInputVGGish', 'TonalExtractor', 'TonicIndianArtMusic', 'TriangularBands', 'TriangularBarkBands', 'Trimmer', 'Tristimulus', 'TruePeakDetector', 'TuningFrequency', 'TuningFrequencyExtractor', 'UnaryOperator', 'UnaryOperatorStream', 'Variance', 'Vibrato', 'WarpedAutoCorrelation', 'Welch', 'Windowing', 'ZeroCrossingRate']";
     // class methods to call various essentia algorithms
     val AfterMaxToBeforeMaxEnergyRatio(std::vector<float>& input_pitch);
     val AllPass(std::vector<float>& input_signal, const float bandwidth=500, const float cutoffFrequency=1500, const int order=1, const float sampleRate=44100);
@@ -59,8 +113,10 @@ class EssentiaJS {
     val BeatsLoudness(std::vector<float>& input_signal, const float beatDuration=0.05, const float beatWindowDuration=0.1, const std::vector<float>& beats=std::vector<float>(), const std::vector<float>& frequencyBands=std::vector<float>{20, 150, 400, 3200, 7000, 22000}, const float sampleRate=44100);
     val BinaryOperator(std::vector<float>& input_array1, std::vector<float>& input_array2, const std::string& type="add");
     val BinaryOperatorStream(std::vector<float>& input_array1, std::vector<float>& input_array2, const std::string& type="add");
+    val BpmHistogram(std::vector<float>& input_novelty, const float bpm=0, const bool constantTempo=false, const float frameRate=86.1328, const float frameSize=4, const float maxBpm=560, const int maxPeaks=50, const float minBpm=30, const int overlap=16, const float tempoChange=5, const bool weightByMagnitude=true, const std::string& windowType="hann", const int zeroPadding=0);
     val BpmHistogramDescriptors(std::vector<float>& input_bpmIntervals);
     val BpmRubato(std::vector<float>& input_beats, const float longRegionsPruningTime=20, const float shortRegionsMergingTime=4, const float tolerance=0.08);
+    val CartesianToPolar(const val& input_complex);
     val CentralMoments(std::vector<float>& input_array, const std::string& mode="pdf", const float range=1);
     val Centroid(std::vector<float>& input_array, const float range=1);
     val ChordsDescriptors(std::vector<std::string> input_chords, std::string input_key, std::string input_scale);
@@ -70,6 +126,7 @@ class EssentiaJS {
     val Chromagram(std::vector<float>& input_frame, const int binsPerOctave=12, const float minFrequency=32.7, const int minimumKernelSize=4, const std::string& normalizeType="unit_max", const int numberBins=84, const float sampleRate=44100, const float scale=1, const float threshold=0.01, const std::string& windowType="hann", const bool zeroPhase=true);
     val ClickDetector(std::vector<float>& input_frame, const float detectionThreshold=30, const int frameSize=512, const int hopSize=256, const int order=12, const int powerEstimationThreshold=10, const float sampleRate=44100, const int silenceThreshold=-50);
     val Clipper(std::vector<float>& input_signal, const float max=1, const float min=-1);
+    val ConstantQ(std::vector<float>& input_frame, const int binsPerOctave=12, const float minFrequency=32.7, const int minimumKernelSize=4, const int numberBins=84, const float sampleRate=44100, const float scale=1, const float threshold=0.01, const std::string& windowType="hann", const bool zeroPhase=true);
     val CoverSongSimilarity(std::vector<std::vector<float> >& input_inputArray, const std::string& alignmentType="serra09", const float disExtension=0.5, const float disOnset=0.5, const std::string& distanceType="asymmetric");
     val Crest(std::vector<float>& input_array);
     val CrossCorrelation(std::vector<float>& input_arrayX, std::vector<float>& input_arrayY, const int maxLag=1, const int minLag=0);
@@ -94,6 +151,10 @@ class EssentiaJS {
     val Entropy(std::vector<float>& input_array);
     val Envelope(std::vector<float>& input_signal, const bool applyRectification=true, const float attackTime=10, const float releaseTime=1500, const float sampleRate=44100);
     val EqualLoudness(std::vector<float>& input_signal, const float sampleRate=44100);
+    val FFT(std::vector<float>& input_frame, const int size=1024);
+    val FFTC(const val& input_frame, const bool negativeFrequencies=false, const int size=1024);
+    val FadeDetection(std::vector<float>& input_rms, const float cutoffHigh=0.85, const float cutoffLow=0.2, const float frameRate=4, const float minLength=3);
+    val FalseStereoDetector(const val& input_frame, const float correlationThreshold=0.9995, const int silenceThreshold=-70);
     val Flatness(std::vector<float>& input_array);
     val FlatnessDB(std::vector<float>& input_array);
     val FlatnessSFX(std::vector<float>& input_envelope);
@@ -107,13 +168,18 @@ class EssentiaJS {
     val HFC(std::vector<float>& input_spectrum, const float sampleRate=44100, const std::string& type="Masri");
     val HPCP(std::vector<float>& input_frequencies, std::vector<float>& input_magnitudes, const bool bandPreset=true, const float bandSplitFrequency=500, const int harmonics=0, const float maxFrequency=5000, const bool maxShifted=false, const float minFrequency=40, const bool nonLinear=false, const std::string& normalized="unitMax", const float referenceFrequency=440, const float sampleRate=44100, const int size=12, const std::string& weightType="squaredCosine", const float windowSize=1);
     val HarmonicBpm(std::vector<float>& input_bpms, const int bpm=60, const float threshold=20, const float tolerance=5);
+    val HarmonicMask(const val& input_fft, float input_pitch, const float attenuation=-200, const int binWidth=4, const float sampleRate=44100);
+    val HarmonicModelAnal(const val& input_fft, float input_pitch, const float freqDevOffset=20, const float freqDevSlope=0.01, const float harmDevSlope=0.01, const int hopSize=512, const float magnitudeThreshold=-74, const float maxFrequency=5000, const int maxPeaks=100, const int maxnSines=100, const float minFrequency=20, const int nHarmonics=100, const std::string& orderBy="frequency", const float sampleRate=44100);
     val HarmonicPeaks(std::vector<float>& input_frequencies, std::vector<float>& input_magnitudes, float input_pitch, const int maxHarmonics=20, const float tolerance=0.2);
     val HighPass(std::vector<float>& input_signal, const float cutoffFrequency=1500, const float sampleRate=44100);
     val HighResolutionFeatures(std::vector<float>& input_hpcp, const int maxPeaks=24);
     val Histogram(std::vector<float>& input_array, const float maxValue=1, const float minValue=0, const std::string& normalize="none", const int numberBins=10);
     val HprModelAnal(std::vector<float>& input_frame, float input_pitch, const int fftSize=2048, const int freqDevOffset=20, const float freqDevSlope=0.01, const float harmDevSlope=0.01, const int hopSize=512, const float magnitudeThreshold=0, const float maxFrequency=5000, const int maxPeaks=100, const int maxnSines=100, const float minFrequency=20, const int nHarmonics=100, const std::string& orderBy="frequency", const float sampleRate=44100, const float stocf=0.2);
     val HpsModelAnal(std::vector<float>& input_frame, float input_pitch, const int fftSize=2048, const int freqDevOffset=20, const float freqDevSlope=0.01, const float harmDevSlope=0.01, const int hopSize=512, const float magnitudeThreshold=0, const float maxFrequency=5000, const int maxPeaks=100, const int maxnSines=100, const float minFrequency=20, const int nHarmonics=100, const std::string& orderBy="frequency", const float sampleRate=44100, const float stocf=0.2);
+    val HumDetector(std::vector<float>& input_signal, const float Q0=0.1, const float Q1=0.55, const float detectionThreshold=5, const float frameSize=0.4, const float hopSize=0.2, const float maximumFrequency=400, const float minimumDuration=2, const float minimumFrequency=22.5, const int numberHarmonics=1, const float sampleRate=44100, const float timeContinuity=10, const float timeWindow=10);
     val IDCT(std::vector<float>& input_dct, const int dctType=2, const int inputSize=10, const int liftering=0, const int outputSize=10);
+    val IFFT(const val& input_fft, const bool normalize=true, const int size=1024);
+    val IFFTC(const val& input_fft, const bool normalize=true, const int size=1024);
     val IIR(std::vector<float>& input_signal, const std::vector<float>& denominator=std::vector<float>{1}, const std::vector<float>& numerator=std::vector<float>{1});
     val Inharmonicity(std::vector<float>& input_frequencies, std::vector<float>& input_magnitudes);
     val InstantPower(std::vector<float>& input_array);
@@ -134,6 +200,7 @@ class EssentiaJS {
     val LowLevelSpectralExtractor(std::vector<float>& input_signal, const int frameSize=2048, const int hopSize=1024, const float sampleRate=44100);
     val LowPass(std::vector<float>& input_signal, const float cutoffFrequency=1500, const float sampleRate=44100);
     val MFCC(std::vector<float>& input_spectrum, const int dctType=2, const float highFrequencyBound=11000, const int inputSize=1025, const int liftering=0, const std::string& logType="dbamp", const float lowFrequencyBound=0, const std::string& normalize="unit_sum", const int numberBands=40, const int numberCoefficients=13, const float sampleRate=44100, const float silenceThreshold=1e-10, const std::string& type="power", const std::string& warpingFormula="htkMel", const std::string& weighting="warping");
+    val Magnitude(const val& input_complex);
     val MaxFilter(std::vector<float>& input_signal, const bool causal=true, const int width=3);
     val MaxMagFreq(std::vector<float>& input_spectrum, const float sampleRate=44100);
     val MaxToTotal(std::vector<float>& input_envelope);
@@ -157,7 +224,9 @@ class EssentiaJS {
     val OnsetDetection(std::vector<float>& input_spectrum, std::vector<float>& input_phase, const std::string& method="hfc", const float sampleRate=44100);
     val OnsetDetectionGlobal(std::vector<float>& input_signal, const int frameSize=2048, const int hopSize=512, const std::string& method="infogain", const float sampleRate=44100);
     val OnsetRate(std::vector<float>& input_signal);
+    val Onsets(const val& input_detections, std::vector<float>& input_weights, const float alpha=0.1, const int delay=5, const float frameRate=86.1328, const float silenceThreshold=0.02);
     val OverlapAdd(std::vector<float>& input_signal, const int frameSize=2048, const float gain=1, const int hopSize=128);
+    val Panning(std::vector<float>& input_spectrumLeft, std::vector<float>& input_spectrumRight, const int averageFrames=43, const int numBands=1, const int numCoeffs=20, const int panningBins=512, const float sampleRate=44100, const bool warpedPanorama=true);
     val PeakDetection(std::vector<float>& input_array, const bool interpolate=true, const int maxPeaks=100, const float maxPosition=1, const float minPeakDistance=0, const float minPosition=0, const std::string& orderBy="position", const float range=1, const float threshold=-1e+06);
     val PercivalBpmEstimator(std::vector<float>& input_signal, const int frameSize=1024, const int frameSizeOSS=2048, const int hopSize=128, const int hopSizeOSS=128, const int maxBPM=210, const int minBPM=50, const int sampleRate=44100);
     val PercivalEnhanceHarmonics(std::vector<float>& input_array);
@@ -177,6 +246,7 @@ class EssentiaJS {
     val PitchYinProbabilistic(std::vector<float>& input_signal, const int frameSize=2048, const int hopSize=256, const float lowRMSThreshold=0.1, const std::string& outputUnvoiced="negative", const bool preciseTime=false, const float sampleRate=44100);
     val PitchYinProbabilities(std::vector<float>& input_signal, const int frameSize=2048, const float lowAmp=0.1, const bool preciseTime=false, const float sampleRate=44100);
     val PitchYinProbabilitiesHMM(std::vector<std::vector<float> >& input_pitchCandidates, std::vector<std::vector<float> >& input_probabilities, const float minFrequency=61.735, const int numberBinsPerSemitone=5, const float selfTransition=0.99, const float yinTrust=0.5);
+    val PolarToCartesian(std::vector<float>& input_magnitude, std::vector<float>& input_phase);
     val PowerMean(std::vector<float>& input_array, const float power=1);
     val PowerSpectrum(std::vector<float>& input_signal, const int size=2048);
     val PredominantPitchMelodia(std::vector<float>& input_signal, const float binResolution=10, const int filterIterations=3, const int frameSize=2048, const bool guessUnvoiced=false, const float harmonicWeight=0.8, const int hopSize=128, const float magnitudeCompression=1, const int magnitudeThreshold=40, const float maxFrequency=20000, const int minDuration=100, const float minFrequency=80, const int numberHarmonics=20, const float peakDistributionThreshold=0.9, const float peakFrameThreshold=0.9, const float pitchContinuity=27.5625, const float referenceFrequency=55, const float sampleRate=44100, const int timeContinuity=100, const bool voiceVibrato=false, const float voicingTolerance=0.2);
@@ -190,11 +260,15 @@ class EssentiaJS {
     val RhythmExtractor2013(std::vector<float>& input_signal, const int maxTempo=208, const std::string& method="multifeature", const int minTempo=40);
     val RhythmTransform(std::vector<std::vector<float> >& input_melBands, const int frameSize=256, const int hopSize=32);
     val RollOff(std::vector<float>& input_spectrum, const float cutoff=0.85, const float sampleRate=44100);
+    val SBic(const val& input_features, const float cpw=1.5, const int inc1=60, const int inc2=20, const int minLength=10, const int size1=300, const int size2=200);
     val SNR(std::vector<float>& input_frame, const float MAAlpha=0.95, const float MMSEAlpha=0.98, const float NoiseAlpha=0.9, const int frameSize=512, const float noiseThreshold=-40, const float sampleRate=44100, const bool useBroadbadNoiseCorrection=true);
     val SaturationDetector(std::vector<float>& input_frame, const float differentialThreshold=0.001, const float energyThreshold=-1, const int frameSize=512, const int hopSize=256, const float minimumDuration=0.005, const float sampleRate=44100);
     val Scale(std::vector<float>& input_signal, const bool clipping=true, const float factor=10, const float maxAbsValue=1);
+    val SineModelAnal(const val& input_fft, const float freqDevOffset=20, const float freqDevSlope=0.01, const float magnitudeThreshold=-74, const float maxFrequency=22050, const int maxPeaks=250, const int maxnSines=100, const float minFrequency=0, const std::string& orderBy="frequency", const float sampleRate=44100);
+    val SineModelSynth(std::vector<float>& input_magnitudes, std::vector<float>& input_frequencies, std::vector<float>& input_phases, const int fftSize=2048, const int hopSize=512, const float sampleRate=44100);
     val SineSubtraction(std::vector<float>& input_frame, std::vector<float>& input_magnitudes, std::vector<float>& input_frequencies, std::vector<float>& input_phases, const int fftSize=512, const int hopSize=128, const float sampleRate=44100);
     val SingleBeatLoudness(std::vector<float>& input_beat, const float beatDuration=0.05, const float beatWindowDuration=0.1, const std::vector<float>& frequencyBands=std::vector<float>{0, 200, 400, 800, 1600, 3200, 22000}, const std::string& onsetStart="sumEnergy", const float sampleRate=44100);
+    val SingleGaussian(const val& input_matrix);
     val Slicer(std::vector<float>& input_audio, const std::vector<float>& endTimes=std::vector<float>(), const float sampleRate=44100, const std::vector<float>& startTimes=std::vector<float>(), const std::string& timeUnits="seconds");
     val SpectralCentroidTime(std::vector<float>& input_array, const float sampleRate=44100);
     val SpectralComplexity(std::vector<float>& input_spectrum, const float magnitudeThreshold=0.005, const float sampleRate=44100);
@@ -211,6 +285,9 @@ class EssentiaJS {
     val SpsModelSynth(std::vector<float>& input_magnitudes, std::vector<float>& input_frequencies, std::vector<float>& input_phases, std::vector<float>& input_stocenv, const int fftSize=2048, const int hopSize=512, const float sampleRate=44100, const float stocf=0.2);
     val StartStopCut(std::vector<float>& input_audio, const int frameSize=256, const int hopSize=256, const float maximumStartTime=10, const float maximumStopTime=10, const float sampleRate=44100, const int threshold=-60);
     val StartStopSilence(std::vector<float>& input_frame, const int threshold=-60);
+    val StereoDemuxer(const val& input_audio);
+    val StereoMuxer(std::vector<float>& input_left, std::vector<float>& input_right);
+    val StereoTrimmer(const val& input_signal, const bool checkRange=false, const float endTime=1e+06, const float sampleRate=44100, const float startTime=0);
     val StochasticModelAnal(std::vector<float>& input_frame, const int fftSize=2048, const int hopSize=512, const float sampleRate=44100, const float stocf=0.2);
     val StochasticModelSynth(std::vector<float>& input_stocenv, const int fftSize=2048, const int hopSize=512, const float sampleRate=44100, const float stocf=0.2);
     val StrongDecay(std::vector<float>& input_signal, const float sampleRate=44100);
@@ -243,9 +320,4714 @@ class EssentiaJS {
     val Welch(std::vector<float>& input_frame, const int averagingFrames=10, const int fftSize=1024, const int frameSize=512, const float sampleRate=44100, const std::string& scaling="density", const std::string& windowType="hann");
     val Windowing(std::vector<float>& input_frame, const bool normalized=true, const int size=1024, const std::string& type="hann", const int zeroPadding=0, const bool zeroPhase=true);
     val ZeroCrossingRate(std::vector<float>& input_signal, const float threshold=0);
+    // NOTE: The following code snippets are machine generated. Do not edit.
+    // batched variants of the algorithm methods which compute all the frames of a flat buffer in one call
+    val AfterMaxToBeforeMaxEnergyRatioBatch(const val& input_pitch, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride);
+    val AllPassBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float bandwidth=500, const float cutoffFrequency=1500, const int order=1, const float sampleRate=44100);
+    val AudioOnsetsMarkerBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const std::vector<float>& onsets=std::vector<float>(), const float sampleRate=44100, const std::string& type="beep");
+    val AutoCorrelationBatch(const val& input_array, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float frequencyDomainCompression=0.5, const bool generalized=false, const std::string& normalization="standard");
+    val BFCCBatch(const val& input_spectrum, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int dctType=2, const float highFrequencyBound=11000, const int inputSize=1025, const int liftering=0, const std::string& logType="dbamp", const float lowFrequencyBound=0, const std::string& normalize="unit_sum", const int numberBands=40, const int numberCoefficients=13, const float sampleRate=44100, const std::string& type="power", const std::string& weighting="warping");
+    val BPFBatch(const val& input_x, const std::vector<float>& xPoints=std::vector<float>{0, 1}, const std::vector<float>& yPoints=std::vector<float>{0, 1});
+    val BandPassBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float bandwidth=500, const float cutoffFrequency=1500, const float sampleRate=44100);
+    val BandRejectBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float bandwidth=500, const float cutoffFrequency=1500, const float sampleRate=44100);
+    val BarkBandsBatch(const val& input_spectrum, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int numberBands=27, const float sampleRate=44100);
+    val BeatTrackerDegaraBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int maxTempo=208, const int minTempo=40);
+    val BeatTrackerMultiFeatureBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int maxTempo=208, const int minTempo=40);
+    val BpmHistogramDescriptorsBatch(const val& input_bpmIntervals, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride);
+    val BpmRubatoBatch(const val& input_beats, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float longRegionsPruningTime=20, const float shortRegionsMergingTime=4, const float tolerance=0.08);
+    val CentralMomentsBatch(const val& input_array, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const std::string& mode="pdf", const float range=1);
+    val CentroidBatch(const val& input_array, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float range=1);
+    val ChromagramBatch(const val& input_frame, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int binsPerOctave=12, const float minFrequency=32.7, const int minimumKernelSize=4, const std::string& normalizeType="unit_max", const int numberBins=84, const float sampleRate=44100, const float scale=1, const float threshold=0.01, const std::string& windowType="hann", const bool zeroPhase=true);
+    val ClickDetectorBatch(const val& input_frame, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float detectionThreshold=30, const int frameSize=512, const int hopSize=256, const int order=12, const int powerEstimationThreshold=10, const float sampleRate=44100, const int silenceThreshold=-50);
+    val ClipperBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float max=1, const float min=-1);
+    val CrestBatch(const val& input_array, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride);
+    val CubicSplineBatch(const val& input_x, const int leftBoundaryFlag=0, const float leftBoundaryValue=0, const int rightBoundaryFlag=0, const float rightBoundaryValue=0, const std::vector<float>& xPoints=std::vector<float>{0, 1}, const std::vector<float>& yPoints=std::vector<float>{0, 1});
+    val DCRemovalBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float cutoffFrequency=40, const float sampleRate=44100);
+    val DCTBatch(const val& input_array, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int dctType=2, const int inputSize=10, const int liftering=0, const int outputSize=10);
+    val DanceabilityBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float maxTau=8800, const float minTau=310, const float sampleRate=44100, const float tauMultiplier=1.1);
+    val DecreaseBatch(const val& input_array, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float range=1);
+    val DerivativeBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride);
+    val DerivativeSFXBatch(const val& input_envelope, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride);
+    val DiscontinuityDetectorBatch(const val& input_frame, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float detectionThreshold=8, const float energyThreshold=-60, const int frameSize=512, const int hopSize=256, const int kernelSize=7, const int order=3, const int silenceThreshold=-50, const int subFrameSize=32);
+    val DistributionShapeBatch(const val& input_centralMoments, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride);
+    val DurationBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float sampleRate=44100);
+    val DynamicComplexityBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float frameSize=0.2, const float sampleRate=44100);
+    val ERBBandsBatch(const val& input_spectrum, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float highFrequencyBound=22050, const int inputSize=1025, const float lowFrequencyBound=50, const int numberBands=40, const float sampleRate=44100, const std::string& type="power", const float width=1);
+    val EffectiveDurationBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float sampleRate=44100, const float thresholdRatio=0.4);
+    val EnergyBatch(const val& input_array, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride);
+    val EnergyBandBatch(const val& input_spectrum, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float sampleRate=44100, const float startCutoffFrequency=0, const float stopCutoffFrequency=100);
+    val EnergyBandRatioBatch(const val& input_spectrum, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float sampleRate=44100, const float startFrequency=0, const float stopFrequency=100);
+    val EntropyBatch(const val& input_array, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride);
+    val EnvelopeBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const bool applyRectification=true, const float attackTime=10, const float releaseTime=1500, const float sampleRate=44100);
+    val EqualLoudnessBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float sampleRate=44100);
+    val FlatnessBatch(const val& input_array, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride);
+    val FlatnessDBBatch(const val& input_array, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride);
+    val FlatnessSFXBatch(const val& input_envelope, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride);
+    val FluxBatch(const val& input_spectrum, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const bool halfRectify=false, const std::string& norm="L2");
+    val FrameCutterBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int frameSize=1024, const int hopSize=512, const bool lastFrameToEndOfFile=false, const bool startFromZero=false, const float validFrameThresholdRatio=0);
+    val FrameToRealBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int frameSize=2048, const int hopSize=128);
+    val FrequencyBandsBatch(const val& input_spectrum, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const std::vector<float>& frequencyBands=std::vector<float>{0, 50, 100, 150, 200, 300, 400, 510, 630, 770, 920, 1080, 1270, 1480, 1720, 2000, 2320, 2700, 3150, 3700, 4400, 5300, 6400, 7700, 9500, 12000, 15500, 20500, 27000}, const float sampleRate=44100);
+    val GFCCBatch(const val& input_spectrum, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int dctType=2, const float highFrequencyBound=22050, const int inputSize=1025, const std::string& logType="dbamp", const float lowFrequencyBound=40, const int numberBands=40, const int numberCoefficients=13, const float sampleRate=44100, const float silenceThreshold=1e-10, const std::string& type="power");
+    val GapsDetectorBatch(const val& input_frame, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float attackTime=0.05, const int frameSize=2048, const int hopSize=1024, const int kernelSize=11, const float maximumTime=3500, const float minimumTime=10, const float postpowerTime=40, const float prepowerThreshold=-30, const float prepowerTime=40, const float releaseTime=0.05, const float sampleRate=44100, const float silenceThreshold=-50);
+    val GeometricMeanBatch(const val& input_array, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride);
+    val HFCBatch(const val& input_spectrum, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float sampleRate=44100, const std::string& type="Masri");
+    val HarmonicBpmBatch(const val& input_bpms, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float bpm=60, const float threshold=20, const float tolerance=5);
+    val HighPassBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float cutoffFrequency=1500, const float sampleRate=44100);
+    val HighResolutionFeaturesBatch(const val& input_hpcp, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int maxPeaks=24);
+    val HistogramBatch(const val& input_array, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float maxValue=1, const float minValue=0, const std::string& normalize="none", const int numberBins=10);
+    val IDCTBatch(const val& input_dct, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int dctType=2, const int inputSize=10, const int liftering=0, const int outputSize=10);
+    val IIRBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const std::vector<float>& denominator=std::vector<float>{1}, const std::vector<float>& numerator=std::vector<float>{1});
+    val InstantPowerBatch(const val& input_array, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride);
+    val IntensityBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float sampleRate=44100);
+    val LPCBatch(const val& input_frame, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int order=10, const float sampleRate=44100, const std::string& type="regular");
+    val LarmBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float attackTime=10, const float power=1.5, const float releaseTime=1500, const float sampleRate=44100);
+    val LeqBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride);
+    val LevelExtractorBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int frameSize=88200, const int hopSize=44100);
+    val LogAttackTimeBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float sampleRate=44100, const float startAttackThreshold=0.2, const float stopAttackThreshold=0.9);
+    val LogSpectrumBatch(const val& input_spectrum, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float binsPerSemitone=3, const int frameSize=1025, const int nOctave=7, const float rollOn=0, const float sampleRate=44100);
+    val LoopBpmEstimatorBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float confidenceThreshold=0.95);
+    val LoudnessBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride);
+    val LoudnessVickersBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float sampleRate=44100);
+    val LowPassBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float cutoffFrequency=1500, const float sampleRate=44100);
+    val MFCCBatch(const val& input_spectrum, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int dctType=2, const float highFrequencyBound=11000, const int inputSize=1025, const int liftering=0, const std::string& logType="dbamp", const float lowFrequencyBound=0, const std::string& normalize="unit_sum", const int numberBands=40, const int numberCoefficients=13, const float sampleRate=44100, const float silenceThreshold=1e-10, const std::string& type="power", const std::string& warpingFormula="htkMel", const std::string& weighting="warping");
+    val MaxFilterBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const bool causal=true, const int width=3);
+    val MaxMagFreqBatch(const val& input_spectrum, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float sampleRate=44100);
+    val MaxToTotalBatch(const val& input_envelope, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride);
+    val MeanBatch(const val& input_array, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride);
+    val MedianBatch(const val& input_array, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride);
+    val MedianFilterBatch(const val& input_array, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int kernelSize=11);
+    val MelBandsBatch(const val& input_spectrum, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float highFrequencyBound=22050, const int inputSize=1025, const bool log=false, const float lowFrequencyBound=0, const std::string& normalize="unit_sum", const int numberBands=24, const float sampleRate=44100, const std::string& type="power", const std::string& warpingFormula="htkMel", const std::string& weighting="warping");
+    val MinMaxBatch(const val& input_array, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const std::string& type="min");
+    val MinToTotalBatch(const val& input_envelope, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride);
+    val MovingAverageBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int size=6);
+    val NoiseAdderBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const bool fixSeed=false, const int level=-100);
+    val NoiseBurstDetectorBatch(const val& input_frame, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float alpha=0.9, const int silenceThreshold=-50, const int threshold=8);
+    val NoveltyCurveFixedBpmEstimatorBatch(const val& input_novelty, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int hopSize=512, const float maxBpm=560, const float minBpm=30, const float sampleRate=44100, const float tolerance=3);
+    val OnsetDetectionGlobalBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int frameSize=2048, const int hopSize=512, const std::string& method="infogain", const float sampleRate=44100);
+    val OnsetRateBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride);
+    val OverlapAddBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int frameSize=2048, const float gain=1, const int hopSize=128);
+    val PeakDetectionBatch(const val& input_array, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const bool interpolate=true, const int maxPeaks=100, const float maxPosition=1, const float minPeakDistance=0, const float minPosition=0, const std::string& orderBy="position", const float range=1, const float threshold=-1e+06);
+    val PercivalBpmEstimatorBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int frameSize=1024, const int frameSizeOSS=2048, const int hopSize=128, const int hopSizeOSS=128, const int maxBPM=210, const int minBPM=50, const int sampleRate=44100);
+    val PercivalEnhanceHarmonicsBatch(const val& input_array, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride);
+    val PitchMelodiaBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float binResolution=10, const int filterIterations=3, const int frameSize=2048, const bool guessUnvoiced=false, const float harmonicWeight=0.8, const int hopSize=128, const float magnitudeCompression=1, const int magnitudeThreshold=40, const float maxFrequency=20000, const int minDuration=100, const float minFrequency=40, const int numberHarmonics=20, const float peakDistributionThreshold=0.9, const float peakFrameThreshold=0.9, const float pitchContinuity=27.5625, const float referenceFrequency=55, const float sampleRate=44100, const int timeContinuity=100);
+    val PitchSalienceBatch(const val& input_spectrum, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float highBoundary=5000, const float lowBoundary=100, const float sampleRate=44100);
+    val PitchSalienceFunctionPeaksBatch(const val& input_salienceFunction, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float binResolution=10, const float maxFrequency=1760, const float minFrequency=55, const float referenceFrequency=55);
+    val PitchYinBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int frameSize=2048, const bool interpolate=true, const float maxFrequency=22050, const float minFrequency=20, const float sampleRate=44100, const float tolerance=0.15);
+    val PitchYinFFTBatch(const val& input_spectrum, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int frameSize=2048, const bool interpolate=true, const float maxFrequency=22050, const float minFrequency=20, const float sampleRate=44100, const float tolerance=1, const std::string& weighting="custom");
+    val PitchYinProbabilisticBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int frameSize=2048, const int hopSize=256, const float lowRMSThreshold=0.1, const std::string& outputUnvoiced="negative", const bool preciseTime=false, const float sampleRate=44100);
+    val PitchYinProbabilitiesBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int frameSize=2048, const float lowAmp=0.1, const bool preciseTime=false, const float sampleRate=44100);
+    val PowerMeanBatch(const val& input_array, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float power=1);
+    val PowerSpectrumBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int size=2048);
+    val PredominantPitchMelodiaBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float binResolution=10, const int filterIterations=3, const int frameSize=2048, const bool guessUnvoiced=false, const float harmonicWeight=0.8, const int hopSize=128, const float magnitudeCompression=1, const int magnitudeThreshold=40, const float maxFrequency=20000, const int minDuration=100, const float minFrequency=80, const int numberHarmonics=20, const float peakDistributionThreshold=0.9, const float peakFrameThreshold=0.9, const float pitchContinuity=27.5625, const float referenceFrequency=55, const float sampleRate=44100, const int timeContinuity=100, const bool voiceVibrato=false, const float voicingTolerance=0.2);
+    val RMSBatch(const val& input_array, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride);
+    val RawMomentsBatch(const val& input_array, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float range=22050);
+    val ReplayGainBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float sampleRate=44100);
+    val ResampleBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float inputSampleRate=44100, const float outputSampleRate=44100, const int quality=1);
+    val ResampleFFTBatch(const val& input_input, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int inSize=128, const int outSize=128);
+    val RhythmDescriptorsBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride);
+    val RhythmExtractorBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int frameHop=1024, const int frameSize=1024, const int hopSize=256, const float lastBeatInterval=0.1, const int maxTempo=208, const int minTempo=40, const int numberFrames=1024, const float sampleRate=44100, const std::vector<float>& tempoHints=std::vector<float>(), const float tolerance=0.24, const bool useBands=true, const bool useOnset=true);
+    val RhythmExtractor2013Batch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int maxTempo=208, const std::string& method="multifeature", const int minTempo=40);
+    val RollOffBatch(const val& input_spectrum, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float cutoff=0.85, const float sampleRate=44100);
+    val SNRBatch(const val& input_frame, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float MAAlpha=0.95, const float MMSEAlpha=0.98, const float NoiseAlpha=0.9, const int frameSize=512, const float noiseThreshold=-40, const float sampleRate=44100, const bool useBroadbadNoiseCorrection=true);
+    val SaturationDetectorBatch(const val& input_frame, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float differentialThreshold=0.001, const float energyThreshold=-1, const int frameSize=512, const int hopSize=256, const float minimumDuration=0.005, const float sampleRate=44100);
+    val ScaleBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const bool clipping=true, const float factor=10, const float maxAbsValue=1);
+    val SingleBeatLoudnessBatch(const val& input_beat, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float beatDuration=0.05, const float beatWindowDuration=0.1, const std::vector<float>& frequencyBands=std::vector<float>{0, 200, 400, 800, 1600, 3200, 22000}, const std::string& onsetStart="sumEnergy", const float sampleRate=44100);
+    val SpectralCentroidTimeBatch(const val& input_array, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float sampleRate=44100);
+    val SpectralComplexityBatch(const val& input_spectrum, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float magnitudeThreshold=0.005, const float sampleRate=44100);
+    val SpectralContrastBatch(const val& input_spectrum, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int frameSize=2048, const float highFrequencyBound=11000, const float lowFrequencyBound=20, const float neighbourRatio=0.4, const int numberBands=6, const float sampleRate=22050, const float staticDistribution=0.15);
+    val SpectralPeaksBatch(const val& input_spectrum, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float magnitudeThreshold=0, const float maxFrequency=5000, const int maxPeaks=100, const float minFrequency=0, const std::string& orderBy="frequency", const float sampleRate=44100);
+    val SpectrumBatch(const val& input_frame, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int size=2048);
+    val SpectrumCQBatch(const val& input_frame, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int binsPerOctave=12, const float minFrequency=32.7, const int minimumKernelSize=4, const int numberBins=84, const float sampleRate=44100, const float scale=1, const float threshold=0.01, const std::string& windowType="hann", const bool zeroPhase=true);
+    val SpectrumToCentBatch(const val& input_spectrum, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int bands=720, const float centBinResolution=10, const int inputSize=32768, const bool log=true, const float minimumFrequency=164, const std::string& normalize="unit_sum", const float sampleRate=44100, const std::string& type="power");
+    val SplineBatch(const val& input_x, const float beta1=1, const float beta2=0, const std::string& type="b", const std::vector<float>& xPoints=std::vector<float>{0, 1}, const std::vector<float>& yPoints=std::vector<float>{0, 1});
+    val SprModelAnalBatch(const val& input_frame, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int fftSize=2048, const int freqDevOffset=20, const float freqDevSlope=0.01, const int hopSize=512, const float magnitudeThreshold=0, const float maxFrequency=5000, const int maxPeaks=100, const int maxnSines=100, const float minFrequency=0, const std::string& orderBy="frequency", const float sampleRate=44100);
+    val SpsModelAnalBatch(const val& input_frame, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int fftSize=2048, const int freqDevOffset=20, const float freqDevSlope=0.01, const int hopSize=512, const float magnitudeThreshold=0, const float maxFrequency=5000, const int maxPeaks=100, const int maxnSines=100, const float minFrequency=0, const std::string& orderBy="frequency", const float sampleRate=44100, const float stocf=0.2);
+    val StartStopCutBatch(const val& input_audio, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int frameSize=256, const int hopSize=256, const float maximumStartTime=10, const float maximumStopTime=10, const float sampleRate=44100, const int threshold=-60);
+    val StartStopSilenceBatch(const val& input_frame, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int threshold=-60);
+    val StochasticModelAnalBatch(const val& input_frame, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int fftSize=2048, const int hopSize=512, const float sampleRate=44100, const float stocf=0.2);
+    val StochasticModelSynthBatch(const val& input_stocenv, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int fftSize=2048, const int hopSize=512, const float sampleRate=44100, const float stocf=0.2);
+    val StrongDecayBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float sampleRate=44100);
+    val StrongPeakBatch(const val& input_spectrum, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride);
+    val SuperFluxExtractorBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float combine=20, const int frameSize=2048, const int hopSize=256, const float ratioThreshold=16, const float sampleRate=44100, const float threshold=0.05);
+    val SuperFluxPeaksBatch(const val& input_novelty, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float combine=30, const float frameRate=172, const float pre_avg=100, const float pre_max=30, const float ratioThreshold=16, const float threshold=0.05);
+    val TCToTotalBatch(const val& input_envelope, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride);
+    val TempoScaleBandsBatch(const val& input_bands, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const std::vector<float>& bandsGain=std::vector<float>{2, 3, 2, 1, 1.20000004768, 2, 3, 2.5}, const float frameTime=512);
+    val TempoTapBatch(const val& input_featuresFrame, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int frameHop=1024, const int frameSize=256, const int maxTempo=208, const int minTempo=40, const int numberFrames=1024, const float sampleRate=44100, const std::vector<float>& tempoHints=std::vector<float>());
+    val TempoTapDegaraBatch(const val& input_onsetDetections, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int maxTempo=208, const int minTempo=40, const std::string& resample="none", const float sampleRateODF=86.1328);
+    val TensorflowInputMusiCNNBatch(const val& input_frame, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride);
+    val TensorflowInputVGGishBatch(const val& input_frame, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride);
+    val TonicIndianArtMusicBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float binResolution=10, const int frameSize=2048, const float harmonicWeight=0.85, const int hopSize=512, const float magnitudeCompression=1, const float magnitudeThreshold=40, const float maxTonicFrequency=375, const float minTonicFrequency=100, const int numberHarmonics=20, const int numberSaliencePeaks=5, const float referenceFrequency=55, const float sampleRate=44100);
+    val TriangularBandsBatch(const val& input_spectrum, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const std::vector<float>& frequencyBands=std::vector<float>{21.533203125, 43.06640625, 64.599609375, 86.1328125, 107.666015625, 129.19921875, 150.732421875, 172.265625, 193.798828125, 215.33203125, 236.865234375, 258.3984375, 279.931640625, 301.46484375, 322.998046875, 344.53125, 366.064453125, 387.59765625, 409.130859375, 430.6640625, 452.197265625, 473.73046875, 495.263671875, 516.796875, 538.330078125, 559.86328125, 581.396484375, 602.9296875, 624.462890625, 645.99609375, 667.529296875, 689.0625, 710.595703125, 732.12890625, 753.662109375, 775.1953125, 796.728515625, 839.794921875, 861.328125, 882.861328125, 904.39453125, 925.927734375, 968.994140625, 990.52734375, 1012.06054688, 1055.12695312, 1076.66015625, 1098.19335938, 1141.25976562, 1184.32617188, 1205.859375, 1248.92578125, 1270.45898438, 1313.52539062, 1356.59179688, 1399.65820312, 1442.72460938, 1485.79101562, 1528.85742188, 1571.92382812, 1614.99023438, 1658.05664062, 1701.12304688, 1765.72265625, 1808.7890625, 1873.38867188, 1916.45507812, 1981.0546875, 2024.12109375, 2088.72070312, 2153.3203125, 2217.91992188, 2282.51953125, 2347.11914062, 2411.71875, 2497.8515625, 2562.45117188, 2627.05078125, 2713.18359375, 2799.31640625, 2885.44921875, 2950.04882812, 3036.18164062, 3143.84765625, 3229.98046875, 3316.11328125, 3423.77929688, 3509.91210938, 3617.578125, 3725.24414062, 3832.91015625, 3940.57617188, 4069.77539062, 4177.44140625, 4306.640625, 4435.83984375, 4565.0390625, 4694.23828125, 4844.97070312, 4974.16992188, 5124.90234375, 5275.63476562, 5426.3671875, 5577.09960938, 5749.36523438, 5921.63085938, 6093.89648438, 6266.16210938, 6459.9609375, 6653.75976562, 6847.55859375, 7041.35742188, 7256.68945312, 7450.48828125, 7687.35351562, 7902.68554688, 8139.55078125, 8376.41601562, 8613.28125, 8871.6796875, 9130.078125, 9388.4765625, 9668.40820312, 9948.33984375, 10249.8046875, 10551.2695312, 10852.734375, 11175.7324219, 11498.7304688, 11843.2617188, 12187.7929688, 12553.8574219, 12919.921875, 13285.9863281, 13673.5839844, 14082.7148438, 14491.8457031, 14922.5097656, 15353.1738281, 15805.3710938, 16257.5683594}, const int inputSize=1025, const bool log=true, const std::string& normalize="unit_sum", const float sampleRate=44100, const std::string& type="power", const std::string& weighting="linear");
+    val TriangularBarkBandsBatch(const val& input_spectrum, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float highFrequencyBound=22050, const int inputSize=1025, const bool log=false, const float lowFrequencyBound=0, const std::string& normalize="unit_sum", const int numberBands=24, const float sampleRate=44100, const std::string& type="power", const std::string& weighting="warping");
+    val TrimmerBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const bool checkRange=false, const float endTime=1e+06, const float sampleRate=44100, const float startTime=0);
+    val TruePeakDetectorBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const bool blockDC=false, const bool emphasise=false, const int oversamplingFactor=4, const int quality=1, const float sampleRate=44100, const float threshold=-0.0002, const int version=4);
+    val TuningFrequencyExtractorBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int frameSize=4096, const int hopSize=2048);
+    val UnaryOperatorBatch(const val& input_array, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float scale=1, const float shift=0, const std::string& type="identity");
+    val UnaryOperatorStreamBatch(const val& input_array, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float scale=1, const float shift=0, const std::string& type="identity");
+    val VarianceBatch(const val& input_array, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride);
+    val VibratoBatch(const val& input_pitch, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float maxExtend=250, const float maxFrequency=8, const float minExtend=50, const float minFrequency=4, const float sampleRate=344.531);
+    val WarpedAutoCorrelationBatch(const val& input_array, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int maxLag=1, const float sampleRate=44100);
+    val WelchBatch(const val& input_frame, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int averagingFrames=10, const int fftSize=1024, const int frameSize=512, const float sampleRate=44100, const std::string& scaling="density", const std::string& windowType="hann");
+    val WindowingBatch(const val& input_frame, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const int constantsDecimals=5, const bool normalized=true, const int size=1024, const bool splitPadding=false, const bool symmetric=true, const std::string& type="hann", const int zeroPadding=0, const bool zeroPhase=true);
+    val ZeroCrossingRateBatch(const val& input_signal, const int batch_numFrames, const int batch_frameSize, const int batch_frameStride, const float threshold=0);
+  private:
+    AlgorithmCache* _algorithmCache;
+    // create a configured algorithm with the given parameters or reuse a cached one if caching is enabled
+    template <typename... Args>
+    essentia::standard::Algorithm* createAlgorithm(const std::string& name, const Args&... args);
+#ifdef ESSENTIAJS_DISPATCHER
+    essentia::standard::Algorithm* createAlgorithm(const std::string& name, const essentia::ParameterMap& params);
+#endif
+    // delete an algorithm created by 'createAlgorithm' unless it is owned by the cache
+    void releaseAlgorithm(essentia::standard::Algorithm* algorithm);
+    std::map<std::string, AlgorithmProfile> _profile;
+    // add a call of an algorithm method to its profile
+    void recordProfile(const std::string& name, double createMs, double inputMs, double computeMs, double outputMs, 
+                       double inputBytes, double outputBytes);
 };
 
+// incremental frame source which cuts overlapping frames out of pushed audio chunks (eg. from a microphone or 
+// a long audio file decoded in chunks) using a ring buffer, without materialising all the frames of the signal
+class FrameStream {
+  public:
+    FrameStream(int frameSize=1024, int hopSize=512, bool startFromZero=false, bool dropSilentFrames=false,
+                bool lastFrameToEndOfFile=false);
+    ~FrameStream() {};
+    void push(const val& chunk);
+    void flush();
+    void reset();
+    val next();
+    val nextBlock(int maxFrames);
+    int available() const;
+    int frameIndex() const;
+  private:
+    int _frameSize;
+    int _hopSize;
+    bool _startFromZero;
+    bool _dropSilentFrames;
+    bool _lastFrameToEndOfFile;
+    bool _flushed;
+    // ring buffer of the pending samples, its capacity is frameSize unless bigger chunks are pushed than pulled
+    std::vector<float> _buffer;
+    size_t _head;
+    size_t _count;
+    // number of the incoming samples to be skipped if hopSize is bigger than frameSize
+    size_t _skip;
+    // number of the pushed samples of the signal
+    size_t _signalSize;
+    int _frameIndex;
+    int _nextFrameIndex;
+    std::vector<float> _chunk;
+    std::vector<float> _frame;
+    std::vector<float> _block;
+    bool nextFrame();
+    bool hasFrame() const;
+    size_t tailMargin() const;
+    void append(std::vector<float>::const_iterator begin, std::vector<float>::const_iterator end);
+};
+
+// network of essentia streaming mode algorithms fed with audio chunks pushed from JS, which stores the outputs 
+// connected to its pool, so that the whole frame loop of the offline analysis of long signals runs inside WASM. 
+// The node 0 is the source whose 'signal' output emits the pushed samples, the other nodes are the added algorithms.
+class StreamingNetwork {
+  public:
+    StreamingNetwork();
+    ~StreamingNetwork();
+    int add(const std::string& name, const val& params);
+    void connect(int source, const std::string& output, int sink, const std::string& input);
+    void connectToPool(int source, const std::string& output, const std::string& descriptorName);
+    void push(const val& chunk);
+    void end();
+    void reset();
+    val getPool() const;
+    val aggregate(const val& stats) const;
+  private:
+    StreamingChunkInput* _source;
+    std::vector<essentia::streaming::Algorithm*> _algorithms;
+    // connections between the nodes, which are checked before the network is started
+    std::vector<std::vector<int> > _sinks;
+    std::set<std::pair<int, std::string> > _connectedInputs;
+    std::set<std::pair<int, std::string> > _connectedOutputs;
+    // connections of the outputs to the pool, which are only made once the network is started
+    std::vector<std::pair<std::pair<int, std::string>, std::string> > _poolOutputs;
+    essentia::Pool* _pool;
+    essentia::scheduler::Network* _network;
+    bool _ended;
+    essentia::streaming::Algorithm* node(int index) const;
+    void start();
+};
+
+// NOTE: The following code snippets are machine generated. Do not edit.
+// persistent algorithm classes which are configured once and can be computed many times
+// persistent wrapper of the essentia 'AfterMaxToBeforeMaxEnergyRatio' algorithm
+class AfterMaxToBeforeMaxEnergyRatioAlgo {
+  public:
+    AfterMaxToBeforeMaxEnergyRatioAlgo();
+    ~AfterMaxToBeforeMaxEnergyRatioAlgo();
+    void configure();
+    val compute(std::vector<float>& input_pitch);
+    val computeTyped(const val& input_pitch);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_pitch;
+    float _output_afterMaxToBeforeMaxEnergyRatio;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'AllPass' algorithm
+class AllPassAlgo {
+  public:
+    AllPassAlgo(const float bandwidth=500, const float cutoffFrequency=1500, const int order=1, const float sampleRate=44100);
+    ~AllPassAlgo();
+    void configure(const float bandwidth=500, const float cutoffFrequency=1500, const int order=1, const float sampleRate=44100);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    std::vector<float> _output_signal;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'AudioOnsetsMarker' algorithm
+class AudioOnsetsMarkerAlgo {
+  public:
+    AudioOnsetsMarkerAlgo(const std::vector<float>& onsets=std::vector<float>(), const float sampleRate=44100, const std::string& type="beep");
+    ~AudioOnsetsMarkerAlgo();
+    void configure(const std::vector<float>& onsets=std::vector<float>(), const float sampleRate=44100, const std::string& type="beep");
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    std::vector<float> _output_signal;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'AutoCorrelation' algorithm
+class AutoCorrelationAlgo {
+  public:
+    AutoCorrelationAlgo(const float frequencyDomainCompression=0.5, const bool generalized=false, const std::string& normalization="standard");
+    ~AutoCorrelationAlgo();
+    void configure(const float frequencyDomainCompression=0.5, const bool generalized=false, const std::string& normalization="standard");
+    val compute(std::vector<float>& input_array);
+    val computeTyped(const val& input_array);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_array;
+    std::vector<float> _output_autoCorrelation;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'BFCC' algorithm
+class BFCCAlgo {
+  public:
+    BFCCAlgo(const int dctType=2, const float highFrequencyBound=11000, const int inputSize=1025, const int liftering=0, const std::string& logType="dbamp", const float lowFrequencyBound=0, const std::string& normalize="unit_sum", const int numberBands=40, const int numberCoefficients=13, const float sampleRate=44100, const std::string& type="power", const std::string& weighting="warping");
+    ~BFCCAlgo();
+    void configure(const int dctType=2, const float highFrequencyBound=11000, const int inputSize=1025, const int liftering=0, const std::string& logType="dbamp", const float lowFrequencyBound=0, const std::string& normalize="unit_sum", const int numberBands=40, const int numberCoefficients=13, const float sampleRate=44100, const std::string& type="power", const std::string& weighting="warping");
+    val compute(std::vector<float>& input_spectrum);
+    val computeTyped(const val& input_spectrum);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_spectrum;
+    std::vector<float> _output_bands;
+    std::vector<float> _output_bfcc;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'BPF' algorithm
+class BPFAlgo {
+  public:
+    BPFAlgo(const std::vector<float>& xPoints=std::vector<float>{0, 1}, const std::vector<float>& yPoints=std::vector<float>{0, 1});
+    ~BPFAlgo();
+    void configure(const std::vector<float>& xPoints=std::vector<float>{0, 1}, const std::vector<float>& yPoints=std::vector<float>{0, 1});
+    val compute(float input_x);
+    val computeTyped(float input_x);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto(float input_x);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    float _output_y;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'BandPass' algorithm
+class BandPassAlgo {
+  public:
+    BandPassAlgo(const float bandwidth=500, const float cutoffFrequency=1500, const float sampleRate=44100);
+    ~BandPassAlgo();
+    void configure(const float bandwidth=500, const float cutoffFrequency=1500, const float sampleRate=44100);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    std::vector<float> _output_signal;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'BandReject' algorithm
+class BandRejectAlgo {
+  public:
+    BandRejectAlgo(const float bandwidth=500, const float cutoffFrequency=1500, const float sampleRate=44100);
+    ~BandRejectAlgo();
+    void configure(const float bandwidth=500, const float cutoffFrequency=1500, const float sampleRate=44100);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    std::vector<float> _output_signal;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'BarkBands' algorithm
+class BarkBandsAlgo {
+  public:
+    BarkBandsAlgo(const int numberBands=27, const float sampleRate=44100);
+    ~BarkBandsAlgo();
+    void configure(const int numberBands=27, const float sampleRate=44100);
+    val compute(std::vector<float>& input_spectrum);
+    val computeTyped(const val& input_spectrum);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_spectrum;
+    std::vector<float> _output_bands;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'BeatTrackerDegara' algorithm
+class BeatTrackerDegaraAlgo {
+  public:
+    BeatTrackerDegaraAlgo(const int maxTempo=208, const int minTempo=40);
+    ~BeatTrackerDegaraAlgo();
+    void configure(const int maxTempo=208, const int minTempo=40);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    std::vector<float> _output_ticks;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'BeatTrackerMultiFeature' algorithm
+class BeatTrackerMultiFeatureAlgo {
+  public:
+    BeatTrackerMultiFeatureAlgo(const int maxTempo=208, const int minTempo=40);
+    ~BeatTrackerMultiFeatureAlgo();
+    void configure(const int maxTempo=208, const int minTempo=40);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    std::vector<float> _output_ticks;
+    float _output_confidence;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'Beatogram' algorithm
+class BeatogramAlgo {
+  public:
+    BeatogramAlgo(const int size=16);
+    ~BeatogramAlgo();
+    void configure(const int size=16);
+    val compute(std::vector<float>& input_loudness, std::vector<std::vector<float> >& input_loudnessBandRatio);
+    val computeTyped(const val& input_loudness, const val& input_loudnessBandRatio);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_loudness;
+    std::vector<std::vector<float> > _input_loudnessBandRatio;
+    std::vector<std::vector<float> > _output_beatogram;
+    std::vector<float> _output_beatogram_buffer;
+};
+ 
+// persistent wrapper of the essentia 'BeatsLoudness' algorithm
+class BeatsLoudnessAlgo {
+  public:
+    BeatsLoudnessAlgo(const float beatDuration=0.05, const float beatWindowDuration=0.1, const std::vector<float>& beats=std::vector<float>(), const std::vector<float>& frequencyBands=std::vector<float>{20, 150, 400, 3200, 7000, 22000}, const float sampleRate=44100);
+    ~BeatsLoudnessAlgo();
+    void configure(const float beatDuration=0.05, const float beatWindowDuration=0.1, const std::vector<float>& beats=std::vector<float>(), const std::vector<float>& frequencyBands=std::vector<float>{20, 150, 400, 3200, 7000, 22000}, const float sampleRate=44100);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    std::vector<float> _output_loudness;
+    std::vector<std::vector<float> > _output_loudnessBandRatio;
+    std::vector<float> _output_loudnessBandRatio_buffer;
+};
+ 
+// persistent wrapper of the essentia 'BinaryOperator' algorithm
+class BinaryOperatorAlgo {
+  public:
+    BinaryOperatorAlgo(const std::string& type="add");
+    ~BinaryOperatorAlgo();
+    void configure(const std::string& type="add");
+    val compute(std::vector<float>& input_array1, std::vector<float>& input_array2);
+    val computeTyped(const val& input_array1, const val& input_array2);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_array1;
+    std::vector<float> _input_array2;
+    std::vector<float> _output_array;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'BinaryOperatorStream' algorithm
+class BinaryOperatorStreamAlgo {
+  public:
+    BinaryOperatorStreamAlgo(const std::string& type="add");
+    ~BinaryOperatorStreamAlgo();
+    void configure(const std::string& type="add");
+    val compute(std::vector<float>& input_array1, std::vector<float>& input_array2);
+    val computeTyped(const val& input_array1, const val& input_array2);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_array1;
+    std::vector<float> _input_array2;
+    std::vector<float> _output_array;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'BpmHistogram' algorithm
+class BpmHistogramAlgo {
+  public:
+    BpmHistogramAlgo(const float bpm=0, const bool constantTempo=false, const float frameRate=86.1328, const float frameSize=4, const float maxBpm=560, const int maxPeaks=50, const float minBpm=30, const int overlap=16, const float tempoChange=5, const bool weightByMagnitude=true, const std::string& windowType="hann", const int zeroPadding=0);
+    ~BpmHistogramAlgo();
+    void configure(const float bpm=0, const bool constantTempo=false, const float frameRate=86.1328, const float frameSize=4, const float maxBpm=560, const int maxPeaks=50, const float minBpm=30, const int overlap=16, const float tempoChange=5, const bool weightByMagnitude=true, const std::string& windowType="hann", const int zeroPadding=0);
+    val compute(std::vector<float>& input_novelty);
+    val computeTyped(const val& input_novelty);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_novelty;
+    float _output_bpm;
+    std::vector<float> _output_bpmCandidates;
+    std::vector<float> _output_bpmMagnitudes;
+    TNT::Array2D<float> _output_tempogram;
+    std::vector<float> _output_tempogram_buffer;
+    std::vector<float> _output_frameBpms;
+    std::vector<float> _output_ticks;
+    std::vector<float> _output_ticksMagnitude;
+    std::vector<float> _output_sinusoid;
+};
+ 
+// persistent wrapper of the essentia 'BpmHistogramDescriptors' algorithm
+class BpmHistogramDescriptorsAlgo {
+  public:
+    BpmHistogramDescriptorsAlgo();
+    ~BpmHistogramDescriptorsAlgo();
+    void configure();
+    val compute(std::vector<float>& input_bpmIntervals);
+    val computeTyped(const val& input_bpmIntervals);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_bpmIntervals;
+    float _output_firstPeakBPM;
+    float _output_firstPeakWeight;
+    float _output_firstPeakSpread;
+    float _output_secondPeakBPM;
+    float _output_secondPeakWeight;
+    float _output_secondPeakSpread;
+    std::vector<float> _output_histogram;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'BpmRubato' algorithm
+class BpmRubatoAlgo {
+  public:
+    BpmRubatoAlgo(const float longRegionsPruningTime=20, const float shortRegionsMergingTime=4, const float tolerance=0.08);
+    ~BpmRubatoAlgo();
+    void configure(const float longRegionsPruningTime=20, const float shortRegionsMergingTime=4, const float tolerance=0.08);
+    val compute(std::vector<float>& input_beats);
+    val computeTyped(const val& input_beats);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_beats;
+    std::vector<float> _output_rubatoStart;
+    std::vector<float> _output_rubatoStop;
+    int _output_rubatoNumber;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'CartesianToPolar' algorithm
+class CartesianToPolarAlgo {
+  public:
+    CartesianToPolarAlgo();
+    ~CartesianToPolarAlgo();
+    void configure();
+    val compute(const val& input_complex);
+    val computeTyped(const val& input_complex);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<std::complex<float> > _input_complex;
+    std::vector<float> _output_magnitude;
+    std::vector<float> _output_phase;
+};
+ 
+// persistent wrapper of the essentia 'CentralMoments' algorithm
+class CentralMomentsAlgo {
+  public:
+    CentralMomentsAlgo(const std::string& mode="pdf", const float range=1);
+    ~CentralMomentsAlgo();
+    void configure(const std::string& mode="pdf", const float range=1);
+    val compute(std::vector<float>& input_array);
+    val computeTyped(const val& input_array);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_array;
+    std::vector<float> _output_centralMoments;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'Centroid' algorithm
+class CentroidAlgo {
+  public:
+    CentroidAlgo(const float range=1);
+    ~CentroidAlgo();
+    void configure(const float range=1);
+    val compute(std::vector<float>& input_array);
+    val computeTyped(const val& input_array);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_array;
+    float _output_centroid;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'ChordsDescriptors' algorithm
+class ChordsDescriptorsAlgo {
+  public:
+    ChordsDescriptorsAlgo();
+    ~ChordsDescriptorsAlgo();
+    void configure();
+    val compute(std::vector<std::string> input_chords, std::string input_key, std::string input_scale);
+    val computeTyped(std::vector<std::string> input_chords, std::string input_key, std::string input_scale);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _output_chordsHistogram;
+    float _output_chordsNumberRate;
+    float _output_chordsChangesRate;
+    std::string _output_chordsKey;
+    std::string _output_chordsScale;
+};
+ 
+// persistent wrapper of the essentia 'ChordsDetection' algorithm
+class ChordsDetectionAlgo {
+  public:
+    ChordsDetectionAlgo(const int hopSize=2048, const float sampleRate=44100, const float windowSize=2);
+    ~ChordsDetectionAlgo();
+    void configure(const int hopSize=2048, const float sampleRate=44100, const float windowSize=2);
+    val compute(std::vector<std::vector<float> >& input_pcp);
+    val computeTyped(const val& input_pcp);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<std::vector<float> > _input_pcp;
+    std::vector<std::string> _output_chords;
+    std::vector<float> _output_strength;
+};
+ 
+// persistent wrapper of the essentia 'ChordsDetectionBeats' algorithm
+class ChordsDetectionBeatsAlgo {
+  public:
+    ChordsDetectionBeatsAlgo(const std::string& chromaPick="interbeat_median", const int hopSize=2048, const float sampleRate=44100);
+    ~ChordsDetectionBeatsAlgo();
+    void configure(const std::string& chromaPick="interbeat_median", const int hopSize=2048, const float sampleRate=44100);
+    val compute(std::vector<std::vector<float> >& input_pcp, std::vector<float>& input_ticks);
+    val computeTyped(const val& input_pcp, const val& input_ticks);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<std::vector<float> > _input_pcp;
+    std::vector<float> _input_ticks;
+    std::vector<std::string> _output_chords;
+    std::vector<float> _output_strength;
+};
+ 
+// persistent wrapper of the essentia 'ChromaCrossSimilarity' algorithm
+class ChromaCrossSimilarityAlgo {
+  public:
+    ChromaCrossSimilarityAlgo(const float binarizePercentile=0.095, const int frameStackSize=9, const int frameStackStride=1, const int noti=12, const bool oti=true, const bool otiBinary=false, const bool streaming=false);
+    ~ChromaCrossSimilarityAlgo();
+    void configure(const float binarizePercentile=0.095, const int frameStackSize=9, const int frameStackStride=1, const int noti=12, const bool oti=true, const bool otiBinary=false, const bool streaming=false);
+    val compute(std::vector<std::vector<float> >& input_queryFeature, std::vector<std::vector<float> >& input_referenceFeature);
+    val computeTyped(const val& input_queryFeature, const val& input_referenceFeature);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<std::vector<float> > _input_queryFeature;
+    std::vector<std::vector<float> > _input_referenceFeature;
+    std::vector<std::vector<float> > _output_csm;
+    std::vector<float> _output_csm_buffer;
+};
+ 
+// persistent wrapper of the essentia 'Chromagram' algorithm
+class ChromagramAlgo {
+  public:
+    ChromagramAlgo(const int binsPerOctave=12, const float minFrequency=32.7, const int minimumKernelSize=4, const std::string& normalizeType="unit_max", const int numberBins=84, const float sampleRate=44100, const float scale=1, const float threshold=0.01, const std::string& windowType="hann", const bool zeroPhase=true);
+    ~ChromagramAlgo();
+    void configure(const int binsPerOctave=12, const float minFrequency=32.7, const int minimumKernelSize=4, const std::string& normalizeType="unit_max", const int numberBins=84, const float sampleRate=44100, const float scale=1, const float threshold=0.01, const std::string& windowType="hann", const bool zeroPhase=true);
+    val compute(std::vector<float>& input_frame);
+    val computeTyped(const val& input_frame);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_frame;
+    std::vector<float> _output_chromagram;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'ClickDetector' algorithm
+class ClickDetectorAlgo {
+  public:
+    ClickDetectorAlgo(const float detectionThreshold=30, const int frameSize=512, const int hopSize=256, const int order=12, const int powerEstimationThreshold=10, const float sampleRate=44100, const int silenceThreshold=-50);
+    ~ClickDetectorAlgo();
+    void configure(const float detectionThreshold=30, const int frameSize=512, const int hopSize=256, const int order=12, const int powerEstimationThreshold=10, const float sampleRate=44100, const int silenceThreshold=-50);
+    val compute(std::vector<float>& input_frame);
+    val computeTyped(const val& input_frame);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_frame;
+    std::vector<float> _output_starts;
+    std::vector<float> _output_ends;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'Clipper' algorithm
+class ClipperAlgo {
+  public:
+    ClipperAlgo(const float max=1, const float min=-1);
+    ~ClipperAlgo();
+    void configure(const float max=1, const float min=-1);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    std::vector<float> _output_signal;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'ConstantQ' algorithm
+class ConstantQAlgo {
+  public:
+    ConstantQAlgo(const int binsPerOctave=12, const float minFrequency=32.7, const int minimumKernelSize=4, const int numberBins=84, const float sampleRate=44100, const float scale=1, const float threshold=0.01, const std::string& windowType="hann", const bool zeroPhase=true);
+    ~ConstantQAlgo();
+    void configure(const int binsPerOctave=12, const float minFrequency=32.7, const int minimumKernelSize=4, const int numberBins=84, const float sampleRate=44100, const float scale=1, const float threshold=0.01, const std::string& windowType="hann", const bool zeroPhase=true);
+    val compute(std::vector<float>& input_frame);
+    val computeTyped(const val& input_frame);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_frame;
+    std::vector<std::complex<float> > _output_constantq;
+};
+ 
+// persistent wrapper of the essentia 'CoverSongSimilarity' algorithm
+class CoverSongSimilarityAlgo {
+  public:
+    CoverSongSimilarityAlgo(const std::string& alignmentType="serra09", const float disExtension=0.5, const float disOnset=0.5, const std::string& distanceType="asymmetric");
+    ~CoverSongSimilarityAlgo();
+    void configure(const std::string& alignmentType="serra09", const float disExtension=0.5, const float disOnset=0.5, const std::string& distanceType="asymmetric");
+    val compute(std::vector<std::vector<float> >& input_inputArray);
+    val computeTyped(const val& input_inputArray);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<std::vector<float> > _input_inputArray;
+    std::vector<std::vector<float> > _output_scoreMatrix;
+    std::vector<float> _output_scoreMatrix_buffer;
+    float _output_distance;
+};
+ 
+// persistent wrapper of the essentia 'Crest' algorithm
+class CrestAlgo {
+  public:
+    CrestAlgo();
+    ~CrestAlgo();
+    void configure();
+    val compute(std::vector<float>& input_array);
+    val computeTyped(const val& input_array);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_array;
+    float _output_crest;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'CrossCorrelation' algorithm
+class CrossCorrelationAlgo {
+  public:
+    CrossCorrelationAlgo(const int maxLag=1, const int minLag=0);
+    ~CrossCorrelationAlgo();
+    void configure(const int maxLag=1, const int minLag=0);
+    val compute(std::vector<float>& input_arrayX, std::vector<float>& input_arrayY);
+    val computeTyped(const val& input_arrayX, const val& input_arrayY);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_arrayX;
+    std::vector<float> _input_arrayY;
+    std::vector<float> _output_crossCorrelation;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'CrossSimilarityMatrix' algorithm
+class CrossSimilarityMatrixAlgo {
+  public:
+    CrossSimilarityMatrixAlgo(const bool binarize=false, const float binarizePercentile=0.095, const int frameStackSize=1, const int frameStackStride=1);
+    ~CrossSimilarityMatrixAlgo();
+    void configure(const bool binarize=false, const float binarizePercentile=0.095, const int frameStackSize=1, const int frameStackStride=1);
+    val compute(std::vector<std::vector<float> >& input_queryFeature, std::vector<std::vector<float> >& input_referenceFeature);
+    val computeTyped(const val& input_queryFeature, const val& input_referenceFeature);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<std::vector<float> > _input_queryFeature;
+    std::vector<std::vector<float> > _input_referenceFeature;
+    std::vector<std::vector<float> > _output_csm;
+    std::vector<float> _output_csm_buffer;
+};
+ 
+// persistent wrapper of the essentia 'CubicSpline' algorithm
+class CubicSplineAlgo {
+  public:
+    CubicSplineAlgo(const int leftBoundaryFlag=0, const float leftBoundaryValue=0, const int rightBoundaryFlag=0, const float rightBoundaryValue=0, const std::vector<float>& xPoints=std::vector<float>{0, 1}, const std::vector<float>& yPoints=std::vector<float>{0, 1});
+    ~CubicSplineAlgo();
+    void configure(const int leftBoundaryFlag=0, const float leftBoundaryValue=0, const int rightBoundaryFlag=0, const float rightBoundaryValue=0, const std::vector<float>& xPoints=std::vector<float>{0, 1}, const std::vector<float>& yPoints=std::vector<float>{0, 1});
+    val compute(float input_x);
+    val computeTyped(float input_x);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto(float input_x);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    float _output_y;
+    float _output_dy;
+    float _output_ddy;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'DCRemoval' algorithm
+class DCRemovalAlgo {
+  public:
+    DCRemovalAlgo(const float cutoffFrequency=40, const float sampleRate=44100);
+    ~DCRemovalAlgo();
+    void configure(const float cutoffFrequency=40, const float sampleRate=44100);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    std::vector<float> _output_signal;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'DCT' algorithm
+class DCTAlgo {
+  public:
+    DCTAlgo(const int dctType=2, const int inputSize=10, const int liftering=0, const int outputSize=10);
+    ~DCTAlgo();
+    void configure(const int dctType=2, const int inputSize=10, const int liftering=0, const int outputSize=10);
+    val compute(std::vector<float>& input_array);
+    val computeTyped(const val& input_array);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_array;
+    std::vector<float> _output_dct;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'Danceability' algorithm
+class DanceabilityAlgo {
+  public:
+    DanceabilityAlgo(const float maxTau=8800, const float minTau=310, const float sampleRate=44100, const float tauMultiplier=1.1);
+    ~DanceabilityAlgo();
+    void configure(const float maxTau=8800, const float minTau=310, const float sampleRate=44100, const float tauMultiplier=1.1);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    float _output_danceability;
+    std::vector<float> _output_dfa;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'Decrease' algorithm
+class DecreaseAlgo {
+  public:
+    DecreaseAlgo(const float range=1);
+    ~DecreaseAlgo();
+    void configure(const float range=1);
+    val compute(std::vector<float>& input_array);
+    val computeTyped(const val& input_array);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_array;
+    float _output_decrease;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'Derivative' algorithm
+class DerivativeAlgo {
+  public:
+    DerivativeAlgo();
+    ~DerivativeAlgo();
+    void configure();
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    std::vector<float> _output_signal;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'DerivativeSFX' algorithm
+class DerivativeSFXAlgo {
+  public:
+    DerivativeSFXAlgo();
+    ~DerivativeSFXAlgo();
+    void configure();
+    val compute(std::vector<float>& input_envelope);
+    val computeTyped(const val& input_envelope);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_envelope;
+    float _output_derAvAfterMax;
+    float _output_maxDerBeforeMax;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'DiscontinuityDetector' algorithm
+class DiscontinuityDetectorAlgo {
+  public:
+    DiscontinuityDetectorAlgo(const float detectionThreshold=8, const float energyThreshold=-60, const int frameSize=512, const int hopSize=256, const int kernelSize=7, const int order=3, const int silenceThreshold=-50, const int subFrameSize=32);
+    ~DiscontinuityDetectorAlgo();
+    void configure(const float detectionThreshold=8, const float energyThreshold=-60, const int frameSize=512, const int hopSize=256, const int kernelSize=7, const int order=3, const int silenceThreshold=-50, const int subFrameSize=32);
+    val compute(std::vector<float>& input_frame);
+    val computeTyped(const val& input_frame);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_frame;
+    std::vector<float> _output_discontinuityLocations;
+    std::vector<float> _output_discontinuityAmplitudes;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'Dissonance' algorithm
+class DissonanceAlgo {
+  public:
+    DissonanceAlgo();
+    ~DissonanceAlgo();
+    void configure();
+    val compute(std::vector<float>& input_frequencies, std::vector<float>& input_magnitudes);
+    val computeTyped(const val& input_frequencies, const val& input_magnitudes);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_frequencies;
+    std::vector<float> _input_magnitudes;
+    float _output_dissonance;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'DistributionShape' algorithm
+class DistributionShapeAlgo {
+  public:
+    DistributionShapeAlgo();
+    ~DistributionShapeAlgo();
+    void configure();
+    val compute(std::vector<float>& input_centralMoments);
+    val computeTyped(const val& input_centralMoments);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_centralMoments;
+    float _output_spread;
+    float _output_skewness;
+    float _output_kurtosis;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'Duration' algorithm
+class DurationAlgo {
+  public:
+    DurationAlgo(const float sampleRate=44100);
+    ~DurationAlgo();
+    void configure(const float sampleRate=44100);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    float _output_duration;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'DynamicComplexity' algorithm
+class DynamicComplexityAlgo {
+  public:
+    DynamicComplexityAlgo(const float frameSize=0.2, const float sampleRate=44100);
+    ~DynamicComplexityAlgo();
+    void configure(const float frameSize=0.2, const float sampleRate=44100);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    float _output_dynamicComplexity;
+    float _output_loudness;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'ERBBands' algorithm
+class ERBBandsAlgo {
+  public:
+    ERBBandsAlgo(const float highFrequencyBound=22050, const int inputSize=1025, const float lowFrequencyBound=50, const int numberBands=40, const float sampleRate=44100, const std::string& type="power", const float width=1);
+    ~ERBBandsAlgo();
+    void configure(const float highFrequencyBound=22050, const int inputSize=1025, const float lowFrequencyBound=50, const int numberBands=40, const float sampleRate=44100, const std::string& type="power", const float width=1);
+    val compute(std::vector<float>& input_spectrum);
+    val computeTyped(const val& input_spectrum);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_spectrum;
+    std::vector<float> _output_bands;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'EffectiveDuration' algorithm
+class EffectiveDurationAlgo {
+  public:
+    EffectiveDurationAlgo(const float sampleRate=44100, const float thresholdRatio=0.4);
+    ~EffectiveDurationAlgo();
+    void configure(const float sampleRate=44100, const float thresholdRatio=0.4);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    float _output_effectiveDuration;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'Energy' algorithm
+class EnergyAlgo {
+  public:
+    EnergyAlgo();
+    ~EnergyAlgo();
+    void configure();
+    val compute(std::vector<float>& input_array);
+    val computeTyped(const val& input_array);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_array;
+    float _output_energy;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'EnergyBand' algorithm
+class EnergyBandAlgo {
+  public:
+    EnergyBandAlgo(const float sampleRate=44100, const float startCutoffFrequency=0, const float stopCutoffFrequency=100);
+    ~EnergyBandAlgo();
+    void configure(const float sampleRate=44100, const float startCutoffFrequency=0, const float stopCutoffFrequency=100);
+    val compute(std::vector<float>& input_spectrum);
+    val computeTyped(const val& input_spectrum);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_spectrum;
+    float _output_energyBand;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'EnergyBandRatio' algorithm
+class EnergyBandRatioAlgo {
+  public:
+    EnergyBandRatioAlgo(const float sampleRate=44100, const float startFrequency=0, const float stopFrequency=100);
+    ~EnergyBandRatioAlgo();
+    void configure(const float sampleRate=44100, const float startFrequency=0, const float stopFrequency=100);
+    val compute(std::vector<float>& input_spectrum);
+    val computeTyped(const val& input_spectrum);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_spectrum;
+    float _output_energyBandRatio;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'Entropy' algorithm
+class EntropyAlgo {
+  public:
+    EntropyAlgo();
+    ~EntropyAlgo();
+    void configure();
+    val compute(std::vector<float>& input_array);
+    val computeTyped(const val& input_array);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_array;
+    float _output_entropy;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'Envelope' algorithm
+class EnvelopeAlgo {
+  public:
+    EnvelopeAlgo(const bool applyRectification=true, const float attackTime=10, const float releaseTime=1500, const float sampleRate=44100);
+    ~EnvelopeAlgo();
+    void configure(const bool applyRectification=true, const float attackTime=10, const float releaseTime=1500, const float sampleRate=44100);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    std::vector<float> _output_signal;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'EqualLoudness' algorithm
+class EqualLoudnessAlgo {
+  public:
+    EqualLoudnessAlgo(const float sampleRate=44100);
+    ~EqualLoudnessAlgo();
+    void configure(const float sampleRate=44100);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    std::vector<float> _output_signal;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'FFT' algorithm
+class FFTAlgo {
+  public:
+    FFTAlgo(const int size=1024);
+    ~FFTAlgo();
+    void configure(const int size=1024);
+    val compute(std::vector<float>& input_frame);
+    val computeTyped(const val& input_frame);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_frame;
+    std::vector<std::complex<float> > _output_fft;
+};
+ 
+// persistent wrapper of the essentia 'FFTC' algorithm
+class FFTCAlgo {
+  public:
+    FFTCAlgo(const bool negativeFrequencies=false, const int size=1024);
+    ~FFTCAlgo();
+    void configure(const bool negativeFrequencies=false, const int size=1024);
+    val compute(const val& input_frame);
+    val computeTyped(const val& input_frame);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<std::complex<float> > _input_frame;
+    std::vector<std::complex<float> > _output_fft;
+};
+ 
+// persistent wrapper of the essentia 'FadeDetection' algorithm
+class FadeDetectionAlgo {
+  public:
+    FadeDetectionAlgo(const float cutoffHigh=0.85, const float cutoffLow=0.2, const float frameRate=4, const float minLength=3);
+    ~FadeDetectionAlgo();
+    void configure(const float cutoffHigh=0.85, const float cutoffLow=0.2, const float frameRate=4, const float minLength=3);
+    val compute(std::vector<float>& input_rms);
+    val computeTyped(const val& input_rms);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_rms;
+    TNT::Array2D<float> _output_fadeIn;
+    std::vector<float> _output_fadeIn_buffer;
+    TNT::Array2D<float> _output_fadeOut;
+    std::vector<float> _output_fadeOut_buffer;
+};
+ 
+// persistent wrapper of the essentia 'FalseStereoDetector' algorithm
+class FalseStereoDetectorAlgo {
+  public:
+    FalseStereoDetectorAlgo(const float correlationThreshold=0.9995, const int silenceThreshold=-70);
+    ~FalseStereoDetectorAlgo();
+    void configure(const float correlationThreshold=0.9995, const int silenceThreshold=-70);
+    val compute(const val& input_frame);
+    val computeTyped(const val& input_frame);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<essentia::StereoSample> _input_frame;
+    int _output_isFalseStereo;
+    float _output_correlation;
+};
+ 
+// persistent wrapper of the essentia 'Flatness' algorithm
+class FlatnessAlgo {
+  public:
+    FlatnessAlgo();
+    ~FlatnessAlgo();
+    void configure();
+    val compute(std::vector<float>& input_array);
+    val computeTyped(const val& input_array);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_array;
+    float _output_flatness;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'FlatnessDB' algorithm
+class FlatnessDBAlgo {
+  public:
+    FlatnessDBAlgo();
+    ~FlatnessDBAlgo();
+    void configure();
+    val compute(std::vector<float>& input_array);
+    val computeTyped(const val& input_array);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_array;
+    float _output_flatnessDB;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'FlatnessSFX' algorithm
+class FlatnessSFXAlgo {
+  public:
+    FlatnessSFXAlgo();
+    ~FlatnessSFXAlgo();
+    void configure();
+    val compute(std::vector<float>& input_envelope);
+    val computeTyped(const val& input_envelope);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_envelope;
+    float _output_flatness;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'Flux' algorithm
+class FluxAlgo {
+  public:
+    FluxAlgo(const bool halfRectify=false, const std::string& norm="L2");
+    ~FluxAlgo();
+    void configure(const bool halfRectify=false, const std::string& norm="L2");
+    val compute(std::vector<float>& input_spectrum);
+    val computeTyped(const val& input_spectrum);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_spectrum;
+    float _output_flux;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'FrameCutter' algorithm
+class FrameCutterAlgo {
+  public:
+    FrameCutterAlgo(const int frameSize=1024, const int hopSize=512, const bool lastFrameToEndOfFile=false, const bool startFromZero=false, const float validFrameThresholdRatio=0);
+    ~FrameCutterAlgo();
+    void configure(const int frameSize=1024, const int hopSize=512, const bool lastFrameToEndOfFile=false, const bool startFromZero=false, const float validFrameThresholdRatio=0);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    std::vector<float> _output_frame;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'FrameToReal' algorithm
+class FrameToRealAlgo {
+  public:
+    FrameToRealAlgo(const int frameSize=2048, const int hopSize=128);
+    ~FrameToRealAlgo();
+    void configure(const int frameSize=2048, const int hopSize=128);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    std::vector<float> _output_signal;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'FrequencyBands' algorithm
+class FrequencyBandsAlgo {
+  public:
+    FrequencyBandsAlgo(const std::vector<float>& frequencyBands=std::vector<float>{0, 50, 100, 150, 200, 300, 400, 510, 630, 770, 920, 1080, 1270, 1480, 1720, 2000, 2320, 2700, 3150, 3700, 4400, 5300, 6400, 7700, 9500, 12000, 15500, 20500, 27000}, const float sampleRate=44100);
+    ~FrequencyBandsAlgo();
+    void configure(const std::vector<float>& frequencyBands=std::vector<float>{0, 50, 100, 150, 200, 300, 400, 510, 630, 770, 920, 1080, 1270, 1480, 1720, 2000, 2320, 2700, 3150, 3700, 4400, 5300, 6400, 7700, 9500, 12000, 15500, 20500, 27000}, const float sampleRate=44100);
+    val compute(std::vector<float>& input_spectrum);
+    val computeTyped(const val& input_spectrum);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_spectrum;
+    std::vector<float> _output_bands;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'GFCC' algorithm
+class GFCCAlgo {
+  public:
+    GFCCAlgo(const int dctType=2, const float highFrequencyBound=22050, const int inputSize=1025, const std::string& logType="dbamp", const float lowFrequencyBound=40, const int numberBands=40, const int numberCoefficients=13, const float sampleRate=44100, const float silenceThreshold=1e-10, const std::string& type="power");
+    ~GFCCAlgo();
+    void configure(const int dctType=2, const float highFrequencyBound=22050, const int inputSize=1025, const std::string& logType="dbamp", const float lowFrequencyBound=40, const int numberBands=40, const int numberCoefficients=13, const float sampleRate=44100, const float silenceThreshold=1e-10, const std::string& type="power");
+    val compute(std::vector<float>& input_spectrum);
+    val computeTyped(const val& input_spectrum);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_spectrum;
+    std::vector<float> _output_bands;
+    std::vector<float> _output_gfcc;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'GapsDetector' algorithm
+class GapsDetectorAlgo {
+  public:
+    GapsDetectorAlgo(const float attackTime=0.05, const int frameSize=2048, const int hopSize=1024, const int kernelSize=11, const float maximumTime=3500, const float minimumTime=10, const float postpowerTime=40, const float prepowerThreshold=-30, const float prepowerTime=40, const float releaseTime=0.05, const float sampleRate=44100, const float silenceThreshold=-50);
+    ~GapsDetectorAlgo();
+    void configure(const float attackTime=0.05, const int frameSize=2048, const int hopSize=1024, const int kernelSize=11, const float maximumTime=3500, const float minimumTime=10, const float postpowerTime=40, const float prepowerThreshold=-30, const float prepowerTime=40, const float releaseTime=0.05, const float sampleRate=44100, const float silenceThreshold=-50);
+    val compute(std::vector<float>& input_frame);
+    val computeTyped(const val& input_frame);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_frame;
+    std::vector<float> _output_starts;
+    std::vector<float> _output_ends;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'GeometricMean' algorithm
+class GeometricMeanAlgo {
+  public:
+    GeometricMeanAlgo();
+    ~GeometricMeanAlgo();
+    void configure();
+    val compute(std::vector<float>& input_array);
+    val computeTyped(const val& input_array);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_array;
+    float _output_geometricMean;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'HFC' algorithm
+class HFCAlgo {
+  public:
+    HFCAlgo(const float sampleRate=44100, const std::string& type="Masri");
+    ~HFCAlgo();
+    void configure(const float sampleRate=44100, const std::string& type="Masri");
+    val compute(std::vector<float>& input_spectrum);
+    val computeTyped(const val& input_spectrum);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_spectrum;
+    float _output_hfc;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'HPCP' algorithm
+class HPCPAlgo {
+  public:
+    HPCPAlgo(const bool bandPreset=true, const float bandSplitFrequency=500, const int harmonics=0, const float maxFrequency=5000, const bool maxShifted=false, const float minFrequency=40, const bool nonLinear=false, const std::string& normalized="unitMax", const float referenceFrequency=440, const float sampleRate=44100, const int size=12, const std::string& weightType="squaredCosine", const float windowSize=1);
+    ~HPCPAlgo();
+    void configure(const bool bandPreset=true, const float bandSplitFrequency=500, const int harmonics=0, const float maxFrequency=5000, const bool maxShifted=false, const float minFrequency=40, const bool nonLinear=false, const std::string& normalized="unitMax", const float referenceFrequency=440, const float sampleRate=44100, const int size=12, const std::string& weightType="squaredCosine", const float windowSize=1);
+    val compute(std::vector<float>& input_frequencies, std::vector<float>& input_magnitudes);
+    val computeTyped(const val& input_frequencies, const val& input_magnitudes);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_frequencies;
+    std::vector<float> _input_magnitudes;
+    std::vector<float> _output_hpcp;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'HarmonicBpm' algorithm
+class HarmonicBpmAlgo {
+  public:
+    HarmonicBpmAlgo(const float bpm=60, const float threshold=20, const float tolerance=5);
+    ~HarmonicBpmAlgo();
+    void configure(const float bpm=60, const float threshold=20, const float tolerance=5);
+    val compute(std::vector<float>& input_bpms);
+    val computeTyped(const val& input_bpms);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_bpms;
+    std::vector<float> _output_harmonicBpms;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'HarmonicMask' algorithm
+class HarmonicMaskAlgo {
+  public:
+    HarmonicMaskAlgo(const float attenuation=-200, const int binWidth=4, const float sampleRate=44100);
+    ~HarmonicMaskAlgo();
+    void configure(const float attenuation=-200, const int binWidth=4, const float sampleRate=44100);
+    val compute(const val& input_fft, float input_pitch);
+    val computeTyped(const val& input_fft, float input_pitch);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<std::complex<float> > _input_fft;
+    std::vector<std::complex<float> > _output_fft;
+};
+ 
+// persistent wrapper of the essentia 'HarmonicModelAnal' algorithm
+class HarmonicModelAnalAlgo {
+  public:
+    HarmonicModelAnalAlgo(const float freqDevOffset=20, const float freqDevSlope=0.01, const float harmDevSlope=0.01, const int hopSize=512, const float magnitudeThreshold=-74, const float maxFrequency=5000, const int maxPeaks=100, const int maxnSines=100, const float minFrequency=20, const int nHarmonics=100, const std::string& orderBy="frequency", const float sampleRate=44100);
+    ~HarmonicModelAnalAlgo();
+    void configure(const float freqDevOffset=20, const float freqDevSlope=0.01, const float harmDevSlope=0.01, const int hopSize=512, const float magnitudeThreshold=-74, const float maxFrequency=5000, const int maxPeaks=100, const int maxnSines=100, const float minFrequency=20, const int nHarmonics=100, const std::string& orderBy="frequency", const float sampleRate=44100);
+    val compute(const val& input_fft, float input_pitch);
+    val computeTyped(const val& input_fft, float input_pitch);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<std::complex<float> > _input_fft;
+    std::vector<float> _output_frequencies;
+    std::vector<float> _output_magnitudes;
+    std::vector<float> _output_phases;
+};
+ 
+// persistent wrapper of the essentia 'HarmonicPeaks' algorithm
+class HarmonicPeaksAlgo {
+  public:
+    HarmonicPeaksAlgo(const int maxHarmonics=20, const float tolerance=0.2);
+    ~HarmonicPeaksAlgo();
+    void configure(const int maxHarmonics=20, const float tolerance=0.2);
+    val compute(std::vector<float>& input_frequencies, std::vector<float>& input_magnitudes, float input_pitch);
+    val computeTyped(const val& input_frequencies, const val& input_magnitudes, float input_pitch);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto(float input_pitch);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_frequencies;
+    std::vector<float> _input_magnitudes;
+    std::vector<float> _output_harmonicFrequencies;
+    std::vector<float> _output_harmonicMagnitudes;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'HighPass' algorithm
+class HighPassAlgo {
+  public:
+    HighPassAlgo(const float cutoffFrequency=1500, const float sampleRate=44100);
+    ~HighPassAlgo();
+    void configure(const float cutoffFrequency=1500, const float sampleRate=44100);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    std::vector<float> _output_signal;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'HighResolutionFeatures' algorithm
+class HighResolutionFeaturesAlgo {
+  public:
+    HighResolutionFeaturesAlgo(const int maxPeaks=24);
+    ~HighResolutionFeaturesAlgo();
+    void configure(const int maxPeaks=24);
+    val compute(std::vector<float>& input_hpcp);
+    val computeTyped(const val& input_hpcp);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_hpcp;
+    float _output_equalTemperedDeviation;
+    float _output_nonTemperedEnergyRatio;
+    float _output_nonTemperedPeaksEnergyRatio;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'Histogram' algorithm
+class HistogramAlgo {
+  public:
+    HistogramAlgo(const float maxValue=1, const float minValue=0, const std::string& normalize="none", const int numberBins=10);
+    ~HistogramAlgo();
+    void configure(const float maxValue=1, const float minValue=0, const std::string& normalize="none", const int numberBins=10);
+    val compute(std::vector<float>& input_array);
+    val computeTyped(const val& input_array);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_array;
+    std::vector<float> _output_histogram;
+    std::vector<float> _output_binEdges;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'HprModelAnal' algorithm
+class HprModelAnalAlgo {
+  public:
+    HprModelAnalAlgo(const int fftSize=2048, const int freqDevOffset=20, const float freqDevSlope=0.01, const float harmDevSlope=0.01, const int hopSize=512, const float magnitudeThreshold=0, const float maxFrequency=5000, const int maxPeaks=100, const int maxnSines=100, const float minFrequency=20, const int nHarmonics=100, const std::string& orderBy="frequency", const float sampleRate=44100, const float stocf=0.2);
+    ~HprModelAnalAlgo();
+    void configure(const int fftSize=2048, const int freqDevOffset=20, const float freqDevSlope=0.01, const float harmDevSlope=0.01, const int hopSize=512, const float magnitudeThreshold=0, const float maxFrequency=5000, const int maxPeaks=100, const int maxnSines=100, const float minFrequency=20, const int nHarmonics=100, const std::string& orderBy="frequency", const float sampleRate=44100, const float stocf=0.2);
+    val compute(std::vector<float>& input_frame, float input_pitch);
+    val computeTyped(const val& input_frame, float input_pitch);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto(float input_pitch);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_frame;
+    std::vector<float> _output_frequencies;
+    std::vector<float> _output_magnitudes;
+    std::vector<float> _output_phases;
+    std::vector<float> _output_res;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'HpsModelAnal' algorithm
+class HpsModelAnalAlgo {
+  public:
+    HpsModelAnalAlgo(const int fftSize=2048, const int freqDevOffset=20, const float freqDevSlope=0.01, const float harmDevSlope=0.01, const int hopSize=512, const float magnitudeThreshold=0, const float maxFrequency=5000, const int maxPeaks=100, const int maxnSines=100, const float minFrequency=20, const int nHarmonics=100, const std::string& orderBy="frequency", const float sampleRate=44100, const float stocf=0.2);
+    ~HpsModelAnalAlgo();
+    void configure(const int fftSize=2048, const int freqDevOffset=20, const float freqDevSlope=0.01, const float harmDevSlope=0.01, const int hopSize=512, const float magnitudeThreshold=0, const float maxFrequency=5000, const int maxPeaks=100, const int maxnSines=100, const float minFrequency=20, const int nHarmonics=100, const std::string& orderBy="frequency", const float sampleRate=44100, const float stocf=0.2);
+    val compute(std::vector<float>& input_frame, float input_pitch);
+    val computeTyped(const val& input_frame, float input_pitch);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto(float input_pitch);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_frame;
+    std::vector<float> _output_frequencies;
+    std::vector<float> _output_magnitudes;
+    std::vector<float> _output_phases;
+    std::vector<float> _output_stocenv;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'HumDetector' algorithm
+class HumDetectorAlgo {
+  public:
+    HumDetectorAlgo(const float Q0=0.1, const float Q1=0.55, const float detectionThreshold=5, const float frameSize=0.4, const float hopSize=0.2, const float maximumFrequency=400, const float minimumDuration=2, const float minimumFrequency=22.5, const int numberHarmonics=1, const float sampleRate=44100, const float timeContinuity=10, const float timeWindow=10);
+    ~HumDetectorAlgo();
+    void configure(const float Q0=0.1, const float Q1=0.55, const float detectionThreshold=5, const float frameSize=0.4, const float hopSize=0.2, const float maximumFrequency=400, const float minimumDuration=2, const float minimumFrequency=22.5, const int numberHarmonics=1, const float sampleRate=44100, const float timeContinuity=10, const float timeWindow=10);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    TNT::Array2D<float> _output_r;
+    std::vector<float> _output_r_buffer;
+    std::vector<float> _output_frequencies;
+    std::vector<float> _output_saliences;
+    std::vector<float> _output_starts;
+    std::vector<float> _output_ends;
+};
+ 
+// persistent wrapper of the essentia 'IDCT' algorithm
+class IDCTAlgo {
+  public:
+    IDCTAlgo(const int dctType=2, const int inputSize=10, const int liftering=0, const int outputSize=10);
+    ~IDCTAlgo();
+    void configure(const int dctType=2, const int inputSize=10, const int liftering=0, const int outputSize=10);
+    val compute(std::vector<float>& input_dct);
+    val computeTyped(const val& input_dct);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_dct;
+    std::vector<float> _output_idct;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'IFFT' algorithm
+class IFFTAlgo {
+  public:
+    IFFTAlgo(const bool normalize=true, const int size=1024);
+    ~IFFTAlgo();
+    void configure(const bool normalize=true, const int size=1024);
+    val compute(const val& input_fft);
+    val computeTyped(const val& input_fft);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<std::complex<float> > _input_fft;
+    std::vector<float> _output_frame;
+};
+ 
+// persistent wrapper of the essentia 'IFFTC' algorithm
+class IFFTCAlgo {
+  public:
+    IFFTCAlgo(const bool normalize=true, const int size=1024);
+    ~IFFTCAlgo();
+    void configure(const bool normalize=true, const int size=1024);
+    val compute(const val& input_fft);
+    val computeTyped(const val& input_fft);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<std::complex<float> > _input_fft;
+    std::vector<std::complex<float> > _output_frame;
+};
+ 
+// persistent wrapper of the essentia 'IIR' algorithm
+class IIRAlgo {
+  public:
+    IIRAlgo(const std::vector<float>& denominator=std::vector<float>{1}, const std::vector<float>& numerator=std::vector<float>{1});
+    ~IIRAlgo();
+    void configure(const std::vector<float>& denominator=std::vector<float>{1}, const std::vector<float>& numerator=std::vector<float>{1});
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    std::vector<float> _output_signal;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'Inharmonicity' algorithm
+class InharmonicityAlgo {
+  public:
+    InharmonicityAlgo();
+    ~InharmonicityAlgo();
+    void configure();
+    val compute(std::vector<float>& input_frequencies, std::vector<float>& input_magnitudes);
+    val computeTyped(const val& input_frequencies, const val& input_magnitudes);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_frequencies;
+    std::vector<float> _input_magnitudes;
+    float _output_inharmonicity;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'InstantPower' algorithm
+class InstantPowerAlgo {
+  public:
+    InstantPowerAlgo();
+    ~InstantPowerAlgo();
+    void configure();
+    val compute(std::vector<float>& input_array);
+    val computeTyped(const val& input_array);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_array;
+    float _output_power;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'Intensity' algorithm
+class IntensityAlgo {
+  public:
+    IntensityAlgo(const float sampleRate=44100);
+    ~IntensityAlgo();
+    void configure(const float sampleRate=44100);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    int _output_intensity;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'Key' algorithm
+class KeyAlgo {
+  public:
+    KeyAlgo(const int numHarmonics=4, const int pcpSize=36, const std::string& profileType="bgate", const float slope=0.6, const bool useMajMin=false, const bool usePolyphony=true, const bool useThreeChords=true);
+    ~KeyAlgo();
+    void configure(const int numHarmonics=4, const int pcpSize=36, const std::string& profileType="bgate", const float slope=0.6, const bool useMajMin=false, const bool usePolyphony=true, const bool useThreeChords=true);
+    val compute(std::vector<float>& input_pcp);
+    val computeTyped(const val& input_pcp);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_pcp;
+    std::string _output_key;
+    std::string _output_scale;
+    float _output_strength;
+    float _output_firstToSecondRelativeStrength;
+};
+ 
+// persistent wrapper of the essentia 'KeyExtractor' algorithm
+class KeyExtractorAlgo {
+  public:
+    KeyExtractorAlgo(const bool averageDetuningCorrection=true, const int frameSize=4096, const int hopSize=4096, const int hpcpSize=12, const float maxFrequency=3500, const int maximumSpectralPeaks=60, const float minFrequency=25, const float pcpThreshold=0.2, const std::string& profileType="bgate", const float sampleRate=44100, const float spectralPeaksThreshold=0.0001, const float tuningFrequency=440, const std::string& weightType="cosine", const std::string& windowType="hann");
+    ~KeyExtractorAlgo();
+    void configure(const bool averageDetuningCorrection=true, const int frameSize=4096, const int hopSize=4096, const int hpcpSize=12, const float maxFrequency=3500, const int maximumSpectralPeaks=60, const float minFrequency=25, const float pcpThreshold=0.2, const std::string& profileType="bgate", const float sampleRate=44100, const float spectralPeaksThreshold=0.0001, const float tuningFrequency=440, const std::string& weightType="cosine", const std::string& windowType="hann");
+    val compute(std::vector<float>& input_audio);
+    val computeTyped(const val& input_audio);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_audio;
+    std::string _output_key;
+    std::string _output_scale;
+    float _output_strength;
+};
+ 
+// persistent wrapper of the essentia 'LPC' algorithm
+class LPCAlgo {
+  public:
+    LPCAlgo(const int order=10, const float sampleRate=44100, const std::string& type="regular");
+    ~LPCAlgo();
+    void configure(const int order=10, const float sampleRate=44100, const std::string& type="regular");
+    val compute(std::vector<float>& input_frame);
+    val computeTyped(const val& input_frame);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_frame;
+    std::vector<float> _output_lpc;
+    std::vector<float> _output_reflection;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'Larm' algorithm
+class LarmAlgo {
+  public:
+    LarmAlgo(const float attackTime=10, const float power=1.5, const float releaseTime=1500, const float sampleRate=44100);
+    ~LarmAlgo();
+    void configure(const float attackTime=10, const float power=1.5, const float releaseTime=1500, const float sampleRate=44100);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    float _output_larm;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'Leq' algorithm
+class LeqAlgo {
+  public:
+    LeqAlgo();
+    ~LeqAlgo();
+    void configure();
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    float _output_leq;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'LevelExtractor' algorithm
+class LevelExtractorAlgo {
+  public:
+    LevelExtractorAlgo(const int frameSize=88200, const int hopSize=44100);
+    ~LevelExtractorAlgo();
+    void configure(const int frameSize=88200, const int hopSize=44100);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    std::vector<float> _output_loudness;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'LogAttackTime' algorithm
+class LogAttackTimeAlgo {
+  public:
+    LogAttackTimeAlgo(const float sampleRate=44100, const float startAttackThreshold=0.2, const float stopAttackThreshold=0.9);
+    ~LogAttackTimeAlgo();
+    void configure(const float sampleRate=44100, const float startAttackThreshold=0.2, const float stopAttackThreshold=0.9);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    float _output_logAttackTime;
+    float _output_attackStart;
+    float _output_attackStop;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'LogSpectrum' algorithm
+class LogSpectrumAlgo {
+  public:
+    LogSpectrumAlgo(const float binsPerSemitone=3, const int frameSize=1025, const int nOctave=7, const float rollOn=0, const float sampleRate=44100);
+    ~LogSpectrumAlgo();
+    void configure(const float binsPerSemitone=3, const int frameSize=1025, const int nOctave=7, const float rollOn=0, const float sampleRate=44100);
+    val compute(std::vector<float>& input_spectrum);
+    val computeTyped(const val& input_spectrum);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_spectrum;
+    std::vector<float> _output_logFreqSpectrum;
+    std::vector<float> _output_meanTuning;
+    float _output_localTuning;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'LoopBpmConfidence' algorithm
+class LoopBpmConfidenceAlgo {
+  public:
+    LoopBpmConfidenceAlgo(const float sampleRate=44100);
+    ~LoopBpmConfidenceAlgo();
+    void configure(const float sampleRate=44100);
+    val compute(std::vector<float>& input_signal, float input_bpmEstimate);
+    val computeTyped(const val& input_signal, float input_bpmEstimate);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto(float input_bpmEstimate);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    float _output_confidence;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'LoopBpmEstimator' algorithm
+class LoopBpmEstimatorAlgo {
+  public:
+    LoopBpmEstimatorAlgo(const float confidenceThreshold=0.95);
+    ~LoopBpmEstimatorAlgo();
+    void configure(const float confidenceThreshold=0.95);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    float _output_bpm;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'Loudness' algorithm
+class LoudnessAlgo {
+  public:
+    LoudnessAlgo();
+    ~LoudnessAlgo();
+    void configure();
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    float _output_loudness;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'LoudnessVickers' algorithm
+class LoudnessVickersAlgo {
+  public:
+    LoudnessVickersAlgo(const float sampleRate=44100);
+    ~LoudnessVickersAlgo();
+    void configure(const float sampleRate=44100);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    float _output_loudness;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'LowLevelSpectralEqloudExtractor' algorithm
+class LowLevelSpectralEqloudExtractorAlgo {
+  public:
+    LowLevelSpectralEqloudExtractorAlgo(const int frameSize=2048, const int hopSize=1024, const float sampleRate=44100);
+    ~LowLevelSpectralEqloudExtractorAlgo();
+    void configure(const int frameSize=2048, const int hopSize=1024, const float sampleRate=44100);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    std::vector<float> _output_dissonance;
+    std::vector<std::vector<float> > _output_sccoeffs;
+    std::vector<float> _output_sccoeffs_buffer;
+    std::vector<std::vector<float> > _output_scvalleys;
+    std::vector<float> _output_scvalleys_buffer;
+    std::vector<float> _output_spectral_centroid;
+    std::vector<float> _output_spectral_kurtosis;
+    std::vector<float> _output_spectral_skewness;
+    std::vector<float> _output_spectral_spread;
+};
+ 
+// persistent wrapper of the essentia 'LowLevelSpectralExtractor' algorithm
+class LowLevelSpectralExtractorAlgo {
+  public:
+    LowLevelSpectralExtractorAlgo(const int frameSize=2048, const int hopSize=1024, const float sampleRate=44100);
+    ~LowLevelSpectralExtractorAlgo();
+    void configure(const int frameSize=2048, const int hopSize=1024, const float sampleRate=44100);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    std::vector<std::vector<float> > _output_barkbands;
+    std::vector<float> _output_barkbands_buffer;
+    std::vector<float> _output_barkbands_kurtosis;
+    std::vector<float> _output_barkbands_skewness;
+    std::vector<float> _output_barkbands_spread;
+    std::vector<float> _output_hfc;
+    std::vector<std::vector<float> > _output_mfcc;
+    std::vector<float> _output_mfcc_buffer;
+    std::vector<float> _output_pitch;
+    std::vector<float> _output_pitch_instantaneous_confidence;
+    std::vector<float> _output_pitch_salience;
+    std::vector<float> _output_silence_rate_20dB;
+    std::vector<float> _output_silence_rate_30dB;
+    std::vector<float> _output_silence_rate_60dB;
+    std::vector<float> _output_spectral_complexity;
+    std::vector<float> _output_spectral_crest;
+    std::vector<float> _output_spectral_decrease;
+    std::vector<float> _output_spectral_energy;
+    std::vector<float> _output_spectral_energyband_low;
+    std::vector<float> _output_spectral_energyband_middle_low;
+    std::vector<float> _output_spectral_energyband_middle_high;
+    std::vector<float> _output_spectral_energyband_high;
+    std::vector<float> _output_spectral_flatness_db;
+    std::vector<float> _output_spectral_flux;
+    std::vector<float> _output_spectral_rms;
+    std::vector<float> _output_spectral_rolloff;
+    std::vector<float> _output_spectral_strongpeak;
+    std::vector<float> _output_zerocrossingrate;
+    std::vector<float> _output_inharmonicity;
+    std::vector<std::vector<float> > _output_tristimulus;
+    std::vector<float> _output_tristimulus_buffer;
+    std::vector<float> _output_oddtoevenharmonicenergyratio;
+};
+ 
+// persistent wrapper of the essentia 'LowPass' algorithm
+class LowPassAlgo {
+  public:
+    LowPassAlgo(const float cutoffFrequency=1500, const float sampleRate=44100);
+    ~LowPassAlgo();
+    void configure(const float cutoffFrequency=1500, const float sampleRate=44100);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    std::vector<float> _output_signal;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'MFCC' algorithm
+class MFCCAlgo {
+  public:
+    MFCCAlgo(const int dctType=2, const float highFrequencyBound=11000, const int inputSize=1025, const int liftering=0, const std::string& logType="dbamp", const float lowFrequencyBound=0, const std::string& normalize="unit_sum", const int numberBands=40, const int numberCoefficients=13, const float sampleRate=44100, const float silenceThreshold=1e-10, const std::string& type="power", const std::string& warpingFormula="htkMel", const std::string& weighting="warping");
+    ~MFCCAlgo();
+    void configure(const int dctType=2, const float highFrequencyBound=11000, const int inputSize=1025, const int liftering=0, const std::string& logType="dbamp", const float lowFrequencyBound=0, const std::string& normalize="unit_sum", const int numberBands=40, const int numberCoefficients=13, const float sampleRate=44100, const float silenceThreshold=1e-10, const std::string& type="power", const std::string& warpingFormula="htkMel", const std::string& weighting="warping");
+    val compute(std::vector<float>& input_spectrum);
+    val computeTyped(const val& input_spectrum);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_spectrum;
+    std::vector<float> _output_bands;
+    std::vector<float> _output_mfcc;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'Magnitude' algorithm
+class MagnitudeAlgo {
+  public:
+    MagnitudeAlgo();
+    ~MagnitudeAlgo();
+    void configure();
+    val compute(const val& input_complex);
+    val computeTyped(const val& input_complex);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<std::complex<float> > _input_complex;
+    std::vector<float> _output_magnitude;
+};
+ 
+// persistent wrapper of the essentia 'MaxFilter' algorithm
+class MaxFilterAlgo {
+  public:
+    MaxFilterAlgo(const bool causal=true, const int width=3);
+    ~MaxFilterAlgo();
+    void configure(const bool causal=true, const int width=3);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    std::vector<float> _output_signal;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'MaxMagFreq' algorithm
+class MaxMagFreqAlgo {
+  public:
+    MaxMagFreqAlgo(const float sampleRate=44100);
+    ~MaxMagFreqAlgo();
+    void configure(const float sampleRate=44100);
+    val compute(std::vector<float>& input_spectrum);
+    val computeTyped(const val& input_spectrum);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_spectrum;
+    float _output_maxMagFreq;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'MaxToTotal' algorithm
+class MaxToTotalAlgo {
+  public:
+    MaxToTotalAlgo();
+    ~MaxToTotalAlgo();
+    void configure();
+    val compute(std::vector<float>& input_envelope);
+    val computeTyped(const val& input_envelope);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_envelope;
+    float _output_maxToTotal;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'Mean' algorithm
+class MeanAlgo {
+  public:
+    MeanAlgo();
+    ~MeanAlgo();
+    void configure();
+    val compute(std::vector<float>& input_array);
+    val computeTyped(const val& input_array);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_array;
+    float _output_mean;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'Median' algorithm
+class MedianAlgo {
+  public:
+    MedianAlgo();
+    ~MedianAlgo();
+    void configure();
+    val compute(std::vector<float>& input_array);
+    val computeTyped(const val& input_array);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_array;
+    float _output_median;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'MedianFilter' algorithm
+class MedianFilterAlgo {
+  public:
+    MedianFilterAlgo(const int kernelSize=11);
+    ~MedianFilterAlgo();
+    void configure(const int kernelSize=11);
+    val compute(std::vector<float>& input_array);
+    val computeTyped(const val& input_array);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_array;
+    std::vector<float> _output_filteredArray;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'MelBands' algorithm
+class MelBandsAlgo {
+  public:
+    MelBandsAlgo(const float highFrequencyBound=22050, const int inputSize=1025, const bool log=false, const float lowFrequencyBound=0, const std::string& normalize="unit_sum", const int numberBands=24, const float sampleRate=44100, const std::string& type="power", const std::string& warpingFormula="htkMel", const std::string& weighting="warping");
+    ~MelBandsAlgo();
+    void configure(const float highFrequencyBound=22050, const int inputSize=1025, const bool log=false, const float lowFrequencyBound=0, const std::string& normalize="unit_sum", const int numberBands=24, const float sampleRate=44100, const std::string& type="power", const std::string& warpingFormula="htkMel", const std::string& weighting="warping");
+    val compute(std::vector<float>& input_spectrum);
+    val computeTyped(const val& input_spectrum);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_spectrum;
+    std::vector<float> _output_bands;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'Meter' algorithm
+class MeterAlgo {
+  public:
+    MeterAlgo();
+    ~MeterAlgo();
+    void configure();
+    val compute(std::vector<std::vector<float> >& input_beatogram);
+    val computeTyped(const val& input_beatogram);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<std::vector<float> > _input_beatogram;
+    float _output_meter;
+};
+ 
+// persistent wrapper of the essentia 'MinMax' algorithm
+class MinMaxAlgo {
+  public:
+    MinMaxAlgo(const std::string& type="min");
+    ~MinMaxAlgo();
+    void configure(const std::string& type="min");
+    val compute(std::vector<float>& input_array);
+    val computeTyped(const val& input_array);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_array;
+    float _output_real;
+    int _output_int;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'MinToTotal' algorithm
+class MinToTotalAlgo {
+  public:
+    MinToTotalAlgo();
+    ~MinToTotalAlgo();
+    void configure();
+    val compute(std::vector<float>& input_envelope);
+    val computeTyped(const val& input_envelope);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_envelope;
+    float _output_minToTotal;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'MovingAverage' algorithm
+class MovingAverageAlgo {
+  public:
+    MovingAverageAlgo(const int size=6);
+    ~MovingAverageAlgo();
+    void configure(const int size=6);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    std::vector<float> _output_signal;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'MultiPitchKlapuri' algorithm
+class MultiPitchKlapuriAlgo {
+  public:
+    MultiPitchKlapuriAlgo(const float binResolution=10, const int frameSize=2048, const float harmonicWeight=0.8, const int hopSize=128, const float magnitudeCompression=1, const int magnitudeThreshold=40, const float maxFrequency=1760, const float minFrequency=80, const int numberHarmonics=10, const float referenceFrequency=55, const float sampleRate=44100);
+    ~MultiPitchKlapuriAlgo();
+    void configure(const float binResolution=10, const int frameSize=2048, const float harmonicWeight=0.8, const int hopSize=128, const float magnitudeCompression=1, const int magnitudeThreshold=40, const float maxFrequency=1760, const float minFrequency=80, const int numberHarmonics=10, const float referenceFrequency=55, const float sampleRate=44100);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    std::vector<std::vector<float> > _output_pitch;
+    std::vector<float> _output_pitch_buffer;
+};
+ 
+// persistent wrapper of the essentia 'MultiPitchMelodia' algorithm
+class MultiPitchMelodiaAlgo {
+  public:
+    MultiPitchMelodiaAlgo(const float binResolution=10, const int filterIterations=3, const int frameSize=2048, const bool guessUnvoiced=false, const float harmonicWeight=0.8, const int hopSize=128, const float magnitudeCompression=1, const int magnitudeThreshold=40, const float maxFrequency=20000, const int minDuration=100, const float minFrequency=40, const int numberHarmonics=20, const float peakDistributionThreshold=0.9, const float peakFrameThreshold=0.9, const float pitchContinuity=27.5625, const float referenceFrequency=55, const float sampleRate=44100, const int timeContinuity=100);
+    ~MultiPitchMelodiaAlgo();
+    void configure(const float binResolution=10, const int filterIterations=3, const int frameSize=2048, const bool guessUnvoiced=false, const float harmonicWeight=0.8, const int hopSize=128, const float magnitudeCompression=1, const int magnitudeThreshold=40, const float maxFrequency=20000, const int minDuration=100, const float minFrequency=40, const int numberHarmonics=20, const float peakDistributionThreshold=0.9, const float peakFrameThreshold=0.9, const float pitchContinuity=27.5625, const float referenceFrequency=55, const float sampleRate=44100, const int timeContinuity=100);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    std::vector<std::vector<float> > _output_pitch;
+    std::vector<float> _output_pitch_buffer;
+};
+ 
+// persistent wrapper of the essentia 'Multiplexer' algorithm
+class MultiplexerAlgo {
+  public:
+    MultiplexerAlgo(const int numberRealInputs=0, const int numberVectorRealInputs=0);
+    ~MultiplexerAlgo();
+    void configure(const int numberRealInputs=0, const int numberVectorRealInputs=0);
+    val compute();
+    val computeTyped();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<std::vector<float> > _output_data;
+    std::vector<float> _output_data_buffer;
+};
+ 
+// persistent wrapper of the essentia 'NNLSChroma' algorithm
+class NNLSChromaAlgo {
+  public:
+    NNLSChromaAlgo(const std::string& chromaNormalization="none", const int frameSize=1025, const float sampleRate=44100, const float spectralShape=0.7, const float spectralWhitening=1, const std::string& tuningMode="global", const bool useNNLS=true);
+    ~NNLSChromaAlgo();
+    void configure(const std::string& chromaNormalization="none", const int frameSize=1025, const float sampleRate=44100, const float spectralShape=0.7, const float spectralWhitening=1, const std::string& tuningMode="global", const bool useNNLS=true);
+    val compute(std::vector<std::vector<float> >& input_logSpectrogram, std::vector<float>& input_meanTuning, std::vector<float>& input_localTuning);
+    val computeTyped(const val& input_logSpectrogram, const val& input_meanTuning, const val& input_localTuning);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<std::vector<float> > _input_logSpectrogram;
+    std::vector<float> _input_meanTuning;
+    std::vector<float> _input_localTuning;
+    std::vector<std::vector<float> > _output_tunedLogfreqSpectrum;
+    std::vector<float> _output_tunedLogfreqSpectrum_buffer;
+    std::vector<std::vector<float> > _output_semitoneSpectrum;
+    std::vector<float> _output_semitoneSpectrum_buffer;
+    std::vector<std::vector<float> > _output_bassChromagram;
+    std::vector<float> _output_bassChromagram_buffer;
+    std::vector<std::vector<float> > _output_chromagram;
+    std::vector<float> _output_chromagram_buffer;
+};
+ 
+// persistent wrapper of the essentia 'NoiseAdder' algorithm
+class NoiseAdderAlgo {
+  public:
+    NoiseAdderAlgo(const bool fixSeed=false, const int level=-100);
+    ~NoiseAdderAlgo();
+    void configure(const bool fixSeed=false, const int level=-100);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    std::vector<float> _output_signal;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'NoiseBurstDetector' algorithm
+class NoiseBurstDetectorAlgo {
+  public:
+    NoiseBurstDetectorAlgo(const float alpha=0.9, const int silenceThreshold=-50, const int threshold=8);
+    ~NoiseBurstDetectorAlgo();
+    void configure(const float alpha=0.9, const int silenceThreshold=-50, const int threshold=8);
+    val compute(std::vector<float>& input_frame);
+    val computeTyped(const val& input_frame);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_frame;
+    std::vector<float> _output_indexes;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'NoveltyCurve' algorithm
+class NoveltyCurveAlgo {
+  public:
+    NoveltyCurveAlgo(const float frameRate=344.531, const bool normalize=false, const std::vector<float>& weightCurve=std::vector<float>(), const std::string& weightCurveType="hybrid");
+    ~NoveltyCurveAlgo();
+    void configure(const float frameRate=344.531, const bool normalize=false, const std::vector<float>& weightCurve=std::vector<float>(), const std::string& weightCurveType="hybrid");
+    val compute(std::vector<std::vector<float> >& input_frequencyBands);
+    val computeTyped(const val& input_frequencyBands);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<std::vector<float> > _input_frequencyBands;
+    std::vector<float> _output_novelty;
+};
+ 
+// persistent wrapper of the essentia 'NoveltyCurveFixedBpmEstimator' algorithm
+class NoveltyCurveFixedBpmEstimatorAlgo {
+  public:
+    NoveltyCurveFixedBpmEstimatorAlgo(const int hopSize=512, const float maxBpm=560, const float minBpm=30, const float sampleRate=44100, const float tolerance=3);
+    ~NoveltyCurveFixedBpmEstimatorAlgo();
+    void configure(const int hopSize=512, const float maxBpm=560, const float minBpm=30, const float sampleRate=44100, const float tolerance=3);
+    val compute(std::vector<float>& input_novelty);
+    val computeTyped(const val& input_novelty);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_novelty;
+    std::vector<float> _output_bpms;
+    std::vector<float> _output_amplitudes;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'OddToEvenHarmonicEnergyRatio' algorithm
+class OddToEvenHarmonicEnergyRatioAlgo {
+  public:
+    OddToEvenHarmonicEnergyRatioAlgo();
+    ~OddToEvenHarmonicEnergyRatioAlgo();
+    void configure();
+    val compute(std::vector<float>& input_frequencies, std::vector<float>& input_magnitudes);
+    val computeTyped(const val& input_frequencies, const val& input_magnitudes);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_frequencies;
+    std::vector<float> _input_magnitudes;
+    float _output_oddToEvenHarmonicEnergyRatio;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'OnsetDetection' algorithm
+class OnsetDetectionAlgo {
+  public:
+    OnsetDetectionAlgo(const std::string& method="hfc", const float sampleRate=44100);
+    ~OnsetDetectionAlgo();
+    void configure(const std::string& method="hfc", const float sampleRate=44100);
+    val compute(std::vector<float>& input_spectrum, std::vector<float>& input_phase);
+    val computeTyped(const val& input_spectrum, const val& input_phase);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_spectrum;
+    std::vector<float> _input_phase;
+    float _output_onsetDetection;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'OnsetDetectionGlobal' algorithm
+class OnsetDetectionGlobalAlgo {
+  public:
+    OnsetDetectionGlobalAlgo(const int frameSize=2048, const int hopSize=512, const std::string& method="infogain", const float sampleRate=44100);
+    ~OnsetDetectionGlobalAlgo();
+    void configure(const int frameSize=2048, const int hopSize=512, const std::string& method="infogain", const float sampleRate=44100);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    std::vector<float> _output_onsetDetections;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'OnsetRate' algorithm
+class OnsetRateAlgo {
+  public:
+    OnsetRateAlgo();
+    ~OnsetRateAlgo();
+    void configure();
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    std::vector<float> _output_onsets;
+    float _output_onsetRate;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'Onsets' algorithm
+class OnsetsAlgo {
+  public:
+    OnsetsAlgo(const float alpha=0.1, const int delay=5, const float frameRate=86.1328, const float silenceThreshold=0.02);
+    ~OnsetsAlgo();
+    void configure(const float alpha=0.1, const int delay=5, const float frameRate=86.1328, const float silenceThreshold=0.02);
+    val compute(const val& input_detections, std::vector<float>& input_weights);
+    val computeTyped(const val& input_detections, const val& input_weights);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    TNT::Array2D<float> _input_detections;
+    std::vector<float> _input_weights;
+    std::vector<float> _output_onsets;
+};
+ 
+// persistent wrapper of the essentia 'OverlapAdd' algorithm
+class OverlapAddAlgo {
+  public:
+    OverlapAddAlgo(const int frameSize=2048, const float gain=1, const int hopSize=128);
+    ~OverlapAddAlgo();
+    void configure(const int frameSize=2048, const float gain=1, const int hopSize=128);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    std::vector<float> _output_signal;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'Panning' algorithm
+class PanningAlgo {
+  public:
+    PanningAlgo(const int averageFrames=43, const int numBands=1, const int numCoeffs=20, const int panningBins=512, const float sampleRate=44100, const bool warpedPanorama=true);
+    ~PanningAlgo();
+    void configure(const int averageFrames=43, const int numBands=1, const int numCoeffs=20, const int panningBins=512, const float sampleRate=44100, const bool warpedPanorama=true);
+    val compute(std::vector<float>& input_spectrumLeft, std::vector<float>& input_spectrumRight);
+    val computeTyped(const val& input_spectrumLeft, const val& input_spectrumRight);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_spectrumLeft;
+    std::vector<float> _input_spectrumRight;
+    TNT::Array2D<float> _output_panningCoeffs;
+    std::vector<float> _output_panningCoeffs_buffer;
+};
+ 
+// persistent wrapper of the essentia 'PeakDetection' algorithm
+class PeakDetectionAlgo {
+  public:
+    PeakDetectionAlgo(const bool interpolate=true, const int maxPeaks=100, const float maxPosition=1, const float minPeakDistance=0, const float minPosition=0, const std::string& orderBy="position", const float range=1, const float threshold=-1e+06);
+    ~PeakDetectionAlgo();
+    void configure(const bool interpolate=true, const int maxPeaks=100, const float maxPosition=1, const float minPeakDistance=0, const float minPosition=0, const std::string& orderBy="position", const float range=1, const float threshold=-1e+06);
+    val compute(std::vector<float>& input_array);
+    val computeTyped(const val& input_array);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_array;
+    std::vector<float> _output_positions;
+    std::vector<float> _output_amplitudes;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'PercivalBpmEstimator' algorithm
+class PercivalBpmEstimatorAlgo {
+  public:
+    PercivalBpmEstimatorAlgo(const int frameSize=1024, const int frameSizeOSS=2048, const int hopSize=128, const int hopSizeOSS=128, const int maxBPM=210, const int minBPM=50, const int sampleRate=44100);
+    ~PercivalBpmEstimatorAlgo();
+    void configure(const int frameSize=1024, const int frameSizeOSS=2048, const int hopSize=128, const int hopSizeOSS=128, const int maxBPM=210, const int minBPM=50, const int sampleRate=44100);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    float _output_bpm;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'PercivalEnhanceHarmonics' algorithm
+class PercivalEnhanceHarmonicsAlgo {
+  public:
+    PercivalEnhanceHarmonicsAlgo();
+    ~PercivalEnhanceHarmonicsAlgo();
+    void configure();
+    val compute(std::vector<float>& input_array);
+    val computeTyped(const val& input_array);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_array;
+    std::vector<float> _output_array;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'PercivalEvaluatePulseTrains' algorithm
+class PercivalEvaluatePulseTrainsAlgo {
+  public:
+    PercivalEvaluatePulseTrainsAlgo();
+    ~PercivalEvaluatePulseTrainsAlgo();
+    void configure();
+    val compute(std::vector<float>& input_oss, std::vector<float>& input_positions);
+    val computeTyped(const val& input_oss, const val& input_positions);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_oss;
+    std::vector<float> _input_positions;
+    float _output_lag;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'PitchContourSegmentation' algorithm
+class PitchContourSegmentationAlgo {
+  public:
+    PitchContourSegmentationAlgo(const int hopSize=128, const float minDuration=0.1, const int pitchDistanceThreshold=60, const int rmsThreshold=-2, const int sampleRate=44100, const int tuningFrequency=440);
+    ~PitchContourSegmentationAlgo();
+    void configure(const int hopSize=128, const float minDuration=0.1, const int pitchDistanceThreshold=60, const int rmsThreshold=-2, const int sampleRate=44100, const int tuningFrequency=440);
+    val compute(std::vector<float>& input_pitch, std::vector<float>& input_signal);
+    val computeTyped(const val& input_pitch, const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_pitch;
+    std::vector<float> _input_signal;
+    std::vector<float> _output_onset;
+    std::vector<float> _output_duration;
+    std::vector<float> _output_MIDIpitch;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'PitchContours' algorithm
+class PitchContoursAlgo {
+  public:
+    PitchContoursAlgo(const float binResolution=10, const int hopSize=128, const float minDuration=100, const float peakDistributionThreshold=0.9, const float peakFrameThreshold=0.9, const float pitchContinuity=27.5625, const float sampleRate=44100, const float timeContinuity=100);
+    ~PitchContoursAlgo();
+    void configure(const float binResolution=10, const int hopSize=128, const float minDuration=100, const float peakDistributionThreshold=0.9, const float peakFrameThreshold=0.9, const float pitchContinuity=27.5625, const float sampleRate=44100, const float timeContinuity=100);
+    val compute(std::vector<std::vector<float> >& input_peakBins, std::vector<std::vector<float> >& input_peakSaliences);
+    val computeTyped(const val& input_peakBins, const val& input_peakSaliences);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<std::vector<float> > _input_peakBins;
+    std::vector<std::vector<float> > _input_peakSaliences;
+    std::vector<std::vector<float> > _output_contoursBins;
+    std::vector<float> _output_contoursBins_buffer;
+    std::vector<std::vector<float> > _output_contoursSaliences;
+    std::vector<float> _output_contoursSaliences_buffer;
+    std::vector<float> _output_contoursStartTimes;
+    float _output_duration;
+};
+ 
+// persistent wrapper of the essentia 'PitchContoursMelody' algorithm
+class PitchContoursMelodyAlgo {
+  public:
+    PitchContoursMelodyAlgo(const float binResolution=10, const int filterIterations=3, const bool guessUnvoiced=false, const int hopSize=128, const float maxFrequency=20000, const float minFrequency=80, const float referenceFrequency=55, const float sampleRate=44100, const bool voiceVibrato=false, const float voicingTolerance=0.2);
+    ~PitchContoursMelodyAlgo();
+    void configure(const float binResolution=10, const int filterIterations=3, const bool guessUnvoiced=false, const int hopSize=128, const float maxFrequency=20000, const float minFrequency=80, const float referenceFrequency=55, const float sampleRate=44100, const bool voiceVibrato=false, const float voicingTolerance=0.2);
+    val compute(std::vector<std::vector<float> >& input_contoursBins, std::vector<std::vector<float> >& input_contoursSaliences, std::vector<float>& input_contoursStartTimes, float input_duration);
+    val computeTyped(const val& input_contoursBins, const val& input_contoursSaliences, const val& input_contoursStartTimes, float input_duration);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<std::vector<float> > _input_contoursBins;
+    std::vector<std::vector<float> > _input_contoursSaliences;
+    std::vector<float> _input_contoursStartTimes;
+    std::vector<float> _output_pitch;
+    std::vector<float> _output_pitchConfidence;
+};
+ 
+// persistent wrapper of the essentia 'PitchContoursMonoMelody' algorithm
+class PitchContoursMonoMelodyAlgo {
+  public:
+    PitchContoursMonoMelodyAlgo(const float binResolution=10, const int filterIterations=3, const bool guessUnvoiced=false, const int hopSize=128, const float maxFrequency=20000, const float minFrequency=80, const float referenceFrequency=55, const float sampleRate=44100);
+    ~PitchContoursMonoMelodyAlgo();
+    void configure(const float binResolution=10, const int filterIterations=3, const bool guessUnvoiced=false, const int hopSize=128, const float maxFrequency=20000, const float minFrequency=80, const float referenceFrequency=55, const float sampleRate=44100);
+    val compute(std::vector<std::vector<float> >& input_contoursBins, std::vector<std::vector<float> >& input_contoursSaliences, std::vector<float>& input_contoursStartTimes, float input_duration);
+    val computeTyped(const val& input_contoursBins, const val& input_contoursSaliences, const val& input_contoursStartTimes, float input_duration);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<std::vector<float> > _input_contoursBins;
+    std::vector<std::vector<float> > _input_contoursSaliences;
+    std::vector<float> _input_contoursStartTimes;
+    std::vector<float> _output_pitch;
+    std::vector<float> _output_pitchConfidence;
+};
+ 
+// persistent wrapper of the essentia 'PitchContoursMultiMelody' algorithm
+class PitchContoursMultiMelodyAlgo {
+  public:
+    PitchContoursMultiMelodyAlgo(const float binResolution=10, const int filterIterations=3, const bool guessUnvoiced=false, const int hopSize=128, const float maxFrequency=20000, const float minFrequency=80, const float referenceFrequency=55, const float sampleRate=44100);
+    ~PitchContoursMultiMelodyAlgo();
+    void configure(const float binResolution=10, const int filterIterations=3, const bool guessUnvoiced=false, const int hopSize=128, const float maxFrequency=20000, const float minFrequency=80, const float referenceFrequency=55, const float sampleRate=44100);
+    val compute(std::vector<std::vector<float> >& input_contoursBins, std::vector<std::vector<float> >& input_contoursSaliences, std::vector<float>& input_contoursStartTimes, float input_duration);
+    val computeTyped(const val& input_contoursBins, const val& input_contoursSaliences, const val& input_contoursStartTimes, float input_duration);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<std::vector<float> > _input_contoursBins;
+    std::vector<std::vector<float> > _input_contoursSaliences;
+    std::vector<float> _input_contoursStartTimes;
+    std::vector<std::vector<float> > _output_pitch;
+    std::vector<float> _output_pitch_buffer;
+};
+ 
+// persistent wrapper of the essentia 'PitchFilter' algorithm
+class PitchFilterAlgo {
+  public:
+    PitchFilterAlgo(const int confidenceThreshold=36, const int minChunkSize=30, const bool useAbsolutePitchConfidence=false);
+    ~PitchFilterAlgo();
+    void configure(const int confidenceThreshold=36, const int minChunkSize=30, const bool useAbsolutePitchConfidence=false);
+    val compute(std::vector<float>& input_pitch, std::vector<float>& input_pitchConfidence);
+    val computeTyped(const val& input_pitch, const val& input_pitchConfidence);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_pitch;
+    std::vector<float> _input_pitchConfidence;
+    std::vector<float> _output_pitchFiltered;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'PitchMelodia' algorithm
+class PitchMelodiaAlgo {
+  public:
+    PitchMelodiaAlgo(const float binResolution=10, const int filterIterations=3, const int frameSize=2048, const bool guessUnvoiced=false, const float harmonicWeight=0.8, const int hopSize=128, const float magnitudeCompression=1, const int magnitudeThreshold=40, const float maxFrequency=20000, const int minDuration=100, const float minFrequency=40, const int numberHarmonics=20, const float peakDistributionThreshold=0.9, const float peakFrameThreshold=0.9, const float pitchContinuity=27.5625, const float referenceFrequency=55, const float sampleRate=44100, const int timeContinuity=100);
+    ~PitchMelodiaAlgo();
+    void configure(const float binResolution=10, const int filterIterations=3, const int frameSize=2048, const bool guessUnvoiced=false, const float harmonicWeight=0.8, const int hopSize=128, const float magnitudeCompression=1, const int magnitudeThreshold=40, const float maxFrequency=20000, const int minDuration=100, const float minFrequency=40, const int numberHarmonics=20, const float peakDistributionThreshold=0.9, const float peakFrameThreshold=0.9, const float pitchContinuity=27.5625, const float referenceFrequency=55, const float sampleRate=44100, const int timeContinuity=100);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    std::vector<float> _output_pitch;
+    std::vector<float> _output_pitchConfidence;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'PitchSalience' algorithm
+class PitchSalienceAlgo {
+  public:
+    PitchSalienceAlgo(const float highBoundary=5000, const float lowBoundary=100, const float sampleRate=44100);
+    ~PitchSalienceAlgo();
+    void configure(const float highBoundary=5000, const float lowBoundary=100, const float sampleRate=44100);
+    val compute(std::vector<float>& input_spectrum);
+    val computeTyped(const val& input_spectrum);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_spectrum;
+    float _output_pitchSalience;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'PitchSalienceFunction' algorithm
+class PitchSalienceFunctionAlgo {
+  public:
+    PitchSalienceFunctionAlgo(const float binResolution=10, const float harmonicWeight=0.8, const float magnitudeCompression=1, const float magnitudeThreshold=40, const int numberHarmonics=20, const float referenceFrequency=55);
+    ~PitchSalienceFunctionAlgo();
+    void configure(const float binResolution=10, const float harmonicWeight=0.8, const float magnitudeCompression=1, const float magnitudeThreshold=40, const int numberHarmonics=20, const float referenceFrequency=55);
+    val compute(std::vector<float>& input_frequencies, std::vector<float>& input_magnitudes);
+    val computeTyped(const val& input_frequencies, const val& input_magnitudes);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_frequencies;
+    std::vector<float> _input_magnitudes;
+    std::vector<float> _output_salienceFunction;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'PitchSalienceFunctionPeaks' algorithm
+class PitchSalienceFunctionPeaksAlgo {
+  public:
+    PitchSalienceFunctionPeaksAlgo(const float binResolution=10, const float maxFrequency=1760, const float minFrequency=55, const float referenceFrequency=55);
+    ~PitchSalienceFunctionPeaksAlgo();
+    void configure(const float binResolution=10, const float maxFrequency=1760, const float minFrequency=55, const float referenceFrequency=55);
+    val compute(std::vector<float>& input_salienceFunction);
+    val computeTyped(const val& input_salienceFunction);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_salienceFunction;
+    std::vector<float> _output_salienceBins;
+    std::vector<float> _output_salienceValues;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'PitchYin' algorithm
+class PitchYinAlgo {
+  public:
+    PitchYinAlgo(const int frameSize=2048, const bool interpolate=true, const float maxFrequency=22050, const float minFrequency=20, const float sampleRate=44100, const float tolerance=0.15);
+    ~PitchYinAlgo();
+    void configure(const int frameSize=2048, const bool interpolate=true, const float maxFrequency=22050, const float minFrequency=20, const float sampleRate=44100, const float tolerance=0.15);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    float _output_pitch;
+    float _output_pitchConfidence;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'PitchYinFFT' algorithm
+class PitchYinFFTAlgo {
+  public:
+    PitchYinFFTAlgo(const int frameSize=2048, const bool interpolate=true, const float maxFrequency=22050, const float minFrequency=20, const float sampleRate=44100, const float tolerance=1, const std::string& weighting="custom");
+    ~PitchYinFFTAlgo();
+    void configure(const int frameSize=2048, const bool interpolate=true, const float maxFrequency=22050, const float minFrequency=20, const float sampleRate=44100, const float tolerance=1, const std::string& weighting="custom");
+    val compute(std::vector<float>& input_spectrum);
+    val computeTyped(const val& input_spectrum);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_spectrum;
+    float _output_pitch;
+    float _output_pitchConfidence;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'PitchYinProbabilistic' algorithm
+class PitchYinProbabilisticAlgo {
+  public:
+    PitchYinProbabilisticAlgo(const int frameSize=2048, const int hopSize=256, const float lowRMSThreshold=0.1, const std::string& outputUnvoiced="negative", const bool preciseTime=false, const float sampleRate=44100);
+    ~PitchYinProbabilisticAlgo();
+    void configure(const int frameSize=2048, const int hopSize=256, const float lowRMSThreshold=0.1, const std::string& outputUnvoiced="negative", const bool preciseTime=false, const float sampleRate=44100);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    std::vector<float> _output_pitch;
+    std::vector<float> _output_voicedProbabilities;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'PitchYinProbabilities' algorithm
+class PitchYinProbabilitiesAlgo {
+  public:
+    PitchYinProbabilitiesAlgo(const int frameSize=2048, const float lowAmp=0.1, const bool preciseTime=false, const float sampleRate=44100);
+    ~PitchYinProbabilitiesAlgo();
+    void configure(const int frameSize=2048, const float lowAmp=0.1, const bool preciseTime=false, const float sampleRate=44100);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    std::vector<float> _output_pitch;
+    std::vector<float> _output_probabilities;
+    float _output_RMS;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'PitchYinProbabilitiesHMM' algorithm
+class PitchYinProbabilitiesHMMAlgo {
+  public:
+    PitchYinProbabilitiesHMMAlgo(const float minFrequency=61.735, const int numberBinsPerSemitone=5, const float selfTransition=0.99, const float yinTrust=0.5);
+    ~PitchYinProbabilitiesHMMAlgo();
+    void configure(const float minFrequency=61.735, const int numberBinsPerSemitone=5, const float selfTransition=0.99, const float yinTrust=0.5);
+    val compute(std::vector<std::vector<float> >& input_pitchCandidates, std::vector<std::vector<float> >& input_probabilities);
+    val computeTyped(const val& input_pitchCandidates, const val& input_probabilities);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<std::vector<float> > _input_pitchCandidates;
+    std::vector<std::vector<float> > _input_probabilities;
+    std::vector<float> _output_pitch;
+};
+ 
+// persistent wrapper of the essentia 'PolarToCartesian' algorithm
+class PolarToCartesianAlgo {
+  public:
+    PolarToCartesianAlgo();
+    ~PolarToCartesianAlgo();
+    void configure();
+    val compute(std::vector<float>& input_magnitude, std::vector<float>& input_phase);
+    val computeTyped(const val& input_magnitude, const val& input_phase);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_magnitude;
+    std::vector<float> _input_phase;
+    std::vector<std::complex<float> > _output_complex;
+};
+ 
+// persistent wrapper of the essentia 'PowerMean' algorithm
+class PowerMeanAlgo {
+  public:
+    PowerMeanAlgo(const float power=1);
+    ~PowerMeanAlgo();
+    void configure(const float power=1);
+    val compute(std::vector<float>& input_array);
+    val computeTyped(const val& input_array);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_array;
+    float _output_powerMean;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'PowerSpectrum' algorithm
+class PowerSpectrumAlgo {
+  public:
+    PowerSpectrumAlgo(const int size=2048);
+    ~PowerSpectrumAlgo();
+    void configure(const int size=2048);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    std::vector<float> _output_powerSpectrum;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'PredominantPitchMelodia' algorithm
+class PredominantPitchMelodiaAlgo {
+  public:
+    PredominantPitchMelodiaAlgo(const float binResolution=10, const int filterIterations=3, const int frameSize=2048, const bool guessUnvoiced=false, const float harmonicWeight=0.8, const int hopSize=128, const float magnitudeCompression=1, const int magnitudeThreshold=40, const float maxFrequency=20000, const int minDuration=100, const float minFrequency=80, const int numberHarmonics=20, const float peakDistributionThreshold=0.9, const float peakFrameThreshold=0.9, const float pitchContinuity=27.5625, const float referenceFrequency=55, const float sampleRate=44100, const int timeContinuity=100, const bool voiceVibrato=false, const float voicingTolerance=0.2);
+    ~PredominantPitchMelodiaAlgo();
+    void configure(const float binResolution=10, const int filterIterations=3, const int frameSize=2048, const bool guessUnvoiced=false, const float harmonicWeight=0.8, const int hopSize=128, const float magnitudeCompression=1, const int magnitudeThreshold=40, const float maxFrequency=20000, const int minDuration=100, const float minFrequency=80, const int numberHarmonics=20, const float peakDistributionThreshold=0.9, const float peakFrameThreshold=0.9, const float pitchContinuity=27.5625, const float referenceFrequency=55, const float sampleRate=44100, const int timeContinuity=100, const bool voiceVibrato=false, const float voicingTolerance=0.2);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    std::vector<float> _output_pitch;
+    std::vector<float> _output_pitchConfidence;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'RMS' algorithm
+class RMSAlgo {
+  public:
+    RMSAlgo();
+    ~RMSAlgo();
+    void configure();
+    val compute(std::vector<float>& input_array);
+    val computeTyped(const val& input_array);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_array;
+    float _output_rms;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'RawMoments' algorithm
+class RawMomentsAlgo {
+  public:
+    RawMomentsAlgo(const float range=22050);
+    ~RawMomentsAlgo();
+    void configure(const float range=22050);
+    val compute(std::vector<float>& input_array);
+    val computeTyped(const val& input_array);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_array;
+    std::vector<float> _output_rawMoments;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'ReplayGain' algorithm
+class ReplayGainAlgo {
+  public:
+    ReplayGainAlgo(const float sampleRate=44100);
+    ~ReplayGainAlgo();
+    void configure(const float sampleRate=44100);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    float _output_replayGain;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'Resample' algorithm
+class ResampleAlgo {
+  public:
+    ResampleAlgo(const float inputSampleRate=44100, const float outputSampleRate=44100, const int quality=1);
+    ~ResampleAlgo();
+    void configure(const float inputSampleRate=44100, const float outputSampleRate=44100, const int quality=1);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    std::vector<float> _output_signal;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'ResampleFFT' algorithm
+class ResampleFFTAlgo {
+  public:
+    ResampleFFTAlgo(const int inSize=128, const int outSize=128);
+    ~ResampleFFTAlgo();
+    void configure(const int inSize=128, const int outSize=128);
+    val compute(std::vector<float>& input_input);
+    val computeTyped(const val& input_input);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_input;
+    std::vector<float> _output_output;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'RhythmDescriptors' algorithm
+class RhythmDescriptorsAlgo {
+  public:
+    RhythmDescriptorsAlgo();
+    ~RhythmDescriptorsAlgo();
+    void configure();
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    std::vector<float> _output_beats_position;
+    float _output_confidence;
+    float _output_bpm;
+    std::vector<float> _output_bpm_estimates;
+    std::vector<float> _output_bpm_intervals;
+    float _output_first_peak_bpm;
+    float _output_first_peak_spread;
+    float _output_first_peak_weight;
+    float _output_second_peak_bpm;
+    float _output_second_peak_spread;
+    float _output_second_peak_weight;
+    std::vector<float> _output_histogram;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'RhythmExtractor' algorithm
+class RhythmExtractorAlgo {
+  public:
+    RhythmExtractorAlgo(const int frameHop=1024, const int frameSize=1024, const int hopSize=256, const float lastBeatInterval=0.1, const int maxTempo=208, const int minTempo=40, const int numberFrames=1024, const float sampleRate=44100, const std::vector<float>& tempoHints=std::vector<float>(), const float tolerance=0.24, const bool useBands=true, const bool useOnset=true);
+    ~RhythmExtractorAlgo();
+    void configure(const int frameHop=1024, const int frameSize=1024, const int hopSize=256, const float lastBeatInterval=0.1, const int maxTempo=208, const int minTempo=40, const int numberFrames=1024, const float sampleRate=44100, const std::vector<float>& tempoHints=std::vector<float>(), const float tolerance=0.24, const bool useBands=true, const bool useOnset=true);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    float _output_bpm;
+    std::vector<float> _output_ticks;
+    std::vector<float> _output_estimates;
+    std::vector<float> _output_bpmIntervals;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'RhythmExtractor2013' algorithm
+class RhythmExtractor2013Algo {
+  public:
+    RhythmExtractor2013Algo(const int maxTempo=208, const std::string& method="multifeature", const int minTempo=40);
+    ~RhythmExtractor2013Algo();
+    void configure(const int maxTempo=208, const std::string& method="multifeature", const int minTempo=40);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    float _output_bpm;
+    std::vector<float> _output_ticks;
+    float _output_confidence;
+    std::vector<float> _output_estimates;
+    std::vector<float> _output_bpmIntervals;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'RhythmTransform' algorithm
+class RhythmTransformAlgo {
+  public:
+    RhythmTransformAlgo(const int frameSize=256, const int hopSize=32);
+    ~RhythmTransformAlgo();
+    void configure(const int frameSize=256, const int hopSize=32);
+    val compute(std::vector<std::vector<float> >& input_melBands);
+    val computeTyped(const val& input_melBands);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<std::vector<float> > _input_melBands;
+    std::vector<std::vector<float> > _output_rhythm;
+    std::vector<float> _output_rhythm_buffer;
+};
+ 
+// persistent wrapper of the essentia 'RollOff' algorithm
+class RollOffAlgo {
+  public:
+    RollOffAlgo(const float cutoff=0.85, const float sampleRate=44100);
+    ~RollOffAlgo();
+    void configure(const float cutoff=0.85, const float sampleRate=44100);
+    val compute(std::vector<float>& input_spectrum);
+    val computeTyped(const val& input_spectrum);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_spectrum;
+    float _output_rollOff;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'SBic' algorithm
+class SBicAlgo {
+  public:
+    SBicAlgo(const float cpw=1.5, const int inc1=60, const int inc2=20, const int minLength=10, const int size1=300, const int size2=200);
+    ~SBicAlgo();
+    void configure(const float cpw=1.5, const int inc1=60, const int inc2=20, const int minLength=10, const int size1=300, const int size2=200);
+    val compute(const val& input_features);
+    val computeTyped(const val& input_features);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    TNT::Array2D<float> _input_features;
+    std::vector<float> _output_segmentation;
+};
+ 
+// persistent wrapper of the essentia 'SNR' algorithm
+class SNRAlgo {
+  public:
+    SNRAlgo(const float MAAlpha=0.95, const float MMSEAlpha=0.98, const float NoiseAlpha=0.9, const int frameSize=512, const float noiseThreshold=-40, const float sampleRate=44100, const bool useBroadbadNoiseCorrection=true);
+    ~SNRAlgo();
+    void configure(const float MAAlpha=0.95, const float MMSEAlpha=0.98, const float NoiseAlpha=0.9, const int frameSize=512, const float noiseThreshold=-40, const float sampleRate=44100, const bool useBroadbadNoiseCorrection=true);
+    val compute(std::vector<float>& input_frame);
+    val computeTyped(const val& input_frame);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_frame;
+    float _output_instantSNR;
+    float _output_averagedSNR;
+    std::vector<float> _output_spectralSNR;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'SaturationDetector' algorithm
+class SaturationDetectorAlgo {
+  public:
+    SaturationDetectorAlgo(const float differentialThreshold=0.001, const float energyThreshold=-1, const int frameSize=512, const int hopSize=256, const float minimumDuration=0.005, const float sampleRate=44100);
+    ~SaturationDetectorAlgo();
+    void configure(const float differentialThreshold=0.001, const float energyThreshold=-1, const int frameSize=512, const int hopSize=256, const float minimumDuration=0.005, const float sampleRate=44100);
+    val compute(std::vector<float>& input_frame);
+    val computeTyped(const val& input_frame);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_frame;
+    std::vector<float> _output_starts;
+    std::vector<float> _output_ends;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'Scale' algorithm
+class ScaleAlgo {
+  public:
+    ScaleAlgo(const bool clipping=true, const float factor=10, const float maxAbsValue=1);
+    ~ScaleAlgo();
+    void configure(const bool clipping=true, const float factor=10, const float maxAbsValue=1);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    std::vector<float> _output_signal;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'SineModelAnal' algorithm
+class SineModelAnalAlgo {
+  public:
+    SineModelAnalAlgo(const float freqDevOffset=20, const float freqDevSlope=0.01, const float magnitudeThreshold=-74, const float maxFrequency=22050, const int maxPeaks=250, const int maxnSines=100, const float minFrequency=0, const std::string& orderBy="frequency", const float sampleRate=44100);
+    ~SineModelAnalAlgo();
+    void configure(const float freqDevOffset=20, const float freqDevSlope=0.01, const float magnitudeThreshold=-74, const float maxFrequency=22050, const int maxPeaks=250, const int maxnSines=100, const float minFrequency=0, const std::string& orderBy="frequency", const float sampleRate=44100);
+    val compute(const val& input_fft);
+    val computeTyped(const val& input_fft);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<std::complex<float> > _input_fft;
+    std::vector<float> _output_frequencies;
+    std::vector<float> _output_magnitudes;
+    std::vector<float> _output_phases;
+};
+ 
+// persistent wrapper of the essentia 'SineModelSynth' algorithm
+class SineModelSynthAlgo {
+  public:
+    SineModelSynthAlgo(const int fftSize=2048, const int hopSize=512, const float sampleRate=44100);
+    ~SineModelSynthAlgo();
+    void configure(const int fftSize=2048, const int hopSize=512, const float sampleRate=44100);
+    val compute(std::vector<float>& input_magnitudes, std::vector<float>& input_frequencies, std::vector<float>& input_phases);
+    val computeTyped(const val& input_magnitudes, const val& input_frequencies, const val& input_phases);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_magnitudes;
+    std::vector<float> _input_frequencies;
+    std::vector<float> _input_phases;
+    std::vector<std::complex<float> > _output_fft;
+};
+ 
+// persistent wrapper of the essentia 'SineSubtraction' algorithm
+class SineSubtractionAlgo {
+  public:
+    SineSubtractionAlgo(const int fftSize=512, const int hopSize=128, const float sampleRate=44100);
+    ~SineSubtractionAlgo();
+    void configure(const int fftSize=512, const int hopSize=128, const float sampleRate=44100);
+    val compute(std::vector<float>& input_frame, std::vector<float>& input_magnitudes, std::vector<float>& input_frequencies, std::vector<float>& input_phases);
+    val computeTyped(const val& input_frame, const val& input_magnitudes, const val& input_frequencies, const val& input_phases);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_frame;
+    std::vector<float> _input_magnitudes;
+    std::vector<float> _input_frequencies;
+    std::vector<float> _input_phases;
+    std::vector<float> _output_frame;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'SingleBeatLoudness' algorithm
+class SingleBeatLoudnessAlgo {
+  public:
+    SingleBeatLoudnessAlgo(const float beatDuration=0.05, const float beatWindowDuration=0.1, const std::vector<float>& frequencyBands=std::vector<float>{0, 200, 400, 800, 1600, 3200, 22000}, const std::string& onsetStart="sumEnergy", const float sampleRate=44100);
+    ~SingleBeatLoudnessAlgo();
+    void configure(const float beatDuration=0.05, const float beatWindowDuration=0.1, const std::vector<float>& frequencyBands=std::vector<float>{0, 200, 400, 800, 1600, 3200, 22000}, const std::string& onsetStart="sumEnergy", const float sampleRate=44100);
+    val compute(std::vector<float>& input_beat);
+    val computeTyped(const val& input_beat);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_beat;
+    float _output_loudness;
+    std::vector<float> _output_loudnessBandRatio;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'SingleGaussian' algorithm
+class SingleGaussianAlgo {
+  public:
+    SingleGaussianAlgo();
+    ~SingleGaussianAlgo();
+    void configure();
+    val compute(const val& input_matrix);
+    val computeTyped(const val& input_matrix);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    TNT::Array2D<float> _input_matrix;
+    std::vector<float> _output_mean;
+    TNT::Array2D<float> _output_covariance;
+    std::vector<float> _output_covariance_buffer;
+    TNT::Array2D<float> _output_inverseCovariance;
+    std::vector<float> _output_inverseCovariance_buffer;
+};
+ 
+// persistent wrapper of the essentia 'Slicer' algorithm
+class SlicerAlgo {
+  public:
+    SlicerAlgo(const std::vector<float>& endTimes=std::vector<float>(), const float sampleRate=44100, const std::vector<float>& startTimes=std::vector<float>(), const std::string& timeUnits="seconds");
+    ~SlicerAlgo();
+    void configure(const std::vector<float>& endTimes=std::vector<float>(), const float sampleRate=44100, const std::vector<float>& startTimes=std::vector<float>(), const std::string& timeUnits="seconds");
+    val compute(std::vector<float>& input_audio);
+    val computeTyped(const val& input_audio);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_audio;
+    std::vector<std::vector<float> > _output_frame;
+    std::vector<float> _output_frame_buffer;
+};
+ 
+// persistent wrapper of the essentia 'SpectralCentroidTime' algorithm
+class SpectralCentroidTimeAlgo {
+  public:
+    SpectralCentroidTimeAlgo(const float sampleRate=44100);
+    ~SpectralCentroidTimeAlgo();
+    void configure(const float sampleRate=44100);
+    val compute(std::vector<float>& input_array);
+    val computeTyped(const val& input_array);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_array;
+    float _output_centroid;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'SpectralComplexity' algorithm
+class SpectralComplexityAlgo {
+  public:
+    SpectralComplexityAlgo(const float magnitudeThreshold=0.005, const float sampleRate=44100);
+    ~SpectralComplexityAlgo();
+    void configure(const float magnitudeThreshold=0.005, const float sampleRate=44100);
+    val compute(std::vector<float>& input_spectrum);
+    val computeTyped(const val& input_spectrum);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_spectrum;
+    float _output_spectralComplexity;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'SpectralContrast' algorithm
+class SpectralContrastAlgo {
+  public:
+    SpectralContrastAlgo(const int frameSize=2048, const float highFrequencyBound=11000, const float lowFrequencyBound=20, const float neighbourRatio=0.4, const int numberBands=6, const float sampleRate=22050, const float staticDistribution=0.15);
+    ~SpectralContrastAlgo();
+    void configure(const int frameSize=2048, const float highFrequencyBound=11000, const float lowFrequencyBound=20, const float neighbourRatio=0.4, const int numberBands=6, const float sampleRate=22050, const float staticDistribution=0.15);
+    val compute(std::vector<float>& input_spectrum);
+    val computeTyped(const val& input_spectrum);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_spectrum;
+    std::vector<float> _output_spectralContrast;
+    std::vector<float> _output_spectralValley;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'SpectralPeaks' algorithm
+class SpectralPeaksAlgo {
+  public:
+    SpectralPeaksAlgo(const float magnitudeThreshold=0, const float maxFrequency=5000, const int maxPeaks=100, const float minFrequency=0, const std::string& orderBy="frequency", const float sampleRate=44100);
+    ~SpectralPeaksAlgo();
+    void configure(const float magnitudeThreshold=0, const float maxFrequency=5000, const int maxPeaks=100, const float minFrequency=0, const std::string& orderBy="frequency", const float sampleRate=44100);
+    val compute(std::vector<float>& input_spectrum);
+    val computeTyped(const val& input_spectrum);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_spectrum;
+    std::vector<float> _output_frequencies;
+    std::vector<float> _output_magnitudes;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'SpectralWhitening' algorithm
+class SpectralWhiteningAlgo {
+  public:
+    SpectralWhiteningAlgo(const float maxFrequency=5000, const float sampleRate=44100);
+    ~SpectralWhiteningAlgo();
+    void configure(const float maxFrequency=5000, const float sampleRate=44100);
+    val compute(std::vector<float>& input_spectrum, std::vector<float>& input_frequencies, std::vector<float>& input_magnitudes);
+    val computeTyped(const val& input_spectrum, const val& input_frequencies, const val& input_magnitudes);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_spectrum;
+    std::vector<float> _input_frequencies;
+    std::vector<float> _input_magnitudes;
+    std::vector<float> _output_magnitudes;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'Spectrum' algorithm
+class SpectrumAlgo {
+  public:
+    SpectrumAlgo(const int size=2048);
+    ~SpectrumAlgo();
+    void configure(const int size=2048);
+    val compute(std::vector<float>& input_frame);
+    val computeTyped(const val& input_frame);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_frame;
+    std::vector<float> _output_spectrum;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'SpectrumCQ' algorithm
+class SpectrumCQAlgo {
+  public:
+    SpectrumCQAlgo(const int binsPerOctave=12, const float minFrequency=32.7, const int minimumKernelSize=4, const int numberBins=84, const float sampleRate=44100, const float scale=1, const float threshold=0.01, const std::string& windowType="hann", const bool zeroPhase=true);
+    ~SpectrumCQAlgo();
+    void configure(const int binsPerOctave=12, const float minFrequency=32.7, const int minimumKernelSize=4, const int numberBins=84, const float sampleRate=44100, const float scale=1, const float threshold=0.01, const std::string& windowType="hann", const bool zeroPhase=true);
+    val compute(std::vector<float>& input_frame);
+    val computeTyped(const val& input_frame);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_frame;
+    std::vector<float> _output_spectrumCQ;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'SpectrumToCent' algorithm
+class SpectrumToCentAlgo {
+  public:
+    SpectrumToCentAlgo(const int bands=720, const float centBinResolution=10, const int inputSize=32768, const bool log=true, const float minimumFrequency=164, const std::string& normalize="unit_sum", const float sampleRate=44100, const std::string& type="power");
+    ~SpectrumToCentAlgo();
+    void configure(const int bands=720, const float centBinResolution=10, const int inputSize=32768, const bool log=true, const float minimumFrequency=164, const std::string& normalize="unit_sum", const float sampleRate=44100, const std::string& type="power");
+    val compute(std::vector<float>& input_spectrum);
+    val computeTyped(const val& input_spectrum);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_spectrum;
+    std::vector<float> _output_bands;
+    std::vector<float> _output_frequencies;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'Spline' algorithm
+class SplineAlgo {
+  public:
+    SplineAlgo(const float beta1=1, const float beta2=0, const std::string& type="b", const std::vector<float>& xPoints=std::vector<float>{0, 1}, const std::vector<float>& yPoints=std::vector<float>{0, 1});
+    ~SplineAlgo();
+    void configure(const float beta1=1, const float beta2=0, const std::string& type="b", const std::vector<float>& xPoints=std::vector<float>{0, 1}, const std::vector<float>& yPoints=std::vector<float>{0, 1});
+    val compute(float input_x);
+    val computeTyped(float input_x);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto(float input_x);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    float _output_y;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'SprModelAnal' algorithm
+class SprModelAnalAlgo {
+  public:
+    SprModelAnalAlgo(const int fftSize=2048, const int freqDevOffset=20, const float freqDevSlope=0.01, const int hopSize=512, const float magnitudeThreshold=0, const float maxFrequency=5000, const int maxPeaks=100, const int maxnSines=100, const float minFrequency=0, const std::string& orderBy="frequency", const float sampleRate=44100);
+    ~SprModelAnalAlgo();
+    void configure(const int fftSize=2048, const int freqDevOffset=20, const float freqDevSlope=0.01, const int hopSize=512, const float magnitudeThreshold=0, const float maxFrequency=5000, const int maxPeaks=100, const int maxnSines=100, const float minFrequency=0, const std::string& orderBy="frequency", const float sampleRate=44100);
+    val compute(std::vector<float>& input_frame);
+    val computeTyped(const val& input_frame);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_frame;
+    std::vector<float> _output_frequencies;
+    std::vector<float> _output_magnitudes;
+    std::vector<float> _output_phases;
+    std::vector<float> _output_res;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'SprModelSynth' algorithm
+class SprModelSynthAlgo {
+  public:
+    SprModelSynthAlgo(const int fftSize=2048, const int hopSize=512, const float sampleRate=44100);
+    ~SprModelSynthAlgo();
+    void configure(const int fftSize=2048, const int hopSize=512, const float sampleRate=44100);
+    val compute(std::vector<float>& input_magnitudes, std::vector<float>& input_frequencies, std::vector<float>& input_phases, std::vector<float>& input_res);
+    val computeTyped(const val& input_magnitudes, const val& input_frequencies, const val& input_phases, const val& input_res);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_magnitudes;
+    std::vector<float> _input_frequencies;
+    std::vector<float> _input_phases;
+    std::vector<float> _input_res;
+    std::vector<float> _output_frame;
+    std::vector<float> _output_sineframe;
+    std::vector<float> _output_resframe;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'SpsModelAnal' algorithm
+class SpsModelAnalAlgo {
+  public:
+    SpsModelAnalAlgo(const int fftSize=2048, const int freqDevOffset=20, const float freqDevSlope=0.01, const int hopSize=512, const float magnitudeThreshold=0, const float maxFrequency=5000, const int maxPeaks=100, const int maxnSines=100, const float minFrequency=0, const std::string& orderBy="frequency", const float sampleRate=44100, const float stocf=0.2);
+    ~SpsModelAnalAlgo();
+    void configure(const int fftSize=2048, const int freqDevOffset=20, const float freqDevSlope=0.01, const int hopSize=512, const float magnitudeThreshold=0, const float maxFrequency=5000, const int maxPeaks=100, const int maxnSines=100, const float minFrequency=0, const std::string& orderBy="frequency", const float sampleRate=44100, const float stocf=0.2);
+    val compute(std::vector<float>& input_frame);
+    val computeTyped(const val& input_frame);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_frame;
+    std::vector<float> _output_frequencies;
+    std::vector<float> _output_magnitudes;
+    std::vector<float> _output_phases;
+    std::vector<float> _output_stocenv;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'SpsModelSynth' algorithm
+class SpsModelSynthAlgo {
+  public:
+    SpsModelSynthAlgo(const int fftSize=2048, const int hopSize=512, const float sampleRate=44100, const float stocf=0.2);
+    ~SpsModelSynthAlgo();
+    void configure(const int fftSize=2048, const int hopSize=512, const float sampleRate=44100, const float stocf=0.2);
+    val compute(std::vector<float>& input_magnitudes, std::vector<float>& input_frequencies, std::vector<float>& input_phases, std::vector<float>& input_stocenv);
+    val computeTyped(const val& input_magnitudes, const val& input_frequencies, const val& input_phases, const val& input_stocenv);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_magnitudes;
+    std::vector<float> _input_frequencies;
+    std::vector<float> _input_phases;
+    std::vector<float> _input_stocenv;
+    std::vector<float> _output_frame;
+    std::vector<float> _output_sineframe;
+    std::vector<float> _output_stocframe;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'StartStopCut' algorithm
+class StartStopCutAlgo {
+  public:
+    StartStopCutAlgo(const int frameSize=256, const int hopSize=256, const float maximumStartTime=10, const float maximumStopTime=10, const float sampleRate=44100, const int threshold=-60);
+    ~StartStopCutAlgo();
+    void configure(const int frameSize=256, const int hopSize=256, const float maximumStartTime=10, const float maximumStopTime=10, const float sampleRate=44100, const int threshold=-60);
+    val compute(std::vector<float>& input_audio);
+    val computeTyped(const val& input_audio);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_audio;
+    int _output_startCut;
+    int _output_stopCut;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'StartStopSilence' algorithm
+class StartStopSilenceAlgo {
+  public:
+    StartStopSilenceAlgo(const int threshold=-60);
+    ~StartStopSilenceAlgo();
+    void configure(const int threshold=-60);
+    val compute(std::vector<float>& input_frame);
+    val computeTyped(const val& input_frame);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_frame;
+    int _output_startFrame;
+    int _output_stopFrame;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'StereoDemuxer' algorithm
+class StereoDemuxerAlgo {
+  public:
+    StereoDemuxerAlgo();
+    ~StereoDemuxerAlgo();
+    void configure();
+    val compute(const val& input_audio);
+    val computeTyped(const val& input_audio);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<essentia::StereoSample> _input_audio;
+    std::vector<float> _output_left;
+    std::vector<float> _output_right;
+};
+ 
+// persistent wrapper of the essentia 'StereoMuxer' algorithm
+class StereoMuxerAlgo {
+  public:
+    StereoMuxerAlgo();
+    ~StereoMuxerAlgo();
+    void configure();
+    val compute(std::vector<float>& input_left, std::vector<float>& input_right);
+    val computeTyped(const val& input_left, const val& input_right);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_left;
+    std::vector<float> _input_right;
+    std::vector<essentia::StereoSample> _output_audio;
+};
+ 
+// persistent wrapper of the essentia 'StereoTrimmer' algorithm
+class StereoTrimmerAlgo {
+  public:
+    StereoTrimmerAlgo(const bool checkRange=false, const float endTime=1e+06, const float sampleRate=44100, const float startTime=0);
+    ~StereoTrimmerAlgo();
+    void configure(const bool checkRange=false, const float endTime=1e+06, const float sampleRate=44100, const float startTime=0);
+    val compute(const val& input_signal);
+    val computeTyped(const val& input_signal);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<essentia::StereoSample> _input_signal;
+    std::vector<essentia::StereoSample> _output_signal;
+};
+ 
+// persistent wrapper of the essentia 'StochasticModelAnal' algorithm
+class StochasticModelAnalAlgo {
+  public:
+    StochasticModelAnalAlgo(const int fftSize=2048, const int hopSize=512, const float sampleRate=44100, const float stocf=0.2);
+    ~StochasticModelAnalAlgo();
+    void configure(const int fftSize=2048, const int hopSize=512, const float sampleRate=44100, const float stocf=0.2);
+    val compute(std::vector<float>& input_frame);
+    val computeTyped(const val& input_frame);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_frame;
+    std::vector<float> _output_stocenv;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'StochasticModelSynth' algorithm
+class StochasticModelSynthAlgo {
+  public:
+    StochasticModelSynthAlgo(const int fftSize=2048, const int hopSize=512, const float sampleRate=44100, const float stocf=0.2);
+    ~StochasticModelSynthAlgo();
+    void configure(const int fftSize=2048, const int hopSize=512, const float sampleRate=44100, const float stocf=0.2);
+    val compute(std::vector<float>& input_stocenv);
+    val computeTyped(const val& input_stocenv);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_stocenv;
+    std::vector<float> _output_frame;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'StrongDecay' algorithm
+class StrongDecayAlgo {
+  public:
+    StrongDecayAlgo(const float sampleRate=44100);
+    ~StrongDecayAlgo();
+    void configure(const float sampleRate=44100);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    float _output_strongDecay;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'StrongPeak' algorithm
+class StrongPeakAlgo {
+  public:
+    StrongPeakAlgo();
+    ~StrongPeakAlgo();
+    void configure();
+    val compute(std::vector<float>& input_spectrum);
+    val computeTyped(const val& input_spectrum);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_spectrum;
+    float _output_strongPeak;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'SuperFluxExtractor' algorithm
+class SuperFluxExtractorAlgo {
+  public:
+    SuperFluxExtractorAlgo(const float combine=20, const int frameSize=2048, const int hopSize=256, const float ratioThreshold=16, const float sampleRate=44100, const float threshold=0.05);
+    ~SuperFluxExtractorAlgo();
+    void configure(const float combine=20, const int frameSize=2048, const int hopSize=256, const float ratioThreshold=16, const float sampleRate=44100, const float threshold=0.05);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    std::vector<float> _output_onsets;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'SuperFluxNovelty' algorithm
+class SuperFluxNoveltyAlgo {
+  public:
+    SuperFluxNoveltyAlgo(const int binWidth=3, const int frameWidth=2);
+    ~SuperFluxNoveltyAlgo();
+    void configure(const int binWidth=3, const int frameWidth=2);
+    val compute(std::vector<std::vector<float> >& input_bands);
+    val computeTyped(const val& input_bands);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<std::vector<float> > _input_bands;
+    float _output_differences;
+};
+ 
+// persistent wrapper of the essentia 'SuperFluxPeaks' algorithm
+class SuperFluxPeaksAlgo {
+  public:
+    SuperFluxPeaksAlgo(const float combine=30, const float frameRate=172, const float pre_avg=100, const float pre_max=30, const float ratioThreshold=16, const float threshold=0.05);
+    ~SuperFluxPeaksAlgo();
+    void configure(const float combine=30, const float frameRate=172, const float pre_avg=100, const float pre_max=30, const float ratioThreshold=16, const float threshold=0.05);
+    val compute(std::vector<float>& input_novelty);
+    val computeTyped(const val& input_novelty);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_novelty;
+    std::vector<float> _output_peaks;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'TCToTotal' algorithm
+class TCToTotalAlgo {
+  public:
+    TCToTotalAlgo();
+    ~TCToTotalAlgo();
+    void configure();
+    val compute(std::vector<float>& input_envelope);
+    val computeTyped(const val& input_envelope);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_envelope;
+    float _output_TCToTotal;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'TempoScaleBands' algorithm
+class TempoScaleBandsAlgo {
+  public:
+    TempoScaleBandsAlgo(const std::vector<float>& bandsGain=std::vector<float>{2, 3, 2, 1, 1.20000004768, 2, 3, 2.5}, const float frameTime=512);
+    ~TempoScaleBandsAlgo();
+    void configure(const std::vector<float>& bandsGain=std::vector<float>{2, 3, 2, 1, 1.20000004768, 2, 3, 2.5}, const float frameTime=512);
+    val compute(std::vector<float>& input_bands);
+    val computeTyped(const val& input_bands);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_bands;
+    std::vector<float> _output_scaledBands;
+    float _output_cumulativeBands;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'TempoTap' algorithm
+class TempoTapAlgo {
+  public:
+    TempoTapAlgo(const int frameHop=1024, const int frameSize=256, const int maxTempo=208, const int minTempo=40, const int numberFrames=1024, const float sampleRate=44100, const std::vector<float>& tempoHints=std::vector<float>());
+    ~TempoTapAlgo();
+    void configure(const int frameHop=1024, const int frameSize=256, const int maxTempo=208, const int minTempo=40, const int numberFrames=1024, const float sampleRate=44100, const std::vector<float>& tempoHints=std::vector<float>());
+    val compute(std::vector<float>& input_featuresFrame);
+    val computeTyped(const val& input_featuresFrame);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_featuresFrame;
+    std::vector<float> _output_periods;
+    std::vector<float> _output_phases;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'TempoTapDegara' algorithm
+class TempoTapDegaraAlgo {
+  public:
+    TempoTapDegaraAlgo(const int maxTempo=208, const int minTempo=40, const std::string& resample="none", const float sampleRateODF=86.1328);
+    ~TempoTapDegaraAlgo();
+    void configure(const int maxTempo=208, const int minTempo=40, const std::string& resample="none", const float sampleRateODF=86.1328);
+    val compute(std::vector<float>& input_onsetDetections);
+    val computeTyped(const val& input_onsetDetections);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_onsetDetections;
+    std::vector<float> _output_ticks;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'TempoTapMaxAgreement' algorithm
+class TempoTapMaxAgreementAlgo {
+  public:
+    TempoTapMaxAgreementAlgo();
+    ~TempoTapMaxAgreementAlgo();
+    void configure();
+    val compute(std::vector<std::vector<float> >& input_tickCandidates);
+    val computeTyped(const val& input_tickCandidates);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<std::vector<float> > _input_tickCandidates;
+    std::vector<float> _output_ticks;
+    float _output_confidence;
+};
+ 
+// persistent wrapper of the essentia 'TempoTapTicks' algorithm
+class TempoTapTicksAlgo {
+  public:
+    TempoTapTicksAlgo(const int frameHop=512, const int hopSize=256, const float sampleRate=44100);
+    ~TempoTapTicksAlgo();
+    void configure(const int frameHop=512, const int hopSize=256, const float sampleRate=44100);
+    val compute(std::vector<float>& input_periods, std::vector<float>& input_phases);
+    val computeTyped(const val& input_periods, const val& input_phases);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_periods;
+    std::vector<float> _input_phases;
+    std::vector<float> _output_ticks;
+    std::vector<float> _output_matchingPeriods;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'TensorflowInputMusiCNN' algorithm
+class TensorflowInputMusiCNNAlgo {
+  public:
+    TensorflowInputMusiCNNAlgo();
+    ~TensorflowInputMusiCNNAlgo();
+    void configure();
+    val compute(std::vector<float>& input_frame);
+    val computeTyped(const val& input_frame);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_frame;
+    std::vector<float> _output_bands;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'TensorflowInputVGGish' algorithm
+class TensorflowInputVGGishAlgo {
+  public:
+    TensorflowInputVGGishAlgo();
+    ~TensorflowInputVGGishAlgo();
+    void configure();
+    val compute(std::vector<float>& input_frame);
+    val computeTyped(const val& input_frame);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_frame;
+    std::vector<float> _output_bands;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'TonalExtractor' algorithm
+class TonalExtractorAlgo {
+  public:
+    TonalExtractorAlgo(const int frameSize=4096, const int hopSize=2048, const float tuningFrequency=440);
+    ~TonalExtractorAlgo();
+    void configure(const int frameSize=4096, const int hopSize=2048, const float tuningFrequency=440);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    float _output_chords_changes_rate;
+    std::vector<float> _output_chords_histogram;
+    std::string _output_chords_key;
+    float _output_chords_number_rate;
+    std::vector<std::string> _output_chords_progression;
+    std::string _output_chords_scale;
+    std::vector<float> _output_chords_strength;
+    std::vector<std::vector<float> > _output_hpcp;
+    std::vector<float> _output_hpcp_buffer;
+    std::vector<std::vector<float> > _output_hpcp_highres;
+    std::vector<float> _output_hpcp_highres_buffer;
+    std::string _output_key_key;
+    std::string _output_key_scale;
+    float _output_key_strength;
+};
+ 
+// persistent wrapper of the essentia 'TonicIndianArtMusic' algorithm
+class TonicIndianArtMusicAlgo {
+  public:
+    TonicIndianArtMusicAlgo(const float binResolution=10, const int frameSize=2048, const float harmonicWeight=0.85, const int hopSize=512, const float magnitudeCompression=1, const float magnitudeThreshold=40, const float maxTonicFrequency=375, const float minTonicFrequency=100, const int numberHarmonics=20, const int numberSaliencePeaks=5, const float referenceFrequency=55, const float sampleRate=44100);
+    ~TonicIndianArtMusicAlgo();
+    void configure(const float binResolution=10, const int frameSize=2048, const float harmonicWeight=0.85, const int hopSize=512, const float magnitudeCompression=1, const float magnitudeThreshold=40, const float maxTonicFrequency=375, const float minTonicFrequency=100, const int numberHarmonics=20, const int numberSaliencePeaks=5, const float referenceFrequency=55, const float sampleRate=44100);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    float _output_tonic;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'TriangularBands' algorithm
+class TriangularBandsAlgo {
+  public:
+    TriangularBandsAlgo(const std::vector<float>& frequencyBands=std::vector<float>{21.533203125, 43.06640625, 64.599609375, 86.1328125, 107.666015625, 129.19921875, 150.732421875, 172.265625, 193.798828125, 215.33203125, 236.865234375, 258.3984375, 279.931640625, 301.46484375, 322.998046875, 344.53125, 366.064453125, 387.59765625, 409.130859375, 430.6640625, 452.197265625, 473.73046875, 495.263671875, 516.796875, 538.330078125, 559.86328125, 581.396484375, 602.9296875, 624.462890625, 645.99609375, 667.529296875, 689.0625, 710.595703125, 732.12890625, 753.662109375, 775.1953125, 796.728515625, 839.794921875, 861.328125, 882.861328125, 904.39453125, 925.927734375, 968.994140625, 990.52734375, 1012.06054688, 1055.12695312, 1076.66015625, 1098.19335938, 1141.25976562, 1184.32617188, 1205.859375, 1248.92578125, 1270.45898438, 1313.52539062, 1356.59179688, 1399.65820312, 1442.72460938, 1485.79101562, 1528.85742188, 1571.92382812, 1614.99023438, 1658.05664062, 1701.12304688, 1765.72265625, 1808.7890625, 1873.38867188, 1916.45507812, 1981.0546875, 2024.12109375, 2088.72070312, 2153.3203125, 2217.91992188, 2282.51953125, 2347.11914062, 2411.71875, 2497.8515625, 2562.45117188, 2627.05078125, 2713.18359375, 2799.31640625, 2885.44921875, 2950.04882812, 3036.18164062, 3143.84765625, 3229.98046875, 3316.11328125, 3423.77929688, 3509.91210938, 3617.578125, 3725.24414062, 3832.91015625, 3940.57617188, 4069.77539062, 4177.44140625, 4306.640625, 4435.83984375, 4565.0390625, 4694.23828125, 4844.97070312, 4974.16992188, 5124.90234375, 5275.63476562, 5426.3671875, 5577.09960938, 5749.36523438, 5921.63085938, 6093.89648438, 6266.16210938, 6459.9609375, 6653.75976562, 6847.55859375, 7041.35742188, 7256.68945312, 7450.48828125, 7687.35351562, 7902.68554688, 8139.55078125, 8376.41601562, 8613.28125, 8871.6796875, 9130.078125, 9388.4765625, 9668.40820312, 9948.33984375, 10249.8046875, 10551.2695312, 10852.734375, 11175.7324219, 11498.7304688, 11843.2617188, 12187.7929688, 12553.8574219, 12919.921875, 13285.9863281, 13673.5839844, 14082.7148438, 14491.8457031, 14922.5097656, 15353.1738281, 15805.3710938, 16257.5683594}, const int inputSize=1025, const bool log=true, const std::string& normalize="unit_sum", const float sampleRate=44100, const std::string& type="power", const std::string& weighting="linear");
+    ~TriangularBandsAlgo();
+    void configure(const std::vector<float>& frequencyBands=std::vector<float>{21.533203125, 43.06640625, 64.599609375, 86.1328125, 107.666015625, 129.19921875, 150.732421875, 172.265625, 193.798828125, 215.33203125, 236.865234375, 258.3984375, 279.931640625, 301.46484375, 322.998046875, 344.53125, 366.064453125, 387.59765625, 409.130859375, 430.6640625, 452.197265625, 473.73046875, 495.263671875, 516.796875, 538.330078125, 559.86328125, 581.396484375, 602.9296875, 624.462890625, 645.99609375, 667.529296875, 689.0625, 710.595703125, 732.12890625, 753.662109375, 775.1953125, 796.728515625, 839.794921875, 861.328125, 882.861328125, 904.39453125, 925.927734375, 968.994140625, 990.52734375, 1012.06054688, 1055.12695312, 1076.66015625, 1098.19335938, 1141.25976562, 1184.32617188, 1205.859375, 1248.92578125, 1270.45898438, 1313.52539062, 1356.59179688, 1399.65820312, 1442.72460938, 1485.79101562, 1528.85742188, 1571.92382812, 1614.99023438, 1658.05664062, 1701.12304688, 1765.72265625, 1808.7890625, 1873.38867188, 1916.45507812, 1981.0546875, 2024.12109375, 2088.72070312, 2153.3203125, 2217.91992188, 2282.51953125, 2347.11914062, 2411.71875, 2497.8515625, 2562.45117188, 2627.05078125, 2713.18359375, 2799.31640625, 2885.44921875, 2950.04882812, 3036.18164062, 3143.84765625, 3229.98046875, 3316.11328125, 3423.77929688, 3509.91210938, 3617.578125, 3725.24414062, 3832.91015625, 3940.57617188, 4069.77539062, 4177.44140625, 4306.640625, 4435.83984375, 4565.0390625, 4694.23828125, 4844.97070312, 4974.16992188, 5124.90234375, 5275.63476562, 5426.3671875, 5577.09960938, 5749.36523438, 5921.63085938, 6093.89648438, 6266.16210938, 6459.9609375, 6653.75976562, 6847.55859375, 7041.35742188, 7256.68945312, 7450.48828125, 7687.35351562, 7902.68554688, 8139.55078125, 8376.41601562, 8613.28125, 8871.6796875, 9130.078125, 9388.4765625, 9668.40820312, 9948.33984375, 10249.8046875, 10551.2695312, 10852.734375, 11175.7324219, 11498.7304688, 11843.2617188, 12187.7929688, 12553.8574219, 12919.921875, 13285.9863281, 13673.5839844, 14082.7148438, 14491.8457031, 14922.5097656, 15353.1738281, 15805.3710938, 16257.5683594}, const int inputSize=1025, const bool log=true, const std::string& normalize="unit_sum", const float sampleRate=44100, const std::string& type="power", const std::string& weighting="linear");
+    val compute(std::vector<float>& input_spectrum);
+    val computeTyped(const val& input_spectrum);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_spectrum;
+    std::vector<float> _output_bands;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'TriangularBarkBands' algorithm
+class TriangularBarkBandsAlgo {
+  public:
+    TriangularBarkBandsAlgo(const float highFrequencyBound=22050, const int inputSize=1025, const bool log=false, const float lowFrequencyBound=0, const std::string& normalize="unit_sum", const int numberBands=24, const float sampleRate=44100, const std::string& type="power", const std::string& weighting="warping");
+    ~TriangularBarkBandsAlgo();
+    void configure(const float highFrequencyBound=22050, const int inputSize=1025, const bool log=false, const float lowFrequencyBound=0, const std::string& normalize="unit_sum", const int numberBands=24, const float sampleRate=44100, const std::string& type="power", const std::string& weighting="warping");
+    val compute(std::vector<float>& input_spectrum);
+    val computeTyped(const val& input_spectrum);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_spectrum;
+    std::vector<float> _output_bands;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'Trimmer' algorithm
+class TrimmerAlgo {
+  public:
+    TrimmerAlgo(const bool checkRange=false, const float endTime=1e+06, const float sampleRate=44100, const float startTime=0);
+    ~TrimmerAlgo();
+    void configure(const bool checkRange=false, const float endTime=1e+06, const float sampleRate=44100, const float startTime=0);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    std::vector<float> _output_signal;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'Tristimulus' algorithm
+class TristimulusAlgo {
+  public:
+    TristimulusAlgo();
+    ~TristimulusAlgo();
+    void configure();
+    val compute(std::vector<float>& input_frequencies, std::vector<float>& input_magnitudes);
+    val computeTyped(const val& input_frequencies, const val& input_magnitudes);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_frequencies;
+    std::vector<float> _input_magnitudes;
+    std::vector<float> _output_tristimulus;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'TruePeakDetector' algorithm
+class TruePeakDetectorAlgo {
+  public:
+    TruePeakDetectorAlgo(const bool blockDC=false, const bool emphasise=false, const int oversamplingFactor=4, const int quality=1, const float sampleRate=44100, const float threshold=-0.0002, const int version=4);
+    ~TruePeakDetectorAlgo();
+    void configure(const bool blockDC=false, const bool emphasise=false, const int oversamplingFactor=4, const int quality=1, const float sampleRate=44100, const float threshold=-0.0002, const int version=4);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    std::vector<float> _output_peakLocations;
+    std::vector<float> _output_output;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'TuningFrequency' algorithm
+class TuningFrequencyAlgo {
+  public:
+    TuningFrequencyAlgo(const float resolution=1);
+    ~TuningFrequencyAlgo();
+    void configure(const float resolution=1);
+    val compute(std::vector<float>& input_frequencies, std::vector<float>& input_magnitudes);
+    val computeTyped(const val& input_frequencies, const val& input_magnitudes);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_frequencies;
+    std::vector<float> _input_magnitudes;
+    float _output_tuningFrequency;
+    float _output_tuningCents;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'TuningFrequencyExtractor' algorithm
+class TuningFrequencyExtractorAlgo {
+  public:
+    TuningFrequencyExtractorAlgo(const int frameSize=4096, const int hopSize=2048);
+    ~TuningFrequencyExtractorAlgo();
+    void configure(const int frameSize=4096, const int hopSize=2048);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    std::vector<float> _output_tuningFrequency;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'UnaryOperator' algorithm
+class UnaryOperatorAlgo {
+  public:
+    UnaryOperatorAlgo(const float scale=1, const float shift=0, const std::string& type="identity");
+    ~UnaryOperatorAlgo();
+    void configure(const float scale=1, const float shift=0, const std::string& type="identity");
+    val compute(std::vector<float>& input_array);
+    val computeTyped(const val& input_array);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_array;
+    std::vector<float> _output_array;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'UnaryOperatorStream' algorithm
+class UnaryOperatorStreamAlgo {
+  public:
+    UnaryOperatorStreamAlgo(const float scale=1, const float shift=0, const std::string& type="identity");
+    ~UnaryOperatorStreamAlgo();
+    void configure(const float scale=1, const float shift=0, const std::string& type="identity");
+    val compute(std::vector<float>& input_array);
+    val computeTyped(const val& input_array);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_array;
+    std::vector<float> _output_array;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'Variance' algorithm
+class VarianceAlgo {
+  public:
+    VarianceAlgo();
+    ~VarianceAlgo();
+    void configure();
+    val compute(std::vector<float>& input_array);
+    val computeTyped(const val& input_array);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_array;
+    float _output_variance;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'Vibrato' algorithm
+class VibratoAlgo {
+  public:
+    VibratoAlgo(const float maxExtend=250, const float maxFrequency=8, const float minExtend=50, const float minFrequency=4, const float sampleRate=344.531);
+    ~VibratoAlgo();
+    void configure(const float maxExtend=250, const float maxFrequency=8, const float minExtend=50, const float minFrequency=4, const float sampleRate=344.531);
+    val compute(std::vector<float>& input_pitch);
+    val computeTyped(const val& input_pitch);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_pitch;
+    std::vector<float> _output_vibratoFrequency;
+    std::vector<float> _output_vibratoExtend;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'WarpedAutoCorrelation' algorithm
+class WarpedAutoCorrelationAlgo {
+  public:
+    WarpedAutoCorrelationAlgo(const int maxLag=1, const float sampleRate=44100);
+    ~WarpedAutoCorrelationAlgo();
+    void configure(const int maxLag=1, const float sampleRate=44100);
+    val compute(std::vector<float>& input_array);
+    val computeTyped(const val& input_array);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_array;
+    std::vector<float> _output_warpedAutoCorrelation;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'Welch' algorithm
+class WelchAlgo {
+  public:
+    WelchAlgo(const int averagingFrames=10, const int fftSize=1024, const int frameSize=512, const float sampleRate=44100, const std::string& scaling="density", const std::string& windowType="hann");
+    ~WelchAlgo();
+    void configure(const int averagingFrames=10, const int fftSize=1024, const int frameSize=512, const float sampleRate=44100, const std::string& scaling="density", const std::string& windowType="hann");
+    val compute(std::vector<float>& input_frame);
+    val computeTyped(const val& input_frame);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_frame;
+    std::vector<float> _output_psd;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'Windowing' algorithm
+class WindowingAlgo {
+  public:
+    WindowingAlgo(const int constantsDecimals=5, const bool normalized=true, const int size=1024, const bool splitPadding=false, const bool symmetric=true, const std::string& type="hann", const int zeroPadding=0, const bool zeroPhase=true);
+    ~WindowingAlgo();
+    void configure(const int constantsDecimals=5, const bool normalized=true, const int size=1024, const bool splitPadding=false, const bool symmetric=true, const std::string& type="hann", const int zeroPadding=0, const bool zeroPhase=true);
+    val compute(std::vector<float>& input_frame);
+    val computeTyped(const val& input_frame);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_frame;
+    std::vector<float> _output_frame;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+// persistent wrapper of the essentia 'ZeroCrossingRate' algorithm
+class ZeroCrossingRateAlgo {
+  public:
+    ZeroCrossingRateAlgo(const float threshold=0);
+    ~ZeroCrossingRateAlgo();
+    void configure(const float threshold=0);
+    val compute(std::vector<float>& input_signal);
+    val computeTyped(const val& input_signal);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto();
+  private:
+    essentia::standard::Algorithm* _algorithm;
+    std::vector<float> _input_signal;
+    float _output_zeroCrossingRate;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+ 
+
+#ifdef ESSENTIAJS_DISPATCHER
+// storage of the inputs or outputs of an algorithm of the metadata table (see essentiajs.cpp)
+struct DispatchData;
+
+// 'vector_real' or scalar output of an algorithm of the metadata table which is computed many times
+struct DispatchOutput {
+  std::vector<float> vector;
+  float real;
+  int integer;
+  bool boolean;
+  DispatchOutput() : real(0), integer(0), boolean(false) {};
+};
+
+// generic persistent wrapper of an algorithm of the metadata table, which replaces the persistent algorithm classes 
+// in the dispatcher mode. The parameters are given as {name: value} and the inputs as [value, ...].
+class DispatchedAlgorithm {
+  public:
+    DispatchedAlgorithm(const std::string& name, const val& params);
+    ~DispatchedAlgorithm();
+    void configure(const val& params);
+    val compute(const val& inputs);
+    val computeTyped(const val& inputs);
+    val inputBuffer(int index, int size);
+    val outputBuffer(int index);
+    int computeInto(const val& inputs);
+  private:
+    std::string _name;
+    essentia::standard::Algorithm* _algorithm;
+    // storage of the outputs of the last 'computeTyped' call, which keeps the returned views valid until the next call
+    DispatchData* _typedOutputs;
+    // input and output buffers of 'computeInto' and the memory of its output buffers at the last call
+    std::vector<std::vector<float> > _inputBuffers;
+    std::vector<DispatchOutput> _outputs;
+    std::vector<float> _outputValues;
+    std::vector<const float*> _outputData;
+    std::vector<size_t> _outputSizes;
+};
+#endif
+
 // convert a Float32 JS typed array into std::vector<float>
 std::vector<float> float32ArrayToVector(const val &arr);
 
+// typed array I/O helpers of the persistent algorithm classes
+// copy a Float32 JS typed array into an existing (reusable) std::vector<float>
+void typedArrayToVector(const val& arr, std::vector<float>& vec);
+// copy a row-major matrix {data: Float32Array, shape: [rows, cols]} into an existing std::vector<std::vector<float> >
+void typedArrayToMatrix(const val& matrix, std::vector<std::vector<float> >& mat);
+// returns a Float32Array view on the memory of a std::vector<float> (zero-copy)
+val vectorToTypedArray(std::vector<float>& vec);
+// pack a matrix into a contiguous row-major buffer and returns it as {data: Float32Array, shape: [rows, cols]}
+val matrixToTypedArray(const std::vector<std::vector<float> >& mat, std::vector<float>& buffer);
+
+// flat buffer helpers of the 'vector_complex' and 'matrix_real' types
+// copy an interleaved [re0, im0, re1, im1, ...] Float32 JS typed array into an existing std::vector<std::complex<float> >
+void typedArrayToComplexVector(const val& arr, std::vector<std::complex<float> >& vec);
+// copy a row-major matrix {data: Float32Array, shape: [rows, cols]} into an existing TNT::Array2D<float>
+void typedArrayToArray2D(const val& matrix, TNT::Array2D<float>& mat);
+// returns the interleaved real and imaginary parts of a complex vector as a Float32Array view (or a copy)
+val complexVectorToTypedArray(std::vector<std::complex<float> >& vec, bool copy=false);
+// pack a TNT::Array2D into a contiguous row-major buffer and returns it as {data: Float32Array, shape: [rows, cols]}
+val array2DToTypedArray(const TNT::Array2D<float>& mat, std::vector<float>& buffer, bool copy=false);
+
+// flat buffer helpers of the 'vector_stereosample' type
+// interleave the left and right channels (Float32 JS typed arrays or VectorFloat) into an existing std::vector<StereoSample>
+void channelsToStereoVector(const val& left, const val& right, std::vector<essentia::StereoSample>& vec);
+// copy an interleaved [l0, r0, l1, r1, ...] Float32 JS typed array or a planar {left, right} stereo signal into an 
+// existing std::vector<StereoSample>
+void typedArrayToStereoVector(const val& signal, std::vector<essentia::StereoSample>& vec);
+// returns the interleaved left and right samples of a stereo vector as a Float32Array view (or a copy)
+val stereoVectorToTypedArray(std::vector<essentia::StereoSample>& vec, bool copy=false);
+
+// check that the given number of frames, frame size and frame stride fit into a flat buffer of frames
+void checkBatchFrames(unsigned int length, const int numFrames, const int frameSize, const int frameStride);
+
+// pack the outputs of an algorithm method or extractor into a single ArrayBuffer (see 'Essentia.unpackOutputs')
+val packOutputs(const val& outputs);
+
+// returns the bit of the given output index if the memory of an output buffer of the 'computeInto' methods
+// moved or was resized since the last call, and updates the given data pointers and sizes of the outputs
+int trackOutputBuffer(const std::vector<float>& buffer, int index, std::vector<const float*>& data, std::vector<size_t>& sizes);
+
 #endif  // ESSENTIAJS_H
\ No newline at end of file
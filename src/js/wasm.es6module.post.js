@@ -1,11 +1,8 @@
 Module['vectorToArray'] = function(vect) {
   if (!vect) { throw "Null input"};
   if (vect.size() == 0) { throw "Empty vector input"};
-  const typedArray = new Float32Array(vect.size());
-    for (var i=0; i < vect.size(); i++) {
-      typedArray[i] = vect.get(i); 
-    }
-  return typedArray;
+  // bulk copy of the memory of the vector
+  return Module['vectorView'](vect).slice();
 }
 // EXPORT_ES6 option does not work as described at
 // https://github.com/emscripten-core/emscripten/issues/6284, so we have to
@@ -1,9 +1,6 @@
 Module['vectorToArray'] = function(vect) {
   if (!vect) { throw "Null input"};
   if (vect.size() == 0) { throw "Empty vector input"};
-  const typedArray = new Float32Array(vect.size());
-  for (var i=0; i < vect.size(); i++) {
-    typedArray[i] = vect.get(i); 
-  }
-  return typedArray;
+  // bulk copy of the memory of the vector
+  return Module['vectorView'](vect).slice();
 }
\ No newline at end of file
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+Access to the documentation structs (`getStruct()`) of the essentia algorithms used by the essentia.js code generators.
+
+By default the structs are queried (once per algorithm) from the essentia python bindings, which are only imported
+on demand. Setting the `ESSENTIAJS_METADATA` environment variable to a JSON manifest written by `export_metadata`
+(eg. using `python configure_bindings.py --export-metadata algorithms_metadata.json`) makes the code generation
+read only from the manifest, so that it can run without a native essentia install.
+"""
+import json
+import logging
+import os
+
+# environment variable with the path to the metadata manifest used by the code generators
+METADATA_ENV_VAR = "ESSENTIAJS_METADATA"
+
+# version of the layout of the metadata manifest
+METADATA_FORMAT_VERSION = 1
+
+_manifest = None
+_structs = dict()
+_streaming_structs = dict()
+
+
+def load_metadata(metadata_file):
+	"""Load a metadata manifest written by `export_metadata`"""
+	with open(metadata_file) as f:
+		manifest = json.load(f)
+	if manifest.get('formatVersion') != METADATA_FORMAT_VERSION:
+		raise IOError("Unsupported format version '%s' of the metadata manifest '%s', expected %s"
+					% (manifest.get('formatVersion'), metadata_file, METADATA_FORMAT_VERSION))
+	logging.info("Using the algorithm metadata of essentia %s from '%s'" % (manifest['essentiaVersion'],
+																			metadata_file))
+	return manifest
+
+
+def get_manifest():
+	"""Returns the metadata manifest set by the ESSENTIAJS_METADATA environment variable or None"""
+	global _manifest
+	if _manifest is None and os.environ.get(METADATA_ENV_VAR):
+		_manifest = load_metadata(os.environ[METADATA_ENV_VAR])
+	return _manifest
+
+
+def algorithm_names():
+	"""Returns the names of all the essentia standard mode algorithms"""
+	manifest = get_manifest()
+	if manifest is not None:
+		return list(manifest['algorithmNames'])
+	import essentia.standard as estd
+	return estd.algorithmNames()
+
+
+def has_algorithm(algorithm_name):
+	return algorithm_name in algorithm_names()
+
+
+def essentia_version():
+	manifest = get_manifest()
+	if manifest is not None:
+		return manifest['essentiaVersion']
+	import essentia
+	return essentia.__version__
+
+
+def get_struct(algorithm_name):
+	"""Returns the documentation struct (name, description, inputs, outputs and parameters) of an essentia algorithm"""
+	if algorithm_name not in _structs:
+		manifest = get_manifest()
+		if manifest is not None:
+			if algorithm_name not in manifest['algorithms']:
+				raise KeyError("Cannot find the algorithm '%s' in the metadata manifest exported from essentia %s"
+								% (algorithm_name, manifest['essentiaVersion']))
+			_structs[algorithm_name] = manifest['algorithms'][algorithm_name]
+		else:
+			import essentia.standard as estd
+			_structs[algorithm_name] = getattr(estd, algorithm_name)().getStruct()
+	return _structs[algorithm_name]
+
+
+def _streaming_manifest(manifest):
+	if 'streamingAlgorithms' not in manifest:
+		raise KeyError("The metadata manifest exported from essentia %s has no streaming mode algorithms, "
+						"export it again with 'configure_bindings.py --export-metadata'" % manifest['essentiaVersion'])
+	return manifest['streamingAlgorithms']
+
+
+def streaming_algorithm_names():
+	"""Returns the names of all the essentia streaming mode algorithms"""
+	manifest = get_manifest()
+	if manifest is not None:
+		return list(_streaming_manifest(manifest).keys())
+	import essentia.streaming as estr
+	return estr.algorithmNames()
+
+
+def get_streaming_struct(algorithm_name):
+	"""Returns the documentation struct of an essentia streaming mode algorithm, whose inputs and outputs 
+	(eg. 'real' samples instead of a 'vector_real' signal) may differ from the standard mode one"""
+	if algorithm_name not in _streaming_structs:
+		manifest = get_manifest()
+		if manifest is not None:
+			streaming = _streaming_manifest(manifest)
+			if algorithm_name not in streaming:
+				raise KeyError("Cannot find the streaming algorithm '%s' in the metadata manifest exported from essentia %s"
+								% (algorithm_name, manifest['essentiaVersion']))
+			_streaming_structs[algorithm_name] = streaming[algorithm_name]
+		else:
+			import essentia.streaming as estr
+			_streaming_structs[algorithm_name] = getattr(estr, algorithm_name)().getStruct()
+	return _streaming_structs[algorithm_name]
+
+
+def export_metadata(metadata_file):
+	"""Write the documentation structs of all the essentia algorithms along with the essentia version
+	to a JSON manifest using the essentia python bindings"""
+	import essentia
+	import essentia.standard as estd
+	import essentia.streaming as estr
+	names = estd.algorithmNames()
+	streaming_names = estr.algorithmNames()
+	logging.info("Exporting the metadata of %s algorithms of essentia %s to '%s' ..." % (len(names),
+																					essentia.__version__,
+																					metadata_file))
+	manifest = dict(formatVersion=METADATA_FORMAT_VERSION,
+					essentiaVersion=essentia.__version__,
+					algorithmNames=names,
+					algorithms=dict((name, getattr(estd, name)().getStruct()) for name in names),
+					streamingAlgorithms=dict((name, getattr(estr, name)().getStruct()) for name in streaming_names))
+	with open(metadata_file, 'w') as f:
+		json.dump(manifest, f, indent=2)
+		f.write('\n')
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+"""
+Resolve the essentia algorithms which are used by a JS/TS application, so that a minimal essentia.js build with only
+their bindings can be generated (see `configure_bindings.py --scan-usage`).
+
+The scan starts from the given entry points (files or directories) and follows their relative imports and requires.
+It collects the algorithm methods called on any object (eg. `essentia.MelBands(`, `pool.Spectrum(`), including the
+persistent classes (`MelBandsAlgo`) and batched variants (`MelBandsBatch`), and the algorithms added to a
+`StreamingNetwork` (`network.add('FrameCutter', ...)`). The sources of the add-on modules used by the application
+(eg. `EssentiaExtractor`) are scanned as well for the algorithms which they call internally, while the bundles of
+the essentia.js library itself (eg. a vendored `essentia.js-core.es.js`) are skipped since they wrap every algorithm.
+Comments are not skipped, so the scan errs on the side of including an algorithm.
+"""
+import logging
+import os
+import re
+from code_generator import ALGORITHM_CLASS_SUFFIX, BATCH_METHOD_SUFFIX
+
+# extensions of the scanned source files, which are also tried while resolving the relative imports
+SOURCE_EXTENSIONS = ['.js', '.mjs', '.cjs', '.jsx', '.ts', '.mts', '.cts', '.tsx']
+
+# typescript sources of the add-on modules which call algorithm methods internally, by the names of their classes
+TYPESCRIPT_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "typescript"))
+ADDON_SOURCES = {
+	'EssentiaExtractor': os.path.join(TYPESCRIPT_DIR, "extractor", "extractor.ts"),
+	'EssentiaTFInputExtractor': os.path.join(TYPESCRIPT_DIR, "machinelearning", "tfjs_input_extractor.ts"),
+}
+
+# prefixes of the file names of the essentia.js bundles, which are not scanned
+LIBRARY_BUNDLE_PREFIXES = ['essentia.js-', 'essentia-wasm']
+
+ALGORITHM_CALL_PATTERN = re.compile(r"\.\s*([A-Z][A-Za-z0-9]*)\s*\(")
+STREAMING_ADD_PATTERN = re.compile(r"\.\s*add\s*\(\s*['\"]([A-Za-z0-9]+)['\"]")
+RELATIVE_IMPORT_PATTERN = re.compile(r"(?:\bfrom|\brequire\s*\(|\bimport\s*\(?)\s*['\"](\.{1,2}/[^'\"]*)['\"]")
+
+
+def resolve_import(source_file, specifier):
+	"""Returns the path of a relative import of a source file, or None if it is not a scanned source file"""
+	path = os.path.normpath(os.path.join(os.path.dirname(source_file), specifier))
+	candidates = [path] + [path + ext for ext in SOURCE_EXTENSIONS] + \
+				[os.path.join(path, "index" + ext) for ext in SOURCE_EXTENSIONS]
+	for candidate in candidates:
+		if os.path.isfile(candidate) and os.path.splitext(candidate)[1] in SOURCE_EXTENSIONS:
+			return candidate
+	return None
+
+
+def is_library_bundle(source_file):
+	return any(os.path.basename(source_file).startswith(prefix) for prefix in LIBRARY_BUNDLE_PREFIXES)
+
+
+def source_files(entry_points):
+	"""Returns the source files of the given entry points, where directories are scanned recursively
+	(except their node_modules)"""
+	files = list()
+	for entry_point in entry_points:
+		if os.path.isdir(entry_point):
+			for root, dirs, names in os.walk(entry_point):
+				dirs[:] = sorted(d for d in dirs if d != 'node_modules')
+				files.extend(os.path.join(root, name) for name in sorted(names)
+							if os.path.splitext(name)[1] in SOURCE_EXTENSIONS)
+		elif os.path.isfile(entry_point):
+			files.append(entry_point)
+		else:
+			raise IOError("Cannot find the entry point '%s'" % entry_point)
+	return [os.path.normpath(f) for f in files]
+
+
+def called_names(source):
+	"""Returns the names of the algorithms which may be called in a JS/TS source, ie. the capitalised methods
+	(without the suffixes of the persistent classes and batched variants) and the names added to streaming networks"""
+	names = set()
+	for name in ALGORITHM_CALL_PATTERN.findall(source):
+		names.add(name)
+		for suffix in [ALGORITHM_CLASS_SUFFIX, BATCH_METHOD_SUFFIX]:
+			if name.endswith(suffix):
+				names.add(name[:-len(suffix)])
+	names.update(STREAMING_ADD_PATTERN.findall(source))
+	return names
+
+
+def scan_algorithm_usage(entry_points, algorithms):
+	"""Scan the given JS/TS entry points, the modules which they import and the add-on modules which they use, and
+	returns the sorted list of the given algorithm names which are called"""
+	pending = [f for f in source_files(entry_points) if not is_library_bundle(f)]
+	scanned = set()
+	names = set()
+	while pending:
+		source_file = pending.pop()
+		if source_file in scanned:
+			continue
+		scanned.add(source_file)
+		with open(source_file) as f:
+			source = f.read()
+		names.update(called_names(source))
+		# the imports of the add-on sources lead to the core API, which wraps every algorithm
+		if source_file not in ADDON_SOURCES.values():
+			for specifier in RELATIVE_IMPORT_PATTERN.findall(source):
+				imported = resolve_import(source_file, specifier)
+				if imported is not None and not is_library_bundle(imported):
+					pending.append(imported)
+		for addon, addon_source in ADDON_SOURCES.items():
+			if re.search(r"\b%s\b" % addon, source):
+				pending.append(addon_source)
+	logging.info("Scanned %s source files for the usage of the essentia algorithms" % len(scanned))
+	return sorted(al for al in algorithms if al in names)
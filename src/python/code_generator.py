@@ -1,13 +1,18 @@
 # -*- coding: utf-8 -*-
 """
-A simple python script for generating essentia.js cpp source files and typescript wrapper from the essentia library upstream documentation using its python bindings.
+A simple python script for generating essentia.js cpp source files and typescript wrapper from the essentia library upstream documentation using its python bindings 
+(or a metadata manifest exported from them, see algorithm_metadata.py).
 Designed to use along with the cog python library (https://nedbatchelder.com/code/cog/).
 """
-import essentia.standard as estd
 import argparse
+import hashlib
+import json
 import logging
+import multiprocessing
+import os
 from ast import literal_eval
-from configure_bindings import TO_INCLUDE_ALGOS, TO_EXCLUDE_ALGOS
+from configure_bindings import TO_INCLUDE_ALGOS, TO_EXCLUDE_ALGOS, ALGORITHM_GROUP, algorithm_groups
+from algorithm_metadata import get_manifest, get_struct, get_streaming_struct, streaming_algorithm_names
 
 logging.basicConfig(level='INFO')
 
@@ -22,6 +27,58 @@ FUNC_RETURN_TYPE = "val"
 # namespace where EssentiaJS class methods are exposed in the typescript wrapper
 JS_ALGORITHMS_RETURN_NAMESPACE = "this.algorithms"
 
+# suffix of the persistent (configure once, compute many) algorithm classes, eg. 'MelBandsAlgo'
+ALGORITHM_CLASS_SUFFIX = "Algo"
+
+# suffix of the batched frame-wise variants of the algorithm methods, eg. 'MelBandsBatch'
+BATCH_METHOD_SUFFIX = "Batch"
+
+# generic persistent algorithm class which replaces the persistent algorithm classes in the dispatcher mode
+DISPATCHED_ALGORITHM_CLASS = "DispatchedAlgorithm"
+
+# essentia types supported for the inputs and the stacked outputs of the batched algorithm methods
+BATCH_INPUT_TYPES = ['vector_real', 'real']
+BATCH_OUTPUT_TYPES = ['vector_real', 'real', 'integer', 'bool']
+
+# essentia types supported for the inputs and outputs of the allocation-free 'computeInto' method of the persistent 
+# algorithm classes, which reads the vector inputs from and writes the outputs to buffers reused across calls
+INTO_INPUT_TYPES = ['vector_real', 'real', 'integer', 'bool']
+INTO_OUTPUT_TYPES = ['vector_real', 'real', 'integer', 'bool']
+
+# essentia types which are marshalled between JS and WASM as contiguous Float32 buffers, ie. 'vector_complex' as 
+# an interleaved [re0, im0, re1, im1, ...] Float32Array, 'matrix_real' as {data: Float32Array, shape: [rows, cols]} 
+# and 'vector_stereosample' as an interleaved [l0, r0, l1, r1, ...] Float32Array (or planar {left, right} inputs)
+FLAT_BUFFER_TYPES = ['vector_complex', 'matrix_real', 'vector_stereosample']
+
+# sizes of the synthetic vector inputs of the generated benchmarks which are derived from the default parameters
+# of the algorithms, ie. (input name, parameter name, size as a function of the parameter value)
+BENCHMARK_INPUT_SIZES = [('spectrum', 'inputSize', lambda n: n), 
+						('spectrum', 'frameSize', lambda n: n // 2 + 1), 
+						('frame', 'frameSize', lambda n: n), 
+						('frame', 'size', lambda n: n), 
+						('pcp', 'pcpSize', lambda n: n)]
+
+# environment variables for the number of parallel code generation processes (defaults to the number of cpus) 
+# and for enabling the split sources mode, ie. one cpp file per algorithm in SPLIT_SOURCES_DIR
+CODEGEN_JOBS_ENV_VAR = "ESSENTIAJS_CODEGEN_JOBS"
+SPLIT_SOURCES_ENV_VAR = "ESSENTIAJS_SPLIT_SOURCES"
+
+# environment variable for enabling the profiling instrumentation of the algorithm methods (see `instrument_compute`)
+PROFILING_ENV_VAR = "ESSENTIAJS_PROFILING"
+
+# environment variable for enabling the dispatcher mode, where the algorithms are computed by a single generic 
+# 'compute' entry point driven by a metadata table instead of one method and embind function per algorithm
+DISPATCHER_ENV_VAR = "ESSENTIAJS_DISPATCHER"
+
+# essentia types of the inputs, outputs and parameters which are marshalled by the generic 'compute' entry point
+DISPATCHER_IO_TYPES = ['vector_real', 'vector_vector_real', 'vector_string', 'vector_complex', 'matrix_real', 
+					'vector_stereosample', 'real', 'integer', 'bool', 'string']
+DISPATCHER_PARAMETER_TYPES = ['vector_real', 'vector_string', 'real', 'integer', 'bool', 'string']
+
+# on-disk cache of the generated code of each algorithm keyed by a hash of its metadata and of the code generator
+CODEGEN_CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".codegen_cache.json")
+SPLIT_SOURCES_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "cpp", "includes", "algorithms"))
+
 logging.info("Generating essentia.js cpp source code and binding files ....")
 logging.info("Excluding the following %s algorithms while generating bindings ..." % len(TO_EXCLUDE_ALGOS))
 logging.info(TO_EXCLUDE_ALGOS)
@@ -41,17 +98,32 @@ def map_types_to_cpp(es_type):
 		return "float"
 	elif es_type == 'bool':
 		return es_type
-	# TODO: implement coressponding JS supported types for the following types
-	# elif es_type == "vector_complex":
-	# 	return "std::complex<float>&"
-	# elif es_type == 'vector_stereosample':
-	# 	return ""
-	# elif es_type == 'matrix_real':
-	# 	return ""
+	elif es_type == "vector_complex":
+		return "std::vector<std::complex<float> >&"
+	elif es_type == 'matrix_real':
+		return "TNT::Array2D<float>&"
+	elif es_type == 'vector_stereosample':
+		return "std::vector<essentia::StereoSample>&"
 	else:
 		raise NotImplementedError("Cannot find the correspoding type for '%s'" % es_type)
 
 
+def map_types_to_cpp_input(es_type):
+	"""Map essentia types to the cpp argument types of the algorithm inputs, where the flat buffer types 
+	are passed from JS as typed arrays (see FLAT_BUFFER_TYPES)"""
+	if es_type in FLAT_BUFFER_TYPES:
+		return "const val&"
+	return map_types_to_cpp(es_type)
+
+
+def map_types_to_cpp_typed_array(es_type):
+	"""Map essentia types to the cpp argument types of the typed array I/O methods, where 'vector_real' 
+	inputs are passed as JS Float32Array and 'vector_vector_real' inputs as {data: Float32Array, shape: [rows, cols]}"""
+	if es_type in ['vector_real', 'vector_vector_real']:
+		return "const val&"
+	return map_types_to_cpp_input(es_type)
+
+
 def map_vector_params_to_cpp(param_dict, target):
 	if param_dict['type'] == 'vector_real':
 		if param_dict['default'] != '[]':
@@ -72,27 +144,11 @@ def map_vector_params_to_cpp(param_dict, target):
 	return 
 
 
-def parse_algorithm_info(algorithm_name, target="header"):
-	"""Parse algorithm info and generate target cpp code for essentia algorithms"""
-	inputs = list()
-	outputs = list()
+def parse_parameters(doc_dict, target="header"):
+	"""Parse the parameters of an essentia algorithm into a list of cpp function arguments and 
+	a list of name-value pairs that can be passed to the essentia AlgorithmFactory."""
 	parameters = list()
-	output_dict = dict()
-	param_dict = dict()
-	output_dict['outputs'] = []
-	param_dict['params'] = []
-	output_var_names = list()
-	# create the algorithm object
-	algo = getattr(estd, algorithm_name)()
-	doc_dict = algo.getStruct()
-	algo_obj = "algo%s" % algorithm_name
-
-	# parse inputs
-	for inp in doc_dict['inputs']:
-		input_var = "%s %s%s" % (map_types_to_cpp(inp['type']), INPUT_PREFIX_ES, inp['name'])
-		inputs.append(input_var)
-
-	# parse parameters
+	factory_params = list()
 	for params in doc_dict['parameters']:
 		if params['type'] == 'string':
 			if target == 'header':
@@ -113,34 +169,244 @@ def parse_algorithm_info(algorithm_name, target="header"):
 				parameters.append("const %s %s" % (map_types_to_cpp(params['type']), 
 												params['name']))
 
-		param_dict['params'].append('"%s", %s' % (params['name'], params['name']))
+		factory_params.append('"%s", %s' % (params['name'], params['name']))
+	return parameters, factory_params
+
+
+def parse_compute(doc_dict, algorithm_name, algo_obj):
+	"""Generate the lines of cpp code which set the inputs and outputs of an already configured 
+	essentia algorithm object, compute it and pack its outputs into a JS object."""
+	lines = list()
+	# set inputs to the algorithm
+	for inp in doc_dict['inputs']:
+		if inp['type'] in FLAT_BUFFER_TYPES:
+			# copy the flat buffer into the corresponding essentia type
+			lines.append("  %s flat_%s%s;" % (map_types_to_cpp(inp['type']).replace('&', ''), 
+											INPUT_PREFIX_ES, inp['name']))
+			lines.append("  %s(%s%s, flat_%s%s);" % (flat_buffer_input_helper(inp['type']), 
+													INPUT_PREFIX_ES, inp['name'], 
+													INPUT_PREFIX_ES, inp['name']))
+			lines.append('  %s->input("%s").set(flat_%s%s);' % (algo_obj, inp['name'], 
+															INPUT_PREFIX_ES, 
+															inp['name']))
+			continue
+		lines.append('  %s->input("%s").set(%s%s);' % (algo_obj, inp['name'], 
+													INPUT_PREFIX_ES, 
+													inp['name']))
+
+	if not doc_dict['outputs']:
+		raise IOError("No output variable found in the algo '%s'" % algorithm_name)
+
+	for out in doc_dict['outputs']:
+		lines.append("  %s %s%s;" % (map_types_to_cpp(out['type']).replace('&', ''), 
+									OUTPUT_PREFIX_ES, 
+									out['name']))
+
+	# set outputs to the algorithm
+	for out in doc_dict['outputs']:
+		lines.append('  %s->output("%s").set(%s%s);' % (algo_obj, 
+														out['name'], 
+														OUTPUT_PREFIX_ES, 
+														out['name']))
+
+	lines.append("  %s->compute();" % algo_obj)
+
+	lines.append("  val output%s(val::object());" % algorithm_name)
+
+	for out in doc_dict['outputs']:
+		out_var = "%s%s" % (OUTPUT_PREFIX_ES, out['name'])
+		# the flat buffers of the outputs are copied since they are local variables
+		if out['type'] == 'vector_complex':
+			lines.append('  output%s.set("%s", complexVectorToTypedArray(%s, true));' % (algorithm_name, 
+																						out['name'], 
+																						out_var))
+		elif out['type'] == 'matrix_real':
+			lines.append("  std::vector<float> %s_buffer;" % out_var)
+			lines.append('  output%s.set("%s", array2DToTypedArray(%s, %s_buffer, true));' % (algorithm_name, 
+																							out['name'], 
+																							out_var, 
+																							out_var))
+		elif out['type'] == 'vector_stereosample':
+			lines.append('  output%s.set("%s", stereoVectorToTypedArray(%s, true));' % (algorithm_name, 
+																					out['name'], 
+																					out_var))
+		else:
+			lines.append('  output%s.set("%s", %s);' % (algorithm_name, out['name'], out_var))
+	return lines
+
+
+def profiling_enabled():
+	"""Check whether the algorithm methods are generated with profiling instrumentation"""
+	return os.environ.get(PROFILING_ENV_VAR, '').lower() in ('1', 'true', 'yes')
+
+
+def dispatcher_enabled():
+	"""Check whether the algorithms are generated for the generic 'compute' entry point (see `generate_algorithm_table`)"""
+	return os.environ.get(DISPATCHER_ENV_VAR, '').lower() in ('1', 'true', 'yes')
+
+
+def instrument_compute(lines, doc_dict, algorithm_name, algo_obj):
+	"""Instrument the lines of cpp code of `parse_compute` with timers of the creation of the algorithm (from 
+	'profileStart'), the setup of its inputs and outputs, the compute and the packing of its outputs into a JS object, 
+	which are recorded along with the number of bytes of the inputs and outputs in the profile of the EssentiaJS instance"""
+	compute_index = lines.index("  %s->compute();" % algo_obj)
+	input_bytes = ["profileBytes(%s%s%s)" % ('flat_' if inp['type'] in FLAT_BUFFER_TYPES else '', 
+											INPUT_PREFIX_ES, 
+											inp['name']) for inp in doc_dict['inputs']]
+	output_bytes = ["profileBytes(%s%s)" % (OUTPUT_PREFIX_ES, out['name']) for out in doc_dict['outputs']]
+
+	instrumented = ["  double profileCreate = emscripten_get_now();"]
+	instrumented.extend(lines[:compute_index])
+	instrumented.append("  double profileInput = emscripten_get_now();")
+	instrumented.append(lines[compute_index])
+	instrumented.append("  double profileCompute = emscripten_get_now();")
+	instrumented.extend(lines[compute_index + 1:])
+	instrumented.append("  double profileOutput = emscripten_get_now();")
+	instrumented.append('  recordProfile("%s", profileCreate - profileStart, profileInput - profileCreate, '
+						'profileCompute - profileInput, profileOutput - profileCompute, %s, %s);' % (algorithm_name, 
+																								' + '.join(input_bytes) or '0', 
+																								' + '.join(output_bytes) or '0'))
+	return instrumented
+
+
+def flat_buffer_input_helper(es_type):
+	"""Returns the name of the cpp helper function which copies a JS flat buffer into the given essentia type"""
+	if es_type == 'vector_complex':
+		return "typedArrayToComplexVector"
+	elif es_type == 'matrix_real':
+		return "typedArrayToArray2D"
+	elif es_type == 'vector_stereosample':
+		return "typedArrayToStereoVector"
+	raise NotImplementedError("'%s' is not a flat buffer type" % es_type)
+
+
+def parse_compute_typed_array(doc_dict, algorithm_name, algo_obj):
+	"""Generate the lines of cpp code which compute a persistent essentia algorithm with JS typed array 
+	inputs and return its array outputs as typed array views on the WASM heap (zero-copy)."""
+	lines = list()
+	for inp in doc_dict['inputs']:
+		if inp['type'] == 'vector_real':
+			# copy the typed array into a reusable input buffer of the class
+			lines.append("  typedArrayToVector(%s%s, _%s%s);" % (INPUT_PREFIX_ES, inp['name'], 
+																INPUT_PREFIX_ES, inp['name']))
+			lines.append('  %s->input("%s").set(_%s%s);' % (algo_obj, inp['name'], INPUT_PREFIX_ES, inp['name']))
+		elif inp['type'] == 'vector_vector_real':
+			lines.append("  typedArrayToMatrix(%s%s, _%s%s);" % (INPUT_PREFIX_ES, inp['name'], 
+																INPUT_PREFIX_ES, inp['name']))
+			lines.append('  %s->input("%s").set(_%s%s);' % (algo_obj, inp['name'], INPUT_PREFIX_ES, inp['name']))
+		elif inp['type'] in FLAT_BUFFER_TYPES:
+			lines.append("  %s(%s%s, _%s%s);" % (flat_buffer_input_helper(inp['type']), 
+												INPUT_PREFIX_ES, inp['name'], 
+												INPUT_PREFIX_ES, inp['name']))
+			lines.append('  %s->input("%s").set(_%s%s);' % (algo_obj, inp['name'], INPUT_PREFIX_ES, inp['name']))
+		else:
+			lines.append('  %s->input("%s").set(%s%s);' % (algo_obj, inp['name'], INPUT_PREFIX_ES, inp['name']))
+
+	if not doc_dict['outputs']:
+		raise IOError("No output variable found in the algo '%s'" % algorithm_name)
+
+	# outputs are members of the class so that the returned views stay valid after the call
+	for out in doc_dict['outputs']:
+		lines.append('  %s->output("%s").set(_%s%s);' % (algo_obj, out['name'], OUTPUT_PREFIX_ES, out['name']))
+
+	lines.append("  %s->compute();" % algo_obj)
+	lines.append("  val output%s(val::object());" % algorithm_name)
+
+	for out in doc_dict['outputs']:
+		if out['type'] == 'vector_real':
+			value = "vectorToTypedArray(_%s%s)" % (OUTPUT_PREFIX_ES, out['name'])
+		elif out['type'] == 'vector_vector_real':
+			value = "matrixToTypedArray(_%s%s, _%s%s_buffer)" % (OUTPUT_PREFIX_ES, out['name'], 
+																OUTPUT_PREFIX_ES, out['name'])
+		elif out['type'] == 'vector_complex':
+			value = "complexVectorToTypedArray(_%s%s)" % (OUTPUT_PREFIX_ES, out['name'])
+		elif out['type'] == 'matrix_real':
+			value = "array2DToTypedArray(_%s%s, _%s%s_buffer)" % (OUTPUT_PREFIX_ES, out['name'], 
+																OUTPUT_PREFIX_ES, out['name'])
+		elif out['type'] == 'vector_stereosample':
+			value = "stereoVectorToTypedArray(_%s%s)" % (OUTPUT_PREFIX_ES, out['name'])
+		else:
+			value = "_%s%s" % (OUTPUT_PREFIX_ES, out['name'])
+		lines.append('  output%s.set("%s", %s);' % (algorithm_name, out['name'], value))
+	return lines
+
+
+def is_into_capable(doc_dict):
+	"""Check whether the persistent class of an algorithm can be computed without any allocation (see `parse_compute_into`), 
+	ie. all of its inputs and outputs are either 'vector_real' or scalars"""
+	if not doc_dict['outputs']:
+		return False
+	return all(inp['type'] in INTO_INPUT_TYPES for inp in doc_dict['inputs']) and \
+			all(out['type'] in INTO_OUTPUT_TYPES for out in doc_dict['outputs'])
+
+
+def parse_compute_into(doc_dict, class_name, algo_obj, into_inputs):
+	"""Generate the cpp methods of the allocation-free variant of a persistent algorithm class. The vector inputs are 
+	written to the input buffers of the class through the views returned by 'inputBuffer', and 'computeInto' writes 
+	the outputs to buffers of the class whose views are returned by 'outputBuffer' (scalar outputs as views of a single 
+	element). 'computeInto' returns the bit mask of the outputs whose buffer moved or was resized since the last call, 
+	so that new views are only requested (and allocated) when needed."""
+	lines = list()
+	lines.append("val %s::inputBuffer(int index, int size) {" % class_name)
+	lines.append("  switch (index) {")
+	for i, inp in enumerate(doc_dict['inputs']):
+		if inp['type'] == 'vector_real':
+			lines.append("    case %s:" % i)
+			lines.append("      _%s%s.resize(size);" % (INPUT_PREFIX_ES, inp['name']))
+			lines.append("      return vectorToTypedArray(_%s%s);" % (INPUT_PREFIX_ES, inp['name']))
+	lines.append("  }")
+	lines.append('  throw EssentiaException("%s::inputBuffer: there is no vector input of index ", index);' % class_name)
+	lines.append("}")
+
+	lines.append("val %s::outputBuffer(int index) {" % class_name)
+	lines.append("  switch (index) {")
+	for i, out in enumerate(doc_dict['outputs']):
+		lines.append("    case %s:" % i)
+		if out['type'] == 'vector_real':
+			lines.append("      return vectorToTypedArray(_%s%s);" % (OUTPUT_PREFIX_ES, out['name']))
+		else:
+			lines.append("      return val(typed_memory_view(1, &_outputValues[%s]));" % i)
+	lines.append("  }")
+	lines.append('  throw EssentiaException("%s::outputBuffer: there is no output of index ", index);' % class_name)
+	lines.append("}")
+
+	lines.append("int %s::computeInto(%s) {" % (class_name, ', '.join(into_inputs)))
+	for inp in doc_dict['inputs']:
+		prefix = '_' if inp['type'] == 'vector_real' else ''
+		lines.append('  %s->input("%s").set(%s%s%s);' % (algo_obj, inp['name'], prefix, INPUT_PREFIX_ES, inp['name']))
+	for out in doc_dict['outputs']:
+		lines.append('  %s->output("%s").set(_%s%s);' % (algo_obj, out['name'], OUTPUT_PREFIX_ES, out['name']))
+	lines.append("  %s->compute();" % algo_obj)
+	lines.append("  int changed = 0;")
+	for i, out in enumerate(doc_dict['outputs']):
+		if out['type'] == 'vector_real':
+			lines.append("  changed |= trackOutputBuffer(_%s%s, %s, _outputData, _outputSizes);" % (OUTPUT_PREFIX_ES, 
+																								out['name'], i))
+		else:
+			lines.append("  _outputValues[%s] = _%s%s;" % (i, OUTPUT_PREFIX_ES, out['name']))
+	lines.append("  return changed;")
+	lines.append("}")
+	return lines
+
+
+def parse_algorithm_info(algorithm_name, target="header"):
+	"""Parse algorithm info and generate target cpp code for essentia algorithms"""
+	inputs = list()
+	outputs = list()
+	doc_dict = get_struct(algorithm_name)
+	algo_obj = "algo%s" % algorithm_name
+
+	# parse inputs
+	for inp in doc_dict['inputs']:
+		input_var = "%s %s%s" % (map_types_to_cpp_input(inp['type']), INPUT_PREFIX_ES, inp['name'])
+		inputs.append(input_var)
+
+	# parse parameters
+	parameters, factory_params = parse_parameters(doc_dict, target=target)
 
 	# parse outputs
-	# if the algorithm has multiple outputs we construct a void function, otherwise return it's return type
-	if (len(doc_dict['outputs']) != 1):
-		func_return_type = "void"
-		if len(doc_dict['outputs']) > 0:
-			for out in doc_dict['outputs']:
-				output_var = "%s %s%s" % (map_types_to_cpp(out['type']), 
-										OUTPUT_PREFIX_ES, 
-										out['name'])
-				
-				outputs.append(output_var)
-				output_var_names.append("%s%s" % (OUTPUT_PREFIX_ES, out['name']))
-				output_dict['outputs'].append('  %s->output("%s").set(%s%s);' % (algo_obj, 
-																			out['name'], 
-																			OUTPUT_PREFIX_ES, 
-																			out['name']))
-	else:
-		func_return_type = map_types_to_cpp(doc_dict['outputs'][0]['type']).replace('&', '')
-		for out in doc_dict['outputs']:
-			output_var = "%s %s%s" % (map_types_to_cpp(out['type']), OUTPUT_PREFIX_ES, out['name'])
-			outputs.append(output_var)
-			output_var_names.append("%s%s" % (OUTPUT_PREFIX_ES, out['name']))
-			output_dict['outputs'].append('  %s->output("%s").set(%s%s);' % (algo_obj, 
-																			out['name'], 
-																			OUTPUT_PREFIX_ES, 
-																			out['name']))
+	for out in doc_dict['outputs']:
+		outputs.append("%s %s%s" % (map_types_to_cpp(out['type']), OUTPUT_PREFIX_ES, out['name']))
 		
 	# Default function declaration string
 	func_str = "%s %s(%s, %s)" % (FUNC_RETURN_TYPE, 
@@ -188,43 +454,25 @@ def parse_algorithm_info(algorithm_name, target="header"):
 											algorithm_name, 
 											func_str.split(arg_parse_str)[1]))
 
-			
-		algorithm.append("  AlgorithmFactory& factory = standard::AlgorithmFactory::instance();")
-
-		if param_dict['params']:
-			algorithm.append('  Algorithm* %s = factory.create("%s", %s);' % (algo_obj, 
-																	algorithm_name, 
-																	', '.join(param_dict['params'])))
-		else:
-			algorithm.append('  Algorithm* %s = factory.create("%s");' % (algo_obj, algorithm_name))
-
-		# set inputs to the algorithm
-		for inp in doc_dict['inputs']:
-			inp_str = '  %s->input("%s").set(%s%s);' % (algo_obj, inp['name'], 
-													INPUT_PREFIX_ES, 
-													inp['name'])
-			algorithm.append(inp_str)
 
-		for out in outputs:
-			algorithm.append("  %s;" % out.replace('&', ''))
+		profiling = profiling_enabled()
+		if profiling:
+			algorithm.append("  double profileStart = emscripten_get_now();")
 
-		# set outputs to the algorithm
-		if output_dict['outputs']:
-			for out in output_dict['outputs']:
-				algorithm.append(out)
+		# the algorithm is either newly created or reused from the algorithm cache of the EssentiaJS instance
+		if factory_params:
+			algorithm.append('  Algorithm* %s = createAlgorithm("%s", %s);' % (algo_obj, 
+																	algorithm_name, 
+																	', '.join(factory_params)))
 		else:
-			raise IOError("No output variable found in the algo '%s'" % algorithm_name)
-
-		algorithm.append("  %s->compute();" % algo_obj)
+			algorithm.append('  Algorithm* %s = createAlgorithm("%s");' % (algo_obj, algorithm_name))
 
-		algorithm.append("  val output%s(val::object());" % algorithm_name)
+		compute = parse_compute(doc_dict, algorithm_name, algo_obj)
+		if profiling:
+			compute = instrument_compute(compute, doc_dict, algorithm_name, algo_obj)
+		algorithm.extend(compute)
 
-		for out_var in output_var_names:
-			algorithm.append('  output%s.set("%s", %s);' % (algorithm_name,
-														out_var.replace(OUTPUT_PREFIX_ES, ''),
-														out_var))
-
-		algorithm.append("  delete %s;" % algo_obj)	
+		algorithm.append("  releaseAlgorithm(%s);" % algo_obj)	
 		algorithm.append("  return output%s;" % algorithm_name)	
 		algorithm.append("}")
 		return algorithm
@@ -234,16 +482,37 @@ def parse_algorithm_info(algorithm_name, target="header"):
 																							% target)
 
 
+def generate_algorithm_table(algorithms=TO_INCLUDE_ALGOS):
+	"""Generate the rows of the metadata table of the generic 'compute' entry point in the dispatcher mode, ie. the name 
+	of each algorithm followed by the space separated "<name>:<type>" lists of its inputs, outputs and parameters"""
+	rows = list()
+	logging.info("Generating the algorithm table of the dispatcher ...")
+	for algo_name in algorithms:
+		doc_dict = get_struct(algo_name)
+		fields = [doc_dict['inputs'], doc_dict['outputs'], doc_dict['parameters']]
+		for values, types in zip(fields, [DISPATCHER_IO_TYPES, DISPATCHER_IO_TYPES, DISPATCHER_PARAMETER_TYPES]):
+			for value in values:
+				if value['type'] not in types:
+					raise NotImplementedError("The dispatcher cannot marshal the type '%s' of '%s' of the algo '%s'" % (
+											value['type'], value['name'], algo_name))
+		rows.append('{"%s", %s},' % (algo_name, ', '.join('"%s"' % ' '.join("%s:%s" % (value['name'], value['type']) 
+																			for value in values) for values in fields)))
+	return rows
+
+
 def generate_headers(algorithms=TO_INCLUDE_ALGOS):
 	"""Generate a list of string where each of this string corresponds to the function declaration 
 	of each essentia algorithm in the target header file."""
 	funcs = list()
 	# we have bindings for 3 more extra algorithms with custom wrappers (MonoMixer, FrameCutter and LoudnessEBUR128) beside autogenerated ones.
 	logging.info("Total %s algorithms" % (len(TO_INCLUDE_ALGOS) + 3))
+	if dispatcher_enabled():
+		logging.info("Dispatcher mode: the algorithms are computed by 'EssentiaJS::compute'")
+		return funcs
 	logging.info("Generating essentiajs.h file ...")
-	for algo_name in algorithms:
+	for algo_name, sources in zip(algorithms, get_algorithm_sources(algorithms)):
 		logging.info(algo_name)
-		funcs.append(parse_algorithm_info(algo_name, target="header"))
+		funcs.append(sources['header'])
 	return funcs
 
 
@@ -252,21 +521,269 @@ def generate_algorithms(algorithms=TO_INCLUDE_ALGOS):
 	for the corresponding essentia algorithm."""
 	algos = list()
 	logging.info("Generating essentiajs.cpp file ...")
-	for algo_name in algorithms:
+	if dispatcher_enabled():
+		return algos
+	for algo_name, sources in zip(algorithms, get_algorithm_sources(algorithms)):
 		logging.info(algo_name)
-		algos.append(parse_algorithm_info(algo_name, target="algorithm"))
+		algos.append(sources['algorithm'])
 	# we have bindings for 3 more extra algorithms with custom wrappers (MonoMixer, FrameCutter and LoudnessEBUR128) beside autogenerated ones.
 	logging.info("Finished generating cpp source code for %s essentia algorithms" % (len(algorithms) + 3))
 	return algos
 
 
+def parse_algorithm_class(algorithm_name, target="header"):
+	"""Parse algorithm info and generate target cpp code for a persistent essentia algorithm class 
+	which is configured once and can be computed many times (eg. on every frame of an audio signal)."""
+	inputs = list()
+	doc_dict = get_struct(algorithm_name)
+	class_name = "%s%s" % (algorithm_name, ALGORITHM_CLASS_SUFFIX)
+	algo_obj = "_algorithm"
+
+	# parse inputs
+	typed_inputs = list()
+	for inp in doc_dict['inputs']:
+		inputs.append("%s %s%s" % (map_types_to_cpp_input(inp['type']), INPUT_PREFIX_ES, inp['name']))
+		typed_inputs.append("%s %s%s" % (map_types_to_cpp_typed_array(inp['type']), INPUT_PREFIX_ES, inp['name']))
+
+	# scalar inputs of the allocation-free variant, whose vector inputs are written to the buffers of the class
+	into = is_into_capable(doc_dict)
+	into_inputs = ["%s %s%s" % (map_types_to_cpp(inp['type']), INPUT_PREFIX_ES, inp['name']) 
+					for inp in doc_dict['inputs'] if inp['type'] != 'vector_real']
+
+	if target == "binding":
+		# embind expects the decayed types of the constructor arguments
+		ctor_types = [map_types_to_cpp(param['type']).replace('&', '') for param in doc_dict['parameters']]
+		binding = list()
+		binding.append('class_<%s>("%s")' % (class_name, class_name))
+		binding.append("  .constructor<%s>()" % ', '.join(ctor_types))
+		binding.append('  .function("configure", &%s::configure)' % class_name)
+		binding.append('  .function("compute", &%s::compute)' % class_name)
+		binding.append('  .function("computeTyped", &%s::computeTyped)' % class_name)
+		if into:
+			binding.append('  .function("inputBuffer", &%s::inputBuffer)' % class_name)
+			binding.append('  .function("outputBuffer", &%s::outputBuffer)' % class_name)
+			binding.append('  .function("computeInto", &%s::computeInto)' % class_name)
+		binding.append("  ;")
+		return binding
+
+	parameters, factory_params = parse_parameters(doc_dict, target=target)
+
+	if target == "header":
+		header = list()
+		header.append("// persistent wrapper of the essentia '%s' algorithm" % algorithm_name)
+		header.append("class %s {" % class_name)
+		header.append("  public:")
+		header.append("    %s(%s);" % (class_name, ', '.join(parameters)))
+		header.append("    ~%s();" % class_name)
+		header.append("    void configure(%s);" % ', '.join(parameters))
+		header.append("    %s compute(%s);" % (FUNC_RETURN_TYPE, ', '.join(inputs)))
+		header.append("    %s computeTyped(%s);" % (FUNC_RETURN_TYPE, ', '.join(typed_inputs)))
+		if into:
+			header.append("    val inputBuffer(int index, int size);")
+			header.append("    val outputBuffer(int index);")
+			header.append("    int computeInto(%s);" % ', '.join(into_inputs))
+		header.append("  private:")
+		header.append("    essentia::standard::Algorithm* %s;" % algo_obj)
+		# reusable buffers of the typed array I/O
+		for inp in doc_dict['inputs']:
+			if inp['type'] in ['vector_real', 'vector_vector_real'] + FLAT_BUFFER_TYPES:
+				header.append("    %s _%s%s;" % (map_types_to_cpp(inp['type']).replace('&', ''), 
+												INPUT_PREFIX_ES, inp['name']))
+		for out in doc_dict['outputs']:
+			header.append("    %s _%s%s;" % (map_types_to_cpp(out['type']).replace('&', ''), 
+											OUTPUT_PREFIX_ES, out['name']))
+			if out['type'] in ['vector_vector_real', 'matrix_real']:
+				header.append("    std::vector<float> _%s%s_buffer;" % (OUTPUT_PREFIX_ES, out['name']))
+		if into:
+			# scalar outputs of 'computeInto' and the memory of its output buffers at the last call
+			header.append("    std::vector<float> _outputValues;")
+			header.append("    std::vector<const float*> _outputData;")
+			header.append("    std::vector<size_t> _outputSizes;")
+		header.append("};")
+		return header
+
+	elif target == "algorithm":
+		algorithm = list()
+		# add empty line
+		algorithm.append(" ")
+		# add comment to the links of documentation
+		algorithm.append("// check https://essentia.upf.edu/reference/std_%s.html" % algorithm_name)
+		# the constructor creates and configures the algorithm only once
+		algorithm.append("%s::%s(%s) {" % (class_name, class_name, ', '.join(parameters)))
+		algorithm.append("  AlgorithmFactory& factory = standard::AlgorithmFactory::instance();")
+		if factory_params:
+			algorithm.append('  %s = factory.create("%s", %s);' % (algo_obj, 
+															algorithm_name, 
+															', '.join(factory_params)))
+		else:
+			algorithm.append('  %s = factory.create("%s");' % (algo_obj, algorithm_name))
+		if into:
+			algorithm.append("  _outputValues.resize(%s);" % len(doc_dict['outputs']))
+			algorithm.append("  _outputData.resize(%s);" % len(doc_dict['outputs']))
+			algorithm.append("  _outputSizes.resize(%s);" % len(doc_dict['outputs']))
+		algorithm.append("}")
+
+		algorithm.append("%s::~%s() {" % (class_name, class_name))
+		algorithm.append("  delete %s;" % algo_obj)
+		algorithm.append("}")
+
+		algorithm.append("void %s::configure(%s) {" % (class_name, ', '.join(parameters)))
+		algorithm.append("  ParameterMap params;")
+		for param in doc_dict['parameters']:
+			algorithm.append('  params.add("%s", %s);' % (param['name'], param['name']))
+		algorithm.append("  %s->configure(params);" % algo_obj)
+		algorithm.append("}")
+
+		algorithm.append("%s %s::compute(%s) {" % (FUNC_RETURN_TYPE, class_name, ', '.join(inputs)))
+		algorithm.extend(parse_compute(doc_dict, algorithm_name, algo_obj))
+		algorithm.append("  return output%s;" % algorithm_name)
+		algorithm.append("}")
+
+		algorithm.append("%s %s::computeTyped(%s) {" % (FUNC_RETURN_TYPE, class_name, ', '.join(typed_inputs)))
+		algorithm.extend(parse_compute_typed_array(doc_dict, algorithm_name, algo_obj))
+		algorithm.append("  return output%s;" % algorithm_name)
+		algorithm.append("}")
+
+		if into:
+			algorithm.extend(parse_compute_into(doc_dict, class_name, algo_obj, into_inputs))
+		return algorithm
+
+	else:
+		raise IOError("Given target=%s is not valid. 'target' should be either 'header', 'algorithm' or 'binding'." 
+																										% target)
+
+
+def generate_algorithm_classes(algorithms=TO_INCLUDE_ALGOS, target="header"):
+	"""Generate a list of code blocks (list of lines) for the persistent algorithm class 
+	of each essentia algorithm for the given target ('header', 'algorithm' or 'binding')."""
+	classes = list()
+	if target not in ('header', 'algorithm', 'binding'):
+		raise IOError("Given target=%s is not valid. 'target' should be either 'header', 'algorithm' or 'binding'." 
+																										% target)
+	# the persistent classes are replaced by the generic 'DispatchedAlgorithm' class in the dispatcher mode
+	if dispatcher_enabled():
+		return classes
+	logging.info("Generating persistent algorithm classes for target '%s' ..." % target)
+	for sources in get_algorithm_sources(algorithms):
+		classes.append(sources['class_%s' % target])
+	return classes
+
+
+def is_batchable(doc_dict):
+	"""Check whether an algorithm can be computed over a batch of frames, ie. it has a single 'vector_real' 
+	or 'real' input and all of its outputs can be stacked frame-wise"""
+	if len(doc_dict['inputs']) != 1 or doc_dict['inputs'][0]['type'] not in BATCH_INPUT_TYPES:
+		return False
+	if not doc_dict['outputs']:
+		return False
+	return all(out['type'] in BATCH_OUTPUT_TYPES for out in doc_dict['outputs'])
+
+
+def batch_algorithm_names(algorithms=TO_INCLUDE_ALGOS):
+	"""Returns the list of names of the algorithms for which batched variants are generated"""
+	return [algo_name for algo_name, sources in zip(algorithms, get_algorithm_sources(algorithms)) 
+			if sources['batch_header'] is not None]
+
+
+def parse_algorithm_batch(algorithm_name, target="header"):
+	"""Parse algorithm info and generate target cpp code for the batched variant of an essentia algorithm 
+	which computes a single configured algorithm instance over all the frames of a flat buffer in one call."""
+	doc_dict = get_struct(algorithm_name)
+	method_name = "%s%s" % (algorithm_name, BATCH_METHOD_SUFFIX)
+	algo_obj = "algo%s" % algorithm_name
+	inp = doc_dict['inputs'][0]
+
+	# a flat buffer of frames for 'vector_real' inputs or a buffer of values for 'real' inputs
+	inputs = ["const val& %s%s" % (INPUT_PREFIX_ES, inp['name'])]
+	if inp['type'] == 'vector_real':
+		inputs.append("const int batch_numFrames, const int batch_frameSize, const int batch_frameStride")
+
+	parameters, factory_params = parse_parameters(doc_dict, target=target)
+	func_str = "%s %s(%s)" % (FUNC_RETURN_TYPE, method_name, ', '.join(inputs + parameters))
+
+	if target == "header":
+		return func_str
+
+	elif target == "algorithm":
+		algorithm = list()
+		algorithm.append(" ")
+		algorithm.append("// batched variant of https://essentia.upf.edu/reference/std_%s.html" % algorithm_name)
+		algorithm.append("%s EssentiaJS::%s {" % (FUNC_RETURN_TYPE, func_str.split(" ", 1)[1]))
+		algorithm.append("  std::vector<float> batch_input = float32ArrayToVector(%s%s);" % (INPUT_PREFIX_ES, 
+																							inp['name']))
+		if inp['type'] == 'vector_real':
+			algorithm.append("  checkBatchFrames(batch_input.size(), batch_numFrames, batch_frameSize, batch_frameStride);")
+		else:
+			algorithm.append("  const int batch_numFrames = batch_input.size();")
+
+		if factory_params:
+			algorithm.append('  Algorithm* %s = createAlgorithm("%s", %s);' % (algo_obj, 
+																	algorithm_name, 
+																	', '.join(factory_params)))
+		else:
+			algorithm.append('  Algorithm* %s = createAlgorithm("%s");' % (algo_obj, algorithm_name))
+
+		algorithm.append("  %s frame_%s;" % (map_types_to_cpp(inp['type']).replace('&', ''), inp['name']))
+		algorithm.append('  %s->input("%s").set(frame_%s);' % (algo_obj, inp['name'], inp['name']))
+		for out in doc_dict['outputs']:
+			algorithm.append("  %s %s%s;" % (map_types_to_cpp(out['type']).replace('&', ''), 
+											OUTPUT_PREFIX_ES, 
+											out['name']))
+			algorithm.append('  %s->output("%s").set(%s%s);' % (algo_obj, out['name'], OUTPUT_PREFIX_ES, out['name']))
+			# frame-wise outputs are stacked into a vector (scalars) or a vector of vectors (vectors)
+			if out['type'] == 'vector_real':
+				algorithm.append("  std::vector<std::vector<float> > batch_%s(batch_numFrames);" % out['name'])
+			else:
+				algorithm.append("  std::vector<float> batch_%s(batch_numFrames);" % out['name'])
+
+		algorithm.append("  for (int i=0; i<batch_numFrames; i++) {")
+		if inp['type'] == 'vector_real':
+			algorithm.append("    frame_%s.assign(batch_input.begin() + i * batch_frameStride, "
+							"batch_input.begin() + i * batch_frameStride + batch_frameSize);" % inp['name'])
+		else:
+			algorithm.append("    frame_%s = batch_input[i];" % inp['name'])
+		algorithm.append("    %s->compute();" % algo_obj)
+		for out in doc_dict['outputs']:
+			algorithm.append("    batch_%s[i] = %s%s;" % (out['name'], OUTPUT_PREFIX_ES, out['name']))
+		algorithm.append("  }")
+
+		algorithm.append("  val output%s(val::object());" % method_name)
+		for out in doc_dict['outputs']:
+			algorithm.append('  output%s.set("%s", batch_%s);' % (method_name, out['name'], out['name']))
+		algorithm.append("  releaseAlgorithm(%s);" % algo_obj)
+		algorithm.append("  return output%s;" % method_name)
+		algorithm.append("}")
+		return algorithm
+
+	else:
+		raise IOError("Given target=%s is not valid. 'target' should be either 'header' or 'algorithm'." 
+																							% target)
+
+
+def generate_batch_algorithms(algorithms=TO_INCLUDE_ALGOS, target="header"):
+	"""Generate the function declarations ('header') or the cpp code ('algorithm') of the batched variants 
+	of the essentia algorithms which have a single 'vector_real' or 'real' input."""
+	batches = list()
+	if target not in ('header', 'algorithm'):
+		raise IOError("Given target=%s is not valid. 'target' should be either 'header' or 'algorithm'." 
+																							% target)
+	# the batched variants are computed by the generic 'EssentiaJS::computeBatch' entry point in the dispatcher mode
+	if dispatcher_enabled():
+		return batches
+	logging.info("Generating batched algorithm methods for target '%s' ..." % target)
+	for sources in get_algorithm_sources(batch_algorithm_names(algorithms)):
+		batches.append(sources['batch_%s' % target])
+	return batches
+
+
 def map_types_to_js(es_type):
 	if es_type in ['vector_real', 
 					'vector_complex', 
 					'matrix_real', 
+					'vector_stereosample', 
 					'vector_string']:
 		return "any[]"
-	elif es_type in ['vector_vector_real', 'vector_vector_complex', 'vector_stereosample']:
+	elif es_type in ['vector_vector_real', 'vector_vector_complex']:
 		return "VectorVectorFloat"
 	elif es_type == 'string':
 		return "string"
@@ -278,33 +795,43 @@ def map_types_to_js(es_type):
 		raise NotImplementedError("Cannot find the correspoding type for '%s'" % es_type)
 
 
-def parse_to_typescript(algorithm_name):
-	inputs = list()
-	parameters = list()
-	param_converted = list()
-	return_inputs = list()
-	return_parameters = list()	
-	comments = list()
-	algorithm = list()
-	# create the algorithm object
-	algo = getattr(estd, algorithm_name)()
-	doc_dict = algo.getStruct()
+def map_flat_buffer_types_to_js(es_type):
+	if es_type == 'vector_complex':
+		return "Float32Array"
+	elif es_type == 'matrix_real':
+		return "{data: Float32Array, shape: number[]}"
+	elif es_type == 'vector_stereosample':
+		return "Float32Array | {left: Float32Array, right: Float32Array}"
+	raise NotImplementedError("'%s' is not a flat buffer type" % es_type)
 
-	doc_link = " Check https://essentia.upf.edu/reference/std_%s.html for more details." % algorithm_name
-	# We do a shim of algorithm description for prettifying the doc
-	algo_description = doc_dict['description'].split('\n\n')[0] + doc_link
-	# add jsdoc string
-	comments.append("/**")
-	comments.append("* %s" % algo_description)
-	comments.append("* @method")
 
-	param_prefix = "* @param"
-	return_prefix = "* @returns"
+def parse_ts_output(out):
+	"""Parse an output of an essentia algorithm into its jsdoc description"""
+	if out['type'] == 'vector_complex':
+		return "%s: '%s' (interleaved real and imaginary parts as Float32Array)" % (out['name'], out['description'])
+	elif out['type'] == 'matrix_real':
+		return "%s: '%s' ({data: Float32Array, shape: [rows, cols]} in row-major order)" % (out['name'], 
+																							out['description'])
+	elif out['type'] == 'vector_stereosample':
+		return "%s: '%s' (interleaved left and right samples as Float32Array)" % (out['name'], out['description'])
+	return "%s: '%s'" % (out['name'], out['description'])
 
-	# parse input variables
+
+def parse_ts_inputs(doc_dict):
+	"""Parse the inputs of an essentia algorithm into jsdoc comments, typescript function arguments 
+	and the arguments passed to the WASM backend."""
+	comments = list()
+	inputs = list()
+	return_inputs = list()
+	param_prefix = "* @param"
 	for inp in doc_dict['inputs']:
 
-		if inp['type'] in ['vector_real', 
+		if inp['type'] in FLAT_BUFFER_TYPES:
+			js_type = map_flat_buffer_types_to_js(inp['type'])
+			inputs.append("%s: %s" % (inp['name'], js_type))
+			comments.append("%s {%s} %s %s" % (param_prefix, js_type, inp['name'], inp['description']))
+
+		elif inp['type'] in ['vector_real', 
 						'vector_complex', 
 						'matrix_real', 
 						'vector_string',
@@ -337,8 +864,18 @@ def parse_to_typescript(algorithm_name):
 												inp['description']))
 
 		return_inputs.append(inp['name'])
-		
-	# parse parameter variables
+	return comments, inputs, return_inputs
+
+
+def parse_ts_parameters(doc_dict, module="this.module"):
+	"""Parse the parameters of an essentia algorithm into jsdoc comments, typescript function arguments 
+	with default values, the lines of code converting JS arrays into vectors of the given WASM backend and 
+	the arguments passed to the WASM backend."""
+	comments = list()
+	parameters = list()
+	param_converted = list()
+	return_parameters = list()
+	param_prefix = "* @param"
 	for param in doc_dict['parameters']:
 
 		comments.append("%s {%s} [%s=%s] %s" % (param_prefix, 
@@ -348,10 +885,8 @@ def parse_to_typescript(algorithm_name):
 												param['description']))
 
 		if param['type'] in ['vector_real', 'vector_complex', 'matrix_real']:
-			param_converted.append("  let vec%s = new this.module.VectorFloat();" % param['name'])
-			param_converted.append("  for (var i=0; i<vec%s.size(); i++) {" %  param['name'])
-			param_converted.append("    vec%s.push_back(%s[i]);" % (param['name'], param['name']))
-			param_converted.append("  }")
+			# copy the whole JS array to the WASM heap at once
+			param_converted.append("  let vec%s = %s.arrayToVector(%s);" % (param['name'], module, param['name']))
 
 			parameters.append("%s: %s=%s" % (param['name'],
 											map_types_to_js(param['type']),
@@ -360,9 +895,9 @@ def parse_to_typescript(algorithm_name):
 			return_parameters.append("vec%s" % param['name'])
 
 		elif param['type'] in ['vector_string']:
-			param_converted.append("  let vec%s = new this.module.VectorString();" % param['name'])
-			param_converted.append("  for (var i=0; i<vec%s.size(); i++) {" % param['name'])
-			param_converted.append("    vec%s.push_back(%s[i]);" % param['name'])
+			param_converted.append("  let vec%s = new %s.VectorString();" % (param['name'], module))
+			param_converted.append("  for (var i=0; i<%s.length; i++) {" % param['name'])
+			param_converted.append("    vec%s.push_back(%s[i]);" % (param['name'], param['name']))
 			param_converted.append("  }")
 
 			parameters.append("%s: %s=%s" % (param['name'],
@@ -383,11 +918,63 @@ def parse_to_typescript(algorithm_name):
 											param['default']))
 
 			return_parameters.append(param['name'])
-	
+	return comments, parameters, param_converted, return_parameters
+
+
+def ts_param_vectors(doc_dict):
+	"""Returns the names of the vectors converted from the JS array parameters by `parse_ts_parameters`"""
+	return ["vec%s" % param['name'] for param in doc_dict['parameters'] 
+			if param['type'] in ['vector_real', 'vector_complex', 'matrix_real', 'vector_string']]
+
+
+def ts_param_object(doc_dict):
+	"""Returns the JS object of the parameters ({name: value}) which are passed by name to the generic entry points 
+	of the dispatcher mode, which convert the JS array parameters themselves"""
+	return "{%s}" % ', '.join("%s: %s" % (param['name'], param['name']) for param in doc_dict['parameters'])
+
+
+def parse_ts_call(call, doc_dict):
+	"""Generate the lines of typescript code returning the result of a call to the WASM backend, which free the 
+	vectors of the converted parameters (see `parse_ts_parameters`) once the call returns or throws"""
+	param_vectors = ts_param_vectors(doc_dict)
+	if not param_vectors:
+		return ["  return %s;" % call]
+	lines = ["  try {", "    return %s;" % call, "  } finally {"]
+	lines.extend("    %s.delete();" % vec for vec in param_vectors)
+	lines.append("  }")
+	return lines
+
+
+def parse_to_typescript(algorithm_name):
+	comments = list()
+	algorithm = list()
+	doc_dict = get_struct(algorithm_name)
+
+	doc_link = " Check https://essentia.upf.edu/reference/std_%s.html for more details." % algorithm_name
+	# We do a shim of algorithm description for prettifying the doc
+	algo_description = doc_dict['description'].split('\n\n')[0] + doc_link
+	# add jsdoc string
+	comments.append("/**")
+	comments.append("* %s" % algo_description)
+	comments.append("* @method")
+
+	param_prefix = "* @param"
+	return_prefix = "* @returns"
+
+	# parse input variables
+	input_comments, inputs, return_inputs = parse_ts_inputs(doc_dict)
+	comments.extend(input_comments)
+
+	# parse parameter variables
+	# the vectors of the parameters are created in the WASM backend of the algorithm group of the algorithm 
+	# (see `Essentia.getAlgorithmModule`), which may be loaded as a separate module
+	param_comments, parameters, param_converted, return_parameters = parse_ts_parameters(doc_dict, module="module")
+	comments.extend(param_comments)
+
 	# parse output variables
 	outs = list()
 	for out in doc_dict['outputs']:
-		outs.append("%s: '%s'" % (out['name'], out['description']))
+		outs.append(parse_ts_output(out))
 	comments.append("%s {object} {%s}" % (return_prefix, ', '.join(outs)))
 
 	comments.append("* @memberof Essentia")
@@ -395,28 +982,41 @@ def parse_to_typescript(algorithm_name):
 
 	if inputs and parameters:
 		func_definition = "%s(%s, %s)" % (algorithm_name, ', '.join(inputs), ', '.join(parameters))
-		return_definition = "return %s.%s(%s, %s);" % (JS_ALGORITHMS_RETURN_NAMESPACE, 
-													algorithm_name, 
-													', '.join(return_inputs), 
-													', '.join(return_parameters))
+		call = "%s.%s(%s, %s)" % (JS_ALGORITHMS_RETURN_NAMESPACE, 
+								algorithm_name, 
+								', '.join(return_inputs), 
+								', '.join(return_parameters))
 	elif inputs:
 		func_definition = "%s(%s)" % (algorithm_name, ', '.join(inputs))
-		return_definition = "return %s.%s(%s);" % (JS_ALGORITHMS_RETURN_NAMESPACE, 
-												algorithm_name, 
-												', '.join(return_inputs))
+		call = "%s.%s(%s)" % (JS_ALGORITHMS_RETURN_NAMESPACE, 
+							algorithm_name, 
+							', '.join(return_inputs))
 	else:
 		func_definition = "%s(%s)" % (algorithm_name, ', '.join(parameters))
-		return_definition = "return %s.%s(%s);" % (JS_ALGORITHMS_RETURN_NAMESPACE, 
-												algorithm_name, 
-												', '.join(return_parameters))
+		call = "%s.%s(%s)" % (JS_ALGORITHMS_RETURN_NAMESPACE, 
+							algorithm_name, 
+							', '.join(return_parameters))
 
 	algorithm.extend(comments)
 	algorithm.append("%s {" % func_definition)
 
+	if dispatcher_enabled():
+		# the typed method is a facade of the generic entry point, which takes the parameters by name 
+		# and converts the JS array parameters itself
+		call = "%s.compute('%s', %s, [%s])" % (JS_ALGORITHMS_RETURN_NAMESPACE, 
+											algorithm_name, 
+											ts_param_object(doc_dict), 
+											', '.join(return_inputs))
+		algorithm.append("  return this.track(%s);" % call)
+		algorithm.append("}")
+		return algorithm
+
 	if param_converted:
+		algorithm.append("  const module = this.getAlgorithmModule('%s');" % algorithm_name)
 		algorithm.extend(param_converted)
 
-	algorithm.append("  %s" % return_definition)  
+	# the output vectors are freed by the enclosing `scope` call, if any
+	algorithm.extend(parse_ts_call("this.track(%s)" % call, doc_dict))
 	algorithm.append("}")
 	return algorithm
 
@@ -424,8 +1024,466 @@ def parse_to_typescript(algorithm_name):
 def generate_typescript_wrapper(algorithms=TO_INCLUDE_ALGOS):
 	algos = list()
 	logging.info("Generating typescript wrapper ...")
-	for algo_name in algorithms:
-		algos.append(parse_to_typescript(algo_name))
+	for sources in get_algorithm_sources(algorithms):
+		algos.append(sources['typescript'])
 	# we have bindings for 3 more extra algorithms (MonoMixer, FrameCutter and LoudnessEBUR128) beside autogenerated ones.
 	logging.info("Finished generating typescript wrapper for %s essentia algorithms" % (len(algorithms) + 3))
 	return algos
+
+
+def parse_to_typescript_class(algorithm_name):
+	"""Generate the typescript wrapper class of a persistent essentia algorithm class"""
+	comments = list()
+	algorithm = list()
+	doc_dict = get_struct(algorithm_name)
+	class_name = "%s%s" % (algorithm_name, ALGORITHM_CLASS_SUFFIX)
+
+	doc_link = " Check https://essentia.upf.edu/reference/std_%s.html for more details." % algorithm_name
+	algo_description = doc_dict['description'].split('\n\n')[0] + doc_link
+
+	input_comments, inputs, return_inputs = parse_ts_inputs(doc_dict)
+	param_comments, parameters, param_converted, return_parameters = parse_ts_parameters(doc_dict)
+
+	outs = list()
+	for out in doc_dict['outputs']:
+		outs.append(parse_ts_output(out))
+
+	# inputs of the typed array I/O
+	typed_inputs = list()
+	typed_input_comments = list()
+	for inp in doc_dict['inputs']:
+		if inp['type'] in ['vector_real', 'vector_vector_real']:
+			js_type = "Float32Array" if inp['type'] == 'vector_real' else "{data: Float32Array, shape: number[]}"
+			typed_inputs.append("%s: %s" % (inp['name'], js_type))
+			typed_input_comments.append("* @param {%s} %s %s" % (js_type, inp['name'], inp['description']))
+		else:
+			typed_inputs.append(inputs[return_inputs.index(inp['name'])])
+			typed_input_comments.append(input_comments[return_inputs.index(inp['name'])])
+
+	# jsdoc of the class and its constructor
+	comments.append("/**")
+	comments.append("* Configure-once, compute-many wrapper of the '%s' algorithm. %s" % (algorithm_name, 
+																						algo_description))
+	comments.append("* @class")
+	comments.append("* @param {EssentiaWASM} EssentiaWASM Essentia WASM backend (emcripten global module object)")
+	comments.extend(param_comments)
+	comments.append("* @memberof Essentia")
+	comments.append("*/")
+
+	into = is_into_capable(doc_dict)
+	scalar_inputs = [inp['name'] for inp in doc_dict['inputs'] if inp['type'] != 'vector_real']
+
+	# arguments of the calls of the algorithm instance
+	param_vectors = ts_param_vectors(doc_dict)
+	instance_params = ', '.join(return_parameters)
+	instance_inputs = ', '.join(return_inputs)
+	into_inputs = ', '.join(scalar_inputs)
+	instance_class = class_name
+	if dispatcher_enabled():
+		# the generic class of the dispatcher mode takes the name of the algorithm, the parameters by name 
+		# and the inputs as an array
+		param_converted = list()
+		param_vectors = list()
+		instance_params = ts_param_object(doc_dict)
+		instance_inputs = "[%s]" % instance_inputs
+		into_inputs = "[%s]" % into_inputs
+		instance_class = DISPATCHED_ALGORITHM_CLASS
+		return_parameters = ["'%s'" % algorithm_name, instance_params]
+
+	algorithm.extend(comments)
+	algorithm.append("export class %s {" % class_name)
+	algorithm.append("  private algoInstance: any;")
+	if into:
+		algorithm.append("  private buffers: AlgorithmBuffers;")
+	algorithm.append("  public module: any;")
+	algorithm.append(" ")
+	algorithm.append("  constructor(EssentiaWASM: any%s) {" % ''.join(', %s' % p for p in parameters))
+	algorithm.append("    this.module = EssentiaWASM;")
+	algorithm.extend("  %s" % ln for ln in param_converted)
+	algorithm.append("    this.algoInstance = new this.module.%s(%s);" % (instance_class, ', '.join(return_parameters)))
+	# the algorithm is configured with copies of the parameters
+	algorithm.extend("    %s.delete();" % vec for vec in param_vectors)
+	if into:
+		algorithm.append("    this.buffers = new AlgorithmBuffers(this.algoInstance);")
+	algorithm.append("  }")
+	algorithm.append(" ")
+	algorithm.append("  /**")
+	algorithm.append("  * Reconfigure the algorithm with new parameter values")
+	algorithm.append("  * @method")
+	algorithm.extend("  %s" % ln for ln in param_comments)
+	algorithm.append("  */")
+	algorithm.append("  configure(%s) {" % ', '.join(parameters))
+	algorithm.extend("  %s" % ln for ln in param_converted)
+	algorithm.append("    this.algoInstance.configure(%s);" % instance_params)
+	algorithm.extend("    %s.delete();" % vec for vec in param_vectors)
+	algorithm.append("  }")
+	algorithm.append(" ")
+	algorithm.append("  /**")
+	algorithm.append("  * Compute the algorithm with the current configuration")
+	algorithm.append("  * @method")
+	algorithm.extend("  %s" % ln for ln in input_comments)
+	algorithm.append("  * @returns {object} {%s}" % ', '.join(outs))
+	algorithm.append("  */")
+	algorithm.append("  compute(%s) {" % ', '.join(inputs))
+	algorithm.append("    return this.algoInstance.compute(%s);" % instance_inputs)
+	algorithm.append("  }")
+	algorithm.append(" ")
+	algorithm.append("  /**")
+	algorithm.append("  * Compute the algorithm with typed array inputs. Array outputs are returned as Float32Array views on the WASM heap ")
+	algorithm.append("  * (matrices as {data, shape} in row-major order, or {data, lengths} with the lengths of their rows if they have rows ")
+	algorithm.append("  * of different sizes) which are only valid until the next call of the instance.")
+	algorithm.append("  * @method")
+	algorithm.extend("  %s" % ln for ln in typed_input_comments)
+	algorithm.append("  * @returns {object} {%s}" % ', '.join(outs))
+	algorithm.append("  */")
+	algorithm.append("  computeTyped(%s) {" % ', '.join(typed_inputs))
+	algorithm.append("    return this.algoInstance.computeTyped(%s);" % instance_inputs)
+	algorithm.append("  }")
+	algorithm.append(" ")
+	if into:
+		output_buffers = ["%s?: Float32Array" % out['name'] for out in doc_dict['outputs']]
+		algorithm.append("  /**")
+		algorithm.append("  * Register the preallocated buffers which the outputs of `computeInto` are written to, where the scalar outputs ")
+		algorithm.append("  * are written to the first element of their buffer. The outputs without a buffer are not copied.")
+		algorithm.append("  * @method")
+		algorithm.append("  * @param {object} outputs {%s}" % ', '.join(output_buffers))
+		algorithm.append("  */")
+		algorithm.append("  setOutputBuffers(outputs: {%s}): void {" % ', '.join(output_buffers))
+		algorithm.append("    this.buffers.outputs = [%s];" % ', '.join("outputs.%s" % out['name'] for out in doc_dict['outputs']))
+		algorithm.append("  }")
+		algorithm.append(" ")
+		algorithm.append("  /**")
+		algorithm.append("  * Allocation-free variant of `computeTyped` for real-time use (eg. in the `process` method of an AudioWorkletProcessor), ")
+		algorithm.append("  * which copies the inputs to buffers reused across calls and writes the outputs to the buffers registered with `setOutputBuffers`.")
+		algorithm.append("  * @method")
+		algorithm.extend("  %s" % ln for ln in typed_input_comments)
+		algorithm.append("  */")
+		algorithm.append("  computeInto(%s): void {" % ', '.join(typed_inputs))
+		for i, inp in enumerate(doc_dict['inputs']):
+			if inp['type'] == 'vector_real':
+				algorithm.append("    this.buffers.setInput(%s, %s);" % (i, inp['name']))
+		algorithm.append("    this.buffers.copyOutputs(this.algoInstance.computeInto(%s));" % into_inputs)
+		algorithm.append("  }")
+		algorithm.append(" ")
+	algorithm.append("  /**")
+	algorithm.append("  * Delete the algorithm instance and free its memory from the WASM heap")
+	algorithm.append("  * @method")
+	algorithm.append("  */")
+	algorithm.append("  delete(): void {")
+	algorithm.append("    this.algoInstance.delete();")
+	algorithm.append("  }")
+	algorithm.append("}")
+	return algorithm
+
+
+def benchmark_inputs(algorithm_name):
+	"""Returns the names and types of the inputs of an algorithm along with the sizes of the vector inputs 
+	which depend on its default parameters (None for the default size)"""
+	doc_dict = get_struct(algorithm_name)
+	defaults = dict((param['name'], param['default']) for param in doc_dict['parameters'])
+	inputs = list()
+	for inp in doc_dict['inputs']:
+		size = None
+		for input_name, param_name, input_size in BENCHMARK_INPUT_SIZES:
+			if inp['name'] == input_name and param_name in defaults:
+				size = input_size(int(float(defaults[param_name])))
+				break
+		inputs.append((inp['name'], inp['type'], size))
+	return inputs
+
+
+def parse_benchmark_case(algorithm_name):
+	"""Generate the benchmark case of an algorithm, ie. a JS object literal with the names and types of its inputs 
+	along with the sizes of the vector inputs which depend on the default parameters (null for the default size)"""
+	doc_dict = get_struct(algorithm_name)
+	inputs = ["{name: '%s', type: '%s', size: %s}" % (name, es_type, 'null' if size is None else size) 
+			for name, es_type, size in benchmark_inputs(algorithm_name)]
+	return "{name: '%s', inputs: [%s], outputs: [%s]}," % (algorithm_name, 
+														', '.join(inputs), 
+														', '.join("'%s'" % out['name'] for out in doc_dict['outputs']))
+
+
+def generate_benchmark_cases(algorithms=TO_INCLUDE_ALGOS):
+	"""Generate the benchmark cases of the algorithms for the node benchmark suite (see benchmarks/run.js)"""
+	logging.info("Generating benchmark cases ...")
+	return [parse_benchmark_case(algo_name) for algo_name in algorithms]
+
+
+def generate_typescript_algorithm_groups(algorithms=TO_INCLUDE_ALGOS):
+	"""Generate the entries of the typescript map of the algorithm groups to the names of their algorithms"""
+	groups = list()
+	for group, algos in algorithm_groups(algorithms).items():
+		groups.append("%s: [%s]," % (group, ', '.join("'%s'" % algo_name for algo_name in algos)))
+	return groups
+
+
+def generate_typescript_algorithm_inputs(algorithms=TO_INCLUDE_ALGOS):
+	"""Generate the entries of the typescript map of the algorithms to the essentia types of their inputs"""
+	inputs = list()
+	for algo_name in algorithms:
+		doc_dict = get_struct(algo_name)
+		inputs.append("%s: [%s]," % (algo_name, ', '.join("'%s'" % inp['type'] for inp in doc_dict['inputs'])))
+	return inputs
+
+
+def generate_typescript_streaming_algorithms(algorithms=TO_INCLUDE_ALGOS):
+	"""Generate the entries of the typescript map of the essentia streaming mode algorithms to the essentia types 
+	of their inputs and outputs, for the included algorithms which have a streaming mode implementation"""
+	entries = list()
+	logging.info("Generating the streaming algorithm table ...")
+	streaming_names = set(streaming_algorithm_names())
+	for algo_name in algorithms:
+		if algo_name not in streaming_names:
+			continue
+		doc_dict = get_streaming_struct(algo_name)
+		entries.append("%s: {inputs: {%s}, outputs: {%s}}," % (algo_name, 
+															', '.join("%s: '%s'" % (inp['name'], inp['type']) 
+																	for inp in doc_dict['inputs']), 
+															', '.join("%s: '%s'" % (out['name'], out['type']) 
+																	for out in doc_dict['outputs'])))
+	return entries
+
+
+def generate_typescript_class_wrapper(algorithms=TO_INCLUDE_ALGOS):
+	algos = list()
+	logging.info("Generating typescript wrapper for the persistent algorithm classes ...")
+	for sources in get_algorithm_sources(algorithms):
+		algos.append(sources['typescript_class'])
+	return algos
+
+
+def parse_to_typescript_batch(algorithm_name):
+	"""Generate the typescript wrapper method of the batched variant of an essentia algorithm"""
+	comments = list()
+	algorithm = list()
+	doc_dict = get_struct(algorithm_name)
+	method_name = "%s%s" % (algorithm_name, BATCH_METHOD_SUFFIX)
+	inp = doc_dict['inputs'][0]
+
+	doc_link = " Check https://essentia.upf.edu/reference/std_%s.html for more details." % algorithm_name
+	algo_description = doc_dict['description'].split('\n\n')[0] + doc_link
+
+	comments.append("/**")
+	comments.append("* Batched variant of '%s' which computes a single configured algorithm instance over all the frames "
+					"of a flat buffer in one call. %s" % (algorithm_name, algo_description))
+	comments.append("* @method")
+	inputs = ["%s: Float32Array" % inp['name']]
+	return_inputs = [inp['name']]
+	if inp['type'] == 'vector_real':
+		comments.append("* @param {Float32Array} %s flat buffer of the frames of %s" % (inp['name'], inp['description']))
+		comments.append("* @param {number} numFrames number of frames in the buffer")
+		comments.append("* @param {number} frameLength number of values of each frame")
+		comments.append("* @param {number} [frameStride=frameLength] offset between the starts of two consecutive frames")
+		inputs.extend(["numFrames: number", "frameLength: number", "frameStride: number=frameLength"])
+		return_inputs.extend(["numFrames", "frameLength", "frameStride"])
+	else:
+		comments.append("* @param {Float32Array} %s buffer of the frame-wise values of %s" % (inp['name'], inp['description']))
+
+	# the vectors of the parameters are created in the WASM backend of the algorithm group of the algorithm 
+	# (see `Essentia.getAlgorithmModule`), which may be loaded as a separate module
+	param_comments, parameters, param_converted, return_parameters = parse_ts_parameters(doc_dict, module="module")
+	comments.extend(param_comments)
+
+	outs = list()
+	for out in doc_dict['outputs']:
+		stacked_type = "VectorVectorFloat" if out['type'] == 'vector_real' else "VectorFloat"
+		outs.append("%s: '%s' (stacked frame-wise as %s)" % (out['name'], out['description'], stacked_type))
+	comments.append("* @returns {object} {%s}" % ', '.join(outs))
+	comments.append("* @memberof Essentia")
+	comments.append("*/")
+
+	algorithm.extend(comments)
+	algorithm.append("%s(%s) {" % (method_name, ', '.join(inputs + parameters)))
+	if dispatcher_enabled():
+		# the batched method is a facade of the generic batch entry point, which derives the frames of 'real' inputs 
+		# from the length of the buffer
+		if inp['type'] != 'vector_real':
+			return_inputs.extend(["%s.length" % inp['name'], "1", "1"])
+		call = "%s.computeBatch('%s', %s, %s)" % (JS_ALGORITHMS_RETURN_NAMESPACE, 
+												algorithm_name, 
+												ts_param_object(doc_dict), 
+												', '.join(return_inputs))
+		algorithm.append("  return this.track(%s);" % call)
+		algorithm.append("}")
+		return algorithm
+	if param_converted:
+		algorithm.append("  const module = this.getAlgorithmModule('%s');" % algorithm_name)
+		algorithm.extend(param_converted)
+	algorithm.extend(parse_ts_call("this.track(%s.%s(%s))" % (JS_ALGORITHMS_RETURN_NAMESPACE, 
+															method_name, 
+															', '.join(return_inputs + return_parameters)), 
+								doc_dict))
+	algorithm.append("}")
+	return algorithm
+
+
+def generate_typescript_batch_wrapper(algorithms=TO_INCLUDE_ALGOS):
+	algos = list()
+	logging.info("Generating typescript wrapper for the batched algorithm methods ...")
+	for sources in get_algorithm_sources(batch_algorithm_names(algorithms)):
+		algos.append(sources['typescript_batch'])
+	return algos
+
+
+# hash of the code generator itself, so that any change to it invalidates the cached code of all the algorithms
+with open(os.path.abspath(__file__), 'rb') as f:
+	GENERATOR_HASH = hashlib.sha1(f.read()).hexdigest()
+
+# generated code of the algorithms in the current process
+_sources = dict()
+
+
+def algorithm_hash(algorithm_name):
+	"""Returns a content hash of the metadata of an algorithm and of the code generator"""
+	doc_json = json.dumps(get_struct(algorithm_name), sort_keys=True, default=str)
+	# the profiling instrumentation and the dispatcher mode change the generated code as well
+	options = ("profiling" if profiling_enabled() else "") + ("dispatcher" if dispatcher_enabled() else "")
+	return hashlib.sha1((GENERATOR_HASH + options + doc_json).encode('utf-8')).hexdigest()
+
+
+def generate_algorithm_sources(algorithm_name):
+	"""Generate all the code of an essentia algorithm, ie. the method declaration and definition, the persistent class, 
+	the batched variant (if any) and the corresponding typescript wrappers as a dict of code blocks"""
+	batchable = is_batchable(get_struct(algorithm_name))
+	return dict(header=parse_algorithm_info(algorithm_name, target="header"),
+				algorithm=parse_algorithm_info(algorithm_name, target="algorithm"),
+				class_header=parse_algorithm_class(algorithm_name, target="header"),
+				class_algorithm=parse_algorithm_class(algorithm_name, target="algorithm"),
+				class_binding=parse_algorithm_class(algorithm_name, target="binding"),
+				batch_header=parse_algorithm_batch(algorithm_name, target="header") if batchable else None,
+				batch_algorithm=parse_algorithm_batch(algorithm_name, target="algorithm") if batchable else None,
+				typescript=parse_to_typescript(algorithm_name),
+				typescript_class=parse_to_typescript_class(algorithm_name),
+				typescript_batch=parse_to_typescript_batch(algorithm_name) if batchable else None)
+
+
+def _update_algorithm_sources(job):
+	"""Generate the code of an algorithm unless its content hash matches with the cached one. 
+	Runs in the worker processes of `get_algorithm_sources`."""
+	algorithm_name, cached_hash = job
+	content_hash = algorithm_hash(algorithm_name)
+	if content_hash == cached_hash:
+		return algorithm_name, content_hash, None
+	return algorithm_name, content_hash, generate_algorithm_sources(algorithm_name)
+
+
+def load_codegen_cache(cache_file=CODEGEN_CACHE_FILE):
+	if not os.path.exists(cache_file):
+		return dict()
+	try:
+		with open(cache_file) as f:
+			return json.load(f)
+	except ValueError:
+		logging.warning("Ignoring the invalid code generation cache '%s'" % cache_file)
+		return dict()
+
+
+def save_codegen_cache(cache, cache_file=CODEGEN_CACHE_FILE):
+	with open(cache_file, 'w') as f:
+		json.dump(cache, f)
+
+
+def codegen_jobs():
+	"""Returns the number of parallel code generation processes"""
+	if os.environ.get(CODEGEN_JOBS_ENV_VAR):
+		return max(1, int(os.environ[CODEGEN_JOBS_ENV_VAR]))
+	return multiprocessing.cpu_count()
+
+
+def get_algorithm_sources(algorithms=TO_INCLUDE_ALGOS):
+	"""Returns the generated code (see `generate_algorithm_sources`) of the given algorithms. 
+	Only the algorithms whose metadata or code generator changed since the last run are generated again, 
+	in parallel using a pool of processes, the others are read from the on-disk cache (CODEGEN_CACHE_FILE)."""
+	missing = [algo_name for algo_name in algorithms if algo_name not in _sources]
+	if missing:
+		cache = load_codegen_cache()
+		jobs = [(algo_name, cache[algo_name]['hash'] if algo_name in cache else None) for algo_name in missing]
+		num_processes = min(codegen_jobs(), len(jobs))
+		# worker processes are forked so that they share the loaded metadata and modules of the current process
+		if num_processes > 1 and 'fork' in multiprocessing.get_all_start_methods():
+			get_manifest()
+			pool = multiprocessing.get_context('fork').Pool(num_processes)
+			try:
+				results = pool.map(_update_algorithm_sources, jobs)
+			finally:
+				pool.close()
+				pool.join()
+		else:
+			results = [_update_algorithm_sources(job) for job in jobs]
+
+		updated = list()
+		for algo_name, content_hash, sources in results:
+			if sources is None:
+				sources = cache[algo_name]['sources']
+			else:
+				cache[algo_name] = dict(hash=content_hash, sources=sources)
+				updated.append(algo_name)
+			_sources[algo_name] = sources
+		logging.info("Generated the code of %s algorithms, reused the cached code of %s algorithms" 
+					% (len(updated), len(results) - len(updated)))
+		if updated:
+			save_codegen_cache(cache)
+	return [_sources[algo_name] for algo_name in algorithms]
+
+
+def split_sources_enabled():
+	"""Check whether the split sources mode (one cpp file per algorithm) is enabled"""
+	return os.environ.get(SPLIT_SOURCES_ENV_VAR, '').lower() in ('1', 'true', 'yes')
+
+
+def generate_split_source(sources):
+	"""Generate the cpp source file of an algorithm for the split sources mode from its generated code 
+	(see `generate_algorithm_sources`), ie. its method, batched variant and persistent class definitions"""
+	lines = ["// NOTE: This source code is machine-generated. Do not edit.", 
+			"",
+			"#include <essentia/algorithmfactory.h>",
+			"#include <essentia/essentiamath.h>",
+			'#include "../essentiajs.h"',
+			'#include "../algorithm_cache.h"',
+			"",
+			"using namespace essentia;",
+			"using namespace essentia::standard;"]
+	# the algorithm methods, batched variants and persistent classes are replaced by the generic 'compute' and 
+	# 'computeBatch' entry points and 'DispatchedAlgorithm' class in the dispatcher mode
+	if not dispatcher_enabled():
+		lines.extend(sources['algorithm'])
+		if sources['batch_algorithm']:
+			lines.extend(sources['batch_algorithm'])
+		lines.append(" ")
+		lines.extend(sources['class_algorithm'])
+	return '\n'.join(lines) + '\n'
+
+
+def update_split_sources(algorithms=TO_INCLUDE_ALGOS, output_dir=SPLIT_SOURCES_DIR):
+	"""Write the cpp source file of each algorithm to the output directory in the split sources mode. 
+	Only the files whose content changed are written, so that their timestamps only change (and make only recompiles them) 
+	if their code changed. The stale files of the algorithms which are not included anymore are removed, 
+	as well as all of the files if the split sources mode is disabled. Returns whether the split sources mode is enabled."""
+	# the algorithm group modules are always generated in a single source file, leaving the split sources untouched
+	if ALGORITHM_GROUP:
+		return False
+	split = split_sources_enabled()
+	stale = set()
+	if os.path.isdir(output_dir):
+		stale = set(f for f in os.listdir(output_dir) if f.endswith('.cpp'))
+	if split:
+		if not os.path.isdir(output_dir):
+			os.makedirs(output_dir)
+		written = 0
+		for algo_name, sources in zip(algorithms, get_algorithm_sources(algorithms)):
+			source_file = "%s.cpp" % algo_name
+			stale.discard(source_file)
+			source = generate_split_source(sources)
+			source_path = os.path.join(output_dir, source_file)
+			if os.path.exists(source_path):
+				with open(source_path) as f:
+					if f.read() == source:
+						continue
+			with open(source_path, 'w') as f:
+				f.write(source)
+			written += 1
+		logging.info("Updated %s of %s algorithm source files in '%s'" % (written, len(algorithms), output_dir))
+	for source_file in sorted(stale):
+		logging.info("Removing the stale algorithm source file '%s'" % source_file)
+		os.remove(os.path.join(output_dir, source_file))
+	return split
@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 import os
+import json
 import argparse
-import essentia.standard as estd
+from collections import OrderedDict
+from algorithm_metadata import algorithm_names, export_metadata, get_struct, METADATA_ENV_VAR
 
 def read_txt_file(txt_file):
     """read a text file and strips \n char from it"""
@@ -20,7 +22,7 @@ TO_EXCLUDE_ALGOS_TXT_FILE = "excluded_algos.md"
 
 # essentia algorithms that are excluded by default 
 # some of them are excluded because of either third party dependencies or the need file I/O access
-# some of them have matrix-real input types which are not supported for the embind wrappers
+# some of them have vector_vector_complex types which are not supported for the embind wrappers
 # see https://github.com/MTG/essentia.js/issues/27
 DEFAULT_EXCLUDE_ALGOS = [# requires FFTW, TagLib or Chromaprint dependencies
                         'MonoLoader', 'AudioLoader', 'EasyLoader', 'MonoWriter', 'MonoMixer', 'EqloudLoader', 'AudioWriter',
@@ -30,13 +32,10 @@ DEFAULT_EXCLUDE_ALGOS = [# requires FFTW, TagLib or Chromaprint dependencies
                         # requires Gaia and Tensorflow dependencies
                         'GaiaTransform', 'MusicExtractorSVM', 
                         'TensorflowPredict', 'TensorflowPredictMusiCNN', 'TensorflowPredictVGGish',
-                        # these algortihms expect a matrix_real input or output types which are not yet supported for the JS bindings 
-                        'BpmHistogram', 'FadeDetection', 'HumDetector', 'Onsets', 'Panning', 'SBic', 'SingleGaussian',
-                        # these algorithms expect std::complex** type for wither input, parameters or outputs, which are not yet supported for the JS bindings 
-                        'CartesianToPolar', 'PolarToCartesian', 'Magnitude', 'ConstantQ', 'NSGConstantQ', 'NSGIConstantQ', 
-                        'FFT', 'IFFT', 'FFTC', 'IFFTC', 'HarmonicMask', 'HarmonicModelAnal', 'SineModelAnal', 'SineModelSynth',
-                        # expect vector_stereosample type
-                        'FalseStereoDetector', 'LoudnessEBUR128', 'StereoDemuxer', 'StereoMuxer', 'StereoTrimmer',
+                        # these algorithms expect std::vector<std::vector<std::complex> > type for either input or outputs, which are not yet supported for the JS bindings 
+                        'NSGConstantQ', 'NSGIConstantQ', 
+                        # wrapped by custom methods of EssentiaJS which take the left and right channels separately
+                        'LoudnessEBUR128',
                         ]
 
 # create a default file for exclude algo list file in case there is none
@@ -47,15 +46,54 @@ if not os.path.exists(TO_EXCLUDE_ALGOS_TXT_FILE):
 # (due to FFTW dependency or need of filesystem access etc) 
 TO_EXCLUDE_ALGOS = read_txt_file(TO_EXCLUDE_ALGOS_TXT_FILE)
 
-# By default, we include all the algorithms from essentia except ones that are in exclude algo list
-DEFAULT_INCLUDE_ALGOS = [al for al in estd.algorithmNames() if al not in TO_EXCLUDE_ALGOS]
+def default_include_algos():
+    """By default, we include all the algorithms from essentia except ones that are in exclude algo list"""
+    return [al for al in algorithm_names() if al not in TO_EXCLUDE_ALGOS]
+
 # create a default to include algo list file in case there is none
 if not os.path.exists(TO_INCLUDE_ALGOS_TXT_FILE): 
-    savelist_to_file(DEFAULT_INCLUDE_ALGOS, TO_INCLUDE_ALGOS_TXT_FILE)
+    savelist_to_file(default_include_algos(), TO_INCLUDE_ALGOS_TXT_FILE)
 
 # Here we only include essentia algorithms that need in the corresponding js bindings (default)
 TO_INCLUDE_ALGOS = read_txt_file(TO_INCLUDE_ALGOS_TXT_FILE)
 
+ALGORITHM_GROUPS_JSON_FILE = "algorithm_groups.json"
+
+# algorithm groups which can be built as separate WASM modules and loaded on demand (see --groups), 
+# by default the algorithms are grouped by their essentia category and the uncategorised ones belong to 'core'
+DEFAULT_ALGORITHM_GROUPS = OrderedDict([
+                        ('core', ['Standard', 'Math', 'Statistics', 'Filters', 'Input/output', 'Duration/silence', 
+                                  'Envelope/SFX', 'Loudness/dynamics', 'Audio Problems']),
+                        ('spectral', ['Spectral', 'Synthesis', 'Extractors', 'Segmentation']),
+                        ('tonal', ['Tonal', 'Pitch', 'Music Similarity']),
+                        ('rhythm', ['Rhythm']),
+                        ])
+
+# environment variable with the name of the algorithm group for which the code is generated (see --groups)
+ALGORITHM_GROUP_ENV_VAR = "ESSENTIAJS_ALGORITHM_GROUP"
+
+def algorithm_groups(algorithms):
+    """Returns an ordered dict of the algorithm groups and their algorithms, using the groups of algorithm_groups.json 
+    if there is one and the default groups of their essentia category otherwise"""
+    custom_groups = dict()
+    if os.path.exists(ALGORITHM_GROUPS_JSON_FILE):
+        with open(ALGORITHM_GROUPS_JSON_FILE) as f:
+            for group, algos in json.load(f, object_pairs_hook=OrderedDict).items():
+                custom_groups.update((al, group) for al in algos)
+    groups = OrderedDict((group, []) for group in DEFAULT_ALGORITHM_GROUPS)
+    for al in algorithms:
+        group = custom_groups.get(al)
+        if group is None:
+            category = get_struct(al).get('category')
+            group = next((gr for gr, categories in DEFAULT_ALGORITHM_GROUPS.items() if category in categories), 'core')
+        groups.setdefault(group, []).append(al)
+    return OrderedDict((group, algos) for group, algos in groups.items() if algos or group == 'core')
+
+# only include the algorithms of a single group while generating the code of an algorithm group module
+ALGORITHM_GROUP = os.environ.get(ALGORITHM_GROUP_ENV_VAR)
+if ALGORITHM_GROUP:
+    TO_INCLUDE_ALGOS = algorithm_groups(TO_INCLUDE_ALGOS)[ALGORITHM_GROUP]
+
 
 if __name__ == '__main__':
     import subprocess
@@ -71,10 +109,90 @@ if __name__ == '__main__':
     parser.add_argument("-e", "--exclude-algos", action="store",
                         help='Either a text file with list of names of essentia algos to be excluded (refer excluded_algos.md file) \
 							or a str(list) of names of essentia (eg. "["HPCP", "Key"]").')
+    parser.add_argument("-m", "--metadata", action="store",
+                        help='Generate the code from a JSON manifest of the essentia algorithm metadata (see --export-metadata) \
+							instead of the essentia python bindings.')
+    parser.add_argument("--export-metadata", action="store",
+                        help='Export the metadata of all the essentia algorithms to the given JSON manifest file and exit.')
+    parser.add_argument("-j", "--jobs", action="store", type=int,
+                        help='Number of parallel processes used to generate the code of the algorithms (defaults to the number of cpus).')
+    parser.add_argument("--groups", action="store_true",
+                        help='Also generate the cpp source code of each algorithm group (see algorithm_groups.json) in src/cpp/groups/<group>, \
+							which can be built as separate WASM modules (make -f Makefile.essentiajs build-groups) and loaded on demand.')
+    parser.add_argument("--group-library-algos", action="store", metavar="ESSENTIA_SRC",
+                        help='Resolve the essentia algorithms created by the generated sources of each algorithm group (see --groups) \
+							and their dependencies in the given checkout of the essentia sources, write them to \
+							src/cpp/groups/<group>/essentia_algos.txt (the --include-algos list of the essentia build of the group, \
+							see make -f Makefile.essentiajs build-group-libs) and exit.')
+    parser.add_argument("--split-sources", action="store_true",
+                        help='Generate the cpp code of each algorithm in a separate source file (src/cpp/includes/algorithms/<algorithm>.cpp), \
+							so that the incremental builds only recompile the algorithms whose code changed.')
+    parser.add_argument("--profiling", action="store_true",
+                        help='Instrument the generated algorithm methods with timers and byte counters of their create, input, compute \
+							and output phases, which are aggregated per algorithm and returned by Essentia.profile().')
+    parser.add_argument("--dispatcher", action="store_true",
+                        help='Generate a compact metadata table of the algorithms and a single generic compute(name, params, inputs) \
+							entry point instead of one cpp method and embind function per algorithm, which shrinks the WASM binary and \
+							speeds up its instantiation. The typed methods of core_api.ts are generated as a facade of the entry point.')
+    parser.add_argument("--scan-usage", action="store", nargs="+", metavar="ENTRY_POINT",
+                        help='Only include the algorithms called by the given JS/TS entry points (files or directories), the modules \
+							which they import and the add-on modules which they use (see algorithm_usage.py), ie. write a minimal \
+							included_algos.md for the smallest WASM build of an application.')
+    parser.add_argument("--parity-fixtures", action="store", metavar="FIXTURES_FILE",
+                        help='Compute the included algorithms with the essentia python bindings on synthetic inputs, write their inputs, \
+							outputs and compute times to the given JSON fixtures file for the WASM-vs-native parity report \
+							(node benchmarks/parity.js --fixtures FIXTURES_FILE) and exit.')
 
     cmd_args = parser.parse_args()
 
-    if cmd_args.include_algos:
+    if cmd_args.dispatcher and (cmd_args.groups or cmd_args.profiling):
+        parser.error("the dispatcher mode cannot be combined with --groups or --profiling")
+
+    if cmd_args.scan_usage and cmd_args.include_algos:
+        parser.error("--scan-usage cannot be combined with --include-algos")
+
+    if cmd_args.export_metadata:
+        export_metadata(cmd_args.export_metadata)
+        parser.exit()
+
+    if cmd_args.parity_fixtures:
+        from parity_fixtures import write_parity_fixtures
+        write_parity_fixtures(cmd_args.parity_fixtures, TO_INCLUDE_ALGOS)
+        parser.exit()
+
+    if cmd_args.group_library_algos:
+        if not os.path.exists(ALGORITHM_GROUPS_JSON_FILE):
+            parser.error("the algorithm groups are not generated, run configure_bindings.py --groups first")
+        from group_libraries import write_group_library_algos
+        with open(ALGORITHM_GROUPS_JSON_FILE) as f:
+            groups = json.load(f, object_pairs_hook=OrderedDict)
+        write_group_library_algos(os.path.join("..", "cpp", "groups"), groups, cmd_args.group_library_algos)
+        parser.exit()
+
+    if cmd_args.metadata:
+        # the environment variable is inherited by the cog subprocess
+        os.environ[METADATA_ENV_VAR] = os.path.abspath(cmd_args.metadata)
+
+    if cmd_args.jobs:
+        os.environ["ESSENTIAJS_CODEGEN_JOBS"] = str(cmd_args.jobs)
+
+    if cmd_args.split_sources:
+        os.environ["ESSENTIAJS_SPLIT_SOURCES"] = "1"
+
+    if cmd_args.profiling:
+        os.environ["ESSENTIAJS_PROFILING"] = "1"
+
+    if cmd_args.dispatcher:
+        os.environ["ESSENTIAJS_DISPATCHER"] = "1"
+
+    if cmd_args.scan_usage:
+        from algorithm_usage import scan_algorithm_usage
+        TO_INCLUDE_ALGOS = scan_algorithm_usage(cmd_args.scan_usage, default_include_algos())
+        if not TO_INCLUDE_ALGOS:
+            print("WARNING: no essentia algorithm is called by the given entry points")
+        print("Including the %s algorithms used by the application: %s" % (len(TO_INCLUDE_ALGOS), ', '.join(TO_INCLUDE_ALGOS)))
+        savelist_to_file(TO_INCLUDE_ALGOS, TO_INCLUDE_ALGOS_TXT_FILE)
+    elif cmd_args.include_algos:
         if os.path.exists(cmd_args.include_algos):
             TO_INCLUDE_ALGOS = read_txt_file(str(cmd_args.include_algos))
             savelist_to_file(TO_INCLUDE_ALGOS, TO_INCLUDE_ALGOS_TXT_FILE)
@@ -82,7 +200,7 @@ if __name__ == '__main__':
             TO_INCLUDE_ALGOS = literal_eval(cmd_args.include_algos)
             savelist_to_file(TO_INCLUDE_ALGOS, TO_INCLUDE_ALGOS_TXT_FILE)
     else:
-        savelist_to_file(DEFAULT_INCLUDE_ALGOS, TO_INCLUDE_ALGOS_TXT_FILE)
+        savelist_to_file(default_include_algos(), TO_INCLUDE_ALGOS_TXT_FILE)
 
     if cmd_args.exclude_algos:
         # here instead replacing our defaults, we extend it with the defaults
@@ -100,4 +218,23 @@ if __name__ == '__main__':
     
     # now spawn a subshell to run our code generator
     subprocess.call("cog -d -D version=3.4.1 @cogfiles.txt", shell=True)
+
+    if cmd_args.groups:
+        groups = algorithm_groups(TO_INCLUDE_ALGOS)
+        with open(ALGORITHM_GROUPS_JSON_FILE, 'w') as f:
+            json.dump(groups, f, indent=2)
+            f.write('\n')
+        # the split sources mode is only supported for the default build
+        os.environ.pop("ESSENTIAJS_SPLIT_SOURCES", None)
+        for group, algos in groups.items():
+            print("Generating the cpp source code of the '%s' algorithm group (%s algorithms)..." % (group, len(algos)))
+            os.environ[ALGORITHM_GROUP_ENV_VAR] = group
+            group_dir = os.path.join("..", "cpp", "groups", group)
+            if not os.path.exists(os.path.join(group_dir, "includes")):
+                os.makedirs(os.path.join(group_dir, "includes"))
+            for cog_file, output_file in [("header.cog", "includes/essentiajs.h"), 
+                                          ("library.cog", "includes/essentiajs.cpp"), 
+                                          ("bindings.cog", "bindings_essentiajs.cpp")]:
+                subprocess.call("cog -d -D version=3.4.1 -o %s %s" % (os.path.join(group_dir, output_file), cog_file), 
+                                shell=True)
     
\ No newline at end of file
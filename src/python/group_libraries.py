@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+Resolve the essentia algorithms which have to be compiled in the essentia static library of an algorithm group
+(`essentia-<group>.a`, see `configure_bindings.py --group-library-algos` and `make -f Makefile.essentiajs
+build-group-libs`), so that the WASM module of the group doesn't link the whole essentia library.
+
+The algorithms created by the generated cpp sources of the group (`create("Windowing", ...)`) are resolved to the
+essentia source files which define them (`const char* Windowing::name = "Windowing";`), and the algorithms created
+or included by these sources are resolved in turn, eg. the algorithms which an extractor creates internally.
+Algorithms created from a name which isn't a string literal (eg. the ones added to a `StreamingNetwork`) are not
+found and have to be added to the group by hand.
+"""
+import logging
+import os
+import re
+
+# directory of the algorithm sources in a checkout of the essentia repository
+ESSENTIA_ALGORITHMS_DIR = os.path.join("src", "algorithms")
+
+# file where the --include-algos list of the essentia build of a group is written, in the directory of the group
+GROUP_LIBRARY_ALGOS_FILE = "essentia_algos.txt"
+
+ALGORITHM_NAME_PATTERN = re.compile(r"::name\s*=\s*\"([A-Za-z0-9]+)\"")
+ALGORITHM_CREATE_PATTERN = re.compile(r"\bcreate\s*\(\s*\"([A-Za-z0-9]+)\"")
+LOCAL_INCLUDE_PATTERN = re.compile(r"#include\s+\"(?:[^\"]*/)?([A-Za-z0-9_]+)\.h\"")
+
+
+def read_source(source_file):
+	with open(source_file) as f:
+		return f.read()
+
+
+def essentia_algorithm_sources(essentia_src):
+	"""Returns a dict of the names of the algorithms defined in the essentia sources and the names (without extension)
+	of their source files, and a dict of the source files and their contents"""
+	algorithms_dir = os.path.join(essentia_src, ESSENTIA_ALGORITHMS_DIR)
+	if not os.path.isdir(algorithms_dir):
+		raise IOError("Cannot find the essentia algorithm sources in '%s'" % algorithms_dir)
+	algorithm_files = dict()
+	sources = dict()
+	for root, dirs, names in os.walk(algorithms_dir):
+		dirs.sort()
+		for name in sorted(names):
+			if os.path.splitext(name)[1] != '.cpp':
+				continue
+			source_name = os.path.splitext(name)[0]
+			sources[source_name] = read_source(os.path.join(root, name))
+			for algorithm in ALGORITHM_NAME_PATTERN.findall(sources[source_name]):
+				algorithm_files.setdefault(algorithm, set()).add(source_name)
+	return algorithm_files, sources
+
+
+def group_library_algos(group_dir, essentia_src):
+	"""Returns the sorted names of the essentia source files of the algorithms created by the cpp sources of an
+	algorithm group and of their dependencies"""
+	algorithm_files, sources = essentia_algorithm_sources(essentia_src)
+	pending = set()
+	for root, dirs, names in os.walk(group_dir):
+		for name in names:
+			if os.path.splitext(name)[1] == '.cpp':
+				pending.update(ALGORITHM_CREATE_PATTERN.findall(read_source(os.path.join(root, name))))
+	resolved = set()
+	source_names = set()
+	while pending:
+		algorithm = pending.pop()
+		if algorithm in resolved:
+			continue
+		resolved.add(algorithm)
+		if algorithm not in algorithm_files:
+			logging.warning("Cannot find the essentia sources of the '%s' algorithm" % algorithm)
+			continue
+		for source_name in algorithm_files[algorithm] - source_names:
+			source_names.add(source_name)
+			pending.update(ALGORITHM_CREATE_PATTERN.findall(sources[source_name]))
+			# the algorithms whose classes are used directly
+			for header in LOCAL_INCLUDE_PATTERN.findall(sources[source_name]):
+				if header in sources and header not in source_names:
+					pending.update(ALGORITHM_NAME_PATTERN.findall(sources[header]))
+	logging.info("Resolved %s essentia algorithms in %s source files for '%s'" % (len(resolved), len(source_names),
+																					group_dir))
+	return sorted(source_names)
+
+
+def write_group_library_algos(groups_dir, groups, essentia_src):
+	"""Writes the comma separated --include-algos list of the essentia build of each algorithm group to the
+	GROUP_LIBRARY_ALGOS_FILE of its directory"""
+	for group in groups:
+		group_dir = os.path.join(groups_dir, group)
+		if not os.path.isdir(group_dir):
+			raise IOError("Cannot find the cpp sources of the '%s' algorithm group in '%s', generate them with "
+						  "configure_bindings.py --groups" % (group, group_dir))
+		source_names = group_library_algos(group_dir, essentia_src)
+		with open(os.path.join(group_dir, GROUP_LIBRARY_ALGOS_FILE), 'w') as f:
+			f.write(','.join(source_names) + '\n')
+		print("The essentia library of the '%s' algorithm group includes %s algorithm sources" % (group,
+																								  len(source_names)))
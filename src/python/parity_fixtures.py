@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+"""
+Write the fixtures of the WASM-vs-native parity report (see `configure_bindings.py --parity-fixtures` and
+benchmarks/parity.js), ie. the synthetic inputs of each included algorithm along with the outputs and the mean
+compute time of the native essentia python bindings (`essentia.standard`) with the default parameters.
+
+The inputs are generated like the ones of the node benchmark suite (see benchmarks/run.js) and stored in the layout
+of the typed array I/O of essentia.js, ie. vectors as flat lists, matrices as `{data, shape}` in row-major order,
+complex vectors and stereo signals interleaved. The numeric outputs are stored as `{type, data, shape}` with the
+flattened values and the shape of the output (`lengths` instead of `shape` for the ragged matrices), the other ones
+as `{type, value}`. The non-finite values are stored as the strings 'NaN', 'Infinity' and '-Infinity'.
+
+The native compute time of an algorithm is measured on a single configured instance which is reset before each call
+(like the cached instances of essentia.js), so it includes the conversions of the python bindings between numpy and
+the essentia types but not the instantiation of the algorithm.
+"""
+import json
+import logging
+import math
+import platform
+import time
+from algorithm_metadata import essentia_version, get_manifest, get_struct
+from code_generator import benchmark_inputs
+
+# version of the layout of the fixtures file, which is checked by benchmarks/parity.js
+PARITY_FIXTURES_FORMAT_VERSION = 1
+
+# same synthetic inputs as the node benchmark suite (see benchmarks/run.js)
+SIGNAL_INPUTS = ['signal', 'frame', 'audio', 'array', 'array1', 'array2', 'arrayX', 'arrayY', 'x']
+INCREASING_INPUTS = ['frequencies', 'bpmIntervals', 'beats', 'ticks', 'contoursStartTimes']
+SAMPLE_RATE = 44100
+
+NUMERIC_OUTPUT_TYPES = ['real', 'integer', 'vector_real', 'vector_integer', 'vector_vector_real', 'matrix_real',
+						'vector_complex', 'vector_stereosample']
+
+
+def synthetic_array(name, size):
+	"""Returns the deterministic synthetic values of an input, ie. an audio-like signal, increasing frequencies or
+	positive values (eg. spectra, magnitudes or envelopes) depending on its name"""
+	values = list()
+	seed = 1
+	for i in range(size):
+		seed = (seed * 16807) % 2147483647
+		noise = seed / 2147483647. - 0.5
+		if name in SIGNAL_INPUTS:
+			values.append(0.5 * math.sin(2 * math.pi * 440 * i / SAMPLE_RATE) + 0.05 * noise)
+		elif name in INCREASING_INPUTS:
+			values.append(20 + i * (SAMPLE_RATE / 2. - 40) / size)
+		else:
+			values.append(0.5 + 0.5 * abs(math.sin(i / 8.)) + 0.05 * noise)
+	return values
+
+
+def synthetic_input(name, es_type, size, length, frames):
+	"""Returns the synthetic value of an input in the layout of the fixtures"""
+	if es_type == 'vector_real':
+		values = synthetic_array(name, size or length)
+	elif es_type in ['vector_vector_real', 'matrix_real']:
+		cols = size or 12
+		return {'data': float32_values(synthetic_array(name, frames * cols)), 'shape': [frames, cols]}
+	elif es_type == 'vector_complex':
+		values = synthetic_array(name, 2 * (size or length // 2 + 1))
+	elif es_type == 'vector_stereosample':
+		# interleaved left and right samples
+		values = synthetic_array('signal', 2 * (size or length))
+	elif es_type == 'real':
+		return 440. if name == 'pitch' else 0.5
+	elif es_type == 'string':
+		return 'major' if name == 'scale' else 'C'
+	elif es_type == 'vector_string':
+		return ['C', 'Am', 'F', 'G']
+	else:
+		raise TypeError("Unsupported input type '%s' of the input '%s'" % (es_type, name))
+	return float32_values(values)
+
+
+def float32_values(values):
+	"""Round the values to float32, so that the stored inputs are exactly the ones computed by both backends"""
+	import numpy as np
+	return np.array(values, dtype=np.float32).tolist()
+
+
+def to_native(es_type, value):
+	"""Convert an input of the fixtures to the type expected by the essentia python bindings"""
+	import numpy as np
+	if es_type == 'vector_real':
+		return np.array(value, dtype=np.float32)
+	if es_type == 'vector_vector_real':
+		rows, cols = value['shape']
+		return [np.array(value['data'][i * cols:(i + 1) * cols], dtype=np.float32) for i in range(rows)]
+	if es_type == 'matrix_real':
+		return np.array(value['data'], dtype=np.float32).reshape(value['shape'])
+	if es_type == 'vector_complex':
+		interleaved = np.array(value, dtype=np.float32)
+		return (interleaved[0::2] + 1j * interleaved[1::2]).astype(np.complex64)
+	if es_type == 'vector_stereosample':
+		return np.array(value, dtype=np.float32).reshape((-1, 2))
+	if es_type == 'real':
+		return float(value)
+	return value
+
+
+def json_number(value):
+	value = float(value)
+	if math.isnan(value):
+		return 'NaN'
+	if math.isinf(value):
+		return 'Infinity' if value > 0 else '-Infinity'
+	return value
+
+
+def from_native(es_type, value):
+	"""Convert an output of the essentia python bindings to the layout of the fixtures"""
+	import numpy as np
+	if es_type not in NUMERIC_OUTPUT_TYPES:
+		if isinstance(value, np.ndarray):
+			value = value.tolist()
+		# raises a TypeError for the types which are not compared (eg. pools)
+		json.dumps(value)
+		return {'type': es_type, 'value': value}
+	output = {'type': es_type}
+	if es_type == 'vector_vector_real':
+		rows = [np.asarray(row, dtype=np.float64).ravel() for row in value]
+		lengths = [len(row) for row in rows]
+		if len(set(lengths)) > 1:
+			output['lengths'] = lengths
+		else:
+			output['shape'] = [len(rows), lengths[0] if rows else 0]
+		data = np.concatenate(rows) if rows else np.zeros(0)
+	else:
+		array = np.asarray(value)
+		if np.iscomplexobj(array):
+			array = np.stack([array.real, array.imag], axis=-1)
+		data = array.astype(np.float64).ravel()
+		if es_type == 'matrix_real':
+			output['shape'] = list(array.shape)
+		elif es_type in ['real', 'integer']:
+			output['shape'] = []
+		else:
+			output['shape'] = [data.size]
+	output['data'] = [json_number(v) for v in data.tolist()]
+	return output
+
+
+def native_compute_ms(algorithm, inputs, min_time):
+	"""Returns the mean time in ms of the calls of a configured algorithm which is reset before each call"""
+	calls = 0
+	elapsed = 0.
+	while elapsed < min_time / 1000. or calls == 0:
+		algorithm.reset()
+		start = time.perf_counter()
+		algorithm(*inputs)
+		elapsed += time.perf_counter() - start
+		calls += 1
+	return elapsed * 1000. / calls
+
+
+def parity_fixture(algorithm_name, length, frames, min_time):
+	"""Returns the fixture of an algorithm, ie. its synthetic inputs, the outputs of the first call of a newly
+	configured native algorithm and the mean time of its calls"""
+	import essentia.standard as estd
+	doc_dict = get_struct(algorithm_name)
+	fixture = dict()
+	try:
+		inputs = [{'name': name, 'type': es_type, 'value': synthetic_input(name, es_type, size, length, frames)}
+					for name, es_type, size in benchmark_inputs(algorithm_name)]
+		fixture['inputs'] = inputs
+		algorithm = getattr(estd, algorithm_name)()
+		native_inputs = [to_native(inp['type'], inp['value']) for inp in inputs]
+		outputs = algorithm(*native_inputs)
+		if len(doc_dict['outputs']) == 1:
+			outputs = [outputs]
+		fixture['outputs'] = dict((out['name'], from_native(out['type'], value))
+									for out, value in zip(doc_dict['outputs'], outputs))
+		fixture['nativeMs'] = native_compute_ms(algorithm, native_inputs, min_time)
+	except Exception as e:
+		fixture['error'] = str(e)
+	return fixture
+
+
+def write_parity_fixtures(fixtures_file, algorithms, length=2048, frames=32, min_time=200):
+	"""Compute the given algorithms with the native essentia python bindings on synthetic inputs and write their
+	inputs, outputs and mean compute times to a JSON fixtures file for benchmarks/parity.js"""
+	if get_manifest() is not None:
+		raise RuntimeError("The parity fixtures are computed with the native essentia python bindings, "
+							"unset the metadata manifest to write them")
+	fixtures = dict()
+	for algorithm_name in algorithms:
+		fixtures[algorithm_name] = parity_fixture(algorithm_name, length, frames, min_time)
+		if 'error' in fixtures[algorithm_name]:
+			logging.warning("Cannot compute '%s' natively: %s" % (algorithm_name, fixtures[algorithm_name]['error']))
+		else:
+			logging.info("%s: %.4f ms" % (algorithm_name, fixtures[algorithm_name]['nativeMs']))
+	with open(fixtures_file, 'w') as f:
+		json.dump({
+			'formatVersion': PARITY_FIXTURES_FORMAT_VERSION,
+			'environment': {
+				'essentiaVersion': essentia_version(),
+				'python': platform.python_version(),
+				'platform': '%s-%s' % (platform.system().lower(), platform.machine()),
+				'date': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+				'length': length,
+				'frames': frames,
+				'time': min_time
+			},
+			'algorithms': fixtures
+		}, f, allow_nan=False)
+		f.write('\n')
+	return fixtures
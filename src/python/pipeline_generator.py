@@ -0,0 +1,736 @@
+# -*- coding: utf-8 -*-
+"""
+A python script for generating fused essentia.js C++ extractors (in the style of the example at `src/cpp/custom`)
+along with their embind bindings, typescript wrapper and Makefile from a declarative JSON/YAML pipeline spec.
+
+The nodes and parameters of the spec are validated against the upstream essentia documentation
+(`getStruct()`, see algorithm_metadata.py) and identical upstream nodes are deduplicated, so that the whole
+chain runs inside WASM with a single JS <-> WASM boundary crossing per call.
+
+Example spec:
+
+	{
+		"name": "SpectralFeaturesExtractor",
+		"parameters": {"frameSize": 2048, "hopSize": 1024, "sampleRate": 44100},
+		"nodes": {
+			"window": {"algorithm": "Windowing", "parameters": {"size": "$frameSize"}, "inputs": {"frame": "frame"}},
+			"spectrum": {"algorithm": "Spectrum", "parameters": {"size": "$frameSize"}, "inputs": {"frame": "window.frame"}},
+			"mfcc": {"algorithm": "MFCC", "parameters": {"sampleRate": "$sampleRate"}, "inputs": {"spectrum": "spectrum"}}
+		},
+		"outputs": {"mfcc": "mfcc.mfcc"}
+	}
+
+The reserved source `frame` refers to the frames cut out of the input signal, `<node>.<output>` to an output of
+a node (or just `<node>` if it has a single output) and `$<name>` to a pipeline parameter, which are exposed as
+arguments of the constructor and `configure` methods of the generated extractor. The parameters of the nodes can
+also be set from arithmetic expressions of the numeric pipeline parameters, eg. "$frameSize / 2 + 1" for the size
+of a spectrum or "$sampleRate / 2" for the Nyquist frequency, so that they follow a reconfiguration of the extractor.
+"""
+import argparse
+import ast
+import json
+import logging
+import os
+import re
+from algorithm_metadata import get_struct, has_algorithm
+from code_generator import map_types_to_cpp, BATCH_OUTPUT_TYPES
+
+logging.basicConfig(level='INFO')
+
+# name of the reserved source of the frames cut out of the input signal by the extractor
+FRAME_SOURCE = "frame"
+
+# pipeline parameters which are required by the frame cutter of every generated extractor
+REQUIRED_PIPELINE_PARAMS = ['frameSize', 'hopSize']
+
+# path to the --pre-js and --post-js files of the Essentia WASM builds
+JS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'js')
+
+LICENSE_HEADER = """/*
+ * Copyright (C) 2006-2021  Music Technology Group - Universitat Pompeu Fabra
+ *
+ * This file is part of Essentia
+ *
+ * Essentia is free software: you can redistribute it and/or modify it under
+ * the terms of the GNU Affero General Public License as published by the Free
+ * Software Foundation (FSF), either version 3 of the License, or (at your
+ * option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful, but WITHOUT
+ * ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+ * FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+ * details.
+ *
+ * You should have received a copy of the Affero GNU General Public License
+ * version 3 along with this program.  If not, see http://www.gnu.org/licenses/
+ */"""
+
+IDENTIFIER_REGEX = re.compile(r'^[A-Za-z][A-Za-z0-9]*$')
+
+# tokens of the parameter expressions of the nodes, ie. pipeline parameters, numbers, operators and parentheses
+EXPRESSION_TOKEN_REGEX = re.compile(r'\s*(\$[A-Za-z][A-Za-z0-9]*|\d+(?:\.\d*)?|[-+*/()])')
+
+# python syntax nodes allowed in the parameter expressions, which are valid cpp expressions as well
+EXPRESSION_SYNTAX_NODES = (ast.Expression, ast.BinOp, ast.UnaryOp, ast.Name, ast.Constant, ast.Load,
+						ast.Add, ast.Sub, ast.Mult, ast.Div, ast.UAdd, ast.USub)
+
+
+def load_pipeline_spec(spec_file):
+	"""Load a pipeline spec from a JSON or YAML (requires PyYAML) file"""
+	with open(spec_file) as f:
+		if spec_file.endswith(('.yaml', '.yml')):
+			try:
+				import yaml
+			except ImportError:
+				raise ImportError("PyYAML is required for parsing YAML pipeline specs, use a JSON spec "
+								"or install it using 'pip install pyyaml'")
+			return yaml.safe_load(f)
+		return json.load(f)
+
+
+def to_snake_case(name):
+	return re.sub(r'(?<!^)(?=[A-Z])', '_', name).lower()
+
+
+def map_value_to_cpp(value):
+	"""Map a python value of a pipeline spec to a cpp literal"""
+	if isinstance(value, bool):
+		return "true" if value else "false"
+	elif isinstance(value, (int, float)):
+		return repr(value)
+	elif isinstance(value, str):
+		return json.dumps(value)
+	elif isinstance(value, list):
+		if all(isinstance(v, str) for v in value):
+			return "std::vector<std::string>{%s}" % ', '.join(json.dumps(v) for v in value)
+		return "std::vector<float>{%s}" % ', '.join(map_value_to_cpp(v) for v in value)
+	raise NotImplementedError("Cannot find the corresponding cpp literal for '%s'" % value)
+
+
+def map_pipeline_param_type(value):
+	"""Map the default value of a pipeline parameter to its essentia type"""
+	if isinstance(value, bool):
+		return 'bool'
+	elif isinstance(value, int):
+		return 'integer'
+	elif isinstance(value, float):
+		return 'real'
+	elif isinstance(value, str):
+		return 'string'
+	raise ValueError("Pipeline parameters should be either a number, a string or a bool, found '%s'" % value)
+
+
+def is_valid_param_value(es_type, value):
+	"""Check whether a python value of a pipeline spec can be passed to an essentia parameter of the given type"""
+	if es_type == 'bool':
+		return isinstance(value, bool)
+	elif es_type == 'integer':
+		return isinstance(value, int) and not isinstance(value, bool)
+	elif es_type == 'real':
+		return isinstance(value, (int, float)) and not isinstance(value, bool)
+	elif es_type == 'string':
+		return isinstance(value, str)
+	elif es_type == 'vector_real':
+		return isinstance(value, list) and all(is_valid_param_value('real', v) for v in value)
+	elif es_type == 'vector_string':
+		return isinstance(value, list) and all(isinstance(v, str) for v in value)
+	raise NotImplementedError("Parameters of type '%s' are not supported in the pipeline specs" % es_type)
+
+
+def is_param_expression(value):
+	"""Check whether a python value of a pipeline spec is a reference to or an expression of pipeline parameters"""
+	return isinstance(value, str) and re.search(r'\$[A-Za-z]', value) is not None
+
+
+def parse_param_expression(node_id, name, expression, pipeline_params):
+	"""Parse the expression of the parameter of a node, ie. a reference to a pipeline parameter (`$<name>`) or
+	numeric pipeline parameters and numbers combined with +, -, *, / and parentheses (eg. "$frameSize / 2 + 1").
+	Returns the cpp expression and its essentia type, ie. 'integer' if all of its operands are integers (where / is
+	an integer division as in cpp), 'real' if any of them is real."""
+	tokens = list()
+	position = 0
+	expression = expression.strip()
+	while position < len(expression):
+		match = EXPRESSION_TOKEN_REGEX.match(expression, position)
+		if not match:
+			raise ValueError("Node '%s': invalid expression '%s' of the parameter '%s'" % (node_id, expression, name))
+		tokens.append(match.group(1))
+		position = match.end()
+
+	refs = [token[1:] for token in tokens if token.startswith('$')]
+	for ref in refs:
+		if ref not in pipeline_params:
+			raise ValueError("Node '%s': parameter '%s' refers to an undefined pipeline parameter '%s'"
+							% (node_id, name, ref))
+	if len(tokens) == 1:
+		return refs[0], map_pipeline_param_type(pipeline_params[refs[0]])
+
+	ref_types = [map_pipeline_param_type(pipeline_params[ref]) for ref in refs]
+	if any(ref_type not in ('integer', 'real') for ref_type in ref_types):
+		raise ValueError("Node '%s': the expression '%s' of the parameter '%s' should only refer to numeric "
+						"pipeline parameters" % (node_id, expression, name))
+	cpp_expression = ' '.join(token.lstrip('$') for token in tokens)
+	try:
+		syntax_nodes = list(ast.walk(ast.parse(cpp_expression, mode='eval')))
+	except SyntaxError:
+		syntax_nodes = [None]
+	if not all(isinstance(syntax_node, EXPRESSION_SYNTAX_NODES) for syntax_node in syntax_nodes):
+		raise ValueError("Node '%s': invalid expression '%s' of the parameter '%s'" % (node_id, expression, name))
+	if 'real' in ref_types or any('.' in token for token in tokens):
+		return cpp_expression, 'real'
+	return cpp_expression, 'integer'
+
+
+def parse_node_parameters(node_id, node, doc_dict, pipeline_params):
+	"""Validate the parameters of a pipeline node and map them to (name, cpp value) pairs"""
+	valid_params = dict((param['name'], param) for param in doc_dict['parameters'])
+	factory_params = list()
+	for name, value in node.get('parameters', {}).items():
+		if name not in valid_params:
+			raise ValueError("Node '%s': '%s' is not a parameter of %s, valid parameters are %s"
+							% (node_id, name, node['algorithm'], sorted(valid_params.keys())))
+		es_type = valid_params[name]['type']
+		if is_param_expression(value):
+			cpp_value, value_type = parse_param_expression(node_id, name, value, pipeline_params)
+			if value_type != es_type and not (es_type == 'real' and value_type == 'integer'):
+				raise ValueError("Node '%s': parameter '%s' of type '%s' cannot be set from '%s' of type '%s'"
+								% (node_id, name, es_type, value, value_type))
+			if es_type == 'real' and value_type == 'integer':
+				cpp_value = "(Real) %s" % (cpp_value if IDENTIFIER_REGEX.match(cpp_value) else "(%s)" % cpp_value)
+			factory_params.append((name, cpp_value))
+		else:
+			if not is_valid_param_value(es_type, value):
+				raise ValueError("Node '%s': invalid value '%s' for the parameter '%s' of type '%s'"
+								% (node_id, value, name, es_type))
+			factory_params.append((name, map_value_to_cpp(value)))
+	return factory_params
+
+
+def resolve_source(ref, node_id, nodes):
+	"""Resolve a source reference of a pipeline spec into a (node, output) pair, where node is None
+	for the reserved frame source"""
+	if ref == FRAME_SOURCE:
+		return (None, FRAME_SOURCE)
+	src_node, _, src_output = ref.partition('.')
+	if src_node not in nodes:
+		raise ValueError("Node '%s': unknown source '%s'" % (node_id, ref))
+	outputs = [out['name'] for out in nodes[src_node]['doc']['outputs']]
+	if not src_output:
+		if len(outputs) != 1:
+			raise ValueError("Node '%s': source '%s' has multiple outputs %s, use '%s.<output>'"
+							% (node_id, ref, outputs, src_node))
+		src_output = outputs[0]
+	if src_output not in outputs:
+		raise ValueError("Node '%s': '%s' is not an output of the node '%s', valid outputs are %s"
+						% (node_id, src_output, src_node, outputs))
+	return (src_node, src_output)
+
+
+def source_type(source, nodes):
+	if source[0] is None:
+		return 'vector_real'
+	return [out['type'] for out in nodes[source[0]]['doc']['outputs'] if out['name'] == source[1]][0]
+
+
+def parse_pipeline(spec):
+	"""Validate a pipeline spec against the essentia algorithm documentation and returns the pipeline
+	with its nodes deduplicated and sorted in the order of their computation."""
+	name = spec.get('name')
+	if not name or not IDENTIFIER_REGEX.match(name):
+		raise ValueError("Pipeline 'name' should be a valid class name, found '%s'" % name)
+
+	pipeline_params = spec.get('parameters', {})
+	for param in REQUIRED_PIPELINE_PARAMS:
+		if not isinstance(pipeline_params.get(param), int):
+			raise ValueError("Pipeline parameter '%s' is required and should be an integer" % param)
+	for param_name, value in pipeline_params.items():
+		if not IDENTIFIER_REGEX.match(param_name):
+			raise ValueError("Pipeline parameter name '%s' should be a valid identifier" % param_name)
+		map_pipeline_param_type(value)
+
+	if not spec.get('nodes'):
+		raise ValueError("Pipeline '%s' has no nodes" % name)
+	if not spec.get('outputs'):
+		raise ValueError("Pipeline '%s' has no outputs" % name)
+
+	nodes = dict()
+	for node_id, node in spec['nodes'].items():
+		if not IDENTIFIER_REGEX.match(node_id) or node_id == FRAME_SOURCE:
+			raise ValueError("Node id '%s' should be a valid identifier other than '%s'" % (node_id, FRAME_SOURCE))
+		if not has_algorithm(node.get('algorithm', '')):
+			raise ValueError("Node '%s': unknown essentia algorithm '%s'" % (node_id, node.get('algorithm')))
+		doc_dict = get_struct(node['algorithm'])
+		for port in doc_dict['inputs'] + doc_dict['outputs']:
+			map_types_to_cpp(port['type'])
+		nodes[node_id] = dict(algorithm=node['algorithm'],
+							doc=doc_dict,
+							parameters=parse_node_parameters(node_id, node, doc_dict, pipeline_params))
+
+	# resolve and type check the connections between the nodes
+	for node_id, node in spec['nodes'].items():
+		connections = node.get('inputs', {})
+		expected = dict((inp['name'], inp['type']) for inp in nodes[node_id]['doc']['inputs'])
+		unknown = set(connections.keys()) - set(expected.keys())
+		missing = set(expected.keys()) - set(connections.keys())
+		if unknown or missing:
+			raise ValueError("Node '%s': inputs of %s should be exactly %s, found %s"
+							% (node_id, node['algorithm'], sorted(expected.keys()), sorted(connections.keys())))
+		inputs = list()
+		for inp in nodes[node_id]['doc']['inputs']:
+			source = resolve_source(connections[inp['name']], node_id, nodes)
+			if source_type(source, nodes) != inp['type']:
+				raise ValueError("Node '%s': cannot connect '%s' of type '%s' to the input '%s' of type '%s'"
+								% (node_id, connections[inp['name']], source_type(source, nodes),
+									inp['name'], inp['type']))
+			inputs.append((inp['name'], source))
+		nodes[node_id]['inputs'] = inputs
+
+	# sort the nodes in the order of their computation (keeping the order of the spec for independent nodes)
+	order = list()
+	pending = list(spec['nodes'].keys())
+	while pending:
+		ready = [node_id for node_id in pending
+				if all(src[0] is None or src[0] in order for _, src in nodes[node_id]['inputs'])]
+		if not ready:
+			raise ValueError("Pipeline '%s' has a cycle between the nodes %s" % (name, pending))
+		order.append(ready[0])
+		pending.remove(ready[0])
+
+	# deduplicate the nodes computing the same algorithm with the same parameters on the same inputs
+	aliases = dict()
+	unique = dict()
+	for node_id in order:
+		node = nodes[node_id]
+		node['inputs'] = [(inp, (aliases.get(src[0], src[0]), src[1])) for inp, src in node['inputs']]
+		key = (node['algorithm'], tuple(sorted(node['parameters'])), tuple(node['inputs']))
+		if key in unique:
+			logging.info("Node '%s' is a duplicate of the node '%s'" % (node_id, unique[key]))
+			aliases[node_id] = unique[key]
+		else:
+			unique[key] = node_id
+
+	outputs = list()
+	for output_name, ref in spec['outputs'].items():
+		if not IDENTIFIER_REGEX.match(output_name):
+			raise ValueError("Pipeline output name '%s' should be a valid identifier" % output_name)
+		source = resolve_source(ref, "outputs", nodes)
+		source = (aliases.get(source[0], source[0]), source[1])
+		if source_type(source, nodes) not in BATCH_OUTPUT_TYPES:
+			raise ValueError("Pipeline output '%s' of type '%s' cannot be stacked frame-wise, supported types are %s"
+							% (output_name, source_type(source, nodes), BATCH_OUTPUT_TYPES))
+		outputs.append((output_name, source))
+
+	# drop the nodes which do not contribute to any of the pipeline outputs
+	used = set(src[0] for _, src in outputs if src[0] is not None)
+	for node_id in reversed(order):
+		if node_id in used:
+			used.update(src[0] for _, src in nodes[node_id]['inputs'] if src[0] is not None)
+	for node_id in order:
+		if node_id not in used and node_id not in aliases:
+			logging.warning("Node '%s' does not contribute to any of the pipeline outputs, skipping it" % node_id)
+
+	return dict(name=name,
+				description=spec.get('description', "Fused essentia.js extractor generated from a pipeline spec."),
+				parameters=pipeline_params,
+				startFromZero=spec.get('startFromZero', True),
+				dropSilentFrames=spec.get('dropSilentFrames', False),
+				nodes=[dict(id=node_id, **nodes[node_id]) for node_id in order if node_id in used],
+				outputs=outputs)
+
+
+def algo_member(node_id):
+	return "_algo_%s" % node_id
+
+
+def buffer_member(source):
+	if source[0] is None:
+		return "_frame"
+	return "_out_%s_%s" % source
+
+
+def cpp_params(pipeline, target="header"):
+	"""Cpp arguments of the constructor and configure methods of a generated extractor"""
+	params = list()
+	for name, value in pipeline['parameters'].items():
+		cpp_type = map_types_to_cpp(map_pipeline_param_type(value))
+		if cpp_type == 'std::string':
+			cpp_type = 'const std::string&'
+		else:
+			cpp_type = 'const %s' % cpp_type
+		if target == "header":
+			params.append("%s %s=%s" % (cpp_type, name, map_value_to_cpp(value)))
+		else:
+			params.append("%s %s" % (cpp_type, name))
+	return params
+
+
+def generate_pipeline_header(pipeline, snake_name):
+	name = pipeline['name']
+	guard = "__%s_H__" % snake_name.upper()
+	params = ', '.join(cpp_params(pipeline, target="header"))
+	lines = [LICENSE_HEADER, ""]
+	lines.append("// generated by src/python/pipeline_generator.py, do not edit by hand")
+	lines.append("")
+	lines.append("#ifndef %s" % guard)
+	lines.append("#define %s" % guard)
+	lines.append("")
+	lines.append("#include <vector>")
+	lines.append("#include <essentia/algorithmfactory.h>")
+	lines.append("#include <essentia/essentiamath.h>")
+	lines.append("#include <emscripten/bind.h>")
+	lines.append("")
+	lines.append("using namespace essentia;")
+	lines.append("using namespace essentia::standard;")
+	lines.append("using namespace emscripten;")
+	lines.append("")
+	lines.append("// %s" % pipeline['description'])
+	lines.append("class %s {" % name)
+	lines.append("  public:")
+	lines.append("    std::string essentiaVersion = essentia::version;")
+	lines.append("    %s(%s);" % (name, params))
+	lines.append("    ~%s();" % name)
+	lines.append("    void configure(%s);" % params)
+	lines.append("    val compute(const val& audioData);")
+	lines.append("    val computeFrame(const val& frameData);")
+	lines.append("    void reset();")
+	lines.append("    void shutdown();")
+	lines.append("  private:")
+	lines.append("    Algorithm* _frameCutter;")
+	for node in pipeline['nodes']:
+		lines.append("    Algorithm* %s;" % algo_member(node['id']))
+	lines.append("    std::vector<float> _frame;")
+	for node in pipeline['nodes']:
+		for out in node['doc']['outputs']:
+			lines.append("    %s %s;" % (map_types_to_cpp(out['type']).replace('&', ''),
+										buffer_member((node['id'], out['name']))))
+	lines.append("    void computeNodes();")
+	lines.append("    void deleteAlgorithms();")
+	lines.append("};")
+	lines.append("")
+	lines.append("#endif // %s" % guard)
+	return lines
+
+
+def generate_pipeline_algorithm(pipeline, snake_name):
+	name = pipeline['name']
+	algos = ["_frameCutter"] + [algo_member(node['id']) for node in pipeline['nodes']]
+	lines = [LICENSE_HEADER, ""]
+	lines.append("// generated by src/python/pipeline_generator.py, do not edit by hand")
+	lines.append("")
+	lines.append('#include "%s.h"' % snake_name)
+	lines.append("")
+	lines.append("")
+	lines.append("// convert a Float32 JS typed array into std::vector<float>")
+	lines.append("// https://github.com/emscripten-core/emscripten/issues/5519#issuecomment-624775352")
+	lines.append("static std::vector<float> float32ArrayToVector(const val &v) {")
+	lines.append("  std::vector<float> rv;")
+	lines.append('  const auto l = v["length"].as<unsigned>();')
+	lines.append("  rv.resize(l);")
+	lines.append("  emscripten::val memoryView{emscripten::typed_memory_view(l, rv.data())};")
+	lines.append('  memoryView.call<void>("set", v);')
+	lines.append("  return rv;")
+	lines.append("}")
+	lines.append("")
+	lines.append("%s::%s(%s) {" % (name, name, ', '.join(cpp_params(pipeline, target="algorithm"))))
+	for algo in algos:
+		lines.append("  %s = NULL;" % algo)
+	lines.append("  configure(%s);" % ', '.join(pipeline['parameters'].keys()))
+	lines.append("}")
+	lines.append("")
+	lines.append("%s::~%s() {" % (name, name))
+	lines.append("  deleteAlgorithms();")
+	lines.append("}")
+	lines.append("")
+	lines.append("// create the algorithms of the pipeline and connect their inputs and outputs once")
+	lines.append("void %s::configure(%s) {" % (name, ', '.join(cpp_params(pipeline, target="algorithm"))))
+	lines.append("  essentia::init();")
+	lines.append("  deleteAlgorithms();")
+	lines.append("  AlgorithmFactory& factory = standard::AlgorithmFactory::instance();")
+	lines.append("")
+	lines.append('  _frameCutter = factory.create("FrameCutter", "frameSize", frameSize, "hopSize", hopSize, '
+				'"startFromZero", %s);' % map_value_to_cpp(bool(pipeline['startFromZero'])))
+	lines.append('  _frameCutter->output("frame").set(_frame);')
+	for node in pipeline['nodes']:
+		lines.append("")
+		factory_params = ', '.join('"%s", %s' % param for param in node['parameters'])
+		if factory_params:
+			lines.append('  %s = factory.create("%s", %s);' % (algo_member(node['id']), node['algorithm'], factory_params))
+		else:
+			lines.append('  %s = factory.create("%s");' % (algo_member(node['id']), node['algorithm']))
+		for inp, source in node['inputs']:
+			lines.append('  %s->input("%s").set(%s);' % (algo_member(node['id']), inp, buffer_member(source)))
+		for out in node['doc']['outputs']:
+			lines.append('  %s->output("%s").set(%s);' % (algo_member(node['id']), out['name'],
+														buffer_member((node['id'], out['name']))))
+	lines.append("}")
+	lines.append("")
+	lines.append("// compute the pipeline on every frame of the input signal and stack the frame-wise outputs")
+	lines.append("val %s::compute(const val& audioData) {" % name)
+	lines.append("  std::vector<float> audioSignal = float32ArrayToVector(audioData);")
+	lines.append("  _frameCutter->reset();")
+	lines.append('  _frameCutter->input("signal").set(audioSignal);')
+	for output_name, source in pipeline['outputs']:
+		if source_type(source, dict((node['id'], node) for node in pipeline['nodes'])) == 'vector_real':
+			lines.append("  std::vector<std::vector<float> > frames_%s;" % output_name)
+		else:
+			lines.append("  std::vector<float> frames_%s;" % output_name)
+	lines.append("  while (true) {")
+	lines.append("    _frameCutter->compute();")
+	lines.append("    if (!_frame.size()) break;")
+	if pipeline['dropSilentFrames']:
+		lines.append("    if (isSilent(_frame)) continue;")
+	lines.append("    computeNodes();")
+	for output_name, source in pipeline['outputs']:
+		lines.append("    frames_%s.push_back(%s);" % (output_name, buffer_member(source)))
+	lines.append("  }")
+	lines.append("  val output(val::object());")
+	for output_name, source in pipeline['outputs']:
+		lines.append('  output.set("%s", frames_%s);' % (output_name, output_name))
+	lines.append("  return output;")
+	lines.append("}")
+	lines.append("")
+	lines.append("// compute the pipeline on a single frame (eg. in an AudioWorklet)")
+	lines.append("val %s::computeFrame(const val& frameData) {" % name)
+	lines.append("  _frame = float32ArrayToVector(frameData);")
+	lines.append("  computeNodes();")
+	lines.append("  val output(val::object());")
+	for output_name, source in pipeline['outputs']:
+		lines.append('  output.set("%s", %s);' % (output_name, buffer_member(source)))
+	lines.append("  return output;")
+	lines.append("}")
+	lines.append("")
+	lines.append("void %s::computeNodes() {" % name)
+	for node in pipeline['nodes']:
+		lines.append("  %s->compute();" % algo_member(node['id']))
+	lines.append("}")
+	lines.append("")
+	lines.append("void %s::reset() {" % name)
+	for algo in algos:
+		lines.append("  %s->reset();" % algo)
+	lines.append("}")
+	lines.append("")
+	lines.append("void %s::deleteAlgorithms() {" % name)
+	for algo in algos:
+		lines.append("  delete %s;" % algo)
+		lines.append("  %s = NULL;" % algo)
+	lines.append("}")
+	lines.append("")
+	lines.append("void %s::shutdown() {" % name)
+	lines.append("  deleteAlgorithms();")
+	lines.append("  essentia::shutdown();")
+	lines.append("}")
+	return lines
+
+
+def generate_pipeline_bindings(pipeline, snake_name):
+	name = pipeline['name']
+	ctor_types = [map_types_to_cpp(map_pipeline_param_type(value)) for value in pipeline['parameters'].values()]
+	lines = [LICENSE_HEADER, ""]
+	lines.append("// generated by src/python/pipeline_generator.py, do not edit by hand")
+	lines.append("")
+	lines.append("#include <emscripten/bind.h>")
+	lines.append('#include "%s.h"' % snake_name)
+	lines.append("")
+	lines.append("EMSCRIPTEN_BINDINGS(CLASS_%s) {" % name)
+	lines.append('  class_<%s>("%s")' % (name, name))
+	lines.append("    .constructor<%s>()" % ', '.join(ctor_types))
+	lines.append('    .property("version", &%s::essentiaVersion)' % name)
+	for method in ['configure', 'compute', 'computeFrame', 'reset', 'shutdown']:
+		lines.append('    .function("%s", &%s::%s)' % (method, name, method))
+	lines.append("    ;")
+	lines.append('  register_vector<float>("VectorFloat");')
+	lines.append('  register_vector<std::vector<float> >("VectorVectorFloat");')
+	lines.append("};")
+	return lines
+
+
+def generate_pipeline_typescript(pipeline):
+	name = pipeline['name']
+	nodes = dict((node['id'], node) for node in pipeline['nodes'])
+	ts_types = {'integer': 'number', 'real': 'number', 'string': 'string', 'bool': 'boolean'}
+	params = list()
+	param_comments = list()
+	for param_name, value in pipeline['parameters'].items():
+		es_type = map_pipeline_param_type(value)
+		default = "'%s'" % value if es_type == 'string' else map_value_to_cpp(value)
+		params.append("%s: %s=%s" % (param_name, ts_types[es_type], default))
+		param_comments.append("* @param {%s} [%s=%s] pipeline parameter" % (ts_types[es_type], param_name, default))
+	param_names = ', '.join(pipeline['parameters'].keys())
+
+	outs = list()
+	frame_outs = list()
+	for output_name, source in pipeline['outputs']:
+		src = "%s.%s" % source if source[0] else FRAME_SOURCE
+		stacked_type = "VectorVectorFloat" if source_type(source, nodes) == 'vector_real' else "VectorFloat"
+		outs.append("%s: '%s' (stacked frame-wise as %s)" % (output_name, src, stacked_type))
+		frame_outs.append("%s: '%s'" % (output_name, src))
+	chain = ', '.join("%s (%s)" % (node['id'], node['algorithm']) for node in pipeline['nodes'])
+
+	lines = [LICENSE_HEADER, ""]
+	lines.append("// generated by src/python/pipeline_generator.py, do not edit by hand")
+	lines.append("")
+	lines.append("/**")
+	lines.append("* %s Computes the nodes %s in a single WASM call." % (pipeline['description'], chain))
+	lines.append("* @class")
+	lines.append("* @example")
+	lines.append("* const extractor = new %s(EssentiaWASM);" % name)
+	lines.append("* const features = extractor.compute(audioData);")
+	lines.append("* extractor.shutdown();")
+	lines.append("* extractor.delete();")
+	lines.append("*/")
+	lines.append("class %s {" % name)
+	lines.append("  private extractor: any;")
+	lines.append("  public module: any;")
+	lines.append("")
+	lines.append("  /**")
+	lines.append("  * @constructs")
+	lines.append("  * @param {EssentiaWASM} EssentiaWASM Essentia WASM backend built from the generated sources of the pipeline")
+	lines.extend("  %s" % comment for comment in param_comments)
+	lines.append("  */")
+	lines.append("  constructor(EssentiaWASM: any, %s) {" % ', '.join(params))
+	lines.append("    this.module = EssentiaWASM;")
+	lines.append("    this.extractor = new this.module.%s(%s);" % (name, param_names))
+	lines.append("  }")
+	lines.append("")
+	lines.append("  /**")
+	lines.append("  * Reconfigure the algorithms of the pipeline")
+	lines.append("  * @method")
+	lines.extend("  %s" % comment for comment in param_comments)
+	lines.append("  */")
+	lines.append("  configure(%s) {" % ', '.join(params))
+	lines.append("    this.extractor.configure(%s);" % param_names)
+	lines.append("  }")
+	lines.append("")
+	lines.append("  /**")
+	lines.append("  * Compute the pipeline on every frame of an audio signal")
+	lines.append("  * @method")
+	lines.append("  * @param {Float32Array} audioData audio signal")
+	lines.append("  * @returns {object} {%s}" % ', '.join(outs))
+	lines.append("  */")
+	lines.append("  compute(audioData: Float32Array) {")
+	lines.append("    return this.extractor.compute(audioData);")
+	lines.append("  }")
+	lines.append("")
+	lines.append("  /**")
+	lines.append("  * Compute the pipeline on a single frame")
+	lines.append("  * @method")
+	lines.append("  * @param {Float32Array} frame audio frame of size 'frameSize'")
+	lines.append("  * @returns {object} {%s}" % ', '.join(frame_outs))
+	lines.append("  */")
+	lines.append("  computeFrame(frame: Float32Array) {")
+	lines.append("    return this.extractor.computeFrame(frame);")
+	lines.append("  }")
+	lines.append("")
+	lines.append("  /**")
+	lines.append("  * Reset the internal states of the algorithms of the pipeline")
+	lines.append("  * @method")
+	lines.append("  */")
+	lines.append("  reset() {")
+	lines.append("    this.extractor.reset();")
+	lines.append("  }")
+	lines.append("")
+	lines.append("  /**")
+	lines.append("  * Delete the algorithms of the pipeline and shutdown the essentia backend")
+	lines.append("  * @method")
+	lines.append("  */")
+	lines.append("  shutdown() {")
+	lines.append("    this.extractor.shutdown();")
+	lines.append("  }")
+	lines.append("")
+	lines.append("  /**")
+	lines.append("  * Free the WASM memory of the extractor instance")
+	lines.append("  * @method")
+	lines.append("  */")
+	lines.append("  delete() {")
+	lines.append("    this.extractor.delete();")
+	lines.append("  }")
+	lines.append("}")
+	lines.append("")
+	lines.append("export default %s;" % name)
+	return lines
+
+
+def generate_pipeline_makefile(snake_name, output_dir):
+	js_dir = os.path.relpath(JS_DIR, os.path.abspath(output_dir))
+	build_name = snake_name.replace('_', '-')
+	lines = list()
+	lines.append("# generated by src/python/pipeline_generator.py, do not edit by hand")
+	lines.append("EIGEN_PATH=/usr/local/include/eigen3")
+	lines.append("LIB_DIR_ESSENTIA=$(EMSCRIPTEN)/system/local/lib")
+	lines.append("ESSENTIA_JS_WEB=%s.web.js" % build_name)
+	lines.append("ESSENTIA_JS_MODULE=%s.module.js" % build_name)
+	lines.append("PRE_JS_WASM=%s/wasm.module.pre.js" % js_dir)
+	lines.append("POST_JS_WEB_WASM=%s/wasm.webmodule.post.js" % js_dir)
+	lines.append("POST_JS_ES6_WASM=%s/wasm.es6module.post.js" % js_dir)
+	lines.append("SOURCES=bindings_%s.cpp %s.cpp" % (snake_name, snake_name))
+	lines.append("")
+	lines.append("build:")
+	lines.append('\t@echo "Compiling the %s pipeline"' % snake_name)
+	lines.append("\t# Async builds for html imports ...")
+	lines.append("\t@emcc -I $(EIGEN_PATH) \\")
+	lines.append("\t   --bind -Oz $(SOURCES) ${LIB_DIR_ESSENTIA}/essentia.a \\")
+	lines.append("\t   -s WASM=1 \\")
+	lines.append("\t   -o $(ESSENTIA_JS_WEB) \\")
+	lines.append("\t   -s ENVIRONMENT=web \\")
+	lines.append("\t   -s MODULARIZE=1 \\")
+	lines.append('\t   -s EXPORT_NAME="EssentiaWASM" \\')
+	lines.append("\t   --post-js $(POST_JS_WEB_WASM) \\")
+	lines.append("\t   -s ALLOW_MEMORY_GROWTH=1 || exit 1")
+	lines.append("")
+	lines.append("\t# Sync builds for ES6 import and AudioWorklet support ...")
+	lines.append("\t@emcc -I $(EIGEN_PATH) \\")
+	lines.append("\t\t--bind -Oz $(SOURCES) ${LIB_DIR_ESSENTIA}/essentia.a \\")
+	lines.append("\t\t-s WASM=1 \\")
+	lines.append("\t\t-o $(ESSENTIA_JS_MODULE) \\")
+	lines.append("\t\t-s BINARYEN_ASYNC_COMPILATION=0 \\")
+	lines.append("\t\t-s ALLOW_MEMORY_GROWTH=1 \\")
+	lines.append("\t\t-s SINGLE_FILE=1 || exit 1")
+	lines.append("")
+	lines.append("\t@cat $(PRE_JS_WASM) $(ESSENTIA_JS_WEB) > $$.tmp && mv $$.tmp $(ESSENTIA_JS_WEB)")
+	lines.append("\t@cat $(PRE_JS_WASM) $(ESSENTIA_JS_MODULE) > $$.tmp && mv $$.tmp $(ESSENTIA_JS_MODULE)")
+	lines.append("\t@cat $(POST_JS_ES6_WASM) >> $(ESSENTIA_JS_MODULE)")
+	lines.append("")
+	lines.append('\t@echo "Done ..."')
+	return lines
+
+
+def generate_pipeline(spec, output_dir):
+	"""Generate the cpp sources, embind bindings, typescript wrapper and Makefile of a fused extractor
+	for the given pipeline spec into 'output_dir'. Returns the list of the generated files."""
+	pipeline = parse_pipeline(spec)
+	snake_name = to_snake_case(pipeline['name'])
+	logging.info("Generating the '%s' pipeline with the nodes %s ..."
+				% (pipeline['name'], [node['id'] for node in pipeline['nodes']]))
+	if not os.path.exists(output_dir):
+		os.makedirs(output_dir)
+	files = [("%s.h" % snake_name, generate_pipeline_header(pipeline, snake_name)),
+			("%s.cpp" % snake_name, generate_pipeline_algorithm(pipeline, snake_name)),
+			("bindings_%s.cpp" % snake_name, generate_pipeline_bindings(pipeline, snake_name)),
+			("%s.ts" % snake_name, generate_pipeline_typescript(pipeline)),
+			("Makefile", generate_pipeline_makefile(snake_name, output_dir))]
+	generated = list()
+	for filename, lines in files:
+		path = os.path.join(output_dir, filename)
+		with open(path, 'w') as f:
+			f.write('\n'.join(lines) + '\n')
+		generated.append(path)
+	logging.info("Generated %s" % generated)
+	return generated
+
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description="CLI inferface for generating a fused essentia.js C++ extractor \
+						and its JS bindings from a JSON/YAML pipeline spec",
+						formatter_class=argparse.ArgumentDefaultsHelpFormatter)
+
+	parser.add_argument("spec", action="store", help="Path to the JSON or YAML pipeline spec file")
+	parser.add_argument("-o", "--output-dir", action="store",
+						help="Directory of the generated files (defaults to a directory named after the pipeline \
+							next to the spec file)")
+
+	cmd_args = parser.parse_args()
+	spec = load_pipeline_spec(cmd_args.spec)
+	output_dir = cmd_args.output_dir
+	if not output_dir:
+		output_dir = os.path.join(os.path.dirname(os.path.abspath(cmd_args.spec)), to_snake_case(spec.get('name', '')))
+	generate_pipeline(spec, output_dir)
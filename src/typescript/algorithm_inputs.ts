@@ -0,0 +1,251 @@
+/**
+ * @license
+ * Copyright (C) 2006-2020  Music Technology Group - Universitat Pompeu Fabra
+ *
+ * This file is part of Essentia
+ *
+ * Essentia is free software: you can redistribute it and/or modify it under
+ * the terms of the GNU Affero General Public License as published by the Free
+ * Software Foundation (FSF), either version 3 of the License, or (at your
+ * option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful, but WITHOUT
+ * ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+ * FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+ * details.
+ *
+ * You should have received a copy of the Affero GNU General Public License
+ * version 3 along with this program.  If not, see http://www.gnu.org/licenses/
+ */
+
+// NOTE: This source code is machine-generated.
+
+/**
+* Essentia types of the inputs of each algorithm method (eg. 'vector_real'), which are used to marshal the 
+* inputs given as JS arrays. This table is kept out of core_api.ts, so that the add-on modules which only need the 
+* input types (eg. EssentiaPool) don't bundle the whole core API.
+*/
+export const algorithmInputTypes: {[algorithm: string]: string[]} = {
+  AfterMaxToBeforeMaxEnergyRatio: ['vector_real'],
+  AllPass: ['vector_real'],
+  AudioOnsetsMarker: ['vector_real'],
+  AutoCorrelation: ['vector_real'],
+  BFCC: ['vector_real'],
+  BPF: ['real'],
+  BandPass: ['vector_real'],
+  BandReject: ['vector_real'],
+  BarkBands: ['vector_real'],
+  BeatTrackerDegara: ['vector_real'],
+  BeatTrackerMultiFeature: ['vector_real'],
+  Beatogram: ['vector_real', 'vector_vector_real'],
+  BeatsLoudness: ['vector_real'],
+  BinaryOperator: ['vector_real', 'vector_real'],
+  BinaryOperatorStream: ['vector_real', 'vector_real'],
+  BpmHistogram: ['vector_real'],
+  BpmHistogramDescriptors: ['vector_real'],
+  BpmRubato: ['vector_real'],
+  CartesianToPolar: ['vector_complex'],
+  CentralMoments: ['vector_real'],
+  Centroid: ['vector_real'],
+  ChordsDescriptors: ['vector_string', 'string', 'string'],
+  ChordsDetection: ['vector_vector_real'],
+  ChordsDetectionBeats: ['vector_vector_real', 'vector_real'],
+  ChromaCrossSimilarity: ['vector_vector_real', 'vector_vector_real'],
+  Chromagram: ['vector_real'],
+  ClickDetector: ['vector_real'],
+  Clipper: ['vector_real'],
+  ConstantQ: ['vector_real'],
+  CoverSongSimilarity: ['vector_vector_real'],
+  Crest: ['vector_real'],
+  CrossCorrelation: ['vector_real', 'vector_real'],
+  CrossSimilarityMatrix: ['vector_vector_real', 'vector_vector_real'],
+  CubicSpline: ['real'],
+  DCRemoval: ['vector_real'],
+  DCT: ['vector_real'],
+  Danceability: ['vector_real'],
+  Decrease: ['vector_real'],
+  Derivative: ['vector_real'],
+  DerivativeSFX: ['vector_real'],
+  DiscontinuityDetector: ['vector_real'],
+  Dissonance: ['vector_real', 'vector_real'],
+  DistributionShape: ['vector_real'],
+  Duration: ['vector_real'],
+  DynamicComplexity: ['vector_real'],
+  ERBBands: ['vector_real'],
+  EffectiveDuration: ['vector_real'],
+  Energy: ['vector_real'],
+  EnergyBand: ['vector_real'],
+  EnergyBandRatio: ['vector_real'],
+  Entropy: ['vector_real'],
+  Envelope: ['vector_real'],
+  EqualLoudness: ['vector_real'],
+  FFT: ['vector_real'],
+  FFTC: ['vector_complex'],
+  FadeDetection: ['vector_real'],
+  FalseStereoDetector: ['vector_stereosample'],
+  Flatness: ['vector_real'],
+  FlatnessDB: ['vector_real'],
+  FlatnessSFX: ['vector_real'],
+  Flux: ['vector_real'],
+  FrameCutter: ['vector_real'],
+  FrameToReal: ['vector_real'],
+  FrequencyBands: ['vector_real'],
+  GFCC: ['vector_real'],
+  GapsDetector: ['vector_real'],
+  GeometricMean: ['vector_real'],
+  HFC: ['vector_real'],
+  HPCP: ['vector_real', 'vector_real'],
+  HarmonicBpm: ['vector_real'],
+  HarmonicMask: ['vector_complex', 'real'],
+  HarmonicModelAnal: ['vector_complex', 'real'],
+  HarmonicPeaks: ['vector_real', 'vector_real', 'real'],
+  HighPass: ['vector_real'],
+  HighResolutionFeatures: ['vector_real'],
+  Histogram: ['vector_real'],
+  HprModelAnal: ['vector_real', 'real'],
+  HpsModelAnal: ['vector_real', 'real'],
+  HumDetector: ['vector_real'],
+  IDCT: ['vector_real'],
+  IFFT: ['vector_complex'],
+  IFFTC: ['vector_complex'],
+  IIR: ['vector_real'],
+  Inharmonicity: ['vector_real', 'vector_real'],
+  InstantPower: ['vector_real'],
+  Intensity: ['vector_real'],
+  Key: ['vector_real'],
+  KeyExtractor: ['vector_real'],
+  LPC: ['vector_real'],
+  Larm: ['vector_real'],
+  Leq: ['vector_real'],
+  LevelExtractor: ['vector_real'],
+  LogAttackTime: ['vector_real'],
+  LogSpectrum: ['vector_real'],
+  LoopBpmConfidence: ['vector_real', 'real'],
+  LoopBpmEstimator: ['vector_real'],
+  Loudness: ['vector_real'],
+  LoudnessVickers: ['vector_real'],
+  LowLevelSpectralEqloudExtractor: ['vector_real'],
+  LowLevelSpectralExtractor: ['vector_real'],
+  LowPass: ['vector_real'],
+  MFCC: ['vector_real'],
+  Magnitude: ['vector_complex'],
+  MaxFilter: ['vector_real'],
+  MaxMagFreq: ['vector_real'],
+  MaxToTotal: ['vector_real'],
+  Mean: ['vector_real'],
+  Median: ['vector_real'],
+  MedianFilter: ['vector_real'],
+  MelBands: ['vector_real'],
+  Meter: ['vector_vector_real'],
+  MinMax: ['vector_real'],
+  MinToTotal: ['vector_real'],
+  MovingAverage: ['vector_real'],
+  MultiPitchKlapuri: ['vector_real'],
+  MultiPitchMelodia: ['vector_real'],
+  Multiplexer: [],
+  NNLSChroma: ['vector_vector_real', 'vector_real', 'vector_real'],
+  NoiseAdder: ['vector_real'],
+  NoiseBurstDetector: ['vector_real'],
+  NoveltyCurve: ['vector_vector_real'],
+  NoveltyCurveFixedBpmEstimator: ['vector_real'],
+  OddToEvenHarmonicEnergyRatio: ['vector_real', 'vector_real'],
+  OnsetDetection: ['vector_real', 'vector_real'],
+  OnsetDetectionGlobal: ['vector_real'],
+  OnsetRate: ['vector_real'],
+  Onsets: ['matrix_real', 'vector_real'],
+  OverlapAdd: ['vector_real'],
+  Panning: ['vector_real', 'vector_real'],
+  PeakDetection: ['vector_real'],
+  PercivalBpmEstimator: ['vector_real'],
+  PercivalEnhanceHarmonics: ['vector_real'],
+  PercivalEvaluatePulseTrains: ['vector_real', 'vector_real'],
+  PitchContourSegmentation: ['vector_real', 'vector_real'],
+  PitchContours: ['vector_vector_real', 'vector_vector_real'],
+  PitchContoursMelody: ['vector_vector_real', 'vector_vector_real', 'vector_real', 'real'],
+  PitchContoursMonoMelody: ['vector_vector_real', 'vector_vector_real', 'vector_real', 'real'],
+  PitchContoursMultiMelody: ['vector_vector_real', 'vector_vector_real', 'vector_real', 'real'],
+  PitchFilter: ['vector_real', 'vector_real'],
+  PitchMelodia: ['vector_real'],
+  PitchSalience: ['vector_real'],
+  PitchSalienceFunction: ['vector_real', 'vector_real'],
+  PitchSalienceFunctionPeaks: ['vector_real'],
+  PitchYin: ['vector_real'],
+  PitchYinFFT: ['vector_real'],
+  PitchYinProbabilistic: ['vector_real'],
+  PitchYinProbabilities: ['vector_real'],
+  PitchYinProbabilitiesHMM: ['vector_vector_real', 'vector_vector_real'],
+  PolarToCartesian: ['vector_real', 'vector_real'],
+  PowerMean: ['vector_real'],
+  PowerSpectrum: ['vector_real'],
+  PredominantPitchMelodia: ['vector_real'],
+  RMS: ['vector_real'],
+  RawMoments: ['vector_real'],
+  ReplayGain: ['vector_real'],
+  Resample: ['vector_real'],
+  ResampleFFT: ['vector_real'],
+  RhythmDescriptors: ['vector_real'],
+  RhythmExtractor: ['vector_real'],
+  RhythmExtractor2013: ['vector_real'],
+  RhythmTransform: ['vector_vector_real'],
+  RollOff: ['vector_real'],
+  SBic: ['matrix_real'],
+  SNR: ['vector_real'],
+  SaturationDetector: ['vector_real'],
+  Scale: ['vector_real'],
+  SineModelAnal: ['vector_complex'],
+  SineModelSynth: ['vector_real', 'vector_real', 'vector_real'],
+  SineSubtraction: ['vector_real', 'vector_real', 'vector_real', 'vector_real'],
+  SingleBeatLoudness: ['vector_real'],
+  SingleGaussian: ['matrix_real'],
+  Slicer: ['vector_real'],
+  SpectralCentroidTime: ['vector_real'],
+  SpectralComplexity: ['vector_real'],
+  SpectralContrast: ['vector_real'],
+  SpectralPeaks: ['vector_real'],
+  SpectralWhitening: ['vector_real', 'vector_real', 'vector_real'],
+  Spectrum: ['vector_real'],
+  SpectrumCQ: ['vector_real'],
+  SpectrumToCent: ['vector_real'],
+  Spline: ['real'],
+  SprModelAnal: ['vector_real'],
+  SprModelSynth: ['vector_real', 'vector_real', 'vector_real', 'vector_real'],
+  SpsModelAnal: ['vector_real'],
+  SpsModelSynth: ['vector_real', 'vector_real', 'vector_real', 'vector_real'],
+  StartStopCut: ['vector_real'],
+  StartStopSilence: ['vector_real'],
+  StereoDemuxer: ['vector_stereosample'],
+  StereoMuxer: ['vector_real', 'vector_real'],
+  StereoTrimmer: ['vector_stereosample'],
+  StochasticModelAnal: ['vector_real'],
+  StochasticModelSynth: ['vector_real'],
+  StrongDecay: ['vector_real'],
+  StrongPeak: ['vector_real'],
+  SuperFluxExtractor: ['vector_real'],
+  SuperFluxNovelty: ['vector_vector_real'],
+  SuperFluxPeaks: ['vector_real'],
+  TCToTotal: ['vector_real'],
+  TempoScaleBands: ['vector_real'],
+  TempoTap: ['vector_real'],
+  TempoTapDegara: ['vector_real'],
+  TempoTapMaxAgreement: ['vector_vector_real'],
+  TempoTapTicks: ['vector_real', 'vector_real'],
+  TensorflowInputMusiCNN: ['vector_real'],
+  TensorflowInputVGGish: ['vector_real'],
+  TonalExtractor: ['vector_real'],
+  TonicIndianArtMusic: ['vector_real'],
+  TriangularBands: ['vector_real'],
+  TriangularBarkBands: ['vector_real'],
+  Trimmer: ['vector_real'],
+  Tristimulus: ['vector_real', 'vector_real'],
+  TruePeakDetector: ['vector_real'],
+  TuningFrequency: ['vector_real', 'vector_real'],
+  TuningFrequencyExtractor: ['vector_real'],
+  UnaryOperator: ['vector_real'],
+  UnaryOperatorStream: ['vector_real'],
+  Variance: ['vector_real'],
+  Vibrato: ['vector_real'],
+  WarpedAutoCorrelation: ['vector_real'],
+  Welch: ['vector_real'],
+  Windowing: ['vector_real'],
+  ZeroCrossingRate: ['vector_real'],
+};
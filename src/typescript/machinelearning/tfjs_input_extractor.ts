@@ -117,10 +117,7 @@ class EssentiaTFInputExtractor {
       return buffer.getChannelData(0);
     }
     if (buffer.numberOfChannels === 2) {
-      const left = this.arrayToVector(buffer.getChannelData(0));
-      const right = this.arrayToVector(buffer.getChannelData(1));
-      let monoSignal = this.essentia.MonoMixer(left, right).audio;
-      return this.vectorToArray(monoSignal);
+      return this.essentia.MonoMixer(buffer.getChannelData(0), buffer.getChannelData(1)).audio;
     }
     throw new Error('Unexpected number of channels found in audio buffer. Only accepts mono or stereo audio buffers.');
   }
@@ -0,0 +1,429 @@
+/**
+ * @license
+ * Copyright (C) 2006-2020  Music Technology Group - Universitat Pompeu Fabra
+ *
+ * This file is part of Essentia
+ *
+ * Essentia is free software: you can redistribute it and/or modify it under
+ * the terms of the GNU Affero General Public License as published by the Free
+ * Software Foundation (FSF), either version 3 of the License, or (at your
+ * option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful, but WITHOUT
+ * ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+ * FOR A PARTICULAR PURPOSE.  See the GNU General Public License for more
+ * details.
+ *
+ * You should have received a copy of the Affero GNU General Public License
+ * version 3 along with this program.  If not, see http://www.gnu.org/licenses/
+ */
+
+// only the type of the essentia instances, so that the core API isn't bundled into the add-on module
+import type Essentia from "../core_api";
+import { algorithmInputTypes } from "../algorithm_inputs";
+
+// a call of an essentia method queued in the pool or running on one of its workers
+interface PoolTask {
+  id: number;
+  method: string;
+  args: any[];
+  transfer: ArrayBuffer[];
+  resolve: (value: any) => void;
+  reject: (reason: any) => void;
+}
+
+interface PoolWorker {
+  worker: any;
+  // the algorithm call running on the worker, if any
+  task: PoolTask | null;
+  // the calls sent to this specific worker (see `callWorker`) which didn't reply yet
+  calls: {[id: number]: PoolTask};
+  // whether the worker takes the queued calls, ie. its essentia instance isn't shut down (from `shutdown` until
+  // `reinstantiate` resolves)
+  available: boolean;
+  // callbacks waiting for the algorithm call running on the worker to complete
+  idleWaiters: (() => void)[];
+}
+
+// listen to the messages of either a node.js Worker/MessagePort (worker_threads) or a Web Worker/worker global scope
+function listen(port: any, onMessage: (data: any) => void, onError?: (error: any) => void): void {
+  if (typeof port.on === 'function') {
+    port.on('message', onMessage);
+    if (onError) {
+      port.on('error', onError);
+      // eg. the worker called process.exit or was terminated
+      port.on('exit', (exitCode: number) => onError(new Error(`The worker exited with code ${exitCode}`)));
+    }
+  } else {
+    port.addEventListener('message', (event: any) => onMessage(event.data));
+    if (onError) port.addEventListener('error', onError);
+  }
+}
+
+// whether a typed array covers its whole buffer, ie. it isn't a view on a bigger buffer such as the WASM memory
+function ownsBuffer(array: ArrayBufferView): boolean {
+  return array.byteOffset === 0 && array.byteLength === array.buffer.byteLength;
+}
+
+// collect the buffers of the typed arrays of a message which can be transferred instead of copied
+function collectTransferables(value: any, transfer: ArrayBuffer[]): ArrayBuffer[] {
+  if (ArrayBuffer.isView(value)) {
+    if (ownsBuffer(value) && value.byteLength > 0 && transfer.indexOf(value.buffer) === -1) transfer.push(value.buffer);
+  } else if (Array.isArray(value)) {
+    for (const item of value) collectTransferables(item, transfer);
+  } else if (value !== null && typeof value === 'object') {
+    for (const key in value) collectTransferables(value[key], transfer);
+  }
+  return transfer;
+}
+
+function isVector(value: any): boolean {
+  return value !== null && typeof value === 'object' && typeof value.size === 'function' && typeof value.get === 'function';
+}
+
+// convert an input given as JS array(s) to the embind type of its essentia type, the created vectors are added to
+// `vectors` in order to be deleted after the call
+function marshalInput(essentia: any, type: string, value: any, vectors: any[]): any {
+  if (isVector(value)) return value;
+  let vector: any;
+  switch (type) {
+    case 'vector_real':
+      vector = essentia.arrayToVector(value instanceof Float32Array ? value : new Float32Array(value));
+      break;
+    case 'vector_vector_real': {
+      // either an array of rows or a row-major matrix {data: Float32Array, shape: [rows, cols]}
+      const rows = Array.isArray(value) ? value : [];
+      if (!Array.isArray(value)) {
+        for (let i=0; i<value.shape[0]; i++) rows.push(value.data.subarray(i * value.shape[1], (i + 1) * value.shape[1]));
+      }
+      vector = new essentia.module.VectorVectorFloat();
+      for (const row of rows) {
+        const rowVector = essentia.arrayToVector(row instanceof Float32Array ? row : new Float32Array(row));
+        vector.push_back(rowVector);
+        rowVector.delete();
+      }
+      break;
+    }
+    case 'vector_string':
+      vector = new essentia.module.VectorString();
+      for (const item of value) vector.push_back(item);
+      break;
+    // scalars, strings and the flat buffer types ('vector_complex', 'matrix_real' and 'vector_stereosample') are passed as they are
+    default:
+      return value;
+  }
+  vectors.push(vector);
+  return vector;
+}
+
+// convert the outputs of an essentia method to JS values which can be posted to another thread and free
+// the memory of its vectors
+function unmarshalOutput(essentia: any, value: any): any {
+  if (isVector(value)) {
+    let output: any;
+    if (value instanceof essentia.module.VectorFloat) {
+      output = new Float32Array(value.size());
+      for (let i=0; i<value.size(); i++) output[i] = value.get(i);
+    } else {
+      output = [];
+      for (let i=0; i<value.size(); i++) output.push(unmarshalOutput(essentia, value.get(i)));
+    }
+    value.delete();
+    return output;
+  }
+  if (ArrayBuffer.isView(value)) {
+    // views on the WASM memory are copied, since transferring them would detach the WASM memory
+    return ownsBuffer(value) ? value : (value as Float32Array).slice();
+  }
+  if (Array.isArray(value)) return value.map((item: any) => unmarshalOutput(essentia, item));
+  if (value !== null && typeof value === 'object') {
+    const output: any = {};
+    for (const key in value) output[key] = unmarshalOutput(essentia, value[key]);
+    return output;
+  }
+  return value;
+}
+
+/**
+ * EssentiaPool
+ * Pool of workers (node.js worker_threads or Web Workers) running their own essentia instance and WASM backend,
+ * so that the computations (eg. the batch analysis of a music library) are spread over multiple cores. The pool has
+ * the same algorithm methods as the `Essentia` class, whose inputs are given as JS arrays (eg. Float32Array instead
+ * of VectorFloat) and which return a promise of their outputs as JS arrays. Each worker computes one call at a time
+ * and the calls are queued up to `maxQueueSize` calls, after which they are rejected (see `waitForCapacity`).
+ * The worker scripts serve the calls of the pool with `EssentiaPool.serve` (see `pool-worker.js` for node.js).
+ * @class
+ * @example
+ * // node.js
+ * const { Worker } = require('worker_threads');
+ * const pool = new EssentiaPool(() => new Worker(require.resolve('essentia.js/pool-worker.js')), os.cpus().length);
+ * const spectrum = (await pool.Spectrum(frame, 1024)).spectrum;
+ * // web browser, where essentia-worker.js calls EssentiaPool.serve(new Essentia(EssentiaWASM), self)
+ * const pool = new EssentiaPool(() => new Worker('essentia-worker.js', {type: 'module'}), navigator.hardwareConcurrency);
+ */
+class EssentiaPool {
+  // the algorithm methods of the Essentia class returning promises
+  [method: string]: any;
+  private workers: PoolWorker[] = [];
+  private queue: PoolTask[] = [];
+  private capacityWaiters: (() => void)[] = [];
+  private nextId: number = 0;
+  private terminated: boolean = false;
+
+  /**
+  * @constructs
+  * @param {function} workerFactory function which returns a new worker serving the calls of the pool
+  * (eg. `() => new Worker('essentia-worker.js')`)
+  * @param {number} [numWorkers=navigator.hardwareConcurrency || 4] number of workers
+  * @param {number} [maxQueueSize=1024] maximum number of calls waiting for a free worker
+  * @param {boolean} [transferInputs=false] whether to transfer the buffers of the typed array inputs to the workers
+  * instead of copying them, in which case the input arrays are no longer usable after the call
+  */
+  constructor(public workerFactory: () => any, public numWorkers: number=EssentiaPool.defaultNumWorkers(),
+              public maxQueueSize: number=1024, public transferInputs: boolean=false) {
+    if (numWorkers < 1) throw new Error('An EssentiaPool needs at least one worker');
+    for (let i=0; i<numWorkers; i++) this.workers.push(this.spawnWorker());
+    for (const algorithmName in algorithmInputTypes) {
+      this[algorithmName] = (...args: any[]) => this.run(algorithmName, args);
+    }
+  }
+
+  /**
+  * Call a method of the essentia instance of the first free worker, eg. the batched variants of the algorithms
+  * (`pool.run('MelBandsBatch', [frames, numFrames, frameSize])`)
+  * @method
+  * @param {string} method name of the method of the Essentia class
+  * @param {any[]} args arguments of the method, given as JS arrays
+  * @returns {Promise<any>} outputs of the method
+  * @memberof EssentiaPool
+  */
+  run(method: string, args: any[]): Promise<any> {
+    if (this.terminated) return Promise.reject(new Error('The EssentiaPool was terminated'));
+    if (this.queue.length >= this.maxQueueSize) {
+      return Promise.reject(new Error(`The queue of the EssentiaPool is full (${this.maxQueueSize} calls), ` +
+                                      'wait for `waitForCapacity` before adding calls'));
+    }
+    return new Promise((resolve, reject) => {
+      const transfer = this.transferInputs ? collectTransferables(args, []) : [];
+      this.queue.push({id: this.nextId++, method: method, args: args, transfer: transfer, resolve: resolve, reject: reject});
+      this.dispatch();
+    });
+  }
+
+  /**
+  * Number of calls which are either queued or running
+  * @method
+  * @returns {number}
+  * @memberof EssentiaPool
+  */
+  pending(): number {
+    return this.queue.length + this.workers.filter((poolWorker: PoolWorker) => poolWorker.task !== null).length;
+  }
+
+  /**
+  * Returns a promise which resolves once calls can be added to the queue, which lets a producer (eg. reading audio
+  * files) follow the pace of the workers
+  * @method
+  * @returns {Promise<void>}
+  * @memberof EssentiaPool
+  */
+  waitForCapacity(): Promise<void> {
+    if (this.queue.length < this.maxQueueSize) return Promise.resolve();
+    return new Promise((resolve) => this.capacityWaiters.push(resolve));
+  }
+
+  /**
+  * Call a method of the essentia instance of a given worker right away (eg. 'getAlgorithmCacheStats' or
+  * 'profile'), ie. after the call running on the worker, if any
+  * @method
+  * @param {number} workerIndex index of the worker
+  * @param {string} method name of the method of the Essentia class
+  * @param {any[]} [args=[]] arguments of the method
+  * @returns {Promise<any>} outputs of the method
+  * @memberof EssentiaPool
+  */
+  callWorker(workerIndex: number, method: string, args: any[]=[]): Promise<any> {
+    if (this.terminated) return Promise.reject(new Error('The EssentiaPool was terminated'));
+    const poolWorker = this.workers[workerIndex];
+    if (!poolWorker) throw new Error(`Invalid worker index ${workerIndex}, the pool has ${this.workers.length} workers`);
+    return new Promise((resolve, reject) => {
+      const task = {id: this.nextId++, method: method, args: args, transfer: [], resolve: resolve, reject: reject};
+      poolWorker.calls[task.id] = task;
+      poolWorker.worker.postMessage({id: task.id, method: method, args: args});
+    });
+  }
+
+  /**
+  * Shutdown the essentia instance of a given worker or of all the workers. The workers stop taking the queued calls
+  * right away and are shut down once their running call completes. They take the queued calls again once
+  * `reinstantiate` resolves, in the meantime the calls are computed by the other workers (or wait in the queue).
+  * @method
+  * @param {number} [workerIndex] index of the worker (default: all the workers)
+  * @returns {Promise<void>}
+  * @memberof EssentiaPool
+  */
+  shutdown(workerIndex?: number): Promise<void> {
+    return Promise.all(this.workerIndexes(workerIndex).map((i: number) => {
+      const poolWorker = this.workers[i];
+      if (poolWorker) poolWorker.available = false;
+      return (poolWorker ? this.whenIdle(poolWorker) : Promise.resolve()).then(() => this.callWorker(i, 'shutdown'));
+    })).then(() => undefined);
+  }
+
+  /**
+  * Re-instantiate the essentia instance of a given worker or of all the workers after a shutdown, after which they
+  * take the queued calls again
+  * @method
+  * @param {number} [workerIndex] index of the worker (default: all the workers)
+  * @returns {Promise<void>}
+  * @memberof EssentiaPool
+  */
+  reinstantiate(workerIndex?: number): Promise<void> {
+    return Promise.all(this.workerIndexes(workerIndex).map((i: number) => {
+      return this.callWorker(i, 'reinstantiate').then(() => {
+        // the worker may have been replaced or the pool terminated in the meantime
+        if (this.workers[i]) this.workers[i].available = true;
+        this.dispatch();
+      });
+    })).then(() => undefined);
+  }
+
+  /**
+  * Terminate all the workers and reject the queued and running calls
+  * @method
+  * @memberof EssentiaPool
+  */
+  terminate(): void {
+    this.terminated = true;
+    const error = new Error('The EssentiaPool was terminated');
+    for (const task of this.queue) task.reject(error);
+    this.queue = [];
+    for (const poolWorker of this.workers) {
+      this.rejectWorkerTasks(poolWorker, error);
+      poolWorker.worker.terminate();
+    }
+    this.workers = [];
+    this.notifyCapacity();
+  }
+
+  /**
+  * Serve the calls of an EssentiaPool in a worker script with the given essentia instance
+  * @method
+  * @static
+  * @param {Essentia} essentia essentia instance of the worker
+  * @param {object} port either the `parentPort` of node.js worker_threads or the global scope of a Web Worker (`self`)
+  * @memberof EssentiaPool
+  */
+  static serve(essentia: Essentia, port: any): void {
+    listen(port, (message: any) => {
+      const vectors: any[] = [];
+      try {
+        const inputTypes = algorithmInputTypes[message.method] || [];
+        const args = message.args.map((arg: any, i: number) => {
+          return i < inputTypes.length ? marshalInput(essentia, inputTypes[i], arg, vectors) : arg;
+        });
+        const result = unmarshalOutput(essentia, (essentia as any)[message.method].apply(essentia, args));
+        port.postMessage({id: message.id, result: result}, collectTransferables(result, []));
+      } catch (error) {
+        // essentia exceptions of the WASM backend are thrown as pointers
+        const reason = typeof error === 'number' ? 'essentia exception' : String(error && error.message || error);
+        port.postMessage({id: message.id, error: `${message.method}: ${reason}`});
+      } finally {
+        for (const vector of vectors) vector.delete();
+      }
+    });
+  }
+
+  private static defaultNumWorkers(): number {
+    return typeof navigator !== 'undefined' && navigator.hardwareConcurrency || 4;
+  }
+
+  private spawnWorker(): PoolWorker {
+    const poolWorker: PoolWorker = {worker: this.workerFactory(), task: null, calls: {}, available: true, idleWaiters: []};
+    listen(poolWorker.worker, (message: any) => this.onMessage(poolWorker, message),
+           (error: any) => this.onError(poolWorker, error));
+    return poolWorker;
+  }
+
+  private onMessage(poolWorker: PoolWorker, message: any): void {
+    let task: PoolTask;
+    if (poolWorker.task && poolWorker.task.id === message.id) {
+      task = poolWorker.task;
+      poolWorker.task = null;
+      this.notifyIdle(poolWorker);
+    } else {
+      task = poolWorker.calls[message.id];
+      delete poolWorker.calls[message.id];
+    }
+    if (!task) return;
+    if ('error' in message) {
+      task.reject(new Error(message.error));
+    } else {
+      task.resolve(message.result);
+    }
+    this.dispatch();
+  }
+
+  // a crashed worker is replaced by a new one
+  private onError(poolWorker: PoolWorker, error: any): void {
+    const index = this.workers.indexOf(poolWorker);
+    // the worker was already replaced or the pool terminated
+    if (index === -1) return;
+    this.rejectWorkerTasks(poolWorker, error instanceof Error ? error : new Error(String(error && error.message || error)));
+    poolWorker.worker.terminate();
+    this.workers[index] = this.spawnWorker();
+    // a worker which is shut down is replaced by a worker which waits for `reinstantiate` as well
+    this.workers[index].available = poolWorker.available;
+    this.dispatch();
+  }
+
+  private rejectWorkerTasks(poolWorker: PoolWorker, error: Error): void {
+    if (poolWorker.task) poolWorker.task.reject(error);
+    poolWorker.task = null;
+    this.notifyIdle(poolWorker);
+    for (const id in poolWorker.calls) poolWorker.calls[id].reject(error);
+    poolWorker.calls = {};
+  }
+
+  // returns a promise which resolves once the algorithm call running on a worker (if any) completes
+  private whenIdle(poolWorker: PoolWorker): Promise<void> {
+    if (!poolWorker.task) return Promise.resolve();
+    return new Promise((resolve) => poolWorker.idleWaiters.push(resolve));
+  }
+
+  private notifyIdle(poolWorker: PoolWorker): void {
+    const idleWaiters = poolWorker.idleWaiters;
+    poolWorker.idleWaiters = [];
+    for (const resolve of idleWaiters) resolve();
+  }
+
+  // send the queued calls to the free workers whose essentia instance isn't shut down
+  private dispatch(): void {
+    for (const poolWorker of this.workers) {
+      if (!this.queue.length) break;
+      if (poolWorker.task || !poolWorker.available) continue;
+      const task = this.queue.shift() as PoolTask;
+      poolWorker.task = task;
+      try {
+        poolWorker.worker.postMessage({id: task.id, method: task.method, args: task.args}, task.transfer);
+      } catch (error) {
+        // eg. the arguments can't be cloned
+        poolWorker.task = null;
+        task.reject(error);
+      }
+    }
+    this.notifyCapacity();
+  }
+
+  private notifyCapacity(): void {
+    while (this.capacityWaiters.length && (this.queue.length < this.maxQueueSize || this.terminated)) {
+      (this.capacityWaiters.shift() as () => void)();
+    }
+  }
+
+  private workerIndexes(workerIndex?: number): number[] {
+    return workerIndex === undefined ? this.workers.map((poolWorker: PoolWorker, i: number) => i) : [workerIndex];
+  }
+}
+
+export default EssentiaPool;
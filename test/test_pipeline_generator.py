@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+Tests of the fused extractors generated from the pipeline specs by `src/python/pipeline_generator.py`, which validate
+the specs against the essentia python bindings (or the metadata manifest, see `src/python/algorithm_metadata.py`).
+The generated cpp sources are also compiled if emscripten is available.
+
+	python -m unittest discover -s test -p "test_*.py"
+"""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+ROOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+PYTHON_DIR = os.path.join(ROOT_DIR, 'src', 'python')
+sys.path.insert(0, PYTHON_DIR)
+
+# the code generator reads the lists of included and excluded algorithms from its working directory
+_working_dir = os.getcwd()
+os.chdir(PYTHON_DIR)
+try:
+	from pipeline_generator import generate_pipeline, load_pipeline_spec, parse_param_expression, parse_pipeline
+finally:
+	os.chdir(_working_dir)
+
+SPEC_FILE = os.path.join(ROOT_DIR, 'src', 'cpp', 'custom', 'pipelines', 'spectral_features.json')
+
+# include path of the generated Makefiles
+EIGEN_PATH = '/usr/local/include/eigen3'
+
+
+class TestParamExpressions(unittest.TestCase):
+	PIPELINE_PARAMS = {'frameSize': 2048, 'hopSize': 1024, 'sampleRate': 44100.0, 'windowType': 'hann'}
+
+	def parse(self, expression):
+		return parse_param_expression('node', 'param', expression, self.PIPELINE_PARAMS)
+
+	def test_reference(self):
+		self.assertEqual(self.parse('$frameSize'), ('frameSize', 'integer'))
+		self.assertEqual(self.parse('$sampleRate'), ('sampleRate', 'real'))
+		self.assertEqual(self.parse('$windowType'), ('windowType', 'string'))
+
+	def test_integer_expression(self):
+		self.assertEqual(self.parse('$frameSize / 2 + 1'), ('frameSize / 2 + 1', 'integer'))
+		self.assertEqual(self.parse('($frameSize-$hopSize)*2'), ('( frameSize - hopSize ) * 2', 'integer'))
+
+	def test_real_expression(self):
+		self.assertEqual(self.parse('$sampleRate / 2'), ('sampleRate / 2', 'real'))
+		self.assertEqual(self.parse('$frameSize * 0.5'), ('frameSize * 0.5', 'real'))
+
+	def test_invalid_expression(self):
+		for expression in ['$frameSize /', '$frameSize 2', '$frameSize % 2', '$frameSize (2)', '$windowType + 1',
+							'$undefined / 2']:
+			with self.assertRaises(ValueError, msg=expression):
+				self.parse(expression)
+
+
+class TestSpectralFeaturesPipeline(unittest.TestCase):
+
+	@classmethod
+	def setUpClass(cls):
+		cls.spec = load_pipeline_spec(SPEC_FILE)
+		cls.output_dir = tempfile.mkdtemp()
+		cls.files = generate_pipeline(cls.spec, cls.output_dir)
+
+	@classmethod
+	def tearDownClass(cls):
+		shutil.rmtree(cls.output_dir)
+
+	def test_nodes(self):
+		pipeline = parse_pipeline(self.spec)
+		self.assertEqual([node['id'] for node in pipeline['nodes']],
+						['window', 'spectrum', 'mfcc', 'centroid', 'peaks', 'hpcp'])
+		parameters = dict((node['id'], dict(node['parameters'])) for node in pipeline['nodes'])
+		# the spectrum of 'frameSize' samples has 'frameSize / 2 + 1' bins up to the Nyquist frequency
+		self.assertEqual(parameters['mfcc']['inputSize'], 'frameSize / 2 + 1')
+		self.assertEqual(parameters['centroid']['range'], 'sampleRate / 2')
+
+	def test_real_parameter_from_integer_expression(self):
+		spec = dict(self.spec, nodes=dict(self.spec['nodes']))
+		spec['nodes']['centroid'] = dict(spec['nodes']['centroid'], parameters={'range': '$frameSize / 2'})
+		pipeline = parse_pipeline(spec)
+		centroid = [node for node in pipeline['nodes'] if node['id'] == 'centroid'][0]
+		self.assertEqual(centroid['parameters'], [('range', '(Real) (frameSize / 2)')])
+
+	def test_invalid_parameter_type(self):
+		spec = dict(self.spec, nodes=dict(self.spec['nodes']))
+		spec['nodes']['mfcc'] = dict(spec['nodes']['mfcc'], parameters={'inputSize': '$sampleRate / 2'})
+		with self.assertRaises(ValueError):
+			parse_pipeline(spec)
+
+	def test_generated_files(self):
+		self.assertEqual(sorted(os.path.basename(path) for path in self.files),
+						['Makefile', 'bindings_spectral_features_extractor.cpp', 'spectral_features_extractor.cpp',
+						'spectral_features_extractor.h', 'spectral_features_extractor.ts'])
+		with open(os.path.join(self.output_dir, 'spectral_features_extractor.cpp')) as f:
+			source = f.read()
+		self.assertIn('factory.create("MFCC", "inputSize", frameSize / 2 + 1, "sampleRate", sampleRate);', source)
+		self.assertIn('factory.create("Centroid", "range", sampleRate / 2);', source)
+
+	@unittest.skipIf(shutil.which('emcc') is None, "emscripten is not available")
+	def test_compile(self):
+		for path in self.files:
+			if path.endswith('.cpp'):
+				subprocess.check_call(['emcc', '-I', EIGEN_PATH, '--bind', '-Oz', '-c', path, '-o', path + '.o'],
+									cwd=self.output_dir)
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -24,10 +24,24 @@ describe('essentia.js-core', function() {
       'Essentia',
       'EssentiaModel',
       'EssentiaExtractor',
-      'EssentiaPlot'
+      'EssentiaPlot',
+      'EssentiaPool'
     ]);
   });
 
+  it('should compute the algorithms in a pool of workers', async function() {
+    const { Worker } = require('worker_threads');
+    const pool = new esLib.EssentiaPool(() => new Worker(require.resolve('../pool-worker.js')), 2);
+    const frame = audio.channelData[0].slice(0, 1024);
+    const expected = essentia.vectorToArray(essentia.Spectrum(essentia.arrayToVector(frame), 1024).spectrum);
+    const outputs = await Promise.all([0, 1, 2, 3].map(() => pool.Spectrum(frame, 1024)));
+    for (const output of outputs) chai.expect(Array.from(output.spectrum)).to.deep.equal(Array.from(expected));
+    await pool.shutdown(0);
+    await pool.reinstantiate(0);
+    chai.expect((await pool.RMS(frame)).rms).to.be.closeTo(essentia.RMS(essentia.arrayToVector(frame)).rms, 1e-6);
+    pool.terminate();
+  });
+
   it('should sucessfully find all the import methods of essentia.js instance', function() {
     chai.expect(essentia).to.have.any.keys([
       'EssentiaWASM',
@@ -46,6 +60,285 @@ describe('essentia.js-core', function() {
       'VectorVectorFloat'
     ]);
   });
+
+  it('should copy a float vector to a typed array through a view on its memory', function() {
+    const signal = audio.channelData[0].slice(0, 1024);
+    const vector = essentia.arrayToVector(signal);
+    const view = esLib.EssentiaWASM.vectorView(vector);
+    chai.expect(view.buffer).to.equal(esLib.EssentiaWASM.HEAPU8.buffer);
+    chai.expect(view).to.deep.equal(signal);
+    const copy = essentia.vectorToArray(vector);
+    chai.expect(copy.buffer).to.not.equal(view.buffer);
+    chai.expect(copy).to.deep.equal(signal);
+    vector.delete();
+  });
+
+  it('should compute a persistent algorithm instance consistently with the stateless method', function() {
+    const frame = essentia.arrayToVector(audio.channelData[0].slice(0, 1024));
+    const windowing = new esLib.Essentia.WindowingAlgo(esLib.EssentiaWASM);
+    const expected = essentia.vectorToArray(essentia.Windowing(frame).frame);
+    // configured once, computed many times
+    for (let i=0; i<3; i++) {
+      chai.expect(essentia.vectorToArray(windowing.compute(frame).frame)).to.deep.equal(expected);
+    }
+    windowing.delete();
+  });
+
+  it('should compute a persistent algorithm instance with typed array I/O', function() {
+    const frame = audio.channelData[0].slice(0, 1024);
+    const spectrum = new esLib.Essentia.SpectrumAlgo(esLib.EssentiaWASM, 1024);
+    const expected = essentia.vectorToArray(essentia.Spectrum(essentia.arrayToVector(frame), 1024).spectrum);
+    const output = spectrum.computeTyped(frame).spectrum;
+    chai.expect(output).to.be.an.instanceof(Float32Array);
+    chai.expect(Array.from(output)).to.deep.equal(Array.from(expected));
+    spectrum.delete();
+  });
+
+  it('should return the matrices with rows of different sizes as typed arrays with the lengths of their rows', function() {
+    // two salience peaks tracked over the frames [0, 60) and [20, 100), a peak with zero salience is discarded
+    const numFrames = 100;
+    const peakBins = {data: new Float32Array(2 * numFrames), shape: [numFrames, 2]};
+    const peakSaliences = {data: new Float32Array(2 * numFrames), shape: [numFrames, 2]};
+    for (let i=0; i<numFrames; i++) {
+      peakBins.data.set([300, 500], 2 * i);
+      peakSaliences.data.set([i < 60 ? 1 : 0, i >= 20 ? 1 : 0], 2 * i);
+    }
+    const pitchContours = new esLib.Essentia.PitchContoursAlgo(esLib.EssentiaWASM);
+    const contours = pitchContours.computeTyped(peakBins, peakSaliences);
+    chai.expect(contours.contoursBins.lengths).to.deep.equal([60, 80]);
+    chai.expect(contours.contoursBins.data).to.be.an.instanceof(Float32Array);
+    chai.expect(Array.from(contours.contoursBins.data)).to.deep.equal(
+      new Array(60).fill(300).concat(new Array(80).fill(500)));
+    chai.expect(contours.contoursSaliences.lengths).to.deep.equal([60, 80]);
+    chai.expect(contours.contoursBins).to.not.have.property('shape');
+    pitchContours.delete();
+  });
+
+  it('should marshal complex vectors as interleaved typed arrays', function() {
+    const frame = audio.channelData[0].slice(0, 1024);
+    const fft = essentia.FFT(essentia.arrayToVector(frame), 1024).fft;
+    chai.expect(fft).to.be.an.instanceof(Float32Array);
+    // interleaved real and imaginary parts of the (size/2 + 1) positive frequency bins
+    chai.expect(fft.length).to.equal(2 * (1024 / 2 + 1));
+    const reconstructed = essentia.vectorToArray(essentia.IFFT(fft, true, 1024).frame);
+    for (let i=0; i<frame.length; i++) {
+      chai.expect(reconstructed[i]).to.be.closeTo(frame[i], 1e-5);
+    }
+  });
+
+  it('should marshal stereo signals as interleaved or planar typed arrays', function() {
+    const left = audio.channelData[0].slice(0, 4096);
+    const right = audio.channelData[1].slice(0, 4096);
+    const interleaved = essentia.StereoMuxer(essentia.arrayToVector(left), essentia.arrayToVector(right)).audio;
+    chai.expect(interleaved).to.be.an.instanceof(Float32Array);
+    chai.expect(Array.from(interleaved.subarray(0, 4))).to.deep.equal([left[0], right[0], left[1], right[1]]);
+    for (const signal of [interleaved, {left: left, right: right}]) {
+      const channels = essentia.StereoDemuxer(signal);
+      chai.expect(essentia.vectorToArray(channels.right)).to.deep.equal(right);
+    }
+    // the channels are passed to the MonoMixer wrapper as typed arrays without a StereoMuxer round-trip
+    const downmixed = essentia.MonoMixer(audio.channelData[0], audio.channelData[1]).audio;
+    chai.expect(downmixed).to.be.an.instanceof(Float32Array);
+    chai.expect(downmixed).to.deep.equal(essentia.vectorToArray(audioDownMixed));
+  });
+
+  it('should pack the outputs of an algorithm into a transferable buffer', function() {
+    const frame = essentia.arrayToVector(audio.channelData[0].slice(0, 1024));
+    const outputs = essentia.MFCC(essentia.Spectrum(frame, 1024).spectrum);
+    const buffer = essentia.packOutputs(outputs);
+    chai.expect(buffer).to.be.an.instanceof(ArrayBuffer);
+    const unpacked = esLib.Essentia.unpackOutputs(buffer);
+    chai.expect(unpacked.mfcc).to.deep.equal(essentia.vectorToArray(outputs.mfcc));
+    chai.expect(unpacked.bands).to.deep.equal(essentia.vectorToArray(outputs.bands));
+  });
+
+  it('should compute a batch of frames in a single call', function() {
+    const frameSize = 1024;
+    const hopSize = 512;
+    const numFrames = 4;
+    const signal = audio.channelData[0].slice(0, (numFrames - 1) * hopSize + frameSize);
+    const batch = essentia.WindowingBatch(signal, numFrames, frameSize, hopSize).frame;
+    chai.expect(batch.size()).to.equal(numFrames);
+    for (let i=0; i<numFrames; i++) {
+      const frame = essentia.arrayToVector(signal.slice(i * hopSize, i * hopSize + frameSize));
+      chai.expect(essentia.vectorToArray(batch.get(i))).to.deep.equal(essentia.vectorToArray(essentia.Windowing(frame).frame));
+    }
+  });
+
+  it('should cut frames incrementally out of pushed audio chunks', function() {
+    const signal = audio.channelData[0].slice(0, 8192);
+    const frameStream = new esLib.Essentia.FrameStream(esLib.EssentiaWASM, 1024, 512, true);
+    const frames = [];
+    // push the signal in chunks of a render quantum
+    for (let i=0; i<signal.length; i+=128) {
+      frameStream.push(signal.slice(i, i + 128));
+      let frame;
+      while ((frame = frameStream.next()) !== null) frames.push(Array.from(frame));
+    }
+    chai.expect(frames.length).to.equal(15);
+    chai.expect(frames[3]).to.deep.equal(Array.from(signal.slice(3 * 512, 3 * 512 + 1024)));
+    // the last frame of FrameCutter reaches the end of the signal, so there is no zero-padded frame left
+    frameStream.flush();
+    chai.expect(frameStream.available()).to.equal(0);
+    chai.expect(frameStream.nextBlock(4).shape).to.deep.equal([0, 1024]);
+    frameStream.delete();
+  });
+
+  it('should cut the same frames incrementally as FrameGenerator', function() {
+    const signal = audio.channelData[0].slice(0, 5000);
+    const expected = essentia.FrameGenerator(signal, 1024, 256);
+    // FrameGenerator drops the silent frames
+    const frameStream = new esLib.Essentia.FrameStream(esLib.EssentiaWASM, 1024, 256, false, true);
+    const frames = [];
+    for (let i=0; i<signal.length; i+=128) {
+      frameStream.push(signal.slice(i, i + 128));
+      if (i + 128 >= signal.length) frameStream.flush();
+      let frame;
+      while ((frame = frameStream.next()) !== null) frames.push(Array.from(frame));
+    }
+    chai.expect(frames.length).to.equal(expected.size());
+    for (let i=0; i<frames.length; i++) {
+      chai.expect(frames[i]).to.deep.equal(essentia.vectorToArray(expected.get(i)));
+    }
+    expected.delete();
+    frameStream.delete();
+  });
+
+  it('should cut zero-padded frames up to the end of the signal with lastFrameToEndOfFile', function() {
+    const signal = audio.channelData[0].slice(0, 5000);
+    // the frames of FrameCutter with startFromZero stop at the frame which reaches the end of the signal (17 frames),
+    // or at the last one which starts before the last hop of the signal with lastFrameToEndOfFile (20 frames)
+    for (const [lastFrameToEndOfFile, numFrames] of [[false, 17], [true, 20]]) {
+      const frameStream = new esLib.Essentia.FrameStream(esLib.EssentiaWASM, 1024, 256, true, false, lastFrameToEndOfFile);
+      frameStream.push(signal);
+      frameStream.flush();
+      chai.expect(frameStream.available()).to.equal(numFrames);
+      const block = frameStream.nextBlock(numFrames + 1);
+      chai.expect(block.shape).to.deep.equal([numFrames, 1024]);
+      const lastStart = (numFrames - 1) * 256;
+      chai.expect(Array.from(block.data.subarray(lastStart * 4, lastStart * 4 + 4))).to.deep.equal(
+        Array.from(signal.subarray(lastStart, lastStart + 4)));
+      frameStream.delete();
+    }
+  });
+
+  it('should run a streaming network on pushed audio chunks', function() {
+    const signal = audio.channelData[0].slice(0, 8192);
+    const network = new esLib.Essentia.StreamingNetwork(esLib.EssentiaWASM);
+    const frameCutter = network.add('FrameCutter', {frameSize: 1024, hopSize: 512, startFromZero: true});
+    const rms = network.add('RMS');
+    network.connect(network.source, 'signal', frameCutter, 'signal');
+    network.connect(frameCutter, 'frame', rms, 'array');
+    network.connectToPool(rms, 'rms', 'lowlevel.rms');
+    for (let i=0; i<signal.length; i+=1000) network.push(signal.slice(i, i + 1000));
+    network.end();
+    const values = network.getPool()['lowlevel.rms'];
+    const expected = essentia.RMS(essentia.arrayToVector(signal.slice(512, 1536))).rms;
+    chai.expect(values[1]).to.be.closeTo(expected, 1e-6);
+    const mean = values.reduce((sum, value) => sum + value, 0) / values.length;
+    chai.expect(network.aggregate(['mean'])['lowlevel.rms.mean']).to.be.closeTo(mean, 1e-6);
+    network.delete();
+  });
+
+  it('should reuse cached algorithm instances for calls with the same parameters', function() {
+    const cachedEssentia = new esLib.Essentia(esLib.EssentiaWASM, false, 4);
+    const frame = cachedEssentia.arrayToVector(audio.channelData[0].slice(0, 1024));
+    const expected = essentia.vectorToArray(essentia.Windowing(frame).frame);
+    for (let i=0; i<3; i++) {
+      chai.expect(cachedEssentia.vectorToArray(cachedEssentia.Windowing(frame).frame)).to.deep.equal(expected);
+    }
+    chai.expect(cachedEssentia.getAlgorithmCacheStats()).to.include({hits: 2, misses: 1, size: 1, capacity: 4});
+    cachedEssentia.clearAlgorithmCache();
+    chai.expect(cachedEssentia.getAlgorithmCacheStats().size).to.equal(0);
+    cachedEssentia.delete();
+  });
+
+  it('should free the vectors created in a scope except the returned ones', function() {
+    const frame = audio.channelData[0].slice(0, 1024);
+    let vector;
+    const spectrum = essentia.scope(() => {
+      vector = essentia.arrayToVector(frame);
+      return essentia.Spectrum(essentia.Windowing(vector).frame, 1024).spectrum;
+    });
+    chai.expect(vector.isDeleted()).to.be.true;
+    chai.expect(spectrum.isDeleted()).to.be.false;
+    chai.expect(spectrum.size()).to.equal(513);
+    spectrum.delete();
+  });
+
+  it('should pass the vector parameters to the algorithms', function() {
+    const spectrum = essentia.arrayToVector(new Float32Array(1025).fill(1));
+    const bands = essentia.FrequencyBands(spectrum, [0, 100, 1000, 10000]).bands;
+    chai.expect(bands.size()).to.equal(3);
+  });
+
+  it('should compute a persistent algorithm into preallocated output buffers', function() {
+    const frame = audio.channelData[0].slice(0, 1024);
+    const expected = essentia.vectorToArray(essentia.Windowing(essentia.arrayToVector(frame)).frame);
+    const windowing = new esLib.Essentia.WindowingAlgo(esLib.EssentiaWASM);
+    const windowedFrame = new Float32Array(1024);
+    windowing.setOutputBuffers({frame: windowedFrame});
+    for (let i=0; i<3; i++) {
+      windowing.computeInto(frame);
+      chai.expect(Array.from(windowedFrame)).to.deep.equal(Array.from(expected));
+    }
+    windowing.delete();
+  });
+
+  it('should only record the profile of the algorithm calls of a profiled build', function() {
+    const frame = essentia.arrayToVector(audio.channelData[0].slice(0, 1024));
+    essentia.resetProfile();
+    essentia.Windowing(frame);
+    const profile = essentia.profile();
+    if (essentia.isProfiled()) {
+      chai.expect(profile.Windowing).to.include({calls: 1, inputBytes: 4096, outputBytes: 4096});
+    } else {
+      chai.expect(profile).to.deep.equal({});
+    }
+    essentia.resetProfile();
+    chai.expect(essentia.profile()).to.deep.equal({});
+  });
+
+  it('should find the algorithm group of every algorithm', async function() {
+    const groupLoader = (group) => Promise.resolve(esLib.EssentiaWASM);
+    const groupEssentia = new esLib.Essentia(esLib.EssentiaWASM, false, 0, groupLoader);
+    chai.expect(groupEssentia.getAlgorithmGroup('HPCP')).to.equal('tonal');
+    chai.expect(groupEssentia.getAlgorithmGroup('RMS')).to.equal('core');
+    // all the groups are in the monolithic WASM backend
+    chai.expect(groupEssentia.isAlgorithmGroupLoaded('rhythm')).to.be.true;
+    await groupEssentia.loadAlgorithms(['HPCP', 'BeatTrackerDegara']);
+    chai.expect(groupEssentia.getAlgorithmModule('HPCP')).to.equal(esLib.EssentiaWASM);
+    groupEssentia.delete();
+  });
+
+  it('should marshal the vectors of an algorithm group loaded as a separate WASM module', async function() {
+    // a second instance of the WASM backend, with its own heap and embind types
+    const wasmPath = require.resolve('../dist/essentia-wasm.umd');
+    delete require.cache[wasmPath];
+    const spectralModule = require(wasmPath).EssentiaWASM;
+    chai.expect(spectralModule).to.not.equal(esLib.EssentiaWASM);
+    // a main backend which doesn't provide the algorithms of the groups, so that they are loaded on demand
+    const coreModule = Object.create(esLib.EssentiaWASM);
+    coreModule.EssentiaJS = function(isDebug, cacheSize) { return new esLib.EssentiaWASM.EssentiaJS(isDebug, cacheSize); };
+    coreModule.EssentiaJS.prototype = {};
+    const groupEssentia = new esLib.Essentia(coreModule, false, 0, (group) => Promise.resolve(spectralModule));
+    await groupEssentia.loadAlgorithms(['FrequencyBands']);
+    chai.expect(groupEssentia.getAlgorithmModule('FrequencyBands')).to.equal(spectralModule);
+
+    const frame = groupEssentia.arrayToVector(audio.channelData[0].slice(0, 2048));
+    const expected = essentia.vectorToArray(essentia.FrequencyBands(essentia.Spectrum(frame).spectrum).bands);
+    // the vectors of the main backend are copied to the backend of the group, the vector of the 'frequencyBands' 
+    // array parameter is created in the backend of the group
+    const spectrum = groupEssentia.Spectrum(frame).spectrum;
+    chai.expect(spectrum).to.be.an.instanceof(spectralModule.VectorFloat);
+    const bands = groupEssentia.FrequencyBands(spectrum).bands;
+    chai.expect(Array.from(groupEssentia.vectorToArray(bands))).to.deep.equal(Array.from(expected));
+    // and the outputs of the group are copied back to the main backend
+    const rms = groupEssentia.RMS(bands).rms;
+    chai.expect(rms).to.equal(essentia.RMS(essentia.arrayToVector(expected)).rms);
+    for (const vector of [frame, spectrum, bands]) vector.delete();
+    groupEssentia.delete();
+  });
   // TODO: add more tests for testing the library on various web platforms.
   // Also write regression test for feature extractors comparing using C++, Python and JS interface.
 });